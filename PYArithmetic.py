@@ -0,0 +1,319 @@
+########################################################################################
+# File: PYArithmetic.py
+# Contents: Vectorized arithmetic calendar calculations.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-14
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Julian, Coptic and proleptic Gregorian Calendrical Calculations over NumPy arrays
+#
+# Days dates are the same ordinal days used everywhere else (January 1, 0001 = 1).
+# Every function accepts anything numpy.asarray accepts and returns int64 arrays,
+# one element per input date. No date objects are created, so millions of dates
+# convert in a single call.
+#
+# Dates are returned as [MonthArray, DayArray, YearArray], the order used by the
+# scalar functions in PYJulian and PYCoptic. Results are identical to DaysFromJulian,
+# JulianFromDays, DaysFromCoptic, CopticFromDays and date.toordinal/date.fromordinal.
+#
+
+from datetime import date
+import numpy as np
+
+#
+# Global variables
+#
+
+January = 1
+February = 2
+March = 3
+April = 4
+May = 5
+June = 6
+July = 7
+August = 8
+September = 9
+October = 10
+November = 11
+December = 12
+
+Sunday = 0
+
+NO_RULES = 0
+EASTER_RULES = 1
+
+JULIAN_EPOCH = -1   # December 30, 0000
+COPTIC_EPOCH = 103605   # August 29, 0284
+JULIAN_MARCH_EPOCH = -307   # March 1, 0000 (Julian)
+GREGORIAN_MARCH_EPOCH = -305   # March 1, 0000 (Gregorian)
+EASTER_TABLE_FIRST_YEAR = 1
+EASTER_TABLE_LAST_YEAR = 9999
+
+#
+# Name, Month, Day, Rule (nDay is the number of +- days offset from Easter)
+#
+EasterFeastsList = [
+   'Clean Monday',0,-48,EASTER_RULES,
+   'Palm Sunday',0,-7,EASTER_RULES,
+   'Good Friday',0,-2,EASTER_RULES,
+   'Easter',0,0,EASTER_RULES,
+   'Ascension',0,39,EASTER_RULES,
+   'Pentecost',0,49,EASTER_RULES
+]
+
+OrthodoxEasterTable = None   # Easter days dates indexed by year - EASTER_TABLE_FIRST_YEAR, built on first use
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmIntArray (Values) -> np.ndarray:
+#
+# Return Values as an int64 array without copying when it already is one
+#
+   return np.asarray(Values,dtype=np.int64)
+# End Def
+
+def cmMonthDayFromMarch (DayOfYearArray):
+#
+# Month and day from the day of a year beginning March 1 (0 = March 1)
+#
+# Months of 31, 30, 31, 30, 31 days repeat every 153 days from March
+#
+   ShiftedMonthArray = np.floor_divide(5 * DayOfYearArray + 2,153)
+   DayArray = DayOfYearArray - np.floor_divide(153 * ShiftedMonthArray + 2,5) + 1
+   return [np.where(ShiftedMonthArray < 10,ShiftedMonthArray + 3,ShiftedMonthArray - 9),DayArray]
+# End Def
+
+def GregorianWeekDayArray (DaysArray) -> np.ndarray:
+#
+# Gregorian day of the week for each days date (Sun = 0 ... Sat = 6)
+#
+   return np.mod(cmIntArray(DaysArray),7)
+# End Def
+
+def JulianLeapYearArray (YearArray) -> np.ndarray:
+#
+# Determine which Julian years are leap years
+#
+# There is no year zero, so years before 1 are leap when year mod 4 = 3
+#
+   YearArray = cmIntArray(YearArray)
+   return np.where(YearArray > 0,np.mod(YearArray,4) == 0,(YearArray == 0) | (np.mod(YearArray,4) == 3))
+# End Def
+
+def DaysFromJulianArray (MonthArray, DayArray, YearArray) -> np.ndarray:
+#
+# Calculate days dates from Julian dates
+#
+# Years are counted from March 1 so the leap day ends each 4 year cycle
+#
+   MonthArray = cmIntArray(MonthArray)
+   YearArray = cmIntArray(YearArray)
+   #
+   # Year has to be adjusted since year zero is not valid
+   #
+   YearArray = np.where(YearArray < 0,YearArray + 1,YearArray) - (MonthArray <= 2)
+   CycleArray = np.floor_divide(YearArray,4)
+   DayOfYearArray = np.floor_divide(153 * np.mod(MonthArray + 9,12) + 2,5) + cmIntArray(DayArray) - 1
+   return 1461 * CycleArray + 365 * (YearArray - 4 * CycleArray) + DayOfYearArray + JULIAN_MARCH_EPOCH
+# End Def
+
+def JulianFromDaysArray (DaysArray):
+#
+# Return the Julian dates [MonthArray, DayArray, YearArray] from days dates
+#
+   DaysArray = cmIntArray(DaysArray) - JULIAN_MARCH_EPOCH
+   CycleArray = np.floor_divide(DaysArray,1461)   # 1461 days in a 4 year cycle
+   DayOfCycleArray = DaysArray - 1461 * CycleArray
+   YearOfCycleArray = np.floor_divide(DayOfCycleArray - np.floor_divide(DayOfCycleArray,1460),365)
+   MonthArray, DayArray = cmMonthDayFromMarch(DayOfCycleArray - 365 * YearOfCycleArray)
+   YearArray = 4 * CycleArray + YearOfCycleArray + (MonthArray <= 2)
+   return [MonthArray,DayArray,np.where(YearArray <= 0,YearArray - 1,YearArray)]
+# End Def
+
+def DaysFromCopticArray (MonthArray, DayArray, YearArray) -> np.ndarray:
+#
+# Given Coptic dates, return days dates
+#
+   YearArray = cmIntArray(YearArray)
+   return (COPTIC_EPOCH - 1) + 365 * (YearArray - 1) + np.floor_divide(YearArray,4) \
+          + 30 * (cmIntArray(MonthArray) - 1) + cmIntArray(DayArray)
+# End Def
+
+def CopticFromDaysArray (DaysArray):
+#
+# Given days dates, return the Coptic dates [MonthArray, DayArray, YearArray]
+#
+# The start of the year is calculated once and reused for the month and day
+#
+   DaysArray = cmIntArray(DaysArray)
+   YearArray = np.floor_divide(4 * (DaysArray - COPTIC_EPOCH) + 1463,1461)
+   DayOfYearArray = DaysArray - DaysFromCopticArray(1,1,YearArray)
+   MonthArray = np.floor_divide(DayOfYearArray,30) + 1
+   return [MonthArray,DayOfYearArray - 30 * (MonthArray - 1) + 1,YearArray]
+# End Def
+
+def GregorianLeapYearArray (YearArray) -> np.ndarray:
+#
+# Determine which proleptic Gregorian years are leap years
+#
+   YearArray = cmIntArray(YearArray)
+   return (np.mod(YearArray,4) == 0) & ((np.mod(YearArray,100) != 0) | (np.mod(YearArray,400) == 0))
+# End Def
+
+def DaysFromGregorianArray (MonthArray, DayArray, YearArray) -> np.ndarray:
+#
+# Calculate days dates from proleptic Gregorian dates (year 0 = 1 BCE)
+#
+   MonthArray = cmIntArray(MonthArray)
+   YearArray = cmIntArray(YearArray) - (MonthArray <= 2)
+   CycleArray = np.floor_divide(YearArray,400)
+   YearOfCycleArray = YearArray - 400 * CycleArray
+   DayOfYearArray = np.floor_divide(153 * np.mod(MonthArray + 9,12) + 2,5) + cmIntArray(DayArray) - 1
+   return 146097 * CycleArray + 365 * YearOfCycleArray + np.floor_divide(YearOfCycleArray,4) \
+          - np.floor_divide(YearOfCycleArray,100) + DayOfYearArray + GREGORIAN_MARCH_EPOCH
+# End Def
+
+def cmGregorianCycleFromDays (DaysArray):
+#
+# Split days dates into 400 year cycles, year of cycle and day of the March based year
+#
+   DaysArray = cmIntArray(DaysArray) - GREGORIAN_MARCH_EPOCH
+   CycleArray = np.floor_divide(DaysArray,146097)   # 146097 days in a 400 year cycle
+   DayOfCycleArray = DaysArray - 146097 * CycleArray
+   YearOfCycleArray = np.floor_divide(DayOfCycleArray - np.floor_divide(DayOfCycleArray,1460) \
+                    + np.floor_divide(DayOfCycleArray,36524) - np.floor_divide(DayOfCycleArray,146096),365)
+   DayOfYearArray = DayOfCycleArray - (365 * YearOfCycleArray + np.floor_divide(YearOfCycleArray,4) - np.floor_divide(YearOfCycleArray,100))
+   return [400 * CycleArray + YearOfCycleArray,DayOfYearArray]
+# End Def
+
+def GregorianYearFromDaysArray (DaysArray) -> np.ndarray:
+#
+# Given days dates, return the Gregorian years
+#
+# Counts whole 400 year cycles instead of building date objects. The March
+# based year moves up by one for January and February (day of year 306 on)
+#
+   GregorianCycle = cmGregorianCycleFromDays(DaysArray)
+   return GregorianCycle[0] + (GregorianCycle[1] >= 306)
+# End Def
+
+def GregorianFromDaysArray (DaysArray):
+#
+# Given days dates, return the Gregorian dates [MonthArray, DayArray, YearArray]
+#
+   GregorianCycle = cmGregorianCycleFromDays(DaysArray)
+   MonthArray, DayArray = cmMonthDayFromMarch(GregorianCycle[1])
+   return [MonthArray,DayArray,GregorianCycle[0] + (MonthArray <= 2)]
+# End Def
+
+def GregorianDateDifferenceArray (StartDaysArray, EndDaysArray) -> np.ndarray:
+#
+# Days between two arrays of days dates
+#
+   return cmIntArray(EndDaysArray) - cmIntArray(StartDaysArray)
+# End Def
+
+def OrthodoxEasterArray (YearArray) -> np.ndarray:
+#
+# Calculate Easter for Orthodox and Coptic churches for every year in YearArray
+#
+# The Sunday after the Julian paschal full moon, returned as days dates
+#
+   YearArray = cmIntArray(YearArray)
+   ShiftedEpactArray = np.mod(14 + 11 * np.mod(YearArray,19),30)
+   #
+   # Year has to be adjusted since year zero is not valid
+   #
+   PaschalMoonArray = DaysFromJulianArray(April,19,np.where(YearArray > 0,YearArray,YearArray - 1)) - ShiftedEpactArray
+   return PaschalMoonArray + 7 - np.mod(PaschalMoonArray - Sunday,7)
+# End Def
+
+def cmOrthodoxEasterTable () -> np.ndarray:
+#
+# Return the Easter table for years EASTER_TABLE_FIRST_YEAR through EASTER_TABLE_LAST_YEAR,
+# indexed by year - EASTER_TABLE_FIRST_YEAR
+#
+   global OrthodoxEasterTable
+   if OrthodoxEasterTable is None:
+      OrthodoxEasterTable = OrthodoxEasterArray(np.arange(EASTER_TABLE_FIRST_YEAR,EASTER_TABLE_LAST_YEAR + 1))
+      OrthodoxEasterTable.flags.writeable = False
+   return OrthodoxEasterTable
+# End Def
+
+def OrthodoxEasterDays (nYear: int) -> int:
+#
+# Orthodox Easter days date for nYear, looked up in the Easter table
+#
+   if nYear >= EASTER_TABLE_FIRST_YEAR and nYear <= EASTER_TABLE_LAST_YEAR:
+      return int(cmOrthodoxEasterTable()[nYear - EASTER_TABLE_FIRST_YEAR])
+   return int(OrthodoxEasterArray(nYear))
+# End Def
+
+def OrthodoxEasterDaysArray (YearArray) -> np.ndarray:
+#
+# Orthodox Easter days dates for every year in YearArray
+#
+# Years inside the table are looked up, any others are calculated
+#
+   YearArray = cmIntArray(YearArray)
+   if YearArray.size == 0 or (YearArray.min() >= EASTER_TABLE_FIRST_YEAR and YearArray.max() <= EASTER_TABLE_LAST_YEAR):
+      return cmOrthodoxEasterTable()[YearArray - EASTER_TABLE_FIRST_YEAR]
+   return OrthodoxEasterArray(YearArray)
+# End Def
+
+def EasterFeastDaysArray (nOffset: int, nFromYear: int, nToYear: int) -> np.ndarray:
+#
+# Days dates of the feast nOffset days from Easter for years nFromYear through nToYear
+#
+   return OrthodoxEasterDaysArray(np.arange(nFromYear,nToYear + 1)) + nOffset
+# End Def
+
+def EasterFeastsInRange (FeastsList: list, nFromYear: int, nToYear: int) -> dict:
+#
+# Resolve every Easter based feast in FeastsList for years nFromYear through nToYear
+#
+# FeastsList uses the Name, Month, Day, Rule layout of the holiday lists.
+# Entries with EASTER_RULES are returned as Name: days dates array, one per year
+#
+   FeastDays = {}
+   EasterArray = OrthodoxEasterDaysArray(np.arange(nFromYear,nToYear + 1))
+   i = 0
+   while i < len(FeastsList):
+      if FeastsList[i + 3] == EASTER_RULES:
+         FeastDays[FeastsList[i]] = EasterArray + FeastsList[i + 2]
+      i = i + 4
+   return FeastDays
+# End Def
+
+if __name__ == '__main__':
+   #
+   # Convert the next seven days in each calendar
+   #
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   DaysArray = np.arange(pyNow.toordinal(),pyNow.toordinal() + 7)
+   print ('Days: ' + str(DaysArray))
+   GregorianDate = GregorianFromDaysArray(DaysArray)
+   print ('Gregorian Month/Day/Year: ' + str(GregorianDate[0]) + ' ' + str(GregorianDate[1]) + ' ' + str(GregorianDate[2]))
+   print ('Days from Gregorian: ' + str(DaysFromGregorianArray(GregorianDate[0],GregorianDate[1],GregorianDate[2])))
+   JulianDate = JulianFromDaysArray(DaysArray)
+   print ('Julian Month/Day/Year: ' + str(JulianDate[0]) + ' ' + str(JulianDate[1]) + ' ' + str(JulianDate[2]))
+   print ('Days from Julian: ' + str(DaysFromJulianArray(JulianDate[0],JulianDate[1],JulianDate[2])))
+   CopticDate = CopticFromDaysArray(DaysArray)
+   print ('Coptic Month/Day/Year: ' + str(CopticDate[0]) + ' ' + str(CopticDate[1]) + ' ' + str(CopticDate[2]))
+   print ('Days from Coptic: ' + str(DaysFromCopticArray(CopticDate[0],CopticDate[1],CopticDate[2])))
+   print ('Week Days: ' + str(GregorianWeekDayArray(DaysArray)))
+   print ('')
+   print ('Orthodox Easter based feasts ' + str(pyNow.year) + ' to ' + str(pyNow.year + 2))
+   print ('')
+   FeastDays = EasterFeastsInRange(EasterFeastsList,pyNow.year,pyNow.year + 2)
+   for sFeast in FeastDays:
+      print (sFeast + ': ' + ', '.join(str(date.fromordinal(int(nDays))) for nDays in FeastDays[sFeast]))
@@ -0,0 +1,1229 @@
+########################################################################################
+# File: PYAstroArray.py
+# Contents: Astronomical Calculations over NumPy arrays.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-25
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Astronomical Calculations over NumPy arrays
+#
+# Array counterparts of the PYAstronomy primitives. Each *Array function takes
+# anything numpy.asarray accepts, moments (days dates with a fraction of a day)
+# or Julian centuries, and returns float64 arrays with one element per input,
+# computing the same series as the scalar function it is named after.
+#
+# SolarLongitudeAfterArray finds many solar longitude crossings at once: every
+# bisection step evaluates the solar longitude of all the searches in one call.
+# SeasonsInRange uses it for the equinoxes and solstices of a range of years,
+# returning moments (Universal Time) or aware datetimes in a chosen zone:
+#
+#    SeasonsInRange(1800,2199)                         Moments
+#    SeasonsInRange(1800,2199,'America/Los_Angeles')   Aware datetimes
+#
+# NthLunarPhaseArray evaluates the cmNthNewMoon series, with the full and
+# quarter moon corrections, for many lunations at once. LunarPhasesInRange lists
+# every new, first quarter, full and last quarter moon of a span of days.
+#
+# TwilightArray solves the sunrise, sunset and civil, nautical and astronomical
+# dawn and dusk of every day of a span at one location, as cmSunRise, cmSunSet,
+# cmDawn and cmDusk do for one day and one event. The first approximation of
+# the four morning (and four evening) events of a day shares one solar position.
+# TwilightTable yields a TwilightRecord per day of a range of years, and
+# TwilightStatistics summarizes day length and twilight duration per year:
+#
+#    TwilightTable(2025,2034,31.9583,-111.5967,2096,'America/Phoenix')
+#    TwilightStatistics(2025,2034,31.9583,-111.5967,2096)
+#
+# TimeScalesArray converts moments between Universal, dynamical, local mean,
+# standard and apparent (sundial) time, to several scales in one call, and
+# MiddayArray gives the true noon of many days:
+#
+#    TimeScaleArray(MomentArray,APPARENT_TIME,STANDARD_TIME,-111.5967,-7)
+#
+# SkyPositionsArray gives the right ascension, declination, hour angle, altitude
+# and azimuth of the sun and moon seen from one place at many moments, sharing
+# the Julian centuries, obliquity and sidereal time between the two bodies.
+# Moments are taken SKY_POSITION_CHUNK at a time to bound the memory used.
+#
+
+from collections import namedtuple
+from datetime import date, datetime, timezone
+import numpy as np
+import PYArithmetic
+import PYAstronomy
+
+#
+# Global variables
+#
+
+January = 1
+March = 3
+June = 6
+July = 7
+September = 9
+December = 12
+
+SPRING = 0
+SUMMER = 90
+AUTUMN = 180
+WINTER = 270
+
+J2000 = 730120.5   # January 1, 2000 at noon
+GREGORIAN_1900 = 693596   # January 1, 1900
+SOLAR_LONGITUDE_TOLERANCE = .00001   # Days, as cmSolarLongitudeAfter
+LUNAR_PHASE_STEPS = 8   # Newton steps allowed by cmLunarPhaseRefine
+LUNAR_PHASE_BRACKET = .002   # Days either side of the Newton moment searched by cmLunarPhaseRefine
+
+SeasonsRecord = namedtuple('SeasonsRecord', ['Year', 'Spring', 'Summer', 'Autumn', 'Winter'])
+
+#
+# Solar longitude periods X, Y, Z, as in PYAstronomy.cmSolarLongitude
+#
+SolarLongitudePeriodsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+SolarLongitudePeriods = np.array(SolarLongitudePeriodsList,dtype=np.float64).reshape(-1,3)
+
+#
+# Season, month searched from (the 15th)
+#
+SeasonsList = [
+   SPRING,March,
+   SUMMER,June,
+   AUTUMN,September,
+   WINTER,December
+]
+
+NEWMOON = 0
+FIRSTQUARTERMOON = 90
+FULLMOON = 180
+LASTQUARTERMOON = 270
+MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
+
+LunarPhaseRecord = namedtuple('LunarPhaseRecord', ['Phase', 'Moment'])
+
+SUNRISE_SUNSET_TIME = 0
+CIVIL_TWILIGHT_TIME = 6
+NAUTICAL_TWILIGHT_TIME = 12
+ASTRONOMICAL_TWILIGHT_TIME = 18
+DEPRESSION_ITERATION = 30 / 3600   # Second approximation when the first moves more than this, as cmMomentOfDepression
+
+#
+# Depression angles of the morning events, earliest first. The evening events
+# are the same depressions in reverse order. SUNRISE_SUNSET_TIME is replaced by
+# the refraction and elevation adjustment of cmSunRise and cmSunSet
+#
+TwilightDepressionsList = [
+   ASTRONOMICAL_TWILIGHT_TIME,
+   NAUTICAL_TWILIGHT_TIME,
+   CIVIL_TWILIGHT_TIME,
+   SUNRISE_SUNSET_TIME
+]
+
+TwilightRecord = namedtuple('TwilightRecord', ['Days', 'AstronomicalDawn', 'NauticalDawn', 'CivilDawn', 'Sunrise', \
+                            'Sunset', 'CivilDusk', 'NauticalDusk', 'AstronomicalDusk', 'DayLength'])
+TwilightStatisticsRecord = namedtuple('TwilightStatisticsRecord', ['Year', 'ShortestDay', 'ShortestDayLength', 'LongestDay', \
+                                      'LongestDayLength', 'MeanDayLength', 'MeanCivilTwilight', 'MeanNauticalTwilight', \
+                                      'MeanAstronomicalTwilight', 'DaysWithoutNight'])
+
+#
+# Periodic terms V, W, X, Y, Z of the lunar phase series: V * E**W * sin(X * solar
+# anomaly + Y * lunar anomaly + Z * moon argument). New moons are the terms of
+# PYAstronomy.cmNthNewMoon, full moons and quarters those Meeus gives alongside
+#
+NewMoonTermsList = [
+   -.40720,0,0,1,0,
+   .01608,0,0,2,0,
+   .00739,1,-1,1,0,
+   .00208,2,2,0,0,
+   -.00057,0,0,1,2,
+   -.00042,0,0,3,0,
+   .00038,1,1,0,-2,
+   -.00007,0,2,1,0,
+   .00004,0,3,0,0,
+   .00003,0,0,2,2,
+   .00003,0,-1,1,2,
+   -.00002,0,1,3,0,
+   .17241,1,1,0,0,
+   .01039,0,0,0,2,
+   -.00514,1,1,1,0,
+   -.00111,0,0,1,-2,
+   .00056,1,1,2,0,
+   .00042,1,1,0,2,
+   -.00024,1,-1,2,0,
+   .00004,0,0,2,-2,
+   .00003,0,1,1,-2,
+   -.00003,0,1,1,2,
+   -.00002,0,-1,1,-2,
+   .00002,0,0,4,0
+]
+FullMoonTermsList = [
+   -.40614,0,0,1,0,
+   .17302,1,1,0,0,
+   .01614,0,0,2,0,
+   .01043,0,0,0,2,
+   .00734,1,-1,1,0,
+   -.00515,1,1,1,0,
+   .00209,2,2,0,0,
+   -.00111,0,0,1,-2,
+   -.00057,0,0,1,2,
+   .00056,1,1,2,0,
+   -.00042,0,0,3,0,
+   .00042,1,1,0,2,
+   .00038,1,1,0,-2,
+   -.00024,1,-1,2,0,
+   -.00007,0,2,1,0,
+   .00004,0,0,2,-2,
+   .00004,0,3,0,0,
+   .00003,0,1,1,-2,
+   .00003,0,0,2,2,
+   -.00003,0,1,1,2,
+   .00003,0,-1,1,2,
+   -.00002,0,-1,1,-2,
+   -.00002,0,1,3,0,
+   .00002,0,0,4,0
+]
+QuarterMoonTermsList = [
+   -.62801,0,0,1,0,
+   .17172,1,1,0,0,
+   -.01183,1,1,1,0,
+   .00862,0,0,2,0,
+   .00804,0,0,0,2,
+   .00454,1,-1,1,0,
+   .00204,2,2,0,0,
+   -.00180,0,0,1,-2,
+   -.00070,0,0,1,2,
+   -.00040,0,0,3,0,
+   -.00034,1,-1,2,0,
+   .00032,1,1,0,2,
+   .00032,1,1,0,-2,
+   -.00028,2,2,1,0,
+   .00027,1,1,2,0,
+   -.00005,0,-1,1,-2,
+   .00004,0,0,2,2,
+   -.00004,0,1,1,2,
+   .00004,0,-2,1,0,
+   .00003,0,1,1,-2,
+   .00003,0,3,0,0,
+   .00002,0,0,2,-2,
+   .00002,0,-1,1,2,
+   -.00002,0,1,3,0
+]
+
+#
+# Planetary terms I, J, L of cmNthNewMoon: L * sin(I + J * k), shared by every phase
+#
+LunarAdditionalTermsList = [
+   251.88,.016321,.000165,
+   349.42,36.412478,.000126,
+   141.74,53.303771,.000062,
+   154.84,7.30686,.000056,
+   207.19,.121824,.000042,
+   161.72,24.198154,.000037,
+   331.55,3.592518,.000023,
+   251.83,26.651886,.000164,
+   84.66,18.206239,.00011,
+   207.14,2.453732,.00006,
+   34.52,27.261239,.000047,
+   291.34,1.844379,.000040,
+   239.56,25.513099,.000035
+]
+
+LunarPhaseTerms = {
+   NEWMOON: np.array(NewMoonTermsList,dtype=np.float64).reshape(-1,5),
+   FIRSTQUARTERMOON: np.array(QuarterMoonTermsList,dtype=np.float64).reshape(-1,5),
+   FULLMOON: np.array(FullMoonTermsList,dtype=np.float64).reshape(-1,5),
+   LASTQUARTERMOON: np.array(QuarterMoonTermsList,dtype=np.float64).reshape(-1,5)
+}
+LunarAdditionalTerms = np.array(LunarAdditionalTermsList,dtype=np.float64).reshape(-1,3)
+
+#
+# Periodic terms V, W, X, Y, Z of the lunar longitude (sine), latitude (sine) and
+# distance (cosine) series: V * E**|X| * trig(W * elongation + X * solar anomaly
+# + Y * lunar anomaly + Z * moon node), as in PYAstronomy
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
+LunarLongitudeTerms = np.array(LunarLongitudeTermsList,dtype=np.float64).reshape(-1,5)
+LunarLatitudeTermsList = [
+   5128122,0,0,0,1,
+   277693,0,0,1,-1,
+   55413,2,0,-1,1,
+   32573,2,0,0,1,
+   9266,2,0,1,-1,
+   8216,2,-1,0,-1,
+   4200,2,0,1,1,
+   2463,2,-1,-1,1,
+   2065,2,-1,-1,-1,
+   1828,4,0,-1,-1,
+   -1749,0,0,0,3,
+   -1491,1,0,0,1,
+   -1410,0,1,1,-1,
+   -1335,1,0,0,-1,
+   1021,4,0,0,-1,
+   777,0,0,1,-3,
+   607,2,0,0,-3,
+   491,2,-1,1,-1,
+   439,0,0,3,-1,
+   421,2,0,-3,-1,
+   -351,2,1,0,1,
+   315,2,-1,1,1,
+   -283,0,0,1,3,
+   223,1,1,0,-1,
+   -220,0,1,-2,-1,
+   -185,1,0,1,1,
+   -177,0,1,2,1,
+   166,4,-1,-1,-1,
+   132,4,0,1,-1,
+   115,4,-1,0,-1,
+   280602,0,0,1,1,
+   173237,2,0,0,-1,
+   46271,2,0,-1,-1,
+   17198,0,0,2,1,
+   8822,0,0,2,-1,
+   4324,2,0,-2,-1,
+   -3359,2,1,0,-1,
+   2211,2,-1,0,1,
+   -1870,0,1,-1,-1,
+   -1794,0,1,0,1,
+   -1565,0,1,-1,1,
+   -1475,0,1,1,1,
+   -1344,0,1,0,-1,
+   1107,0,0,3,1,
+   833,4,0,-1,1,
+   671,4,0,-2,1,
+   596,2,0,2,-1,
+   -451,2,0,-2,1,
+   422,2,0,2,1,
+   -366,2,1,-1,1,
+   331,4,0,0,1,
+   302,2,-2,0,-1,
+   -229,2,1,1,-1,
+   223,1,1,0,1,
+   -220,2,1,-1,-1,
+   181,2,-1,-2,-1,
+   176,4,0,-2,-1,
+   -164,1,0,1,-1,
+   -119,1,0,-2,-1,
+   107,2,-2,0,1
+]
+LunarLatitudeTerms = np.array(LunarLatitudeTermsList,dtype=np.float64).reshape(-1,5)
+LunarDistanceTermsList = [
+   -20905355,0,0,1,0,
+   -2955968,2,0,0,0,
+   48888,0,1,0,0,
+   246158,2,0,-2,0,
+   -170733,2,0,1,0,
+   -129620,0,1,-1,0,
+   104755,0,1,1,0,
+   -34782,4,0,-1,0,
+   -21636,4,0,-2,0,
+   30824,2,1,0,0,
+   -16675,1,1,0,0,
+   -10445,2,0,2,0,
+   14403,2,0,-3,0,
+   6322,1,0,1,0,
+   5751,0,1,2,0,
+   -4950,2,-2,-1,0,
+   2616,2,1,1,0,
+   -2117,0,2,-1,0,
+   -1423,4,0,1,0,
+   -1571,4,-1,0,0,
+   1165,0,2,1,0,
+   -3699111,2,0,-1,0,
+   -569925,0,0,2,0,
+   -3149,0,0,0,2,
+   -152138,2,-1,-1,0,
+   -204586,2,-1,0,0,
+   108743,1,0,0,0,
+   10321,2,0,0,-2,
+   79661,0,0,1,-2,
+   -23210,0,0,3,0,
+   24208,2,1,-1,0,
+   -8379,1,0,-1,0,
+   -12831,2,-1,1,0,
+   -11650,4,0,0,0,
+   -7003,0,1,-2,0,
+   10056,2,-1,-2,0,
+   -9884,2,-2,0,0,
+   4130,2,0,1,-2,
+   -3958,4,-1,-1,0,
+   3258,3,0,-1,0,
+   -1897,4,-1,-2,0,
+   2354,2,2,-1,0,
+   -1117,0,0,4,0,
+   -1739,1,0,-2,0,
+   -4421,0,0,2,-2,
+   0,0,0,1,2,
+   0,2,0,-1,2,
+   0,0,2,0,0,
+   0,2,0,0,2,
+   0,0,0,2,2,
+   0,2,1,-2,0,
+   0,2,-1,0,-2,
+   0,2,1,0,-2,
+   0,1,1,1,0,
+   0,3,0,-2,0,
+   0,4,0,-3,0,
+   0,2,-1,2,0,
+   8752,2,0,-1,-2
+]
+LunarDistanceTerms = np.array(LunarDistanceTermsList,dtype=np.float64).reshape(-1,5)
+
+UNIVERSAL_TIME = 0
+DYNAMICAL_TIME = 1
+LOCAL_MEAN_TIME = 2
+STANDARD_TIME = 3
+APPARENT_TIME = 4
+
+SKY_POSITION_CHUNK = 20000   # Moments evaluated together by SkyPositionsArray
+SkyPositionsRecord = namedtuple('SkyPositionsRecord', ['RightAscension', 'Declination', 'HourAngle', 'Altitude', 'Azimuth'])
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmFloatArray (Values) -> np.ndarray:
+#
+# Values as a float64 array
+#
+   return np.asarray(Values,dtype=np.float64)
+# End Def
+
+def cmSinDegreesArray (ThetaArray) -> np.ndarray:
+#
+# Sine of degrees
+#
+   return np.sin(np.radians(ThetaArray))
+# End Def
+
+def cmCoSineDegreesArray (ThetaArray) -> np.ndarray:
+#
+# Cosine of degrees
+#
+   return np.cos(np.radians(ThetaArray))
+# End Def
+
+def EphemerisCorrectionArray (MomentArray) -> np.ndarray:
+#
+# Dynamical minus Universal Time in days, as cmEphemerisCorrection
+#
+   YearArray = PYArithmetic.GregorianYearFromDaysArray(np.floor(cmFloatArray(MomentArray)).astype(np.int64))
+   Y = YearArray.astype(np.float64)
+   C = (PYArithmetic.DaysFromGregorianArray(July,1,YearArray) - GREGORIAN_1900) / 36525.0
+   ConditionsList = [
+      (YearArray >= 2051) & (YearArray <= 2150),
+      (YearArray >= 2006) & (YearArray <= 2050),
+      (YearArray >= 1987) & (YearArray <= 2005),
+      (YearArray >= 1900) & (YearArray <= 1986),
+      (YearArray >= 1800) & (YearArray <= 1899),
+      (YearArray >= 1700) & (YearArray <= 1799),
+      (YearArray >= 1600) & (YearArray <= 1699),
+      (YearArray >= 500) & (YearArray <= 1599),
+      (YearArray >= -499) & (YearArray <= 499)
+   ]
+   Y2000 = Y - 2000
+   Y1700 = Y - 1700
+   Y1600 = Y - 1600
+   Y1000 = (Y - 1000) / 100
+   Y0 = Y / 100
+   Y1820 = (Y - 1820) / 100
+   ChoicesList = [
+      (-20 + 32 * ((Y - 1820) / 100)**2 + 0.5628 * (2150 - Y)) / 86400.0,
+      (62.92 + 0.32217 * Y2000 + 0.005589 * Y2000**2) / 86400.0,
+      (63.86 + 0.3345 * Y2000 - 0.060374 * Y2000**2 + 0.0017275 * Y2000**3 + 0.000651814 * Y2000**4 + 0.00002373599 * Y2000**5) / 86400.0,
+      -0.00002 + 0.000297 * C + 0.025184 * C**2 - 0.181133 * C**3 + 0.553040 * C**4 - 0.861938 * C**5 + 0.677066 * C**6 - 0.212591 * C**7,
+      -0.000009 + 0.003844 * C + 0.083563 * C**2 + 0.865736 * C**3 + 4.867575 * C**4 + 15.845535 * C**5 + 31.332267 * C**6 + 38.291999 * C**7 \
+         + 28.316289 * C**8 + 11.636204 * C**9 + 2.043794 * C**10,
+      (8.118780842 - 0.005092142 * Y1700 + 0.003336121 * Y1700**2 - 0.0000266484 * Y1700**3) / 86400.0,
+      (120 - 0.9808 * Y1600 - 0.01532 * Y1600**2 + 0.000140272128 * Y1600**3) / 86400.0,
+      (1574.2 - 556.01 * Y1000 + 71.23472 * Y1000**2 + 0.319781 * Y1000**3 - 0.8503463 * Y1000**4 - 0.005050998 * Y1000**5 + 0.0083572073 * Y1000**6) / 86400.0,
+      (10583.6 - 1014.41 * Y0 + 33.78311 * Y0**2 - 5.952053 * Y0**3 - 0.1798452 * Y0**4 + 0.022174192 * Y0**5 + 0.0090316521 * Y0**6) / 86400.0
+   ]
+   return np.select(ConditionsList,ChoicesList,(-20 + 32 * Y1820**2) / 86400.0)
+# End Def
+
+def DynamicalFromUniversalArray (UniversalArray) -> np.ndarray:
+#
+# Universal Time to Dynamical Time
+#
+   UniversalArray = cmFloatArray(UniversalArray)
+   return UniversalArray + EphemerisCorrectionArray(UniversalArray)
+# End Def
+
+def UniversalFromDynamicalArray (DynamicalArray) -> np.ndarray:
+#
+# Dynamical Time to Universal Time
+#
+   DynamicalArray = cmFloatArray(DynamicalArray)
+   return DynamicalArray - EphemerisCorrectionArray(DynamicalArray)
+# End Def
+
+def JulianCenturiesArray (MomentArray) -> np.ndarray:
+#
+# Julian Centuries since 2000
+#
+   return (DynamicalFromUniversalArray(MomentArray) - J2000) / 36525
+# End Def
+
+def AberrationArray (CArray) -> np.ndarray:
+#
+# Aberration of the sun in degrees
+#
+   return (.0000974 * cmCoSineDegreesArray(177.63 + 35999.01848 * cmFloatArray(CArray))) - .005575
+# End Def
+
+def NutationArray (CArray) -> np.ndarray:
+#
+# Nutation in longitude in degrees
+#
+   CArray = cmFloatArray(CArray)
+   A = 124.90 - 1934.134 * CArray + .002063 * CArray**2
+   B = 201.11 + 72001.5377 * CArray + .00057 * CArray**2
+   return (-.004778 * cmSinDegreesArray(A)) - (.0003667 * cmSinDegreesArray(B))
+# End Def
+
+def ObliquityArray (CArray) -> np.ndarray:
+#
+# Obliquity of the ecliptic in degrees
+#
+   CArray = cmFloatArray(CArray)
+   return PYAstronomy.cmAngle(23,26,21.448) - (PYAstronomy.cmAngle(0,0,46.8150) * CArray) \
+          - (PYAstronomy.cmAngle(0,0,0.00059) * CArray**2) + (PYAstronomy.cmAngle(0,0,0.001813) * CArray**3)
+# End Def
+
+def DeclinationArray (MomentArray, LatitudeArray, LongitudeArray) -> np.ndarray:
+#
+# Declination in degrees of ecliptic latitudes and longitudes, as cmDeclination
+#
+   Obliquity = ObliquityArray(JulianCenturiesArray(MomentArray))
+   return np.degrees(np.arcsin(cmSinDegreesArray(LatitudeArray) * cmCoSineDegreesArray(Obliquity) \
+          + cmCoSineDegreesArray(LatitudeArray) * cmSinDegreesArray(Obliquity) * cmSinDegreesArray(LongitudeArray)))
+# End Def
+
+def EquationOfTimeArray (MomentArray) -> np.ndarray:
+#
+# Equation of time in days, as cmEquationOfTime
+#
+   return cmEquationOfTimeFromCenturiesArray(JulianCenturiesArray(MomentArray))
+# End Def
+
+def cmEquationOfTimeFromCenturiesArray (C) -> np.ndarray:
+#
+# Equation of time in days at Julian centuries C
+#
+   Longitude = 280.46645 + 36000.76983 * C + .0003032 * C**2
+   Anomaly = 357.52910 + 35999.05030 * C - 0.0001559 * C**2 - 0.00000048 * C**3
+   Eccentricity = 0.016708617 - 0.000042037 * C - 0.0000001236 * C**2
+   Y = np.tan(np.radians(ObliquityArray(C) / 2))**2
+   Equation = 1 / (2 * np.pi) \
+            * ((Y * cmSinDegreesArray(Longitude * 2)) \
+            - (2 * Eccentricity * cmSinDegreesArray(Anomaly)) \
+            + (4 * Eccentricity * Y * cmSinDegreesArray(Anomaly) * cmCoSineDegreesArray(Longitude * 2)) \
+            - (.5 * Y**2 * cmSinDegreesArray(Longitude * 4)) \
+            - (1.25 * Eccentricity**2 * cmSinDegreesArray(Anomaly * 2)))
+   return np.sign(Equation) * np.minimum(np.abs(Equation),.5)
+# End Def
+
+def LocalFromApparentArray (MomentArray, nLongitude: float) -> np.ndarray:
+#
+# Apparent (sundial) time to local mean time, as cmLocalFromApparent
+#
+   MomentArray = cmFloatArray(MomentArray)
+   return MomentArray - EquationOfTimeArray(MomentArray - nLongitude / 360)
+# End Def
+
+def cmUniversalFromScaleArray (MomentArray: np.ndarray, nScale: int, nLongitude: float, nZone: float) -> np.ndarray:
+#
+# Moments on time scale nScale to Universal Time
+#
+   if nScale == UNIVERSAL_TIME:
+      return MomentArray
+   if nScale == DYNAMICAL_TIME:
+      return MomentArray - EphemerisCorrectionArray(MomentArray)
+   if nScale == LOCAL_MEAN_TIME:
+      return MomentArray - nLongitude / 360
+   if nScale == STANDARD_TIME:
+      return MomentArray - nZone / 24
+   if nScale == APPARENT_TIME:
+      return (MomentArray - EquationOfTimeArray(MomentArray - nLongitude / 360)) - nLongitude / 360
+   raise ValueError('Unknown time scale ' + str(nScale))
+# End Def
+
+def TimeScalesArray (MomentArray, nFromScale: int, ToScalesList: list, nLongitude: float = 0, nZone: float = 0) -> list:
+#
+# Moments on time scale nFromScale converted to each scale of ToScalesList,
+# one array per scale
+#
+# The scales are UNIVERSAL_TIME, DYNAMICAL_TIME, LOCAL_MEAN_TIME (at
+# nLongitude), STANDARD_TIME (nZone hours from Universal Time) and
+# APPARENT_TIME (sundial time at nLongitude). Each conversion goes through
+# Universal Time as the scalar functions do (cmDynamicalFromUniversal,
+# cmStandardFromLocal, cmApparentFromLocal, cmUniversalFromApparent, ...).
+# Delta T at the Universal moments is calculated once and serves both the
+# dynamical time and the equation of time of the apparent time
+#
+   UniversalArray = cmUniversalFromScaleArray(cmFloatArray(MomentArray),nFromScale,nLongitude,nZone)
+   DeltaT = None
+   ScalesList = []
+   for nScale in ToScalesList:
+      if nScale in (DYNAMICAL_TIME,APPARENT_TIME) and DeltaT is None:
+         DeltaT = EphemerisCorrectionArray(UniversalArray)
+      if nScale == UNIVERSAL_TIME:
+         ScalesList.append(UniversalArray)
+      elif nScale == DYNAMICAL_TIME:
+         ScalesList.append(UniversalArray + DeltaT)
+      elif nScale == LOCAL_MEAN_TIME:
+         ScalesList.append(UniversalArray + nLongitude / 360)
+      elif nScale == STANDARD_TIME:
+         ScalesList.append(UniversalArray + nZone / 24)
+      elif nScale == APPARENT_TIME:
+         C = ((UniversalArray + DeltaT) - J2000) / 36525
+         ScalesList.append((UniversalArray + nLongitude / 360) + cmEquationOfTimeFromCenturiesArray(C))
+      else:
+         raise ValueError('Unknown time scale ' + str(nScale))
+   return ScalesList
+# End Def
+
+def TimeScaleArray (MomentArray, nFromScale: int, nToScale: int, nLongitude: float = 0, nZone: float = 0) -> np.ndarray:
+#
+# Moments on time scale nFromScale converted to nToScale, as TimeScalesArray
+#
+   return TimeScalesArray(MomentArray,nFromScale,[nToScale],nLongitude,nZone)[0]
+# End Def
+
+def MiddayArray (DaysArray, nLongitude: float) -> np.ndarray:
+#
+# Universal Time of true (apparent) noon on each day at nLongitude, as cmMidday
+#
+   return TimeScaleArray(cmFloatArray(DaysArray) + .5,APPARENT_TIME,UNIVERSAL_TIME,nLongitude)
+# End Def
+
+def MeanTropicalYearArray (CArray) -> np.ndarray:
+#
+# Mean interval between vernal equinoxes in days
+#
+   CArray = cmFloatArray(CArray)
+   return 365.2421896698 - (.00000615359 * CArray) - (.000000000729 * CArray**2) + (.000000000264 * CArray**3)
+# End Def
+
+def SolarLongitudeArray (MomentArray) -> np.ndarray:
+#
+# Apparent solar longitude in degrees
+#
+   return cmSolarLongitudeFromCenturiesArray(JulianCenturiesArray(MomentArray))
+# End Def
+
+def cmSolarLongitudeFromCenturiesArray (C) -> np.ndarray:
+#
+# Apparent solar longitude in degrees at Julian centuries C
+#
+   Terms = SolarLongitudePeriods[:,0] * cmSinDegreesArray(SolarLongitudePeriods[:,1] + np.multiply.outer(C,SolarLongitudePeriods[:,2]))
+   Longitude = 282.7771834 + 36000.76953744 * C + .000005729577951308232 * Terms.sum(axis=-1)
+   return np.mod(Longitude + AberrationArray(C) + NutationArray(C),360)
+# End Def
+
+def SolarDeclinationArray (MomentArray, nLongitude: float) -> np.ndarray:
+#
+# Declination of the sun at local moments, as cmSineOffset finds it
+#
+   MomentArray = cmFloatArray(MomentArray)
+   return DeclinationArray(MomentArray - nLongitude / 360,0,SolarLongitudeArray(MomentArray))
+# End Def
+
+def ApproxMomentOfDepressionArray (MomentArray, DeclinationArray, nLatitude: float, nLongitude: float, DepressionArray, EarlyArray) -> np.ndarray:
+#
+# Local moments the sun is at each depression on the day of each moment, as
+# cmApproxMomentOfDepression, given the solar declination at the moments
+#
+# NaN where the sun does not reach the depression
+#
+   MomentArray, DeclinationArray, DepressionArray, EarlyArray = np.broadcast_arrays(cmFloatArray(MomentArray), \
+      cmFloatArray(DeclinationArray),cmFloatArray(DepressionArray),np.asarray(EarlyArray,dtype=bool))
+   Value = np.tan(np.radians(nLatitude)) * np.tan(np.radians(DeclinationArray)) \
+         + (cmSinDegreesArray(DepressionArray) / (cmCoSineDegreesArray(DeclinationArray) * np.cos(np.radians(nLatitude))))
+   Occurs = np.abs(Value) <= 1
+   Offset = np.mod(np.degrees(np.arcsin(np.where(Occurs,Value,0))) / 360 + .5,1) - .5
+   Apparent = np.floor(MomentArray) + np.where(EarlyArray,.25 - Offset,.75 + Offset)
+   return np.where(Occurs,LocalFromApparentArray(Apparent,nLongitude),np.nan)
+# End Def
+
+def LunarArgumentsArray (C) -> list:
+#
+# [MeanMoon, Elongation, SolarAnomaly, LunarAnomaly, MoonFromNode, E] at
+# Julian centuries C, as cmLunarArguments
+#
+   C = cmFloatArray(C)
+   return [np.mod(218.3164477 + 481267.88123421 * C - .0015786 * C**2 + (C**3 / 538841) - (C**4 / 65194000),360),
+           np.mod(297.8501921 + 445267.1114034 * C - .0018819 * C**2 + (C**3 / 545868) - (C**4 / 113065000),360),
+           np.mod(357.5291092 + 35999.0502909 * C - .0001536 * C**2 + (C**3 / 24490000),360),
+           np.mod(134.9633964 + 477198.8675055 * C + .0087414 * C**2 + (C**3 / 69699) - (C**4 / 14712000),360),
+           np.mod(93.2720950 + 483202.0175233 * C - .0036539 * C**2 - (C**3 / 3526000) + (C**4 / 863310000),360),
+           1 - .002516 * C - .0000074 * C**2]
+# End Def
+
+def cmLunarSeriesArray (Terms: np.ndarray, ArgumentsList: list, fnTrig) -> np.ndarray:
+#
+# Sum of V * E**|X| * fnTrig(W * D + X * M + Y * M' + Z * F) over Terms
+#
+# |X| is at most 2, so E**|X| is picked from 1, E and E**2
+#
+   MeanMoon, Elongation, SolarAnomaly, LunarAnomaly, MoonFromNode, E = ArgumentsList
+   Argument = np.stack([Elongation,SolarAnomaly,LunarAnomaly,MoonFromNode],axis=-1) @ Terms[:,1:5].T
+   EPowers = np.stack([np.ones_like(E),E,E * E],axis=-1)[...,np.abs(Terms[:,2]).astype(np.int64)]
+   return (fnTrig(np.radians(Argument)) * EPowers) @ Terms[:,0]
+# End Def
+
+def cmLunarLongitudeFromCenturiesArray (C, ArgumentsList: list) -> np.ndarray:
+#
+# Lunar longitude in degrees, as cmLunarLongitude
+#
+   MeanMoon, Elongation, SolarAnomaly, LunarAnomaly, MoonFromNode, E = ArgumentsList
+   Correction = .000001 * cmLunarSeriesArray(LunarLongitudeTerms,ArgumentsList,np.sin)
+   Venus = .003958 * cmSinDegreesArray(119.75 + (C * 131.849))
+   Jupiter = .000318 * cmSinDegreesArray(53.09 + (C * 479264.29))
+   FlatEarth = .001962 * cmSinDegreesArray(MeanMoon - MoonFromNode)
+   return np.mod(MeanMoon + Correction + Venus + Jupiter + FlatEarth + NutationArray(C),360)
+# End Def
+
+def cmLunarLatitudeFromCenturiesArray (C, ArgumentsList: list) -> np.ndarray:
+#
+# Lunar latitude in degrees, as cmLunarLatitude
+#
+   MeanMoon, Elongation, SolarAnomaly, LunarAnomaly, MoonFromNode, E = ArgumentsList
+   Venus = .000175 * (cmSinDegreesArray(119.75 + (C * 131.849) + MoonFromNode) + cmSinDegreesArray(119.75 + (C * 131.849) - MoonFromNode))
+   FlatEarth = (-.002235 * cmSinDegreesArray(MeanMoon)) + (.000127 * cmSinDegreesArray(MeanMoon - LunarAnomaly)) \
+             + (-.000115 * cmSinDegreesArray(MeanMoon + LunarAnomaly))
+   Extra = .000382 * cmSinDegreesArray(313.45 + C * 481266.484)
+   Correction = .000001 * cmLunarSeriesArray(LunarLatitudeTerms,ArgumentsList,np.sin)
+   return np.mod(Correction + Venus + FlatEarth + Extra,360)
+# End Def
+
+def cmLunarDistanceFromCenturiesArray (ArgumentsList: list) -> np.ndarray:
+#
+# Distance of the moon in meters, as cmLunarDistance
+#
+   return 385000560 + cmLunarSeriesArray(LunarDistanceTerms,ArgumentsList,np.cos)
+# End Def
+
+def LunarLongitudeArray (MomentArray) -> np.ndarray:
+#
+# Lunar longitude in degrees
+#
+   C = JulianCenturiesArray(MomentArray)
+   return cmLunarLongitudeFromCenturiesArray(C,LunarArgumentsArray(C))
+# End Def
+
+def LunarLatitudeArray (MomentArray) -> np.ndarray:
+#
+# Lunar latitude in degrees
+#
+   C = JulianCenturiesArray(MomentArray)
+   return cmLunarLatitudeFromCenturiesArray(C,LunarArgumentsArray(C))
+# End Def
+
+def LunarDistanceArray (MomentArray) -> np.ndarray:
+#
+# Distance of the moon in meters
+#
+   return cmLunarDistanceFromCenturiesArray(LunarArgumentsArray(JulianCenturiesArray(MomentArray)))
+# End Def
+
+def SiderealFromMomentArray (MomentArray) -> np.ndarray:
+#
+# Sidereal time in degrees, as cmSiderealFromMoment
+#
+   C = (cmFloatArray(MomentArray) - J2000) / 36525
+   return np.mod(280.46061837 + 36525 * 360.98564736629 * C + .000387933 * C**2 - (C**3 / 38710000),360)
+# End Def
+
+def cmEquatorialArray (LatitudeArray, LongitudeArray, Obliquity) -> list:
+#
+# [Right Ascension, Declination] in degrees of ecliptic latitudes and
+# longitudes, as cmRightAscension and cmDeclination
+#
+   SinObliquity = cmSinDegreesArray(Obliquity)
+   CosObliquity = cmCoSineDegreesArray(Obliquity)
+   RightAscension = np.mod(np.degrees(np.arctan2(cmSinDegreesArray(LongitudeArray) * CosObliquity \
+                    - np.tan(np.radians(LatitudeArray)) * SinObliquity,cmCoSineDegreesArray(LongitudeArray))),360)
+   Declination = np.degrees(np.arcsin(cmSinDegreesArray(LatitudeArray) * CosObliquity \
+                 + cmCoSineDegreesArray(LatitudeArray) * SinObliquity * cmSinDegreesArray(LongitudeArray)))
+   return [RightAscension,Declination]
+# End Def
+
+def cmHorizontalArray (HourAngle, Declination, nLatitude: float) -> list:
+#
+# [Altitude, Azimuth] in degrees, azimuth from north through east
+#
+   SinLatitude = np.sin(np.radians(nLatitude))
+   CosLatitude = np.cos(np.radians(nLatitude))
+   Altitude = np.degrees(np.arcsin(SinLatitude * cmSinDegreesArray(Declination) \
+              + CosLatitude * cmCoSineDegreesArray(Declination) * cmCoSineDegreesArray(HourAngle)))
+   Azimuth = np.mod(np.degrees(np.arctan2(-cmCoSineDegreesArray(Declination) * cmSinDegreesArray(HourAngle), \
+             CosLatitude * cmSinDegreesArray(Declination) - SinLatitude * cmCoSineDegreesArray(Declination) * cmCoSineDegreesArray(HourAngle))),360)
+   return [Altitude,Azimuth]
+# End Def
+
+def cmSkyPositionsChunk (MomentArray: np.ndarray, nLatitude: float, nLongitude: float, nElevation: float, bSolar: bool, bLunar: bool) -> list:
+#
+# [Solar, Lunar] lists of right ascension, declination, hour angle, altitude
+# and azimuth arrays (None for a body not asked for) for a chunk of moments
+#
+   C = JulianCenturiesArray(MomentArray)
+   Obliquity = ObliquityArray(C)
+   Sidereal = SiderealFromMomentArray(MomentArray)
+   PositionsList = [None,None]
+   if bSolar == True:
+      RightAscension, Declination = cmEquatorialArray(0,cmSolarLongitudeFromCenturiesArray(C),Obliquity)
+      HourAngle = np.mod(Sidereal + nLongitude - RightAscension,360)
+      PositionsList[0] = [RightAscension,Declination,HourAngle] + cmHorizontalArray(HourAngle,Declination,nLatitude)
+   if bLunar == True:
+      ArgumentsList = LunarArgumentsArray(C)
+      RightAscension, Declination = cmEquatorialArray(cmLunarLatitudeFromCenturiesArray(C,ArgumentsList), \
+                                                      cmLunarLongitudeFromCenturiesArray(C,ArgumentsList),Obliquity)
+      HourAngle = np.mod(Sidereal + nLongitude - RightAscension,360)
+      Altitude, Azimuth = cmHorizontalArray(HourAngle,Declination,nLatitude)
+      if nElevation is not None:
+         Parallax = np.degrees(np.arcsin((PYAstronomy.cmEarthRadius(nLatitude) / cmLunarDistanceFromCenturiesArray(ArgumentsList)) \
+                    * cmCoSineDegreesArray(Altitude)))
+         Altitude = Altitude - Parallax + PYAstronomy.cmSolarRefraction(nElevation,nLatitude)
+      PositionsList[1] = [RightAscension,Declination,HourAngle,Altitude,Azimuth]
+   return PositionsList
+# End Def
+
+def SkyPositionsArray (MomentArray, nLatitude: float, nLongitude: float, nElevation: float = None, bSolar: bool = True, bLunar: bool = True) -> list:
+#
+# [Solar, Lunar] SkyPositionsRecords of arrays, one element per moment
+# (Universal Time), for an observer at nLatitude, nLongitude
+#
+# Angles are degrees: right ascension, hour angle and azimuth (from north
+# through east) 0 to 360, declination and altitude -90 to 90. Altitudes are
+# geocentric, as cmGeocentricLunarAltitude; given nElevation the lunar altitude
+# is topocentric, corrected for parallax and refraction as
+# cmTopocentricLunarAltitude. A body not asked for (bSolar, bLunar) is None
+#
+   MomentArray = cmFloatArray(MomentArray)
+   Shape = MomentArray.shape
+   MomentArray = MomentArray.reshape(-1)
+   ChunksList = [cmSkyPositionsChunk(MomentArray[i:i + SKY_POSITION_CHUNK],nLatitude,nLongitude,nElevation,bSolar,bLunar) \
+                 for i in range(0,max(len(MomentArray),1),SKY_POSITION_CHUNK)]
+   PositionsList = []
+   for iBody in range(2):
+      if ChunksList[0][iBody] is None:
+         PositionsList.append(None)
+      else:
+         PositionsList.append(SkyPositionsRecord(*[np.concatenate([Chunk[iBody][i] for Chunk in ChunksList]).reshape(Shape) for i in range(5)]))
+   return PositionsList
+# End Def
+
+def SolarPositionsArray (MomentArray, nLatitude: float, nLongitude: float) -> SkyPositionsRecord:
+#
+# SkyPositionsRecord of the sun, as SkyPositionsArray
+#
+   return SkyPositionsArray(MomentArray,nLatitude,nLongitude,None,True,False)[0]
+# End Def
+
+def LunarPositionsArray (MomentArray, nLatitude: float, nLongitude: float, nElevation: float = None) -> SkyPositionsRecord:
+#
+# SkyPositionsRecord of the moon, as SkyPositionsArray
+#
+   return SkyPositionsArray(MomentArray,nLatitude,nLongitude,nElevation,False,True)[1]
+# End Def
+
+def SolarLongitudeAfterArray (MomentArray, TargetArray) -> np.ndarray:
+#
+# Moments the sun next reaches each target longitude after each moment, as
+# cmSolarLongitudeAfter
+#
+# All searches bisect together, each step evaluating every solar longitude in
+# one call. A search stops narrowing once within SOLAR_LONGITUDE_TOLERANCE
+#
+   MomentArray, TargetArray = np.broadcast_arrays(cmFloatArray(MomentArray),cmFloatArray(TargetArray))
+   Rate = MeanTropicalYearArray(JulianCenturiesArray(MomentArray)) / 360
+   End = MomentArray + Rate * np.mod(TargetArray - SolarLongitudeArray(MomentArray),360)
+   Start = np.minimum(MomentArray,End - 5)
+   End = End + 5
+   Searching = np.ones(Start.shape,dtype=bool)
+   while Searching.any():
+      Middle = Start[Searching] + (End[Searching] - Start[Searching]) * .5
+      Before = np.mod(SolarLongitudeArray(Middle) - TargetArray[Searching],360) >= 180
+      NewStart = np.where(Before,Middle,Start[Searching])
+      NewEnd = np.where(Before,End[Searching],Middle)
+      Start[Searching] = NewStart
+      End[Searching] = NewEnd
+      Searching[Searching] = NewEnd - NewStart >= SOLAR_LONGITUDE_TOLERANCE
+   return Start + (End - Start) * .5
+# End Def
+
+def SeasonsArray (nFromYear: int, nToYear: int) -> np.ndarray:
+#
+# Moments (Universal Time) of the spring equinox, summer solstice, autumn
+# equinox and winter solstice of nFromYear through nToYear, one row per year
+#
+   YearArray = np.arange(nFromYear,nToYear + 1,dtype=np.int64)
+   Targets = np.array(SeasonsList[0::2],dtype=np.float64)
+   Starts = PYArithmetic.DaysFromGregorianArray(np.array(SeasonsList[1::2]),15,YearArray[:,None])
+   return SolarLongitudeAfterArray(Starts,np.broadcast_to(Targets,Starts.shape))
+# End Def
+
+def SeasonsInRange (nFromYear: int, nToYear: int, sTimezone: str = None) -> list:
+#
+# SeasonsRecord for each year nFromYear through nToYear
+#
+# The seasons are moments (Universal Time) when sTimezone is None, otherwise
+# aware datetimes in sTimezone, as PYAstronomy.SeasonalEquinox returns them
+#
+   Moments = SeasonsArray(nFromYear,nToYear)
+   SeasonsRecordsList = []
+   for i in range(Moments.shape[0]):
+      if sTimezone is None:
+         SeasonsRecordsList.append(SeasonsRecord(nFromYear + i,*Moments[i].tolist()))
+      else:
+         SeasonsRecordsList.append(SeasonsRecord(nFromYear + i,*[PYAstronomy.cmLocalAwareFromUniversal(nMoment,sTimezone) for nMoment in Moments[i].tolist()]))
+   return SeasonsRecordsList
+# End Def
+
+def NthLunarPhaseArray (NthMoonArray, nPhase: int = NEWMOON) -> np.ndarray:
+#
+# Moments (Universal Time) of nPhase (NEWMOON, FIRSTQUARTERMOON, FULLMOON or
+# LASTQUARTERMOON) in the lunations after the new moon of January 11, 1 given
+# by NthMoonArray. NthLunarPhaseArray(n) is cmNthNewMoon(n)
+#
+   K = np.asarray(NthMoonArray,dtype=np.float64) - 24724 + nPhase / 360
+   C = K / 1236.85
+   C2 = C**2
+   C3 = C**3
+   C4 = C**4
+   Approx = J2000 + 5.09766 + MeanSynodicMonth * 1236.85 * C + .00015437 * C2 - .000000150 * C3 + .00000000073 * C4
+   E = 1.0 - .002516 * C - .0000074 * C2
+   SolarAnomaly = 2.5534 + 29.10535670 * 1236.85 * C - .0000014 * C2 - .00000011 * C3
+   LunarAnomaly = 201.5643 + 385.81693528 * 1236.85 * C + .0107582 * C2 + .00001238 * C3 - .000000058 * C4
+   MoonArgument = 160.7108 + 390.67050284 * 1236.85 * C - .0016118 * C2 - .00000227 * C3 + .000000011 * C4
+   Omega = 124.7746 + (-1.56375588 * 1236.85 * C) + .0020672 * C2 + .00000215 * C3
+   Terms = LunarPhaseTerms[nPhase]
+   Arguments = np.multiply.outer(SolarAnomaly,Terms[:,2]) + np.multiply.outer(LunarAnomaly,Terms[:,3]) + np.multiply.outer(MoonArgument,Terms[:,4])
+   Correction = -.00017 * cmSinDegreesArray(Omega) + (Terms[:,0] * np.power.outer(E,Terms[:,1]) * cmSinDegreesArray(Arguments)).sum(axis=-1)
+   if nPhase == FIRSTQUARTERMOON or nPhase == LASTQUARTERMOON:
+      W = .00306 - .00038 * E * cmCoSineDegreesArray(SolarAnomaly) + .00026 * cmCoSineDegreesArray(LunarAnomaly) \
+          - .00002 * cmCoSineDegreesArray(LunarAnomaly - SolarAnomaly) + .00002 * cmCoSineDegreesArray(LunarAnomaly + SolarAnomaly) \
+          + .00002 * cmCoSineDegreesArray(2 * MoonArgument)
+      if nPhase == FIRSTQUARTERMOON:
+         Correction = Correction + W
+      else:
+         Correction = Correction - W
+   Extra = .000325 * cmSinDegreesArray(299.77 + 132.8475848 * C - .009173 * C2)
+   Additional = (LunarAdditionalTerms[:,2] * cmSinDegreesArray(LunarAdditionalTerms[:,0] + np.multiply.outer(K,LunarAdditionalTerms[:,1]))).sum(axis=-1)
+   return UniversalFromDynamicalArray(Approx + Correction + Extra + Additional)
+# End Def
+
+def LunarPhasesArray (nFromDays: int, nToDays: int, PhasesList: list = None):
+#
+# [MomentArray, PhaseArray] of every lunar phase in PhasesList (all four when
+# None) with a moment (Universal Time) on days nFromDays through nToDays, in
+# time order
+#
+   if PhasesList is None:
+      PhasesList = [NEWMOON, FIRSTQUARTERMOON, FULLMOON, LASTQUARTERMOON]
+   nNewMoon0 = float(NthLunarPhaseArray(0))
+   NthMoonArray = np.arange(int(np.floor((nFromDays - nNewMoon0) / MeanSynodicMonth)) - 1,int(np.ceil((nToDays + 1 - nNewMoon0) / MeanSynodicMonth)) + 1)
+   MomentsList = []
+   PhaseList = []
+   for nPhase in PhasesList:
+      Moments = NthLunarPhaseArray(NthMoonArray,nPhase)
+      Moments = Moments[(Moments >= nFromDays) & (Moments < nToDays + 1)]
+      MomentsList.append(Moments)
+      PhaseList.append(np.full(Moments.shape,nPhase,dtype=np.int64))
+   MomentArray = np.concatenate(MomentsList)
+   PhaseArray = np.concatenate(PhaseList)
+   Order = np.argsort(MomentArray,kind='stable')
+   return [MomentArray[Order],PhaseArray[Order]]
+# End Def
+
+def cmLunarPhaseRefine (nMoment: float, nPhase: int) -> float:
+#
+# Moment nPhase is reached by PYAstronomy.cmLunarPhase. Newton steps using
+# the phase rate of cmLunarPhaseKernel close in from the series moment
+# nMoment, then a bisection within LUNAR_PHASE_BRACKET days settles on the
+# moment cmLunarPhase passes nPhase, which at new moon may be the switch to
+# the cmNthNewMoon based phase rather than the longitude crossing
+#
+   for i in range(LUNAR_PHASE_STEPS):
+      nCurrent, nRate = PYAstronomy.cmLunarPhaseKernel(nMoment,True)
+      nStep = (PYAstronomy.cmCalcDegrees(nCurrent - nPhase + 180) - 180) / nRate
+      nMoment = nMoment - nStep
+      if abs(nStep) < LUNAR_PHASE_BRACKET / 10:
+         break
+   nStartMoment = nMoment - LUNAR_PHASE_BRACKET
+   nEndMoment = nMoment + LUNAR_PHASE_BRACKET
+   while nEndMoment - nStartMoment >= SOLAR_LONGITUDE_TOLERANCE:
+      nNewMoment = nStartMoment + ((nEndMoment - nStartMoment) * .5)
+      if PYAstronomy.cmCalcDegrees(PYAstronomy.cmLunarPhase(nNewMoment) - nPhase) < 180:
+         nEndMoment = nNewMoment
+      else:
+         nStartMoment = nNewMoment
+   return nStartMoment + ((nEndMoment - nStartMoment) * .5)
+# End Def
+
+def LunarPhasesInRange (nFromDays: int, nToDays: int, sTimezone: str = None, bRefine: bool = False, PhasesList: list = None) -> list:
+#
+# LunarPhaseRecord for every lunar phase on days nFromDays through nToDays
+#
+# Moments are Universal Time when sTimezone is None, otherwise aware datetimes
+# in sTimezone. The series moments agree with the longitude based phases of
+# PYAstronomy (LunarNewMoonAware and the others) to about a minute; bRefine
+# moves each moment onto those phases, at the cost of a short scalar search
+#
+   MomentArray, PhaseArray = LunarPhasesArray(nFromDays,nToDays,PhasesList)
+   LunarPhasesList = []
+   for nMoment, nPhase in zip(MomentArray.tolist(),PhaseArray.tolist()):
+      if bRefine == True:
+         nMoment = cmLunarPhaseRefine(nMoment,nPhase)
+      if sTimezone is not None:
+         nMoment = PYAstronomy.cmLocalAwareFromUniversal(nMoment,sTimezone)
+      LunarPhasesList.append(LunarPhaseRecord(nPhase,nMoment))
+   return LunarPhasesList
+# End Def
+
+def cmMeanOrNone (ValuesArray) -> float:
+#
+# Mean of the values that are not NaN, None if there are none
+#
+   ValuesArray = ValuesArray[~np.isnan(ValuesArray)]
+   if len(ValuesArray) == 0:
+      return None
+   return float(ValuesArray.mean())
+# End Def
+
+def TwilightArray (nFromDays: int, nToDays: int, nLatitude: float, nLongitude: float, nElevation: float = 0) -> np.ndarray:
+#
+# Moments (Universal Time) of astronomical, nautical and civil dawn, sunrise,
+# sunset and civil, nautical and astronomical dusk on days nFromDays through
+# nToDays at a location, one row per day in the order of TwilightRecord
+#
+# Sunrise and sunset are adjusted for refraction and nElevation as cmSunRise
+# and cmSunSet. An event is NaN on days the sun does not reach its depression
+#
+   DaysArray = np.arange(nFromDays,nToDays + 1,dtype=np.float64)
+   DepressionsList = TwilightDepressionsList[:-1] + [PYAstronomy.cmAngle(0,SUNRISE_SUNSET_TIME,0) + PYAstronomy.cmSolarRefraction(nElevation,nLatitude)]
+   Depressions = np.array(DepressionsList + DepressionsList[::-1],dtype=np.float64)
+   Early = np.arange(8) < 4
+#
+# First approximation: the four morning events share the solar position at
+# 6 a.m. local time and the four evening events the one at 6 p.m.
+#
+   Start = DaysArray[:,None] + np.array([.25,.75])
+   Declination = SolarDeclinationArray(Start,nLongitude)
+   Start = np.repeat(Start,4,axis=1)
+   Declination = np.repeat(Declination,4,axis=1)
+   Approx = ApproxMomentOfDepressionArray(Start,Declination,nLatitude,nLongitude,Depressions,Early)
+#
+# Second approximation from the solar position at each first approximation
+# that moved more than DEPRESSION_ITERATION, as cmMomentOfDepression
+#
+   Again = np.abs(Start - Approx) >= DEPRESSION_ITERATION
+   Moments = Approx.copy()
+   if Again.any():
+      Redo = Approx[Again]
+      Moments[Again] = ApproxMomentOfDepressionArray(Redo,SolarDeclinationArray(Redo,nLongitude),nLatitude,nLongitude, \
+                                                     Depressions[np.nonzero(Again)[1]],Early[np.nonzero(Again)[1]])
+   return Moments - nLongitude / 360
+# End Def
+
+def TwilightTable (nFromYear: int, nToYear: int, nLatitude: float, nLongitude: float, nElevation: float = 0, sTimezone: str = None):
+#
+# Generator of a TwilightRecord for each day of nFromYear through nToYear
+#
+# Events are moments (Universal Time) when sTimezone is None, otherwise aware
+# datetimes in sTimezone, and None when they do not occur. DayLength is the
+# hours from sunrise to sunset. Each year is solved with one TwilightArray call
+#
+   for nYear in range(nFromYear,nToYear + 1):
+      nFromDays = date(nYear,January,1).toordinal()
+      Moments = TwilightArray(nFromDays,date(nYear,December,31).toordinal(),nLatitude,nLongitude,nElevation)
+      DayLength = (Moments[:,4] - Moments[:,3]) * 24
+      for i, EventsList in enumerate(Moments.tolist()):
+         EventsList = [None if np.isnan(nMoment) else nMoment for nMoment in EventsList]
+         if sTimezone is not None:
+            EventsList = [None if nMoment is None else PYAstronomy.cmLocalAwareFromUniversal(nMoment,sTimezone) for nMoment in EventsList]
+         nDayLength = None if np.isnan(DayLength[i]) else float(DayLength[i])
+         yield TwilightRecord(nFromDays + i,*EventsList,nDayLength)
+# End Def
+
+def TwilightStatistics (nFromYear: int, nToYear: int, nLatitude: float, nLongitude: float, nElevation: float = 0) -> list:
+#
+# TwilightStatisticsRecord for each year nFromYear through nToYear
+#
+# Lengths are hours. The shortest and longest days (days dates) are among the
+# days with both a sunrise and a sunset. A twilight is the time from dawn to
+# sunrise plus sunset to dusk at that depression, averaged over the days both
+# occur. DaysWithoutNight counts the days without astronomical dusk
+#
+   StatisticsList = []
+   for nYear in range(nFromYear,nToYear + 1):
+      nFromDays = date(nYear,January,1).toordinal()
+      Moments = TwilightArray(nFromDays,date(nYear,December,31).toordinal(),nLatitude,nLongitude,nElevation) * 24
+      DayLength = Moments[:,4] - Moments[:,3]
+      TwilightsList = [cmMeanOrNone((Moments[:,3] - Moments[:,i]) + (Moments[:,7 - i] - Moments[:,4])) for i in (2,1,0)]
+      nDaysWithoutNight = int(np.isnan(Moments[:,7]).sum())
+      if np.isnan(DayLength).all():
+         StatisticsList.append(TwilightStatisticsRecord(nYear,None,None,None,None,None,*TwilightsList,nDaysWithoutNight))
+         continue
+      iShortest = int(np.nanargmin(DayLength))
+      iLongest = int(np.nanargmax(DayLength))
+      StatisticsList.append(TwilightStatisticsRecord(nYear,nFromDays + iShortest,float(DayLength[iShortest]),nFromDays + iLongest, \
+                            float(DayLength[iLongest]),cmMeanOrNone(DayLength),*TwilightsList,nDaysWithoutNight))
+   return StatisticsList
+# End Def
+
+if __name__ == '__main__':
+   import time
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   for Seasons in SeasonsInRange(pyNow.year,pyNow.year + 1,PYAstronomy.LocalTimeZoneName()):
+      print (str(Seasons.Year) + ' Spring: ' + str(Seasons.Spring) + ' Summer: ' + str(Seasons.Summer) \
+             + ' Autumn: ' + str(Seasons.Autumn) + ' Winter: ' + str(Seasons.Winter))
+   nStart = time.perf_counter()
+   Moments = SeasonsArray(1800,2199)
+   print ('400 years of seasons: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   nDays = pyNow.toordinal()
+   for LunarPhase in LunarPhasesInRange(nDays,nDays + 30,PYAstronomy.LocalTimeZoneName()):
+      print (['New Moon', 'First Quarter Moon', 'Full Moon', 'Last Quarter Moon'][LunarPhase.Phase // 90] + ': ' + str(LunarPhase.Moment))
+   nStart = time.perf_counter()
+   MomentArray, PhaseArray = LunarPhasesArray(date(1950,1,1).toordinal(),date(2049,12,31).toordinal())
+   print (str(len(MomentArray)) + ' phases in 100 years: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   nStart = time.perf_counter()
+   TwilightsList = list(TwilightTable(pyNow.year,pyNow.year + 9,31.9583,-111.5967,2096,'America/Phoenix'))
+   print (str(len(TwilightsList)) + ' days of twilight at Kitt Peak: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   Twilight = TwilightsList[pyNow.toordinal() - TwilightsList[0].Days]
+   print ('Astronomical Dawn: ' + str(Twilight.AstronomicalDawn) + ' Sunrise: ' + str(Twilight.Sunrise))
+   print ('Sunset: ' + str(Twilight.Sunset) + ' Astronomical Dusk: ' + str(Twilight.AstronomicalDusk))
+   for Statistics in TwilightStatistics(pyNow.year,pyNow.year,31.9583,-111.5967,2096):
+      print (str(Statistics.Year) + ' Day Length ' + str(round(Statistics.ShortestDayLength,2)) + ' to ' + str(round(Statistics.LongestDayLength,2)) \
+             + ' hours, mean astronomical twilight ' + str(round(Statistics.MeanAstronomicalTwilight,2)) + ' hours')
+   nStart = time.perf_counter()
+   MinutesArray = date(pyNow.year,January,1).toordinal() + np.arange(0,365,1 / 1440)
+   Solar = SolarPositionsArray(MinutesArray,31.9583,-111.5967)
+   print (str(len(MinutesArray)) + ' minutes of sun positions at Kitt Peak: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds, ' \
+          + str(round(np.count_nonzero(Solar.Altitude > 0) / 60)) + ' hours of daylight')
+   Solar, Lunar = SkyPositionsArray(PYAstronomy.DateTimeToMoment(datetime.now(timezone.utc)),31.9583,-111.5967,2096)
+   print ('Sun now: altitude ' + str(round(float(Solar.Altitude),2)) + ' azimuth ' + str(round(float(Solar.Azimuth),2)) \
+          + ' Moon now: altitude ' + str(round(float(Lunar.Altitude),2)) + ' azimuth ' + str(round(float(Lunar.Azimuth),2)))
+   nStart = time.perf_counter()
+   DaysArray = date(pyNow.year,January,1).toordinal() + np.arange(365)
+   NoonArray = TimeScaleArray(MiddayArray(DaysArray,-111.5967),UNIVERSAL_TIME,STANDARD_TIME,nZone = -7)
+   NoonArray = (NoonArray - DaysArray) * 24
+   print ('Kitt Peak true noon from ' + str(round(float(NoonArray.min()),3)) + ' to ' + str(round(float(NoonArray.max()),3)) \
+          + ' hours MST: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
@@ -15,7 +15,34 @@
 # Calculations involving astronomical events use algorithms that are fairly precise
 # within +- 2000 years or so. Outside that range, errata increase the farther from
 # that range. Rise and Set times are +- 10 min or so from published values
-
+#
+# At high latitudes the sun may stay above or below a depression for days at a
+# time. cmPolarIntervals finds those spans of a year from the solar declination,
+# SunEvent classifies one day and SunEventsInYear lists a year of sunrises,
+# sunsets or twilights as SunEventRecords, skipping the days inside the spans.
+#
+# LunarDistanceExtrema and SolarDistanceExtrema yield the perigees and apogees
+# of the Moon, or the perihelions and aphelions of the Earth, in a span of days.
+# Each extremum is seeded from the mean anomaly and refined with a few Newton
+# steps on the slope of the distance, so long spans stream in constant memory.
+#
+# Eclipses yields the solar and lunar eclipses in a span of days as
+# EclipseRecords. Each mean new and full moon is first checked against the
+# Moon's mean argument of latitude, and only the syzygies near a node are
+# refined and classified as total, annular, partial or penumbral.
+#
+# SunEventsForDepressions gives the morning and evening moments of any number
+# of depression angles (sunrise, the twilights, the Hindu sunrise at 47
+# minutes, ...) for a range of days. The declination and equation of time are
+# sampled five times a day and shared by every angle.
+#
+# An AstroMoment is a moment that remembers the quantities derived from it
+# (Julian centuries, delta T, nutation, obliquity, solar and lunar coordinates).
+# It is accepted wherever a moment is, and composite calculations such as
+# lunar phase, altitude and illumination wrap their moment in one so that each
+# fundamental argument is computed only once.
+
+from collections import namedtuple
 from datetime import datetime, date, timezone, timedelta
 from dateutil.relativedelta import relativedelta
 from zoneinfo import ZoneInfo
@@ -71,6 +98,158 @@ TOPOCENTRIC = False
 
 VisibleHorizon = 0.8413147543981382   # Half diameter of the sun (16 minutes + 34.478885263888294 minutes for refraction)
 MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
+MeanAnomalisticMonth = 27.554549886   # Mean time from perigee to perigee
+MeanAnomalisticYear = 365.259636   # Mean time from perihelion to perihelion
+DistanceStep = .001   # Days between the distances of a central difference
+DistanceTolerance = .000001   # Days within which a distance extremum is refined
+DistanceIterations = 20   # Limit of refinement steps for a distance extremum
+EclipseNodeLimit = .36   # Sine of the mean argument of latitude at a syzygy beyond which no eclipse occurs
+EarthRadius = 6378140   # Equatorial radius of the Earth in meters
+
+SUN_EVENT = 0   # The sun reaches the depression, Moment is set
+SUN_ALWAYS_UP = 1   # The sun stays above the depression all day
+SUN_ALWAYS_DOWN = 2   # The sun stays below the depression all day
+
+PERIGEE = 0   # Moon nearest the Earth
+APOGEE = 1   # Moon farthest from the Earth
+PERIHELION = 2   # Earth nearest the Sun
+APHELION = 3   # Earth farthest from the Sun
+
+NO_ECLIPSE = 0
+TOTAL_SOLAR_ECLIPSE = 1
+ANNULAR_SOLAR_ECLIPSE = 2
+PARTIAL_SOLAR_ECLIPSE = 3
+TOTAL_LUNAR_ECLIPSE = 4
+PARTIAL_LUNAR_ECLIPSE = 5
+PENUMBRAL_LUNAR_ECLIPSE = 6
+
+SunEventRecord = namedtuple('SunEventRecord', ['Days', 'Event', 'Moment'])
+PolarIntervalRecord = namedtuple('PolarIntervalRecord', ['Event', 'FromDays', 'ToDays'])
+DistanceExtremumRecord = namedtuple('DistanceExtremumRecord', ['Event', 'Moment', 'Distance'])
+EclipseRecord = namedtuple('EclipseRecord', ['Event', 'Moment', 'Magnitude'])
+DepressionEventsRecord = namedtuple('DepressionEventsRecord', ['Days', 'Depressions', 'Mornings', 'Evenings'])
+NthNewMoonEpoch = 11.458922815748194   # cmNthNewMoon(0), new moon of January 11, 1
+LunarPhaseMargin = 30   # Degrees from new moon beyond which cmLunarPhase never prefers cmNthNewMoon
+
+#
+# Solar longitude periodic terms X, Y, Z in the order summed by cmSolarLongitude
+#
+SolarLongitudeTermsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+
+#
+# Lunar longitude periodic terms V, W, X, Y, Z in the order summed by cmLunarLongitude
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
 
 def CurrentDate () -> datetime:
 #
@@ -86,6 +265,50 @@ def DateTimeToMoment (dt: datetime) -> float:
   return dt.toordinal() + (((dt.hour * 3600) + (dt.minute * 60) + (dt.second) + (dt.microsecond / 1000)) / 86400)
 # End Def
 
+class AstroMoment (float):
+#
+# Moment carrying a dictionary of the values already calculated for it
+#
+# Arithmetic on an AstroMoment returns a plain float, so moments derived
+# from it (nMoment + 1, dynamical from universal, ...) never share values
+#
+   __slots__ = ('Values',)
+
+   def __new__ (cls, nMoment: float):
+      Self = super().__new__(cls,nMoment)
+      Self.Values = {}
+      return Self
+   # End Def
+# End Class
+
+def cmAstroMoment (nMoment: float) -> AstroMoment:
+#
+# Wrap nMoment in an AstroMoment, keeping one that is already wrapped
+#
+   if type(nMoment) is AstroMoment:
+      return nMoment
+   return AstroMoment(nMoment)
+# End Def
+
+def cmMomentRecall (nMoment: float, sName: str):
+#
+# Value sName remembered by nMoment, None if not yet calculated or
+# nMoment is a plain float
+#
+   if type(nMoment) is AstroMoment:
+      return nMoment.Values.get(sName)
+   return None
+# End Def
+
+def cmMomentRemember (nMoment: float, sName: str, nValue):
+#
+# Remember nValue as sName when nMoment is an AstroMoment, return nValue
+#
+   if type(nMoment) is AstroMoment:
+      nMoment.Values[sName] = nValue
+   return nValue
+# End Def
+
 def cmFloor (x: float) -> int:
 #
 # Largest integer less than or equal to x
@@ -326,7 +549,7 @@ def cmEquationOfTime (nMoment: float) -> float:
    nLongitude = 280.46645 + 36000.76983 * nC + .0003032 * nC**2
    nAnomaly = 357.52910 + 35999.05030 * nC - 0.0001559 * nC**2 - 0.00000048 * nC**3
    nEccentricity = 0.016708617 - 0.000042037 * nC - 0.0000001236 * nC**2
-   nY = cmTangentDegrees(cmObliquity(nC) / 2)**2
+   nY = cmTangentDegrees(cmMomentObliquity(nMoment) / 2)**2
    nEquation = 1 / (2 * math.pi) \
              * ((nY * cmSinDegrees(nLongitude * 2)) \
              - (2 * nEccentricity * cmSinDegrees(nAnomaly)) \
@@ -414,7 +637,10 @@ def cmJulianCenturies (nMoment: float) -> float:
 #
 # Julian Centuries since 2000
 #
-   return (cmDynamicalFromUniversal(nMoment) - J2000) / 36525
+   nC = cmMomentRecall(nMoment,'Centuries')
+   if nC is None:
+      nC = cmMomentRemember(nMoment,'Centuries',(cmDynamicalFromUniversal(nMoment) - J2000) / 36525)
+   return nC
 #End Def
 
 def cmEarthRadius (nLatitude: float) -> float:
@@ -451,6 +677,9 @@ def cmEphemerisCorrection (nMoment: float) -> float:
 #
 # General adjustment for the slowly decreasing rotation of the earth
 #
+   nCorrection = cmMomentRecall(nMoment,'EphemerisCorrection')
+   if nCorrection is not None:
+      return nCorrection
    nYear = cmGregorianYearFromDays(cmFloor(nMoment))
    nC = cmGregorianDateDifference(January,1,1900,July,1,nYear) / 36525.0
    if nYear >= 2051 and nYear <= 2150:
@@ -480,7 +709,7 @@ def cmEphemerisCorrection (nMoment: float) -> float:
    else:
       nY = (nYear - 1820) / 100
       nCorrection = (-20 + 32 * nY**2) / 86400.0
-   return nCorrection
+   return cmMomentRemember(nMoment,'EphemerisCorrection',nCorrection)
 # End Def
 
 def cmDynamicalFromUniversal (nUniversal: float) -> float:
@@ -516,6 +745,26 @@ def cmNutation (nC: float) -> float:
    return (-.004778 * cmSinDegrees(nA)) - (.0003667 * cmSinDegrees(nB))
 # End Def
 
+def cmMomentNutation (nMoment: float) -> float:
+#
+# Nutation at nMoment
+#
+   nNutation = cmMomentRecall(nMoment,'Nutation')
+   if nNutation is None:
+      nNutation = cmMomentRemember(nMoment,'Nutation',cmNutation(cmJulianCenturies(nMoment)))
+   return nNutation
+# End Def
+
+def cmMomentObliquity (nMoment: float) -> float:
+#
+# Obliquity of the ecliptic at nMoment
+#
+   nObliquity = cmMomentRecall(nMoment,'Obliquity')
+   if nObliquity is None:
+      nObliquity = cmMomentRemember(nMoment,'Obliquity',cmObliquity(cmJulianCenturies(nMoment)))
+   return nObliquity
+# End Def
+
 def cmSumSolarLongitudePeriods (dtC: float, dwX: float, dtY: float, dtZ: float) -> float:
 #
 # Support for adjustment of solar longitude calculation
@@ -527,6 +776,9 @@ def cmSolarLongitude (dtMoment: float) -> float:
 #
 # Solar Longitude
 #
+   dtLongitude = cmMomentRecall(dtMoment,'SolarLongitude')
+   if dtLongitude is not None:
+      return dtLongitude
    dtC = cmJulianCenturies(dtMoment)
    dtLongitude = 282.7771834 + 36000.76953744 * dtC \
                + (.000005729577951308232 \
@@ -579,14 +831,14 @@ def cmSolarLongitude (dtMoment: float) -> float:
                + cmSumSolarLongitudePeriods(dtC,10,126.6,26895.292) \
                + cmSumSolarLongitudePeriods(dtC,10,85.9,12297.536) \
                + cmSumSolarLongitudePeriods(dtC,10,146.1,90073.778)))
-   return cmCalcDegrees(dtLongitude + cmAberration(dtC) + cmNutation(dtC))
+   return cmMomentRemember(dtMoment,'SolarLongitude',cmCalcDegrees(dtLongitude + cmAberration(dtC) + cmMomentNutation(dtMoment)))
 # End Def
 
 def cmDeclination (nMoment: float, nLatitude: float, nLongitude: float) -> float:
 #
 # Angular distance of a point north or south of the celestial equator
 #
-   nObliquity = cmObliquity(cmJulianCenturies(nMoment))
+   nObliquity = cmMomentObliquity(nMoment)
    return cmArcSinDegrees(cmSinDegrees(nLatitude) \
           * cmCoSineDegrees(nObliquity) \
           + cmCoSineDegrees(nLatitude) \
@@ -699,10 +951,13 @@ def cmSolarDistance (nMoment: float) -> float:
 # Distance between the centers of the Earth and Sun in Astronomical Units
 # 1 AU = 149,597,870.691 kilometers or 92,955,807.267433 miles
 #
+   nDistance = cmMomentRecall(nMoment,'SolarDistance')
+   if nDistance is not None:
+      return nDistance
    nC = cmJulianCenturies(nMoment)
    nEccentricity = cmEccentricityEarthOrbit(nC)
    nSolarAnomaly = cmCalcDegrees(357.5291092 + 35999.0502909 * nC - .0001537 * nC**2) + cmSolarEquationOfCenter(nC)
-   return (1.000001018 * (1 - nEccentricity**2)) / (1 + nEccentricity * cmCoSineDegrees(nSolarAnomaly))
+   return cmMomentRemember(nMoment,'SolarDistance',(1.000001018 * (1 - nEccentricity**2)) / (1 + nEccentricity * cmCoSineDegrees(nSolarAnomaly)))
 # End Def
 
 def SolarDistance (nLocal: datetime, nTimezone: str) -> float:
@@ -722,11 +977,13 @@ def cmApproxMomentOfDepression (nMoment: float, nLatitude: float, nLongitude: fl
    nTry = cmSineOffset(nMoment,nLatitude,nLongitude,nDepression)
    if nDepression >= 0:
       if bEarly == MORNING:
-         nAlt = 1
+         nAlt = nDays
       else:
-         nAlt = nDays + .5
+         nAlt = nDays + 1
+   else:
+      nAlt = nDays + .5
    if abs(nTry) > 1:
-      nValue = cmSineOffset(nAlt,nLatitude,nDepression)
+      nValue = cmSineOffset(nAlt,nLatitude,nLongitude,nDepression)
    else:
       nValue = nTry
    if abs(nValue) <=1:   # Event Occurs
@@ -802,6 +1059,239 @@ def SunSetTimeZone (nDays: int, nTimeZone: str, nLatitude: float, nLongitude: fl
    return Sunset
 # End Def
 
+def cmSunEventDepression (nLatitude: float, nElevation: float, nDepression: float) -> float:
+#
+# Depression angle of a sun event, SUNRISE_SUNSET_TIME adjusted for refraction
+# and elevation as cmSunRise, a twilight depression as is
+#
+   if nDepression == SUNRISE_SUNSET_TIME:
+      return cmAngle(0,SUNRISE_SUNSET_TIME,0) + cmSolarRefraction(nElevation,nLatitude)
+   return nDepression
+# End Def
+
+def cmPolarIntervals (nYear: int, nLatitude: float, nDepression: float) -> list:
+#
+# PolarIntervalRecord for each span of days of nYear the sun stays above
+# (SUN_ALWAYS_UP) or below (SUN_ALWAYS_DOWN) nDepression degrees below the
+# horizon at nLatitude
+#
+# Over a day the altitude of the sun runs from |nLatitude + Declination| - 90
+# to 90 - |nLatitude - Declination|. With the declination taken positive
+# toward the hemisphere of nLatitude, the sun never sinks to the depression
+# while the declination exceeds 90 - nDepression - |nLatitude|, and never
+# climbs to it while the declination is below |nLatitude| - 90 - nDepression.
+# Since sin(Declination) = sin(Obliquity) * sin(Solar Longitude), each limit
+# is a pair of solar longitudes and a span runs between two
+# cmSolarLongitudeAfter moments. FromDays and ToDays are the first and last
+# days lying wholly within the span
+#
+   nFromDays = date(nYear,January,1).toordinal()
+   nToDays = date(nYear,December,31).toordinal()
+   nSinObliquity = cmSinDegrees(cmObliquity(cmJulianCenturies(date(nYear,July,1).toordinal())))
+   nSign = 1 if nLatitude >= 0 else -1
+   IntervalsList = []
+   for nEvent, nHemisphere, nLimit in ((SUN_ALWAYS_UP,nSign,90 - nDepression - abs(nLatitude)), \
+                                      (SUN_ALWAYS_DOWN,-nSign,90 + nDepression - abs(nLatitude))):
+      nSinLimit = cmSinDegrees(nLimit) / nSinObliquity
+      if nSinLimit >= 1:   # Declination never passes the limit
+         continue
+      if nSinLimit <= -1:   # Declination always beyond the limit
+         IntervalsList.append(PolarIntervalRecord(nEvent,nFromDays,nToDays))
+         continue
+#
+# nHemisphere * Declination is beyond nLimit while the solar longitude runs
+# from nStartLongitude to nEndLongitude
+#
+      nShift = 0 if nHemisphere == 1 else 180
+      nStartLongitude = cmCalcDegrees(cmArcSinDegrees(nSinLimit) + nShift)
+      nEndLongitude = cmCalcDegrees(180 - cmArcSinDegrees(nSinLimit) + nShift)
+      nStart = cmSolarLongitudeAfter(nFromDays - 366,nStartLongitude)
+      while nStart <= nToDays + 1:
+         nEnd = cmSolarLongitudeAfter(nStart,nEndLongitude)
+         nFirst = max(cmFloor(nStart) + 1,nFromDays)
+         nLast = min(cmFloor(nEnd) - 1,nToDays)
+         if nFirst <= nLast:
+            IntervalsList.append(PolarIntervalRecord(nEvent,nFirst,nLast))
+         nStart = cmSolarLongitudeAfter(nEnd,nStartLongitude)
+   return sorted(IntervalsList,key=lambda Interval: Interval.FromDays)
+# End Def
+
+def cmSunEvent (nDays: int, nLatitude: float, nLongitude: float, nDepression: float, bEarly: bool) -> list:
+#
+# [Event, Moment] for the sun reaching nDepression degrees in the morning
+# (bEarly MORNING) or evening of nDays, Moment in Universal Time when Event
+# is SUN_EVENT, otherwise 0
+#
+   if bEarly == MORNING:
+      nMoment = nDays + .25
+   else:
+      nMoment = nDays + .75
+   nEvent = cmMomentOfDepression(nMoment,nLatitude,nLongitude,nDepression,bEarly)
+   if nEvent != 0:
+      return [SUN_EVENT,cmStandardFromLocal(nEvent,0,nLongitude)]
+   if cmSineOffset(nMoment,nLatitude,nLongitude,nDepression) > 1:
+      return [SUN_ALWAYS_UP,0]
+   return [SUN_ALWAYS_DOWN,0]
+# End Def
+
+def SunEvent (nDays: int, nTimeZone: str, nLatitude: float, nLongitude: float, nElevation: float, nDepression: float, bEarly: bool) -> SunEventRecord:
+#
+# SunEventRecord for the sunrise or dawn (bEarly MORNING), or the sunset or
+# dusk (bEarly EVENING) of nDays
+#
+# nDepression SUNRISE_SUNSET_TIME is the sunrise or sunset, adjusted for
+# refraction and nElevation; the twilight depressions (CIVIL_TWILIGHT_TIME,
+# ...) are the dawn or dusk. Moment is timezone aware, None when the sun stays
+# above (SUN_ALWAYS_UP) or below (SUN_ALWAYS_DOWN) the depression all day
+#
+   nEvent, nMoment = cmSunEvent(nDays,nLatitude,nLongitude,cmSunEventDepression(nLatitude,nElevation,nDepression),bEarly)
+   if nEvent != SUN_EVENT:
+      return SunEventRecord(nDays,nEvent,None)
+   return SunEventRecord(nDays,nEvent,cmLocalAwareFromUniversal(nMoment,nTimeZone))
+# End Def
+
+def SunEventsInYear (nYear: int, nTimeZone: str, nLatitude: float, nLongitude: float, nElevation: float, nDepression: float, bEarly: bool) -> list:
+#
+# SunEventRecord, as SunEvent, for every day of nYear
+#
+# Days within the polar day and polar night spans of cmPolarIntervals are
+# classified without calculation
+#
+   nDepression = cmSunEventDepression(nLatitude,nElevation,nDepression)
+   PolarDict = {}
+   for Interval in cmPolarIntervals(nYear,nLatitude,nDepression):
+      for nDays in range(Interval.FromDays,Interval.ToDays + 1):
+         PolarDict[nDays] = Interval.Event
+   EventsList = []
+   for nDays in range(date(nYear,January,1).toordinal(),date(nYear,December,31).toordinal() + 1):
+      if nDays in PolarDict:
+         EventsList.append(SunEventRecord(nDays,PolarDict[nDays],None))
+         continue
+      nEvent, nMoment = cmSunEvent(nDays,nLatitude,nLongitude,nDepression,bEarly)
+      if nEvent != SUN_EVENT:
+         EventsList.append(SunEventRecord(nDays,nEvent,None))
+      else:
+         EventsList.append(SunEventRecord(nDays,nEvent,cmLocalAwareFromUniversal(nMoment,nTimeZone)))
+   return EventsList
+# End Def
+
+def cmSolarDayState (nDays: int, nLongitude: float, State: list = None) -> list:
+#
+# Solar state of the local day nDays at nLongitude for cmDepressionMoments
+#
+# Returns [Declinations, Equations], the declination used by cmSineOffset and
+# the equation of time used by cmLocalFromApparent at the local moments nDays,
+# nDays + .25, ... nDays + 1. State, the state of nDays - 1, lends its last
+# samples as the first
+#
+   DeclinationsList = []
+   EquationsList = []
+   for i in range(5):
+      if i == 0 and State is not None:
+         DeclinationsList.append(State[0][4])
+         EquationsList.append(State[1][4])
+         continue
+      nMoment = nDays + i / 4
+      nUniversal = cmUniversalFromLocal(nMoment,nLongitude)
+      DeclinationsList.append(cmDeclination(nUniversal,0,cmSolarLongitude(nMoment)))
+      EquationsList.append(cmEquationOfTime(nUniversal))
+   return [DeclinationsList,EquationsList]
+# End Def
+
+def cmQuarterDayInterpolate (ValuesList: list, nFraction: float) -> float:
+#
+# Value at nFraction of a day interpolated from the five quarter day samples
+# of ValuesList by Newton forward differences, the sample itself at a quarter
+#
+   nX = nFraction * 4
+   if nX == cmFloor(nX) and 0 <= nX <= 4:
+      return ValuesList[int(nX)]
+   nF0, nF1, nF2, nF3, nF4 = ValuesList
+   nD1 = nF1 - nF0
+   nD2 = nF2 - 2 * nF1 + nF0
+   nD3 = nF3 - 3 * nF2 + 3 * nF1 - nF0
+   nD4 = nF4 - 4 * nF3 + 6 * nF2 - 4 * nF1 + nF0
+   return nF0 + nX * (nD1 + (nX - 1) / 2 * (nD2 + (nX - 2) / 3 * (nD3 + (nX - 3) / 4 * nD4)))
+# End Def
+
+def cmStateApproxMoment (State: list, nDays: int, nMoment: float, nLatitude: float, nLongitude: float, nDepression: float, bEarly: bool) -> float:
+#
+# cmApproxMomentOfDepression with the declination and equation of time taken
+# from State, the cmSolarDayState of nDays
+#
+   if cmFloor(nMoment) != nDays:
+      return cmApproxMomentOfDepression(nMoment,nLatitude,nLongitude,nDepression,bEarly)
+   if nDepression >= 0:
+      if bEarly == MORNING:
+         nAlt = 0
+      else:
+         nAlt = 1
+   else:
+      nAlt = .5
+   nApprox = 0    # if return is 0, event did not occur
+   for nFraction in (nMoment - nDays,nAlt):
+      nDeclination = cmQuarterDayInterpolate(State[0],nFraction)
+      nValue = cmTangentDegrees(nLatitude) \
+             * cmTangentDegrees(nDeclination) \
+             + (cmSinDegrees(nDepression) / (cmCoSineDegrees(nDeclination) * cmCoSineDegrees(nLatitude)))
+      if abs(nValue) <= 1:   # Event Occurs
+         nOffset = cmMod3(cmArcSinDegrees(nValue) / 360,-.5,.5)
+         if bEarly == MORNING:
+            nOffsetAdjust = (.25 - nOffset)
+         else:
+            nOffsetAdjust = (.75 + nOffset)
+         nApprox = (nDays + nOffsetAdjust) - cmQuarterDayInterpolate(State[1],nOffsetAdjust)
+         break
+   return nApprox
+# End Def
+
+def cmDepressionMoments (nDays: int, nLatitude: float, nLongitude: float, DepressionsList: list, bEarly: bool, State: list = None) -> list:
+#
+# Local moment, as cmDawn (bEarly MORNING) or cmDusk, of the sun at each
+# depression of DepressionsList on nDays, 0 when the sun does not reach it
+#
+# Every depression shares one cmSolarDayState (State when given), so the
+# solar longitude, obliquity and equation of time are calculated five times
+# a day however many depressions are asked for
+#
+   if State is None:
+      State = cmSolarDayState(nDays,nLongitude)
+   if bEarly == MORNING:
+      nStart = nDays + .25
+   else:
+      nStart = nDays + .75
+   MomentsList = []
+   for nDepression in DepressionsList:
+      nMoment = cmStateApproxMoment(State,nDays,nStart,nLatitude,nLongitude,nDepression,bEarly)
+      if nMoment != 0:
+         if abs(nStart - nMoment) >= 30 / 3600:   # Within 30 sec?
+            nMoment = cmStateApproxMoment(State,nDays,nMoment,nLatitude,nLongitude,nDepression,bEarly)
+      MomentsList.append(nMoment)
+   return MomentsList
+# End Def
+
+def SunEventsForDepressions (nFromDays: int, nToDays: int, nTimeZone: str, nLatitude: float, nLongitude: float, nElevation: float, DepressionsList: list):
+#
+# Generator of a DepressionEventsRecord for each day from nFromDays through
+# nToDays with the morning and evening moments of the sun at each depression
+# of DepressionsList
+#
+# SUNRISE_SUNSET_TIME is adjusted for refraction and nElevation as SunEvent;
+# any other depression, such as the twilights or 47 / 60 for the Hindu
+# sunrise, is taken as is. Mornings and Evenings are timezone aware in the
+# order of DepressionsList, None when the sun does not reach the depression
+#
+   EventDepressionsList = [cmSunEventDepression(nLatitude,nElevation,nDepression) for nDepression in DepressionsList]
+   State = None
+   for nDays in range(nFromDays,nToDays + 1):
+      State = cmSolarDayState(nDays,nLongitude,State)
+      EventsList = []
+      for bEarly in (MORNING,EVENING):
+         EventsList.append([None if nMoment == 0 else cmLocalAwareFromUniversal(cmStandardFromLocal(nMoment,0,nLongitude),nTimeZone) \
+                            for nMoment in cmDepressionMoments(nDays,nLatitude,nLongitude,EventDepressionsList,bEarly,State)])
+      yield DepressionEventsRecord(nDays,list(DepressionsList),*EventsList)
+# End Def
+
 def cmSolarAnomaly (nC: float) -> float:
 #
 # Solar Anomaly
@@ -830,6 +1320,21 @@ def cmLunarElongation (nC: float) -> float:
    return cmCalcDegrees(297.8501921 + 445267.1114034 * nC - .0018819 * nC**2 + (nC**3 / 545868) - (nC**4 / 113065000))
 # End Def
 
+def cmLunarArguments (nMoment: float) -> list:
+#
+# Fundamental lunar arguments at nMoment shared by the lunar distance,
+# latitude and longitude series
+#
+# Returns [Centuries, MeanMoon, Elongation, SolarAnomaly, LunarAnomaly, MoonFromNode, E]
+#
+   ArgumentsList = cmMomentRecall(nMoment,'LunarArguments')
+   if ArgumentsList is None:
+      nC = cmJulianCenturies(nMoment)
+      ArgumentsList = cmMomentRemember(nMoment,'LunarArguments',[nC,cmMeanLunarLongitude(nC),cmLunarElongation(nC), \
+                      cmSolarAnomaly(nC),cmLunarAnomaly(nC),cmMoonNode(nC),1 - .002516 * nC - .0000074 * nC**2])
+   return ArgumentsList
+# End Def
+
 def cmSumDistancePeriods (nE: float, nElongation: float, nSolarAnomaly: float, nLunarAnomaly: float, nMoonFromNode: float, nV: float, nW: float, nX: float, nY: float, nZ: float) -> float:
 #
 # Distance adjustments of the Moon from Earth
@@ -843,12 +1348,10 @@ def cmLunarDistance (nMoment: float) -> float:
 #
 # Get UTC Moment in nTimeZone
 #
-   nC = cmJulianCenturies(nMoment)
-   nElongation = cmLunarElongation(nC)
-   nSolarAnomaly = cmSolarAnomaly(nC)
-   nLunarAnomaly = cmLunarAnomaly(nC)
-   nMoonFromNode = cmMoonNode(nC)
-   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nDistance = cmMomentRecall(nMoment,'LunarDistance')
+   if nDistance is not None:
+      return nDistance
+   nC, nMeanMoon, nElongation, nSolarAnomaly, nLunarAnomaly, nMoonFromNode, nE = cmLunarArguments(nMoment)
    nCorrection = cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-20905355,0,0,1,0) \
                + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-2955968,2,0,0,0) \
                + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,48888,0,1,0,0) \
@@ -907,7 +1410,7 @@ def cmLunarDistance (nMoment: float) -> float:
                + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,4,0,-3,0) \
                + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,-1,2,0) \
                + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,8752,2,0,-1,-2)
-   return 385000560 + nCorrection
+   return cmMomentRemember(nMoment,'LunarDistance',385000560 + nCorrection)
 # End Def
 
 def cmSumLunarPeriods (nE: float, nElongation: float, nSolarAnomaly: float, nLunarAnomaly: float, nMoonFromNode: float, nV: float, nW: float, nX: float, nY: float, nZ: float) -> float:
@@ -928,13 +1431,10 @@ def cmLunarLatitude (nMoment: float) -> float:
 #
 # Return the Latitude of the Moon
 #
-   nC = cmJulianCenturies(nMoment)
-   nMeanMoon = cmMeanLunarLongitude(nC)
-   nElongation = cmLunarElongation(nC)
-   nSolarAnomaly = cmSolarAnomaly(nC)
-   nLunarAnomaly = cmLunarAnomaly(nC)
-   nMoonFromNode = cmMoonNode(nC)
-   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nLatitude = cmMomentRecall(nMoment,'LunarLatitude')
+   if nLatitude is not None:
+      return nLatitude
+   nC, nMeanMoon, nElongation, nSolarAnomaly, nLunarAnomaly, nMoonFromNode, nE = cmLunarArguments(nMoment)
    nVenus = .000175 * (cmSinDegrees(119.75 + (nC * 131.849) + nMoonFromNode) +  cmSinDegrees(119.75 + (nC * 131.849) - nMoonFromNode))
    nFlatEarth = (-.002235 * cmSinDegrees(nMeanMoon)) + (.000127 * cmSinDegrees(nMeanMoon - nLunarAnomaly)) + (-.000115 * cmSinDegrees(nMeanMoon + nLunarAnomaly))
    nExtra = .000382 * cmSinDegrees(313.45 + nC * 481266.484)
@@ -999,20 +1499,17 @@ def cmLunarLatitude (nMoment: float) -> float:
                 + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-119,1,0,-2,-1) \
                 + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,107,2,-2,0,1)
    nCorrection = .000001 * nCorrection
-   return cmCalcDegrees(nCorrection + nVenus + nFlatEarth + nExtra)
+   return cmMomentRemember(nMoment,'LunarLatitude',cmCalcDegrees(nCorrection + nVenus + nFlatEarth + nExtra))
 # End Def
 
 def cmLunarLongitude (nMoment: float) -> float:
 #
 # Return the Longitude of the Moon
 #
-   nC = cmJulianCenturies(nMoment)
-   nMeanMoon = cmMeanLunarLongitude(nC)
-   nElongation = cmLunarElongation(nC)
-   nSolarAnomaly = cmSolarAnomaly(nC)
-   nLunarAnomaly = cmLunarAnomaly(nC)
-   nMoonFromNode = cmMoonNode(nC)
-   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nLongitude = cmMomentRecall(nMoment,'LunarLongitude')
+   if nLongitude is not None:
+      return nLongitude
+   nC, nMeanMoon, nElongation, nSolarAnomaly, nLunarAnomaly, nMoonFromNode, nE = cmLunarArguments(nMoment)
    nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
    nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
    nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
@@ -1076,7 +1573,7 @@ def cmLunarLongitude (nMoment: float) -> float:
                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,327,2,-1,2,0) \
                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,299,1,1,-1,0)
    nCorrection = .000001 * nCorrection
-   return cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + cmNutation(nC))
+   return cmMomentRemember(nMoment,'LunarLongitude',cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + cmMomentNutation(nMoment)))
 # End Def
 
 def LunarDistance (nLocal: datetime, nTimezone: str) -> float:
@@ -1087,12 +1584,97 @@ def LunarDistance (nLocal: datetime, nTimezone: str) -> float:
   return cmLunarDistance(nUniversal) / 1000
 # End Def
 
+def cmDistanceSlope (fnDistance, nMoment: float) -> list:
+#
+# [Slope, Curvature] of fnDistance at nMoment from central differences
+#
+   nBefore = fnDistance(nMoment - DistanceStep)
+   nAt = fnDistance(nMoment)
+   nAfter = fnDistance(nMoment + DistanceStep)
+   return [(nAfter - nBefore) / (2 * DistanceStep),(nAfter - 2 * nAt + nBefore) / DistanceStep**2]
+# End Def
+
+def cmDistanceExtremum (fnDistance, nGuess: float, nPeriod: float, bNearest: bool) -> float:
+#
+# Moment of the minimum (bNearest) or maximum of fnDistance nearest the mean
+# moment nGuess of an orbit of nPeriod days
+#
+# Newton steps on the slope of the distance from nGuess. The extremum lies
+# within a quarter period of its mean moment, and the sign of each slope
+# narrows that bracket; a step leaving the bracket bisects it instead
+#
+   nSign = 1 if bNearest else -1
+   nLow = nGuess - nPeriod / 4
+   nHigh = nGuess + nPeriod / 4
+   nMoment = nGuess
+   for i in range(DistanceIterations):
+      nSlope, nCurvature = cmDistanceSlope(fnDistance,nMoment)
+      if nSign * nSlope < 0:
+         nLow = nMoment
+      else:
+         nHigh = nMoment
+      nNext = (nLow + nHigh) / 2
+      if nSign * nCurvature > 0 and nLow <= nMoment - nSlope / nCurvature <= nHigh:
+         nNext = nMoment - nSlope / nCurvature
+      if abs(nNext - nMoment) < DistanceTolerance:
+         return nNext
+      nMoment = nNext
+   return nMoment
+# End Def
+
+def cmDistanceExtrema (nFromMoment: float, nToMoment: float, bLunar: bool):
+#
+# Generator of [Event, Moment, Distance] for each perigee and apogee of the
+# Moon (bLunar) or perihelion and aphelion of the Earth from nFromMoment to
+# nToMoment, in order
+#
+# Moment is Universal Time and Distance is cmLunarDistance (meters) or
+# cmSolarDistance (AU). The mean anomaly is 0 at the mean nearest moment and
+# 180 at the mean farthest; each mean moment, half a mean anomalistic period
+# after the last, seeds cmDistanceExtremum
+#
+   if bLunar:
+      fnDistance, fnAnomaly, nPeriod, nNearest, nFarthest = cmLunarDistance, cmLunarAnomaly, MeanAnomalisticMonth, PERIGEE, APOGEE
+   else:
+      fnDistance, fnAnomaly, nPeriod, nNearest, nFarthest = cmSolarDistance, cmSolarAnomaly, MeanAnomalisticYear, PERIHELION, APHELION
+   nAnomaly = fnAnomaly(cmJulianCenturies(nFromMoment))
+   nMean = nFromMoment - (cmMod(nAnomaly,180) / 360) * nPeriod
+   bNearest = nAnomaly < 180
+   while True:
+      nMoment = cmDistanceExtremum(fnDistance,nMean,nPeriod,bNearest)
+      if nMoment > nToMoment:
+         return
+      if nMoment >= nFromMoment:
+         yield [nNearest if bNearest else nFarthest,nMoment,fnDistance(nMoment)]
+      nMean = nMean + nPeriod / 2
+      nMean = nMean - ((cmMod(fnAnomaly(cmJulianCenturies(nMean)) + 90,180) - 90) / 360) * nPeriod
+      bNearest = not bNearest
+# End Def
+
+def LunarDistanceExtrema (nFromDays: int, nToDays: int, nTimeZone: str):
+#
+# Generator of a DistanceExtremumRecord for each perigee and apogee of the
+# Moon from nFromDays through nToDays, Distance in Kilometers
+#
+   for nEvent, nMoment, nDistance in cmDistanceExtrema(nFromDays,nToDays + 1,True):
+      yield DistanceExtremumRecord(nEvent,cmLocalAwareFromUniversal(nMoment,nTimeZone),nDistance / 1000)
+# End Def
+
+def SolarDistanceExtrema (nFromDays: int, nToDays: int, nTimeZone: str):
+#
+# Generator of a DistanceExtremumRecord for each perihelion and aphelion of the
+# Earth from nFromDays through nToDays, Distance in Kilometers
+#
+   for nEvent, nMoment, nDistance in cmDistanceExtrema(nFromDays,nToDays + 1,False):
+      yield DistanceExtremumRecord(nEvent,cmLocalAwareFromUniversal(nMoment,nTimeZone),nDistance * 149597870.7)
+# End Def
+
 def LunarIllumination (nLocal: datetime, nTimezone: str) -> float:
 #
 # Lunar Illumination
 #
    nUniversal = DateTimeToMoment(cmUniversalAwareFromLocal(nLocal,nTimezone))
-   nMoment = cmDynamicalFromUniversal(cmUniversalFromStandard(nUniversal,cmLocalTimeZoneOffset()))
+   nMoment = cmAstroMoment(cmDynamicalFromUniversal(cmUniversalFromStandard(nUniversal,cmLocalTimeZoneOffset())))
    nSolarDistance = cmSolarDistance(nMoment) * 149597870.691
    nLunarDistance = cmLunarDistance(nMoment) / 1000
    nLunarLatitude = cmLunarLatitude(nMoment)
@@ -1214,6 +1796,77 @@ def cmNthNewMoon (nNthMoon: int) -> float:
    return cmUniversalFromDynamical(nApprox + nCorrection + nExtra + nAdditional)
 # End Def
 
+def cmLunarPhaseKernel (nMoment: float, bRate: bool = False):
+#
+# Lunar Phase as calculated by cmLunarPhase, fused into one pass
+#
+# Julian centuries and nutation are calculated once for both the lunar and
+# solar longitude and the periodic terms are summed from tables in the same
+# order as cmLunarLongitude and cmSolarLongitude, so the phase is identical.
+# The cmNthNewMoon check is only made within LunarPhaseMargin degrees of new
+# moon, the only place the two estimates can disagree by more than 180 degrees.
+#
+# When bRate is True, returns [Phase, Rate] with Rate the change of the phase
+# in degrees per day, for root finders
+#
+   nC = cmJulianCenturies(nMoment)
+   nNutation = cmNutation(nC)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = 0
+   nCorrectionRate = 0
+   for i in range(0,len(LunarLongitudeTermsList),5):
+      nV = LunarLongitudeTermsList[i]
+      nW = LunarLongitudeTermsList[i + 1]
+      nX = LunarLongitudeTermsList[i + 2]
+      nY = LunarLongitudeTermsList[i + 3]
+      nZ = LunarLongitudeTermsList[i + 4]
+      nArgument = (nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode)
+      nCorrection += nV * nE**abs(nX) * math.sin(math.radians(nArgument))
+      if bRate == True:
+         nCorrectionRate += nV * nE**abs(nX) * math.cos(math.radians(nArgument)) \
+                          * (nW * 445267.1114034 + nX * 35999.0502909 + nY * 477198.8675055 + nZ * 483202.0175233)
+   nCorrection = .000001 * nCorrection
+   nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
+   nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
+   nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
+   nLunarLongitude = cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + nNutation)
+   nSolarSum = 0
+   nSolarRate = 0
+   for i in range(0,len(SolarLongitudeTermsList),3):
+      nX = SolarLongitudeTermsList[i]
+      nY = SolarLongitudeTermsList[i + 1]
+      nZ = SolarLongitudeTermsList[i + 2]
+      nSolarSum += nX * math.sin(math.radians(nY + (nZ * nC)))
+      if bRate == True:
+         nSolarRate += nX * nZ * math.cos(math.radians(nY + (nZ * nC)))
+   nSolarLongitude = cmCalcDegrees(282.7771834 + 36000.76953744 * nC + (.000005729577951308232 * nSolarSum) + cmAberration(nC) + nNutation)
+   nPhase = cmCalcDegrees(nLunarLongitude - nSolarLongitude)
+   if nPhase < LunarPhaseMargin or nPhase > 360 - LunarPhaseMargin:
+      nMeanSynodic = cmFloor(cmRound((nMoment - NthNewMoonEpoch) / MeanSynodicMonth))
+      nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
+      if abs(nPhase - nPreferred) > 180:
+         nPhase = nPreferred
+   if bRate == False:
+      return nPhase
+#
+# Derivatives per century of the terms above, using the linear rates of the
+# fundamental arguments, converted to degrees per day
+#
+   nRadians = math.pi / 180
+   nLunarRate = 481267.88123421 \
+              + nRadians * (.000001 * nCorrectionRate \
+              + .003958 * 131.849 * cmCoSineDegrees(119.75 + (nC * 131.849)) \
+              + .000318 * 479264.29 * cmCoSineDegrees(53.09 + (nC * 479264.29)) \
+              + .001962 * (481267.88123421 - 483202.0175233) * cmCoSineDegrees(nMeanMoon - nMoonFromNode))
+   nSolarRate = 36000.76953744 + nRadians * .000005729577951308232 * nSolarRate
+   return [nPhase,(nLunarRate - nSolarRate) / 36525]
+# End Def
+
 def cmLunarPhase (nMoment: float) -> float:
 #
 # Lunar Phase
@@ -1223,16 +1876,12 @@ def cmLunarPhase (nMoment: float) -> float:
 # moon as calculated by the more precise cmNthNewMoon function.
 #
 # If it does, then an approximation based on cmNthNewMoon is
-# preferred.
+# preferred. See cmLunarPhaseKernel
 #
-   nLongitudeDifference = cmCalcDegrees(cmLunarLongitude(nMoment) - cmSolarLongitude(nMoment))
-   nNthNewMoon = cmNthNewMoon(0)
-   nMeanSynodic = cmFloor(cmRound((nMoment - nNthNewMoon) / MeanSynodicMonth))
-   nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
-   if abs(nLongitudeDifference - nPreferred) > 180:
-      return nPreferred
-   else:
-      return nLongitudeDifference
+   nPhase = cmMomentRecall(nMoment,'LunarPhase')
+   if nPhase is not None:
+      return nPhase
+   return cmMomentRemember(nMoment,'LunarPhase',cmLunarPhaseKernel(nMoment))
 # End Def
 
 def cmLunarPhaseAtOrBefore (nMoment: float, nTargetLongitude: float) -> float:
@@ -1286,7 +1935,7 @@ def cmLunarFindPhase (nFromDays: int, nToDays: int, nTargetLongitude: float) ->
          bLoop = False
       else:
          nTo = nTo - 28
-         if nFrom > nTo:
+         if nFromDays > nTo:
             bLoop = False
             nMoon = date(1,1,1).toordinal()
    return nMoon
@@ -1356,6 +2005,117 @@ def LunarLastQuarterMoonAware (nYear: int, nMonth: int, ntimezone: str) -> datet
       return datetime.fromordinal(nPhase)
 # End Def
 
+def cmEclipseCandidate (nLunation: float) -> bool:
+#
+# True when an eclipse is possible at the mean new moon (nLunation whole) or
+# full moon (nLunation + .5) nLunation lunations after the new moon of
+# January 11, 1
+#
+# The mean argument of latitude of the Moon is the nMoonArgument of
+# cmNthNewMoon; far from a node the Moon passes above or below the shadow
+#
+   nC = (nLunation - 24724) / 1236.85
+   nMoonArgument = 160.7108 + 390.67050284 * 1236.85 * nC - .0016118 * nC**2 - .00000227 * nC**3 + .000000011 * nC**4
+   return abs(cmSinDegrees(nMoonArgument)) < EclipseNodeLimit
+# End Def
+
+def cmSyzygy (nLunation: float) -> float:
+#
+# Moment (Universal Time) of the new or full moon of nLunation, as
+# cmEclipseCandidate, by Newton steps on cmLunarPhaseKernel
+#
+   nTarget = cmMod(nLunation,1) * 360
+   nMoment = NthNewMoonEpoch + nLunation * MeanSynodicMonth
+   for i in range(DistanceIterations):
+      nPhase, nRate = cmLunarPhaseKernel(nMoment,True)
+      nStep = (cmMod(nPhase - nTarget + 180,360) - 180) / nRate
+      nMoment = nMoment - nStep
+      if abs(nStep) < DistanceTolerance:
+         break
+   return nMoment
+# End Def
+
+def cmClassifyEclipse (nMoment: float, bSolar: bool) -> list:
+#
+# [Event, Moment, Magnitude] of the solar (bSolar) or lunar eclipse at the
+# syzygy nMoment, Event NO_ECLIPSE when there is none
+#
+# The Moon moves in a straight line across the Sun or the shadow of the Earth
+# near the syzygy, so the greatest eclipse is the point of that line nearest
+# the center. A lunar eclipse compares the Moon's separation from the shadow
+# axis with the umbra and penumbra, enlarged 2% for the atmosphere; Magnitude
+# is the fraction of the lunar diameter in the umbra (penumbra when
+# penumbral). A solar eclipse is central when the axis of the lunar shadow
+# meets the Earth (gamma, the distance of the axis from the center of the
+# Earth in Earth radii, below the polar radius plus the shadow radius),
+# total when the Moon then appears larger than the Sun and otherwise
+# annular; Magnitude is the fraction of the solar diameter covered
+#
+   nPhase, nRate = cmLunarPhaseKernel(nMoment,True)
+   nLatitude = cmMod(cmLunarLatitude(nMoment) + 180,360) - 180
+   nLatitudeRate = (cmMod(cmLunarLatitude(nMoment + DistanceStep) - cmLunarLatitude(nMoment - DistanceStep) + 180,360) - 180) / (2 * DistanceStep)
+   nLongitudeRate = nRate * cmCoSineDegrees(nLatitude)
+   nRateSquared = nLongitudeRate**2 + nLatitudeRate**2
+   nMoment = nMoment - nLatitude * nLatitudeRate / nRateSquared
+   nSeparation = abs(nLatitude) * abs(nLongitudeRate) / math.sqrt(nRateSquared)
+   nLunarDistance = cmLunarDistance(nMoment)
+   nSolarDistance = cmSolarDistance(nMoment)
+   nLunarParallax = cmArcSinDegrees(EarthRadius / nLunarDistance)
+   nLunarRadius = cmArcSinDegrees(.272481 * EarthRadius / nLunarDistance)
+   nSolarParallax = 8.794 / 3600 / nSolarDistance
+   nSolarRadius = 959.63 / 3600 / nSolarDistance
+   if bSolar == False:
+      nUmbra = 1.02 * (nLunarParallax + nSolarParallax - nSolarRadius)
+      nPenumbra = 1.02 * (nLunarParallax + nSolarParallax + nSolarRadius)
+      nMagnitude = (nUmbra + nLunarRadius - nSeparation) / (2 * nLunarRadius)
+      if nMagnitude >= 1:
+         return [TOTAL_LUNAR_ECLIPSE,nMoment,nMagnitude]
+      if nMagnitude > 0:
+         return [PARTIAL_LUNAR_ECLIPSE,nMoment,nMagnitude]
+      nMagnitude = (nPenumbra + nLunarRadius - nSeparation) / (2 * nLunarRadius)
+      if nMagnitude > 0:
+         return [PENUMBRAL_LUNAR_ECLIPSE,nMoment,nMagnitude]
+      return [NO_ECLIPSE,nMoment,0]
+   nGamma = cmSinDegrees(nSeparation) / cmSinDegrees(nLunarParallax)
+   nShadow = abs(nLunarRadius - nSolarRadius) / nLunarParallax
+   if nGamma < .9972 + nShadow:
+      nNearest = nLunarDistance - EarthRadius * math.sqrt(max(0,1 - nGamma**2))
+      nMagnitude = cmArcSinDegrees(.272481 * EarthRadius / nNearest) / nSolarRadius
+      if nMagnitude >= 1:
+         return [TOTAL_SOLAR_ECLIPSE,nMoment,nMagnitude]
+      return [ANNULAR_SOLAR_ECLIPSE,nMoment,nMagnitude]
+   nMagnitude = (nLunarRadius + nSolarRadius - (nSeparation - (nLunarParallax - nSolarParallax))) / (2 * nSolarRadius)
+   if nMagnitude > 0:
+      return [PARTIAL_SOLAR_ECLIPSE,nMoment,nMagnitude]
+   return [NO_ECLIPSE,nMoment,0]
+# End Def
+
+def cmEclipses (nFromMoment: float, nToMoment: float):
+#
+# Generator of [Event, Moment, Magnitude], as cmClassifyEclipse, for each
+# solar and lunar eclipse from nFromMoment to nToMoment, in order
+#
+# Every mean new and full moon is filtered by cmEclipseCandidate, and only the
+# candidates, about a quarter of them, are refined and classified
+#
+   nLunation = cmFloor((nFromMoment - NthNewMoonEpoch) / MeanSynodicMonth) - 1
+   while NthNewMoonEpoch + nLunation * MeanSynodicMonth <= nToMoment + 1:
+      if cmEclipseCandidate(nLunation):
+         nEvent, nMoment, nMagnitude = cmClassifyEclipse(cmSyzygy(nLunation),cmMod(nLunation,1) == 0)
+         if nEvent != NO_ECLIPSE and nFromMoment <= nMoment <= nToMoment:
+            yield [nEvent,nMoment,nMagnitude]
+      nLunation = nLunation + .5
+# End Def
+
+def Eclipses (nFromDays: int, nToDays: int, nTimeZone: str):
+#
+# Generator of an EclipseRecord for each solar and lunar eclipse from nFromDays
+# through nToDays, Moment the greatest eclipse in nTimeZone
+#
+   for nEvent, nMoment, nMagnitude in cmEclipses(nFromDays,nToDays + 1):
+      yield EclipseRecord(nEvent,cmLocalAwareFromUniversal(nMoment,nTimeZone),nMagnitude)
+# End Def
+
 def cmLunarParallax (nMoment: float, nLunarAltitude: float, nLatitude: float) -> float:
 #
 # Lunar Parallax
@@ -1367,7 +2127,7 @@ def cmRightAscension (nMoment: float, nLatitude: float, nLongitude: float) -> fl
 #
 # Angular distance measured eastward along the celestial equator from the vernal equinox 
 #
-   nObliquity = cmObliquity(cmJulianCenturies(nMoment))
+   nObliquity = cmMomentObliquity(nMoment)
    return cmArcTanDegrees((cmSinDegrees(nLongitude) * cmCoSineDegrees(nObliquity)) - (cmTangentDegrees(nLatitude) * cmSinDegrees(nObliquity)),cmCoSineDegrees(nLongitude))
 # End Def
 
@@ -1385,6 +2145,7 @@ def cmGeocentricLunarAltitude (nMoment: float, nLatitude: float, nLongitude: flo
 #
 # Not corrected for parallax or refraction
 #
+   nMoment = cmAstroMoment(nMoment)
    nLunarLongitude = cmLunarLongitude(nMoment)
    nLunarLatitude = cmLunarLatitude(nMoment)
    nLunarRightAscension = cmRightAscension(nMoment,nLunarLatitude,nLunarLongitude)
@@ -1405,6 +2166,7 @@ def cmTopocentricLunarAltitude (nMoment: float, nLatitude: float, nLongitude: fl
 # Correct geocentric altitude from earth center to surface
 # and adjust for parallax and refraction
 #
+   nMoment = cmAstroMoment(nMoment)
    nLunarAltitude = cmGeocentricLunarAltitude(nMoment,nLatitude,nLongitude)
    return nLunarAltitude - cmLunarParallax(nMoment,nLunarAltitude,nLatitude) + cmSolarRefraction(nElevation,nLatitude)
 # End Def
@@ -1613,544 +2375,542 @@ def MoonSetAware (nUniversalDays: int, nLatitude: float, nLongitude: float, nEle
    return MoonSetList
 # End Def
 
-pyNow = CurrentDate()
-print ("Today: " + str(pyNow))
-print ("Local Time Zone: " + str(LocalTimeZoneName()) + " Current UTC offset hours: " + str(cmLocalTimeZoneOffset()))
-print ("Solar Distance today: " + str(SolarDistance(pyNow,LocalTimeZoneName())) + " kilometers")
-print ("Lunar Distance today: " + str(LunarDistance(pyNow,LocalTimeZoneName())) + " kilometers")
-print ("Lunar Illumination today: " + str(LunarIllumination(pyNow,LocalTimeZoneName())))
-print ("Lunar Crescent today: " + str(LunarCrescent(pyNow,LocalTimeZoneName())))
-print ("Lunar Waxing today: " + str(LunarWaxing(pyNow,LocalTimeZoneName())))
-print ("New Moon at: " + str(LunarNewMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
-print ("First Quarter Moon at: " + str(LunarFirstQuarterMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
-print ("Full Moon at: " + str(LunarFullMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
-print ("Last Quarter Moon at: " + str(LunarLastQuarterMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
-print ("Spring Equinox: " + str(SeasonalEquinox (pyNow.year,SPRING)))
-print ("Summer Equinox: " + str(SeasonalEquinox (pyNow.year,SUMMER)))
-print ("Autumn Equinox: " + str(SeasonalEquinox (pyNow.year,AUTUMN)))
-print ("Winter Equinox: " + str(SeasonalEquinox (pyNow.year,WINTER)))
-#
-# For Sunrise/Sunset/Moonrise/Moonset a location profile is needed
-#
-nLocationName = 'Los Angles International Airport'
-nLocationLatitude = 33.942496     # North
-nLocationLongitude = -118.408049  # West
-nLocationTimezone = 'America/Los_Angeles'
-nLocationElevation = 38.95344  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Salt Lake City International Airport'
-nLocationTimezone = 'America/Denver'
-nLocationLatitude = 40.788393     # North
-nLocationLongitude = -111.977773  # West
-nLocationElevation = 1289.6  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Des Moines International Airport'
-nLocationLatitude = 41.500639     # North
-nLocationLongitude = -93.663072  # West
-nLocationTimezone = 'America/Chicago'
-nLocationElevation = 292  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Newport, Washington'
-nLocationLatitude = 48.188056     # North
-nLocationLongitude = -117.056944  # West
-nLocationTimezone = 'America/Los_Angeles'
-nLocationElevation = 691.896  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Miami International Airport'
-nLocationLatitude = 25.784167     # North
-nLocationLongitude = -80.290116  # West
-nLocationTimezone = 'America/New_York'
-nLocationElevation = 2.8  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Sydney Kingsford Smith Airport'
-nLocationLatitude = -33.94609833 # South
-nLocationLongitude = 151.177002  # East
-nLocationTimezone = 'Australia/Brisbane'
-nLocationElevation = 6.4008  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Minister Pistarini International Airport'
-nLocationLatitude = -34.8222 # South
-nLocationLongitude = -58.5358  # West
-nLocationTimezone = 'America/Buenos_Aires'
-nLocationElevation = 20.4216  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'London Heathrow International Airport'
-nLocationLatitude = 51.47060012817383 # North
-nLocationLongitude = -0.46194100379944  # West
-nLocationTimezone = 'Europe/London'
-nLocationElevation = 25.2984  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Henri Coanda International Airport'
-nLocationLatitude = 44.572161 # North
-nLocationLongitude = 26.102178  # East
-nLocationTimezone = 'Europe/Bucharest'
-nLocationElevation = 96  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Indira Gandhi International Airport'
-nLocationLatitude = 28.550421 # North
-nLocationLongitude = 77.121765  # East
-nLocationTimezone = 'Asia/Calcutta'
-nLocationElevation = 220  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Haneda International Airport'
-nLocationLatitude = 35.55333 # North
-nLocationLongitude = 139.78111  # East
-nLocationTimezone = 'Asia/Tokyo'
-nLocationElevation = 6  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-nLocationName = 'Fairbanks International Airport'
-nLocationLatitude = 64.815356 # North
-nLocationLongitude = -147.856667  # West
-nLocationTimezone = 'America/Anchorage'
-nLocationElevation = 131.1  # Meters
-Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunrise) != 0:
-   for i in range(len(Sunrise)):
-      print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
-else:
-   print ("Sunrise for " + nLocationName + ':  did not occur')
-print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
-Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
-if len(Sunset) != 0:
-   for i in range(len(Sunset)):
-      print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
-else:
-   print ("Sunset for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonRise) != 0:
-   for i in range(len(MoonRise)):
-      print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
-else:
-   print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
-MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
-if len(MoonSet) != 0:
-   for i in range(len(MoonSet)):
-      print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
-else:
-   print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   print ("Today: " + str(pyNow))
+   print ("Local Time Zone: " + str(LocalTimeZoneName()) + " Current UTC offset hours: " + str(cmLocalTimeZoneOffset()))
+   print ("Solar Distance today: " + str(SolarDistance(pyNow,LocalTimeZoneName())) + " kilometers")
+   print ("Lunar Distance today: " + str(LunarDistance(pyNow,LocalTimeZoneName())) + " kilometers")
+   for Extremum in LunarDistanceExtrema(pyNow.toordinal(),pyNow.toordinal() + 30,LocalTimeZoneName()):
+      print (['Perigee','Apogee'][Extremum.Event - PERIGEE] + ": " + str(Extremum.Moment) + " " + str(round(Extremum.Distance,1)) + " kilometers")
+   for Extremum in SolarDistanceExtrema(date(pyNow.year,January,1).toordinal(),date(pyNow.year,December,31).toordinal(),LocalTimeZoneName()):
+      print (['Perihelion','Aphelion'][Extremum.Event - PERIHELION] + ": " + str(Extremum.Moment) + " " + str(round(Extremum.Distance,1)) + " kilometers")
+   for Eclipse in Eclipses(pyNow.toordinal(),pyNow.toordinal() + 365,LocalTimeZoneName()):
+      print (['Total Solar','Annular Solar','Partial Solar','Total Lunar','Partial Lunar','Penumbral Lunar'][Eclipse.Event - TOTAL_SOLAR_ECLIPSE] \
+             + " Eclipse: " + str(Eclipse.Moment) + " magnitude " + str(round(Eclipse.Magnitude,3)))
+   print ("Lunar Illumination today: " + str(LunarIllumination(pyNow,LocalTimeZoneName())))
+   print ("Lunar Crescent today: " + str(LunarCrescent(pyNow,LocalTimeZoneName())))
+   print ("Lunar Waxing today: " + str(LunarWaxing(pyNow,LocalTimeZoneName())))
+   print ("New Moon at: " + str(LunarNewMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
+   print ("First Quarter Moon at: " + str(LunarFirstQuarterMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
+   print ("Full Moon at: " + str(LunarFullMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
+   print ("Last Quarter Moon at: " + str(LunarLastQuarterMoonAware(pyNow.year,pyNow.month,LocalTimeZoneName())))
+   print ("Spring Equinox: " + str(SeasonalEquinox (pyNow.year,SPRING)))
+   print ("Summer Equinox: " + str(SeasonalEquinox (pyNow.year,SUMMER)))
+   print ("Autumn Equinox: " + str(SeasonalEquinox (pyNow.year,AUTUMN)))
+   print ("Winter Equinox: " + str(SeasonalEquinox (pyNow.year,WINTER)))
+   #
+   # For Sunrise/Sunset/Moonrise/Moonset a location profile is needed
+   #
+   nLocationName = 'Los Angles International Airport'
+   nLocationLatitude = 33.942496     # North
+   nLocationLongitude = -118.408049  # West
+   nLocationTimezone = 'America/Los_Angeles'
+   nLocationElevation = 38.95344  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   for Events in SunEventsForDepressions(pyNow.toordinal(),pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation, \
+                                         [47 / 60,SUNRISE_SUNSET_TIME,CIVIL_TWILIGHT_TIME,NAUTICAL_TWILIGHT_TIME,ASTRONOMICAL_TWILIGHT_TIME]):
+      for nDepression, Morning, Evening in zip(Events.Depressions,Events.Mornings,Events.Evenings):
+         print ("Sun at " + str(round(nDepression,3)) + " degrees for " + nLocationName + ': ' + str(Morning) + ' and ' + str(Evening))
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Salt Lake City International Airport'
+   nLocationTimezone = 'America/Denver'
+   nLocationLatitude = 40.788393     # North
+   nLocationLongitude = -111.977773  # West
+   nLocationElevation = 1289.6  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Des Moines International Airport'
+   nLocationLatitude = 41.500639     # North
+   nLocationLongitude = -93.663072  # West
+   nLocationTimezone = 'America/Chicago'
+   nLocationElevation = 292  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Newport, Washington'
+   nLocationLatitude = 48.188056     # North
+   nLocationLongitude = -117.056944  # West
+   nLocationTimezone = 'America/Los_Angeles'
+   nLocationElevation = 691.896  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Miami International Airport'
+   nLocationLatitude = 25.784167     # North
+   nLocationLongitude = -80.290116  # West
+   nLocationTimezone = 'America/New_York'
+   nLocationElevation = 2.8  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Sydney Kingsford Smith Airport'
+   nLocationLatitude = -33.94609833 # South
+   nLocationLongitude = 151.177002  # East
+   nLocationTimezone = 'Australia/Brisbane'
+   nLocationElevation = 6.4008  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Minister Pistarini International Airport'
+   nLocationLatitude = -34.8222 # South
+   nLocationLongitude = -58.5358  # West
+   nLocationTimezone = 'America/Buenos_Aires'
+   nLocationElevation = 20.4216  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'London Heathrow International Airport'
+   nLocationLatitude = 51.47060012817383 # North
+   nLocationLongitude = -0.46194100379944  # West
+   nLocationTimezone = 'Europe/London'
+   nLocationElevation = 25.2984  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Henri Coanda International Airport'
+   nLocationLatitude = 44.572161 # North
+   nLocationLongitude = 26.102178  # East
+   nLocationTimezone = 'Europe/Bucharest'
+   nLocationElevation = 96  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Indira Gandhi International Airport'
+   nLocationLatitude = 28.550421 # North
+   nLocationLongitude = 77.121765  # East
+   nLocationTimezone = 'Asia/Calcutta'
+   nLocationElevation = 220  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Haneda International Airport'
+   nLocationLatitude = 35.55333 # North
+   nLocationLongitude = 139.78111  # East
+   nLocationTimezone = 'Asia/Tokyo'
+   nLocationElevation = 6  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
+   nLocationName = 'Fairbanks International Airport'
+   nLocationLatitude = 64.815356 # North
+   nLocationLongitude = -147.856667  # West
+   nLocationTimezone = 'America/Anchorage'
+   nLocationElevation = 131.1  # Meters
+   Sunrise = SunRiseTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunrise) != 0:
+      for i in range(len(Sunrise)):
+         print ("Sunrise for " + nLocationName + ': ' + str(Sunrise[i]))
+   else:
+      print ("Sunrise for " + nLocationName + ':  did not occur')
+   print ("Solar Transit: " + str(SunTransitAware(pyNow.toordinal(),nLocationLongitude,nLocationTimezone)))
+   Sunset = SunSetTimeZone(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,SUNRISE_SUNSET_TIME)
+   if len(Sunset) != 0:
+      for i in range(len(Sunset)):
+         print ("Sunset for " + nLocationName + ': ' + str(Sunset[i]))
+   else:
+      print ("Sunset for " + nLocationName + ':  did not occur')
+   for nDepression in (CIVIL_TWILIGHT_TIME,NAUTICAL_TWILIGHT_TIME,ASTRONOMICAL_TWILIGHT_TIME):
+      for Interval in cmPolarIntervals(pyNow.year,nLocationLatitude,nDepression):
+         print (str(nDepression) + " degree twilight " + ['', 'all night', 'missing'][Interval.Event] + " for " + nLocationName + ': ' \
+                + str(date.fromordinal(Interval.FromDays)) + ' to ' + str(date.fromordinal(Interval.ToDays)))
+   Dusk = SunEvent(pyNow.toordinal(),nLocationTimezone,nLocationLatitude,nLocationLongitude,nLocationElevation,CIVIL_TWILIGHT_TIME,EVENING)
+   print ("Civil Dusk for " + nLocationName + ': ' + ['at ' + str(Dusk.Moment), 'did not occur, sun above', 'did not occur, sun below'][Dusk.Event])
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Geocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Geocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonRise = MoonRiseAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonRise) != 0:
+      for i in range(len(MoonRise)):
+         print ("Topocentric Moonrise for " + nLocationName + ': ' + str(MoonRise[i]))
+   else:
+      print ("Topocentric Moonrise for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,GEOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Geocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Geocentric Moonset for " + nLocationName + ':  did not occur')
+   MoonSet = MoonSetAware(pyNow.toordinal(),nLocationLatitude,nLocationLongitude,nLocationElevation,nLocationTimezone,TOPOCENTRIC)
+   if len(MoonSet) != 0:
+      for i in range(len(MoonSet)):
+         print ("Topocentric Moonset for " + nLocationName + ': ' + str(MoonSet[i]))
+   else:
+      print ("Topocentric Moonset for " + nLocationName + ':  did not occur')
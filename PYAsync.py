@@ -0,0 +1,283 @@
+########################################################################################
+# File: PYAsync.py
+# Contents: asyncio front end for calendar conversions.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-22
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Asynchronous Calendar Service
+#
+# An AsyncCalendarService converts days dates for code running on an asyncio
+# event loop without ever running a conversion on the loop itself:
+#
+#    Service = AsyncCalendarService()
+#    ChineseDate = await Service.FromDays('Chinese',nDays)
+#    await Service.Close()
+#
+# Conversions run on a PYParallel pool (threads when the GIL is disabled,
+# processes otherwise). Requests are combined before they reach the pool:
+#
+#    Coalescing   Concurrent requests for the same calendar, day and locale
+#                 share a single conversion.
+#
+#    Batching     Requests arriving within ASYNC_BATCH_WINDOW seconds for the
+#                 same calendar and locale are sorted, and runs of neighbouring
+#                 days become one task that converts the whole run, reusing the
+#                 new years and month starts found for the first day.
+#
+#    Backpressure At most nMaxPending distinct conversions are queued. Further
+#                 requests wait for room, or raise AsyncServiceBusy after
+#                 nQueueTimeout seconds.
+#
+
+from datetime import date
+import asyncio
+import time
+import PYBahai
+import PYChinese
+import PYCoptic
+import PYHebrew
+import PYHindu
+import PYIslamic
+import PYJulian
+import PYParallel
+import PYPersian
+import PYSamaritan
+
+#
+# Global variables
+#
+
+ASYNC_BATCH_WINDOW = .002   # Seconds to collect requests before converting
+ASYNC_BATCH_GAP = 3   # Days missing between requests that still join one run
+ASYNC_MAX_RUN = 400   # Longest run of days converted by one task
+ASYNC_MAX_PENDING = 4096   # Distinct conversions queued before callers wait
+
+#
+# Calendar, *FromDays function, default Locale
+#
+# Locale is a CalendarLocale for the Hindu, Bahai, Persian and Samaritan
+# calendars, the country for Chinese and the hemisphere for Islamic
+#
+AsyncCalendarsList = [
+   'Bahai',PYBahai.BahaiFromDays,None,
+   'Chinese',PYChinese.cmChineseFromDays,PYChinese.CHINESE,
+   'Coptic',PYCoptic.CopticFromDays,None,
+   'Hebrew',PYHebrew.HebrewFromDays,None,
+   'HinduLunar',PYHindu.HinduLunarFromDays,None,
+   'HinduSolar',PYHindu.HinduSolarFromDays,None,
+   'Islamic',PYIslamic.IslamicFromDays,PYIslamic.EASTHEMISPHERE,
+   'Julian',PYJulian.JulianFromDays,None,
+   'Persian',PYPersian.PersianFromDays,None,
+   'Samaritan',PYSamaritan.SamaritanFromDays,None
+]
+
+class AsyncServiceBusy(RuntimeError):
+#
+# Raised when a request could not be queued within nQueueTimeout seconds
+#
+   pass
+# End Class
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmAsyncCalendar (sCalendar: str) -> int:
+#
+# Index of sCalendar in AsyncCalendarsList
+#
+   for i in range(0,len(AsyncCalendarsList),3):
+      if AsyncCalendarsList[i] == sCalendar:
+         return i
+   raise ValueError('Unknown calendar ' + sCalendar)
+# End Def
+
+def cmAsyncConvertRange (sCalendar: str, nFromDays: int, nToDays: int, Locale) -> list:
+#
+# Worker task: convert nFromDays through nToDays to sCalendar
+#
+   i = cmAsyncCalendar(sCalendar)
+   fnFromDays = AsyncCalendarsList[i + 1]
+   if Locale is None:
+      return [fnFromDays(nDays) for nDays in range(nFromDays,nToDays + 1)]
+   return [fnFromDays(nDays,Locale) for nDays in range(nFromDays,nToDays + 1)]
+# End Def
+
+def cmAsyncRuns (DaysList: list) -> list:
+#
+# Split sorted days dates into [From, To] runs, joining gaps of up to
+# ASYNC_BATCH_GAP days and stopping a run at ASYNC_MAX_RUN days
+#
+   RunsList = []
+   for nDays in DaysList:
+      if len(RunsList) > 0 and nDays - RunsList[-1][1] <= ASYNC_BATCH_GAP + 1 and nDays - RunsList[-1][0] < ASYNC_MAX_RUN:
+         RunsList[-1][1] = nDays
+      else:
+         RunsList.append([nDays,nDays])
+   return RunsList
+# End Def
+
+class AsyncCalendarService:
+#
+# Event loop facing conversion service, see the file header
+#
+   def __init__ (self, nWorkers: int = 0, nMode: int = PYParallel.PARALLEL_AUTO, nMaxPending: int = ASYNC_MAX_PENDING, \
+                 nQueueTimeout: float = 0):
+      self.nWorkers = PYParallel.cmParallelWorkers(nWorkers)
+      self.nMode = PYParallel.cmParallelMode(nMode)
+      self.nMaxPending = nMaxPending
+      self.nQueueTimeout = nQueueTimeout
+      self.Pending = {}   # (Calendar, Locale, Days) -> Future
+      self.Batches = {}   # (Calendar, Locale) -> [Days]
+      self.Timers = {}   # (Calendar, Locale) -> flush TimerHandle
+      self.Tasks = set()
+      self.Room = None
+      self.Statistics = {'Requests': 0, 'Coalesced': 0, 'Conversions': 0, 'Tasks': 0, 'Waited': 0, 'Busy': 0, 'Deepest': 0}
+   # End Def
+
+   async def FromDays (self, sCalendar: str, nDays: int, Locale = None):
+   #
+   # Convert nDays to sCalendar, Locale defaults to the calendar default
+   #
+      i = cmAsyncCalendar(sCalendar)
+      if Locale is None:
+         Locale = AsyncCalendarsList[i + 2]
+      self.Statistics['Requests'] = self.Statistics['Requests'] + 1
+      Key = (sCalendar,Locale,nDays)
+      if Key in self.Pending:
+         self.Statistics['Coalesced'] = self.Statistics['Coalesced'] + 1
+         return await asyncio.shield(self.Pending[Key])
+      await self.cmReserve()
+      if Key in self.Pending:   # Queued by another request while this one waited
+         self.Room.release()
+         self.Statistics['Coalesced'] = self.Statistics['Coalesced'] + 1
+         return await asyncio.shield(self.Pending[Key])
+      Loop = asyncio.get_running_loop()
+      Future = Loop.create_future()
+      self.Pending[Key] = Future
+      self.Statistics['Deepest'] = max(self.Statistics['Deepest'],len(self.Pending))
+      BatchKey = (sCalendar,Locale)
+      if BatchKey not in self.Batches:
+         self.Batches[BatchKey] = []
+         self.Timers[BatchKey] = Loop.call_later(ASYNC_BATCH_WINDOW,self.cmFlush,BatchKey)
+      self.Batches[BatchKey].append(nDays)
+      if len(self.Batches[BatchKey]) >= ASYNC_MAX_RUN:
+         self.cmFlush(BatchKey)
+      return await asyncio.shield(Future)
+   # End Def
+
+   async def RangeFromDays (self, sCalendar: str, nFromDays: int, nToDays: int, Locale = None) -> list:
+   #
+   # Convert nFromDays through nToDays, the requests are batched together
+   #
+      return await asyncio.gather(*[self.FromDays(sCalendar,nDays,Locale) for nDays in range(nFromDays,nToDays + 1)])
+   # End Def
+
+   async def cmReserve (self):
+   #
+   # Wait for room in the queue
+   #
+      if self.Room is None:
+         self.Room = asyncio.Semaphore(self.nMaxPending)
+      if self.Room.locked() == False:
+         await self.Room.acquire()
+         return
+      self.Statistics['Waited'] = self.Statistics['Waited'] + 1
+      if self.nQueueTimeout <= 0:
+         await self.Room.acquire()
+         return
+      try:
+         await asyncio.wait_for(self.Room.acquire(),self.nQueueTimeout)
+      except asyncio.TimeoutError:
+         self.Statistics['Busy'] = self.Statistics['Busy'] + 1
+         raise AsyncServiceBusy(str(len(self.Pending)) + ' conversions queued')
+   # End Def
+
+   def cmFlush (self, BatchKey):
+   #
+   # Send the collected days for BatchKey to the pool as runs, cancelling the
+   # flush timer so it cannot cut short the next batch for BatchKey
+   #
+      Timer = self.Timers.pop(BatchKey,None)
+      if Timer is not None:
+         Timer.cancel()
+      DaysList = self.Batches.pop(BatchKey,None)
+      if not DaysList:
+         return
+      sCalendar, Locale = BatchKey
+      Executor = PYParallel.cmParallelExecutor(self.nMode,self.nWorkers)
+      Loop = asyncio.get_running_loop()
+      for nFromDays, nToDays in cmAsyncRuns(sorted(DaysList)):
+         Task = Loop.run_in_executor(Executor,cmAsyncConvertRange,sCalendar,nFromDays,nToDays,Locale)
+         self.Statistics['Tasks'] = self.Statistics['Tasks'] + 1
+         self.Tasks.add(Task)
+         Task.add_done_callback(lambda Done, nFrom = nFromDays, nTo = nToDays: self.cmDeliver(Done,sCalendar,Locale,nFrom,nTo))
+   # End Def
+
+   def cmDeliver (self, Task, sCalendar: str, Locale, nFromDays: int, nToDays: int):
+   #
+   # Hand the results of a run to the requests waiting for them, the requests
+   # are cancelled when the run was cancelled
+   #
+      self.Tasks.discard(Task)
+      bCancelled = Task.cancelled()
+      Exception = None if bCancelled else Task.exception()
+      for nDays in range(nFromDays,nToDays + 1):
+         Future = self.Pending.pop((sCalendar,Locale,nDays),None)
+         if Future is None:
+            continue
+         self.Room.release()
+         if Future.done():
+            continue
+         if bCancelled:
+            Future.cancel()
+         elif Exception is not None:
+            Future.set_exception(Exception)
+         else:
+            Future.set_result(Task.result()[nDays - nFromDays])
+            self.Statistics['Conversions'] = self.Statistics['Conversions'] + 1
+   # End Def
+
+   async def Close (self):
+   #
+   # Wait for the queued conversions to finish
+   #
+      for BatchKey in list(self.Batches):
+         self.cmFlush(BatchKey)
+      if self.Tasks:
+         await asyncio.gather(*self.Tasks,return_exceptions=True)
+   # End Def
+# End Class
+
+async def cmAsyncDemo ():
+#
+# A burst of overlapping requests around today
+#
+   pyNow = CurrentDate()
+   nDays = pyNow.toordinal()
+   Service = AsyncCalendarService()
+   nStart = time.perf_counter()
+   RequestsList = []
+   for nClient in range(50):
+      for sCalendar in ['Hebrew', 'Islamic', 'Persian', 'Chinese']:
+         RequestsList.append(Service.FromDays(sCalendar,nDays + nClient % 20))
+   ResultsList = await asyncio.gather(*RequestsList)
+   print ('Requests: ' + str(len(ResultsList)) + ' in ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   print ('Hebrew today: ' + str(ResultsList[0]))
+   print ('Chinese today: ' + str(ResultsList[3]))
+   Month = await Service.RangeFromDays('Samaritan',nDays,nDays + 29)
+   print ('Samaritan in 29 days: ' + str(Month[-1]))
+   await Service.Close()
+   print ('Statistics: ' + str(Service.Statistics))
+# End Def
+
+if __name__ == '__main__':
+   print ('Today Local: ' + str(CurrentDate()))
+   asyncio.run(cmAsyncDemo())
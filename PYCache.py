@@ -0,0 +1,283 @@
+########################################################################################
+# File: PYCache.py
+# Contents: Bounded in-memory memoization of calendar primitives.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-20
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# In-Memory LRU Cache
+#
+# Molads, Hebrew new years, Chinese new years and new moons, Hindu sunrises and
+# the like are pure functions of a few integers and are called over and over
+# with the same arguments, often recursively. CacheInstall replaces those
+# functions in a calendar module with a cached version:
+#
+#    import PYHebrew, PYCache
+#    PYCache.CacheInstall(PYHebrew)
+#
+# Every function has its own least recently used cache. Budgets (the number of
+# results kept) are set per function in CacheTargetsList, larger for the
+# astronomical Chinese and Hindu primitives than for the Hebrew arithmetic,
+# and can be changed at any time with CacheResize. CacheStatistics reports hits,
+# misses and evictions, CacheClear empties one or every cache.
+#
+# Each cache is split into CACHE_STRIPES stripes by key hash, every stripe with
+# its own lock and an equal share of the budget, so threads working on
+# different dates rarely wait for each other. A lock is held only while its
+# stripe is read or changed, never while a result is computed, so recursive
+# calls are not blocked. Locks are renewed in a forked child process.
+#
+# Locales are passed to the Hindu and Bahai primitives as arguments and so are
+# part of every key. A primitive called without a Locale also keys on the
+# module default, BahaiLocale or HinduLocale. PYMemo may be installed as well, in either order.
+#
+
+from collections import OrderedDict
+from datetime import date
+import inspect
+import os
+import threading
+
+#
+# Global variables
+#
+
+CACHE_STRIPES = 16   # Independently locked parts of every cache
+CACHE_SMALL = 1024   # Cheap arithmetic primitives
+CACHE_MEDIUM = 4096
+CACHE_LARGE = 16384   # Astronomical primitives
+
+#
+# Module, Function, Budget, module values the result depends on
+#
+CacheTargetsList = [
+   'PYBahai','cmBahaiNewYearOnOrBefore',CACHE_SMALL,['BahaiLocale'],
+   'PYBahai','DaysFromBahai',CACHE_MEDIUM,['BahaiLocale'],
+   'PYChinese','cmChineseNewMoonOnOrAfter',CACHE_LARGE,[],
+   'PYChinese','cmChineseNewYearInSui',CACHE_LARGE,[],
+   'PYChinese','cmChineseNewYearOnOrBefore',CACHE_LARGE,[],
+   'PYChinese','cmChineseWinterSolsticeOnOrBefore',CACHE_LARGE,[],
+   'PYChinese','cmDaysFromChinese',CACHE_LARGE,[],
+   'PYHebrew','cmMolad',CACHE_SMALL,[],
+   'PYHebrew','cmHebrewCalendarElapsedDays',CACHE_SMALL,[],
+   'PYHebrew','cmHebrewYearLengthCorrection',CACHE_SMALL,[],
+   'PYHebrew','cmHebrewNewYear',CACHE_SMALL,[],
+   'PYHindu','cmHinduSunRise',CACHE_LARGE,['HinduLocale'],
+   'PYHindu','cmHinduSunSet',CACHE_LARGE,['HinduLocale'],
+   'PYIslamic','cmPhasisOnOrBefore',CACHE_MEDIUM,[]
+]
+
+#
+# 'Module.Function' -> [Module, fnOriginal, nBudget, ContextList, StripesList, Signature]
+#
+# Each stripe is [Results, Lock, Counts, nStripeBudget]
+#
+CacheInstalled = {}
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmCacheStripes (nBudget: int) -> list:
+#
+# Empty stripes sharing nBudget
+#
+   StripesList = []
+   for i in range(CACHE_STRIPES):
+      StripesList.append([OrderedDict(),threading.Lock(),{'Hits': 0, 'Misses': 0, 'Evictions': 0},cmCacheStripeBudget(nBudget)])
+   return StripesList
+# End Def
+
+def cmCacheStripeBudget (nBudget: int) -> int:
+#
+# Results kept by one stripe of a cache with nBudget results
+#
+   return max(1,-(-nBudget // CACHE_STRIPES))
+# End Def
+
+def cmCacheEvict (Stripe: list):
+#
+# Drop the least recently used results beyond the stripe budget
+#
+# Callers hold the stripe lock
+#
+   while len(Stripe[0]) > Stripe[3]:
+      Stripe[0].popitem(last=False)
+      Stripe[2]['Evictions'] = Stripe[2]['Evictions'] + 1
+# End Def
+
+def cmCacheArguments (Signature, Arguments: tuple, Keywords: dict) -> tuple:
+#
+# Arguments and Keywords of a call as the positional arguments of Signature,
+# defaults included, so every form of the same call shares one key
+#
+   if not Keywords and len(Arguments) == len(Signature.parameters):
+      return Arguments
+   Bound = Signature.bind(*Arguments,**Keywords)
+   Bound.apply_defaults()
+   return tuple(Bound.arguments.values())
+# End Def
+
+def cmCacheFunction (sName: str):
+#
+# Cached replacement for the installed function sName
+#
+   Entry = CacheInstalled[sName]
+   Module = Entry[0]
+   fnOriginal = Entry[1]
+   ContextList = Entry[3]
+   Signature = Entry[5]
+   def fnCache (*Arguments, **Keywords):
+      Arguments = cmCacheArguments(Signature,Arguments,Keywords)
+      if ContextList:
+         Key = Arguments + tuple(getattr(Module,sContext) for sContext in ContextList)
+      else:
+         Key = Arguments
+      Stripe = Entry[4][hash(Key) % CACHE_STRIPES]
+      Results = Stripe[0]
+      Counts = Stripe[2]
+      with Stripe[1]:
+         if Key in Results:
+            Results.move_to_end(Key)
+            Counts['Hits'] = Counts['Hits'] + 1
+            return Results[Key]
+         Counts['Misses'] = Counts['Misses'] + 1
+      Value = fnOriginal(*Arguments)
+      with Stripe[1]:
+         Results[Key] = Value
+         cmCacheEvict(Stripe)
+      return Value
+   fnCache.__name__ = fnOriginal.__name__
+   fnCache.__wrapped__ = fnOriginal
+   return fnCache
+# End Def
+
+def CacheInstall (Module) -> list:
+#
+# Replace the functions of Module listed in CacheTargetsList with cached versions
+#
+# Calls made inside the module use the cached versions as well. Returns the
+# names installed
+#
+   InstalledList = []
+   for i in range(0,len(CacheTargetsList),4):
+      if CacheTargetsList[i] != Module.__name__:
+         continue
+      sName = CacheTargetsList[i] + '.' + CacheTargetsList[i + 1]
+      if sName in CacheInstalled:
+         continue
+      fnOriginal = getattr(Module,CacheTargetsList[i + 1])
+      CacheInstalled[sName] = [Module,fnOriginal,CacheTargetsList[i + 2],CacheTargetsList[i + 3],cmCacheStripes(CacheTargetsList[i + 2]), \
+                             inspect.signature(fnOriginal)]
+      setattr(Module,CacheTargetsList[i + 1],cmCacheFunction(sName))
+      InstalledList.append(sName)
+   return InstalledList
+# End Def
+
+def CacheUninstall (Module):
+#
+# Restore the original functions of Module and drop their caches
+#
+   for sName in list(CacheInstalled):
+      Entry = CacheInstalled[sName]
+      if Entry[0] is Module:
+         setattr(Module,sName.split('.')[-1],Entry[1])
+         del CacheInstalled[sName]
+# End Def
+
+def cmCacheNames (sName: str) -> list:
+#
+# Installed names matching sName, every installed name when sName is None
+#
+   if sName is None:
+      return list(CacheInstalled)
+   if sName not in CacheInstalled:
+      raise ValueError(sName + ' is not installed')
+   return [sName]
+# End Def
+
+def CacheClear (sName: str = None):
+#
+# Empty the cache of sName ('PYHebrew.cmMolad'), or every cache
+#
+   for sCache in cmCacheNames(sName):
+      for Stripe in CacheInstalled[sCache][4]:
+         with Stripe[1]:
+            Stripe[0].clear()
+# End Def
+
+def CacheResize (nBudget: int, sName: str = None):
+#
+# Change the budget of sName, or of every cache, evicting the least recently
+# used results beyond it
+#
+   if nBudget < 1:
+      raise ValueError('nBudget must be at least 1')
+   for sCache in cmCacheNames(sName):
+      Entry = CacheInstalled[sCache]
+      Entry[2] = nBudget
+      for Stripe in Entry[4]:
+         with Stripe[1]:
+            Stripe[3] = cmCacheStripeBudget(nBudget)
+            cmCacheEvict(Stripe)
+# End Def
+
+def CacheStatistics (sName: str = None) -> dict:
+#
+# Hits, misses, evictions, size and budget by installed name
+#
+   Statistics = {}
+   for sCache in cmCacheNames(sName):
+      Entry = CacheInstalled[sCache]
+      Statistics[sCache] = {'Hits': 0, 'Misses': 0, 'Evictions': 0, 'Size': 0, 'Budget': Entry[2]}
+      for Stripe in Entry[4]:
+         with Stripe[1]:
+            for sCount in Stripe[2]:
+               Statistics[sCache][sCount] = Statistics[sCache][sCount] + Stripe[2][sCount]
+            Statistics[sCache]['Size'] = Statistics[sCache]['Size'] + len(Stripe[0])
+   return Statistics
+# End Def
+
+def cmCacheAfterFork ():
+#
+# A lock held by another thread at fork time is never released in the child
+#
+   for sName in CacheInstalled:
+      for Stripe in CacheInstalled[sName][4]:
+         Stripe[1] = threading.Lock()
+# End Def
+
+if hasattr(os,'register_at_fork'):
+   os.register_at_fork(after_in_child=cmCacheAfterFork)
+
+if __name__ == '__main__':
+   #
+   # Cache the Hebrew and Chinese calendars and time a year of dates before and after
+   #
+   import time
+   import PYChinese
+   import PYHebrew
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   nStart = time.perf_counter()
+   for nDay in range(nDays,nDays + 366):
+      PYHebrew.HebrewFromDays(nDay)
+      PYChinese.cmChineseFromDays(nDay,PYChinese.CHINESE)
+   print ('Uncached: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   print ('Installed: ' + str(CacheInstall(PYHebrew) + CacheInstall(PYChinese)))
+   for sPass in ['First', 'Second']:
+      nStart = time.perf_counter()
+      for nDay in range(nDays,nDays + 366):
+         PYHebrew.HebrewFromDays(nDay)
+         PYChinese.cmChineseFromDays(nDay,PYChinese.CHINESE)
+      print (sPass + ' pass: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   Statistics = CacheStatistics()
+   for sName in Statistics:
+      print (sName + ': ' + str(Statistics[sName]))
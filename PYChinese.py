@@ -13,6 +13,7 @@
 #
 
 import math
+from collections import namedtuple
 from datetime import date, datetime, timezone
 import pytz
 
@@ -57,6 +58,128 @@ AUTUMN = 180
 WINTER = 270
 J2000 = 730120.5   # January 1, 2000 at noon
 MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
+NthNewMoonEpoch = 11.458922815748194   # cmNthNewMoon(0), new moon of January 11, 1
+LunarPhaseMargin = 30   # Degrees from new moon beyond which cmLunarPhase never prefers cmNthNewMoon
+
+#
+# Solar longitude periodic terms X, Y, Z in the order summed by cmSolarLongitude
+#
+SolarLongitudeTermsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+
+#
+# Lunar longitude periodic terms V, W, X, Y, Z in the order summed by cmLunarLongitude
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
 
 # Description Lists
 
@@ -85,6 +208,11 @@ ChineseHolidaysList = [
    'Laba Festival',12,8,NO_RULES,
 ]
 
+#
+# Date returned by cmChineseFromDays
+#
+ChineseDateRecord = namedtuple('ChineseDateRecord', ['Cycle', 'Year', 'LeapYear', 'Month', 'LeapMonth', 'Day', 'Country'])
+
 def CurrentDate () -> date:
 #
 # Retrieve the current date
@@ -621,6 +749,77 @@ def cmNthNewMoon (nNthMoon: int) -> float:
    return cmUniversalFromDynamical(nApprox + nCorrection + nExtra + nAdditional)
 # End Def
 
+def cmLunarPhaseKernel (nMoment: float, bRate: bool = False):
+#
+# Lunar Phase as calculated by cmLunarPhase, fused into one pass
+#
+# Julian centuries and nutation are calculated once for both the lunar and
+# solar longitude and the periodic terms are summed from tables in the same
+# order as cmLunarLongitude and cmSolarLongitude, so the phase is identical.
+# The cmNthNewMoon check is only made within LunarPhaseMargin degrees of new
+# moon, the only place the two estimates can disagree by more than 180 degrees.
+#
+# When bRate is True, returns [Phase, Rate] with Rate the change of the phase
+# in degrees per day, for root finders
+#
+   nC = cmJulianCenturies(nMoment)
+   nNutation = cmNutation(nC)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = 0
+   nCorrectionRate = 0
+   for i in range(0,len(LunarLongitudeTermsList),5):
+      nV = LunarLongitudeTermsList[i]
+      nW = LunarLongitudeTermsList[i + 1]
+      nX = LunarLongitudeTermsList[i + 2]
+      nY = LunarLongitudeTermsList[i + 3]
+      nZ = LunarLongitudeTermsList[i + 4]
+      nArgument = (nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode)
+      nCorrection += nV * nE**abs(nX) * math.sin(math.radians(nArgument))
+      if bRate == True:
+         nCorrectionRate += nV * nE**abs(nX) * math.cos(math.radians(nArgument)) \
+                          * (nW * 445267.1114034 + nX * 35999.0502909 + nY * 477198.8675055 + nZ * 483202.0175233)
+   nCorrection = .000001 * nCorrection
+   nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
+   nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
+   nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
+   nLunarLongitude = cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + nNutation)
+   nSolarSum = 0
+   nSolarRate = 0
+   for i in range(0,len(SolarLongitudeTermsList),3):
+      nX = SolarLongitudeTermsList[i]
+      nY = SolarLongitudeTermsList[i + 1]
+      nZ = SolarLongitudeTermsList[i + 2]
+      nSolarSum += nX * math.sin(math.radians(nY + (nZ * nC)))
+      if bRate == True:
+         nSolarRate += nX * nZ * math.cos(math.radians(nY + (nZ * nC)))
+   nSolarLongitude = cmCalcDegrees(282.7771834 + 36000.76953744 * nC + (.000005729577951308232 * nSolarSum) + cmAberration(nC) + nNutation)
+   nPhase = cmCalcDegrees(nLunarLongitude - nSolarLongitude)
+   if nPhase < LunarPhaseMargin or nPhase > 360 - LunarPhaseMargin:
+      nMeanSynodic = cmFloor(cmRound((nMoment - NthNewMoonEpoch) / MeanSynodicMonth))
+      nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
+      if abs(nPhase - nPreferred) > 180:
+         nPhase = nPreferred
+   if bRate == False:
+      return nPhase
+#
+# Derivatives per century of the terms above, using the linear rates of the
+# fundamental arguments, converted to degrees per day
+#
+   nRadians = math.pi / 180
+   nLunarRate = 481267.88123421 \
+              + nRadians * (.000001 * nCorrectionRate \
+              + .003958 * 131.849 * cmCoSineDegrees(119.75 + (nC * 131.849)) \
+              + .000318 * 479264.29 * cmCoSineDegrees(53.09 + (nC * 479264.29)) \
+              + .001962 * (481267.88123421 - 483202.0175233) * cmCoSineDegrees(nMeanMoon - nMoonFromNode))
+   nSolarRate = 36000.76953744 + nRadians * .000005729577951308232 * nSolarRate
+   return [nPhase,(nLunarRate - nSolarRate) / 36525]
+# End Def
+
 def cmLunarPhase (nMoment: float) -> float:
 #
 # Lunar Phase
@@ -630,16 +829,9 @@ def cmLunarPhase (nMoment: float) -> float:
 # moon as calculated by the more precise cmNthNewMoon function.
 #
 # If it does, then an approximation based on cmNthNewMoon is
-# preferred.
-#
-   nLongitudeDifference = cmCalcDegrees(cmLunarLongitude(nMoment) - cmSolarLongitude(nMoment))
-   nNthNewMoon = cmNthNewMoon(0)
-   nMeanSynodic = cmFloor(cmRound((nMoment - nNthNewMoon) / MeanSynodicMonth))
-   nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
-   if abs(nLongitudeDifference - nPreferred) > 180:
-      return nPreferred
-   else:
-      return nLongitudeDifference
+# preferred. See cmLunarPhaseKernel
+#
+   return cmLunarPhaseKernel(nMoment)
 # End Def
 
 def cmNewMoonAfter (nMoment: float) -> float:
@@ -652,7 +844,7 @@ def cmNewMoonAfter (nMoment: float) -> float:
 # occasions (i.e. year 2481) when nMoment is very close to
 # the time of a new moon which are addressed.
 #
-   nN0 = cmNthNewMoon(0)
+   nN0 = NthNewMoonEpoch
    nLunarPhase = cmLunarPhase(nMoment)
 #
 # To ensure independence of the phase at the R.D. epoch,
@@ -688,7 +880,7 @@ def cmNewMoonBefore (nMoment: float) -> float:
 # occasions (i.e. year 2481) when nMoment is very close to
 # the time of a new moon which are addressed.
 #
-   nN0 = cmNthNewMoon(0)
+   nN0 = NthNewMoonEpoch
    nLunarPhase = cmLunarPhase(nMoment)
 #
 # To ensure independence of the phase at the R.D. epoch,
@@ -795,7 +987,6 @@ def cmChineseFromDays (nDays: int,nCountry):
 #
 # Given days date nDays, return the Chinese equivalent
 #
-   ChineseDate = []
    nS1 = cmChineseWinterSolsticeOnOrBefore(nDays,nCountry)
    nM12 = cmChineseNewMoonOnOrAfter(nS1 + 1,nCountry)
    nM = cmChineseNewMoonBefore(nDays + 1,nCountry)
@@ -817,14 +1008,7 @@ def cmChineseFromDays (nDays: int,nCountry):
    nCycle = cmFloor((nElaspedYears - 1) / 60) + 1
    nYear = cmAMod(nElaspedYears,60)
    nDay = nDays - nM + 1
-   ChineseDate.append(nCycle)
-   ChineseDate.append(nYear)
-   ChineseDate.append(bLeapYear)
-   ChineseDate.append(nMonth)
-   ChineseDate.append(bLeapMonth)
-   ChineseDate.append(nDay)
-   ChineseDate.append(nCountry)
-   return ChineseDate
+   return ChineseDateRecord(nCycle,nYear,bLeapYear,nMonth,bLeapMonth,nDay,nCountry)
 # End Def
 
 def cmDaysFromChinese (nCycle: int, nYear: int, nMonth: int, bLeapMonth: bool, nDay: int, nCountry: int) -> int:
@@ -1031,45 +1215,43 @@ def ChineseHolidayCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRul
    return ChineseHoliday
 # End Def
 
-#
-# Chinese Date List
-#
-#   Cycle
-#   Year
-#   Leap Year (True/False)
-#   Month
-#   Leap Month (True/False)
-#   Day
-#   Country China=0,Vietnam=1,Korea=2,Japan=3
-#
-
-pyNow = CurrentDate()
-print ('Today: ' + str(pyNow))
-nDays = pyNow.toordinal()
-print ("Today's Ordinal Days: " + str(nDays))
-ChineseDate = cmChineseFromDays(nDays,CHINESE)
-print ('Chinese date in ' + FormatChineseDate(ChineseDate))
-print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
-ChineseDate = cmChineseFromDays(nDays,VIETNAMESE)
-print ('Chinese date in ' + FormatChineseDate(ChineseDate))
-print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
-ChineseDate = cmChineseFromDays(nDays,KOREAN)
-print ('Chinese date in ' + FormatChineseDate(ChineseDate))
-print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
-ChineseDate = cmChineseFromDays(nDays,JAPANESE)
-print ('Chinese date in ' + FormatChineseDate(ChineseDate))
-print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
-print ('')
-print ('Chinese Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(ChineseHolidaysList):
-   ChineseHoliday = ChineseHolidayCalculation (ChineseHolidaysList[i+1],ChineseHolidaysList[i+2],pyNow.year,ChineseHolidaysList[i+3],CHINESE)
-   if len(ChineseHoliday) != 0:
-      print (ChineseHolidaysList[i] + ': ' + str(ChineseHoliday[0]))
-   else:
-      print (ChineseHolidaysList[i] + ': did not occur')      
-   i = i + 4
-
-
-
+if __name__ == '__main__':
+   #
+   # Chinese Date List
+   #
+   #   Cycle
+   #   Year
+   #   Leap Year (True/False)
+   #   Month
+   #   Leap Month (True/False)
+   #   Day
+   #   Country China=0,Vietnam=1,Korea=2,Japan=3
+   #
+
+   pyNow = CurrentDate()
+   print ('Today: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   print ("Today's Ordinal Days: " + str(nDays))
+   ChineseDate = cmChineseFromDays(nDays,CHINESE)
+   print ('Chinese date in ' + FormatChineseDate(ChineseDate))
+   print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
+   ChineseDate = cmChineseFromDays(nDays,VIETNAMESE)
+   print ('Chinese date in ' + FormatChineseDate(ChineseDate))
+   print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
+   ChineseDate = cmChineseFromDays(nDays,KOREAN)
+   print ('Chinese date in ' + FormatChineseDate(ChineseDate))
+   print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
+   ChineseDate = cmChineseFromDays(nDays,JAPANESE)
+   print ('Chinese date in ' + FormatChineseDate(ChineseDate))
+   print ('Days from Chinese in ' + ChineseCountry[ChineseDate[6]] + ': ' + str(cmDaysFromChinese(ChineseDate[0],ChineseDate[1],ChineseDate[3],ChineseDate[4],ChineseDate[5],ChineseDate[6])))
+   print ('')
+   print ('Chinese Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(ChineseHolidaysList):
+      ChineseHoliday = ChineseHolidayCalculation (ChineseHolidaysList[i+1],ChineseHolidaysList[i+2],pyNow.year,ChineseHolidaysList[i+3],CHINESE)
+      if len(ChineseHoliday) != 0:
+         print (ChineseHolidaysList[i] + ': ' + str(ChineseHoliday[0]))
+      else:
+         print (ChineseHolidaysList[i] + ': did not occur')      
+      i = i + 4
@@ -0,0 +1,236 @@
+########################################################################################
+# File: PYColumnar.py
+# Contents: Columnar storage of converted calendar dates.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-16
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Columnar Calendar Dates
+#
+# The *FromDays functions return one immutable record (a namedtuple such as
+# HebrewDateRecord or IslamicDateRecord) per date. For bulk output the same
+# fields are held here as parallel NumPy arrays, one per record field, using
+# the narrowest type that holds the field:
+#
+#    Days                        int32
+#    Year                        int16
+#    Month, Day, Cycle, ...      int8
+#    LeapYear, LeapMonth, ...    bool (one byte)
+#
+# A CalendarColumns holds the record type, the days dates and the columns.
+# Rows are turned back into records with ColumnarRecord or ColumnarLookup.
+#
+
+from collections import namedtuple
+from datetime import date
+import numpy as np
+
+#
+# Global variables
+#
+
+COLUMNAR_CHUNK_SIZE = 65536   # Records converted to columns at a time
+
+#
+# Column type by record field name, fields not listed are int32
+#
+ColumnTypes = {
+   'Days': np.int32,
+   'Year': np.int16,
+   'Month': np.int8,
+   'Day': np.int8,
+   'WeekDay': np.int8,
+   'Cycle': np.int8,
+   'Major': np.int8,
+   'LunarStation': np.int8,
+   'Country': np.int8,
+   'LeapYear': np.bool_,
+   'LeapMonth': np.bool_,
+   'LeapDay': np.bool_,
+   'SabbaticalYear': np.bool_
+}
+
+CalendarColumns = namedtuple('CalendarColumns', ['Record', 'Days', 'Columns'])
+
+#
+# Gregorian date, used where no calendar module record applies
+#
+GregorianDateRecord = namedtuple('GregorianDateRecord', ['Month', 'Day', 'Year', 'WeekDay'])
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def GregorianFromDays (nDays: int):
+#
+# Given a Days date, return the Gregorian date
+#
+   pyDate = date.fromordinal(nDays)
+   return GregorianDateRecord(pyDate.month,pyDate.day,pyDate.year,nDays % 7)
+# End Def
+
+def cmColumnType (sField: str):
+#
+# NumPy type used to store sField
+#
+   return ColumnTypes.get(sField,np.int32)
+# End Def
+
+def cmColumnarStore (Columns: dict, Fields, nStart: int, ChunkList) -> int:
+#
+# Copy the records in ChunkList into Columns starting at row nStart
+#
+   nEnd = nStart + len(ChunkList)
+   i = 0
+   for sField in Fields:
+      Columns[sField][nStart:nEnd] = [Row[i] for Row in ChunkList]
+      i = i + 1
+   return nEnd
+# End Def
+
+def ColumnarFromRecords (DaysArray, RecordsList) -> CalendarColumns:
+#
+# Store RecordsList, the records for the days dates in DaysArray, as columns
+#
+# Records are copied COLUMNAR_CHUNK_SIZE at a time, and a value that does not
+# fit its column type raises OverflowError rather than wrapping
+#
+   DaysArray = np.asarray(DaysArray,dtype=cmColumnType('Days'))
+   if len(RecordsList) != len(DaysArray):
+      raise ValueError('RecordsList and DaysArray lengths differ')
+   if len(RecordsList) == 0:
+      raise ValueError('RecordsList is empty')
+   Record = type(RecordsList[0])
+   Columns = {}
+   for sField in Record._fields:
+      Columns[sField] = np.empty(len(RecordsList),dtype=cmColumnType(sField))
+   nStart = 0
+   while nStart < len(RecordsList):
+      nStart = cmColumnarStore(Columns,Record._fields,nStart,RecordsList[nStart:nStart + COLUMNAR_CHUNK_SIZE])
+   return CalendarColumns(Record,DaysArray,Columns)
+# End Def
+
+def ColumnarFromDays (fnFromDays, DaysArray) -> CalendarColumns:
+#
+# Convert every days date in DaysArray with fnFromDays and store the results as columns
+#
+# fnFromDays(nDays) must return a record, for example PYHebrew.HebrewFromDays.
+# Only COLUMNAR_CHUNK_SIZE records are alive at any time
+#
+   DaysArray = np.asarray(DaysArray,dtype=cmColumnType('Days'))
+   if len(DaysArray) == 0:
+      raise ValueError('DaysArray is empty')
+   Record = type(fnFromDays(int(DaysArray[0])))
+   Columns = {}
+   for sField in Record._fields:
+      Columns[sField] = np.empty(len(DaysArray),dtype=cmColumnType(sField))
+   nStart = 0
+   while nStart < len(DaysArray):
+      ChunkList = [fnFromDays(nDays) for nDays in DaysArray[nStart:nStart + COLUMNAR_CHUNK_SIZE].tolist()]
+      nStart = cmColumnarStore(Columns,Record._fields,nStart,ChunkList)
+   return CalendarColumns(Record,DaysArray,Columns)
+# End Def
+
+def ColumnarFromArrays (Record, DaysArray, ArraysList) -> CalendarColumns:
+#
+# Store arrays already holding one field each (in Record field order) as columns
+#
+# Used with the [MonthArray, DayArray, YearArray] results of PYArithmetic.
+# Values are range checked before narrowing
+#
+   DaysArray = np.asarray(DaysArray,dtype=cmColumnType('Days'))
+   if len(ArraysList) != len(Record._fields):
+      raise ValueError('ArraysList does not match the fields of ' + Record.__name__)
+   Columns = {}
+   i = 0
+   for sField in Record._fields:
+      FieldArray = np.asarray(ArraysList[i])
+      ColumnType = cmColumnType(sField)
+      if ColumnType is not np.bool_ and FieldArray.size > 0:
+         TypeInfo = np.iinfo(ColumnType)
+         if FieldArray.min() < TypeInfo.min or FieldArray.max() > TypeInfo.max:
+            raise OverflowError(sField + ' does not fit in ' + np.dtype(ColumnType).name)
+      Columns[sField] = FieldArray.astype(ColumnType)
+      i = i + 1
+   return CalendarColumns(Record,DaysArray,Columns)
+# End Def
+
+def ColumnarLength (Calendar: CalendarColumns) -> int:
+#
+# Number of dates held
+#
+   return len(Calendar.Days)
+# End Def
+
+def ColumnarBytes (Calendar: CalendarColumns) -> int:
+#
+# Memory held by the days dates and columns
+#
+   nBytes = Calendar.Days.nbytes
+   for sField in Calendar.Columns:
+      nBytes = nBytes + Calendar.Columns[sField].nbytes
+   return nBytes
+# End Def
+
+def ColumnarRecord (Calendar: CalendarColumns, nIndex: int):
+#
+# Return row nIndex as a record
+#
+   Values = []
+   for sField in Calendar.Record._fields:
+      Values.append(Calendar.Columns[sField][nIndex].item())
+   return Calendar.Record(*Values)
+# End Def
+
+def ColumnarIndex (Calendar: CalendarColumns, nDays: int) -> int:
+#
+# Row holding days date nDays, -1 if it is not held
+#
+# Days dates are expected in ascending order. A contiguous range is
+# indexed directly, anything else is searched
+#
+   nCount = len(Calendar.Days)
+   if nCount == 0:
+      return -1
+   nFirst = int(Calendar.Days[0])
+   if int(Calendar.Days[-1]) - nFirst == nCount - 1:
+      nIndex = nDays - nFirst
+      if nIndex < 0 or nIndex >= nCount:
+         return -1
+      return nIndex
+   nIndex = int(np.searchsorted(Calendar.Days,nDays))
+   if nIndex < nCount and int(Calendar.Days[nIndex]) == nDays:
+      return nIndex
+   return -1
+# End Def
+
+def ColumnarLookup (Calendar: CalendarColumns, nDays: int):
+#
+# Return the record for days date nDays, None if it is not held
+#
+   nIndex = ColumnarIndex(Calendar,nDays)
+   if nIndex < 0:
+      return None
+   return ColumnarRecord(Calendar,nIndex)
+# End Def
+
+if __name__ == '__main__':
+   #
+   # Store a year of Gregorian dates as columns and show the memory used
+   #
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   GregorianColumns = ColumnarFromDays(GregorianFromDays,np.arange(nDays,nDays + 366))
+   print ('Dates held: ' + str(ColumnarLength(GregorianColumns)))
+   print ('Column bytes: ' + str(ColumnarBytes(GregorianColumns)))
+   for sField in GregorianColumns.Columns:
+      print (sField + ': ' + str(GregorianColumns.Columns[sField].dtype) + ' ' + str(GregorianColumns.Columns[sField][:7]))
+   print ('Today: ' + str(ColumnarLookup(GregorianColumns,nDays)))
+   print ('In 100 days: ' + str(ColumnarLookup(GregorianColumns,nDays + 100)))
@@ -0,0 +1,360 @@
+########################################################################################
+# File: PYConvert.py
+# Contents: Streaming command line batch converter.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-24
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Batch Conversion of Date Streams
+#
+# Reads Gregorian dates (2025-06-24) or days dates (739426) from CSV or NDJSON
+# files, or from stdin, and writes every row back with its dates in the chosen
+# calendars appended:
+#
+#    python PYConvert.py -c Hebrew,Islamic,Chinese dates.csv > converted.csv
+#    zcat events.ndjson.gz | python PYConvert.py -c Persian --column timestamp
+#
+# CSV rows gain a Calendar.Field column for each record field, NDJSON objects
+# gain one object per calendar. The date is taken from the column named
+# --column, or the first column (CSV) or the date or days member (NDJSON).
+# Rows whose date cannot be read are written unchanged with empty dates and
+# counted on stderr.
+#
+# Input is read and converted CONVERT_CHUNK_SIZE rows at a time, so memory use
+# does not grow with the input. Within a chunk, a date that follows the
+# previous one in the same month is found by stepping the previous record's Day
+# rather than by a new conversion (calendars in ConvertMonthLengthsList), and a
+# repeated date reuses the previous record, so sorted input converts far
+# faster than shuffled input. Unsorted input is still converted correctly.
+# PYCache is installed in every process doing conversions.
+#
+# With --workers above 1, chunks are converted by a PYParallel pool while
+# earlier chunks are written, at most CONVERT_CHUNKS_IN_FLIGHT per worker at once.
+#
+
+from collections import deque
+from datetime import date
+from itertools import chain, islice
+import argparse
+import csv
+import json
+import sys
+import time
+import PYAsync
+import PYCache
+import PYIslamic
+import PYParallel
+
+#
+# Global variables
+#
+
+CONVERT_CHUNK_SIZE = 10000   # Rows read and converted at a time
+CONVERT_CHUNKS_IN_FLIGHT = 2   # Chunks queued per worker with --workers
+
+#
+# Calendar, shortest month in days. A date at most that many days after the
+# previous date, and in the same month, is the previous record with a larger Day.
+# Chinese is not listed as its LeapYear (a leap sui) can change within a month
+#
+ConvertMonthLengthsList = [
+   'Hebrew',29,
+   'Islamic',29,
+   'Persian',29,
+   'Samaritan',29
+]
+
+ConvertFields = {}   # Calendar -> record field names
+ConvertHemispheres = {'east': PYIslamic.EASTHEMISPHERE, 'west': PYIslamic.WESTHEMISPHERE, '0': PYIslamic.EASTHEMISPHERE, '1': PYIslamic.WESTHEMISPHERE}
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmConvertMonthLength (sCalendar: str) -> int:
+#
+# Shortest month of sCalendar, 0 when records may not be stepped
+#
+   for i in range(0,len(ConvertMonthLengthsList),2):
+      if ConvertMonthLengthsList[i] == sCalendar:
+         return ConvertMonthLengthsList[i + 1]
+   return 0
+# End Def
+
+def cmConvertFields (sCalendar: str) -> list:
+#
+# Record field names of sCalendar
+#
+   if sCalendar not in ConvertFields:
+      i = PYAsync.cmAsyncCalendar(sCalendar)
+      ConvertFields[sCalendar] = list(PYAsync.cmAsyncConvertRange(sCalendar,730120,730120,PYAsync.AsyncCalendarsList[i + 2])[0]._fields)
+   return ConvertFields[sCalendar]
+# End Def
+
+def cmConvertDays (sValue) -> int:
+#
+# Days date from a days number or an ISO date (a time after the date is ignored),
+# None when sValue is neither
+#
+   if isinstance(sValue, int):
+      return sValue
+   if not isinstance(sValue, str):
+      return None
+   sValue = sValue.strip()
+   try:
+      if sValue.lstrip('-').isdigit():
+         return int(sValue)
+      return date.fromisoformat(sValue[:10]).toordinal()
+   except ValueError:
+      return None
+# End Def
+
+def cmConvertCalendar (sCalendar: str, Locale, DaysList: list) -> list:
+#
+# Records for DaysList (None entries stay None), stepping from the previous
+# record where the calendar allows
+#
+   i = PYAsync.cmAsyncCalendar(sCalendar)
+   fnFromDays = PYAsync.AsyncCalendarsList[i + 1]
+   nMonthLength = cmConvertMonthLength(sCalendar)
+   RecordsList = []
+   Previous = None
+   nPrevious = 0
+   for nDays in DaysList:
+      if nDays is None:
+         RecordsList.append(None)
+         continue
+      nStep = nDays - nPrevious
+      if Previous is not None and nStep == 0:
+         pass
+      elif Previous is not None and nStep > 0 and Previous.Day + nStep <= nMonthLength:
+         Previous = Previous._replace(Day=Previous.Day + nStep)
+      elif Locale is None:
+         Previous = fnFromDays(nDays)
+      else:
+         Previous = fnFromDays(nDays,Locale)
+      nPrevious = nDays
+      RecordsList.append(Previous)
+   return RecordsList
+# End Def
+
+def cmConvertCaches ():
+#
+# Install PYCache in the calendar modules, once per process
+#
+   for i in range(1,len(PYAsync.AsyncCalendarsList),3):
+      PYCache.CacheInstall(sys.modules[PYAsync.AsyncCalendarsList[i].__module__])
+# End Def
+
+def cmConvertChunk (CalendarsList: list, LocalesList: list, DaysList: list) -> list:
+#
+# Worker task: records for DaysList in every calendar of CalendarsList
+#
+   cmConvertCaches()
+   return [cmConvertCalendar(CalendarsList[i],LocalesList[i],DaysList) for i in range(len(CalendarsList))]
+# End Def
+
+def cmConvertLocales (CalendarsList: list, nCountry: int = None, sHemisphere: str = None, LocaleValues: list = None) -> list:
+#
+# Locale for each calendar: the Chinese country, the Islamic hemisphere (a
+# ConvertHemispheres key), a CalendarLocale built from [Latitude, Longitude,
+# Elevation, Zone] for the calendars taking one, or the calendar default
+#
+   LocalesList = []
+   for sCalendar in CalendarsList:
+      i = PYAsync.cmAsyncCalendar(sCalendar)
+      Locale = PYAsync.AsyncCalendarsList[i + 2]
+      if sCalendar == 'Chinese' and nCountry is not None:
+         Locale = nCountry
+      elif sCalendar == 'Islamic' and sHemisphere is not None:
+         Locale = ConvertHemispheres[sHemisphere]
+      elif LocaleValues is not None and sCalendar in ['Bahai', 'HinduLunar', 'HinduSolar', 'Persian', 'Samaritan']:
+         Module = sys.modules[PYAsync.AsyncCalendarsList[i + 1].__module__]
+         Locale = Module.CalendarLocale('Command line',*LocaleValues)
+      LocalesList.append(Locale)
+   return LocalesList
+# End Def
+
+def cmConvertCsvRows (Lines, sColumn: str):
+#
+# (Row, Days) for CSV lines, the header row first with Days None
+#
+   Reader = csv.reader(Lines)
+   Header = next(Reader,None)
+   if Header is None:
+      return
+   nColumn = 0
+   if sColumn is not None:
+      if sColumn.isdigit():
+         nColumn = int(sColumn)
+      elif sColumn in Header:
+         nColumn = Header.index(sColumn)
+      else:
+         raise ValueError('No column ' + sColumn)
+   if len(Header) > nColumn and cmConvertDays(Header[nColumn]) is not None:
+      yield None, None   # No header row
+      Reader = chain([Header],Reader)
+   else:
+      yield Header, None
+   for Row in Reader:
+      if len(Row) > nColumn:
+         yield Row, cmConvertDays(Row[nColumn])
+      else:
+         yield Row, None
+# End Def
+
+def cmConvertJsonRows (Lines, sColumn: str):
+#
+# (Object, Days) for NDJSON lines, blank lines are skipped
+#
+   for sLine in Lines:
+      if sLine.strip() == '':
+         continue
+      try:
+         Object = json.loads(sLine)
+      except ValueError:
+         yield {'Line': sLine.rstrip('\n')}, None
+         continue
+      if not isinstance(Object, dict):
+         yield {'Value': Object}, None
+      elif sColumn is not None:
+         yield Object, cmConvertDays(Object.get(sColumn))
+      elif 'date' in Object:
+         yield Object, cmConvertDays(Object['date'])
+      else:
+         yield Object, cmConvertDays(Object.get('days'))
+# End Def
+
+def cmConvertWrite (Writer, bJson: bool, CalendarsList: list, Chunk: list, ResultsList: list) -> int:
+#
+# Write a converted chunk, returns the rows without a date
+#
+   nMissing = 0
+   for j in range(len(Chunk)):
+      Row = Chunk[j][0]
+      if Chunk[j][1] is None:
+         nMissing = nMissing + 1
+      if bJson == True:
+         for i in range(len(CalendarsList)):
+            Record = ResultsList[i][j]
+            if Record is not None:
+               Row[CalendarsList[i]] = Record._asdict()
+            else:
+               Row[CalendarsList[i]] = None
+         Writer.write(json.dumps(Row,ensure_ascii=False) + '\n')
+      else:
+         Output = list(Row)
+         for i in range(len(CalendarsList)):
+            Record = ResultsList[i][j]
+            if Record is not None:
+               Output.extend(Record)
+            else:
+               Output.extend([''] * len(cmConvertFields(CalendarsList[i])))
+         Writer.writerow(Output)
+   return nMissing
+# End Def
+
+def ConvertStream (Lines, Output, CalendarsList: list, sFormat: str = 'auto', sColumn: str = None, nChunkSize: int = CONVERT_CHUNK_SIZE, \
+                   nWorkers: int = 1, LocalesList: list = None) -> list:
+#
+# Convert the CSV or NDJSON text Lines into Output (a text file)
+#
+# sFormat is 'csv', 'ndjson' or 'auto' (NDJSON when the first line starts with {).
+# Returns [Rows, Rows without a date]
+#
+   if LocalesList is None:
+      LocalesList = cmConvertLocales(CalendarsList)
+   Lines = iter(Lines)
+   sFirst = next(Lines,None)
+   if sFirst is None:
+      return [0,0]
+   Lines = chain([sFirst],Lines)
+   if sFormat == 'auto':
+      sFormat = 'csv'
+      if sFirst.lstrip().startswith('{'):
+         sFormat = 'ndjson'
+   bJson = sFormat == 'ndjson'
+   if bJson == True:
+      Writer = Output
+      Rows = cmConvertJsonRows(Lines,sColumn)
+   else:
+      Writer = csv.writer(Output,lineterminator='\n')
+      Rows = cmConvertCsvRows(Lines,sColumn)
+      Header = next(Rows)[0]
+      if Header is not None:
+         for sCalendar in CalendarsList:
+            Header = Header + [sCalendar + '.' + sField for sField in cmConvertFields(sCalendar)]
+         Writer.writerow(Header)
+   nRows = 0
+   nMissing = 0
+   Pending = deque()
+   Executor = None
+   if nWorkers > 1:
+      Executor = PYParallel.cmParallelExecutor(PYParallel.cmParallelMode(PYParallel.PARALLEL_AUTO),nWorkers)
+   while True:
+      Chunk = list(islice(Rows,nChunkSize))
+      if len(Chunk) == 0:
+         break
+      nRows = nRows + len(Chunk)
+      DaysList = [Entry[1] for Entry in Chunk]
+      if Executor is None:
+         nMissing = nMissing + cmConvertWrite(Writer,bJson,CalendarsList,Chunk,cmConvertChunk(CalendarsList,LocalesList,DaysList))
+         continue
+      Pending.append((Chunk,Executor.submit(cmConvertChunk,CalendarsList,LocalesList,DaysList)))
+      if len(Pending) >= nWorkers * CONVERT_CHUNKS_IN_FLIGHT:
+         Chunk, Future = Pending.popleft()
+         nMissing = nMissing + cmConvertWrite(Writer,bJson,CalendarsList,Chunk,Future.result())
+   while Pending:
+      Chunk, Future = Pending.popleft()
+      nMissing = nMissing + cmConvertWrite(Writer,bJson,CalendarsList,Chunk,Future.result())
+   return [nRows,nMissing]
+# End Def
+
+def cmConvertLines (FilesList: list):
+#
+# Lines of every file in FilesList in turn, stdin when empty or '-'
+#
+   if not FilesList:
+      FilesList = ['-']
+   for sFile in FilesList:
+      if sFile == '-':
+         yield from sys.stdin
+      else:
+         with open(sFile,newline='',encoding='utf-8') as File:
+            yield from File
+# End Def
+
+if __name__ == '__main__':
+   Parser = argparse.ArgumentParser(description='Convert streams of dates to other calendars')
+   Parser.add_argument('files',nargs='*',help='CSV or NDJSON files, stdin when none or -')
+   Parser.add_argument('-c','--calendars',default='Hebrew',help='comma separated, from: ' + \
+                       ','.join(PYAsync.AsyncCalendarsList[i] for i in range(0,len(PYAsync.AsyncCalendarsList),3)))
+   Parser.add_argument('-f','--format',choices=['auto','csv','ndjson'],default='auto')
+   Parser.add_argument('--column',help='column name or number (CSV) or member (NDJSON) holding the date')
+   Parser.add_argument('--chunk',type=int,default=CONVERT_CHUNK_SIZE,help='rows converted at a time')
+   Parser.add_argument('-w','--workers',type=int,default=1,help='worker processes, 0 for one per core')
+   Parser.add_argument('--country',type=int,help='Chinese calendar country, 0 China 1 Vietnam 2 Korea 3 Japan')
+   Parser.add_argument('--hemisphere',choices=list(ConvertHemispheres),help='Islamic hemisphere, east (0) or west (1)')
+   Parser.add_argument('--locale',help='LATITUDE,LONGITUDE,ELEVATION,ZONE for the Bahai, Hindu, Persian and Samaritan calendars')
+   Arguments = Parser.parse_args()
+   CalendarsList = Arguments.calendars.split(',')
+   LocaleValues = None
+   if Arguments.locale is not None:
+      LocaleValues = [float(sValue) for sValue in Arguments.locale.split(',')]
+   try:
+      LocalesList = cmConvertLocales(CalendarsList,Arguments.country,Arguments.hemisphere,LocaleValues)
+      nStart = time.perf_counter()
+      sys.stdout.reconfigure(newline='')
+      nRows, nMissing = ConvertStream(cmConvertLines(Arguments.files),sys.stdout,CalendarsList,Arguments.format,Arguments.column,Arguments.chunk, \
+                                      PYParallel.cmParallelWorkers(Arguments.workers),LocalesList)
+   except (ValueError, OSError) as Error:
+      sys.exit('PYConvert: ' + str(Error))
+   sys.stdout.flush()
+   nSeconds = time.perf_counter() - nStart
+   print ('Rows: ' + str(nRows) + ' without a date: ' + str(nMissing) + ' in ' + str(round(nSeconds,3)) + ' seconds',file=sys.stderr)
@@ -15,6 +15,7 @@
 # A subset of Julian date calculations are included for the calculation of Easter
 
 import math
+from collections import namedtuple
 from datetime import date
 
 #
@@ -81,6 +82,11 @@ CopticHolidaysList = [
    'Ascension',0,39,EASTER_RULES
 ]
 
+#
+# Date returned by CopticFromDays
+#
+CopticDateRecord = namedtuple('CopticDateRecord', ['Month', 'Day', 'Year'])
+
 def CurrentDate () -> date:
 #
 # Retrieve the current date
@@ -126,7 +132,7 @@ def cmJulianLeapYear (nYear: int):
       nLeapYear = True
    elif nYear == 0:
       nLeapYear = True
-   elif cmFloor(cmMod(nYear,4)) == 3:
+   elif nYear < 0 and cmFloor(cmMod(nYear,4)) == 3:
      nLeapYear = True
    return nLeapYear
 # End Def
@@ -183,11 +189,7 @@ def CopticFromDays (nDays: int):
    nYear = cmFloor((4 * (nDays - COPTIC_EPOCH) + 1463) / 1461)
    nMonth = cmFloor((nDays - DaysFromCoptic(1,1,nYear)) / 30) + 1
    nDay = nDays + 1 - DaysFromCoptic(nMonth,1,nYear)
-   CopticDate = []
-   CopticDate.append(nMonth)
-   CopticDate.append(nDay)
-   CopticDate.append(nYear)
-   return CopticDate
+   return CopticDateRecord(nMonth,nDay,nYear)
 # End Def
 
 def CopticDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: int) -> date:
@@ -211,27 +213,18 @@ def CopticDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: i
    return date.fromordinal(nCalcDays)
 # End Def
 
-pyNow = CurrentDate()
-print ('Today Local: ' + str(pyNow))
-nDays = pyNow.toordinal()
-print ("Today's Local Ordinal Days: " + str(nDays))
-CopticDate = CopticFromDays(nDays)
-print ('Coptic Date: ' + CopticMonthNames[CopticDate[0] - 1] + ' ' + str(CopticDate[1]) + ', ' + str(CopticDate[2]))
-print ('Days from Coptic: ' + str(DaysFromCoptic(CopticDate[0],CopticDate[1],CopticDate[2])))
-print ('')
-print ('Coptic Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(CopticHolidaysList):
-   print (CopticHolidaysList[i] + ': ' + str(CopticDateCalculation(CopticHolidaysList[i + 1],CopticHolidaysList[i + 2],pyNow.year,CopticHolidaysList[i + 3])))      
-   i = i + 4
-
-
-
-
-
-
-
-
-
-
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   print ("Today's Local Ordinal Days: " + str(nDays))
+   CopticDate = CopticFromDays(nDays)
+   print ('Coptic Date: ' + CopticMonthNames[CopticDate[0] - 1] + ' ' + str(CopticDate[1]) + ', ' + str(CopticDate[2]))
+   print ('Days from Coptic: ' + str(DaysFromCoptic(CopticDate[0],CopticDate[1],CopticDate[2])))
+   print ('')
+   print ('Coptic Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(CopticHolidaysList):
+      print (CopticHolidaysList[i] + ': ' + str(CopticDateCalculation(CopticHolidaysList[i + 1],CopticHolidaysList[i + 2],pyNow.year,CopticHolidaysList[i + 3])))      
+      i = i + 4
@@ -0,0 +1,658 @@
+########################################################################################
+# File: PYDimension.py
+# Contents: Calendar dimension table export and memory-mapped loading.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-18
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Calendar Dimension Table
+#
+# A dimension table holds one row per days date over a fixed range and one
+# column per calendar field, for example HebrewMonth, IslamicDay, ChineseLeapMonth
+# or HinduLunarLunarStation. Every column is a single contiguous typed array
+# (the PYColumnar types) so the table is built once, written to disk as is and
+# mapped back into memory without parsing.
+#
+# Two on-disk formats are written:
+#
+#    NumPy     A directory with one <Field>.npy file per column and a
+#              Dimension.json manifest. Loaded with numpy.load(mmap_mode='r').
+#
+#    Arrow     A single Arrow IPC file (Feather V2, uncompressed). pyarrow is
+#              used when it is installed, otherwise the file is written and read
+#              here directly. Integer columns are mapped without copying, flag
+#              columns are bit packed by Arrow and unpacked on load.
+#
+# Both formats carry DIMENSION_FORMAT_VERSION. Readers refuse any other version,
+# so a file written by one release is either read exactly or rejected.
+#
+
+from collections import namedtuple
+from datetime import date
+import json
+import mmap
+import os
+import struct
+import numpy as np
+import PYArithmetic
+import PYBahai
+import PYChinese
+import PYColumnar
+import PYCoptic
+import PYHebrew
+import PYHindu
+import PYIslamic
+import PYJulian
+import PYPersian
+import PYSamaritan
+
+try:
+   import pyarrow
+   import pyarrow.ipc
+except ImportError:
+   pyarrow = None
+
+#
+# Global variables
+#
+
+DIMENSION_FORMAT_VERSION = 1
+DIMENSION_MANIFEST = 'Dimension.json'
+DIMENSION_METADATA_PREFIX = 'PYCalendrical.'
+
+#
+# Calendars in a dimension table, in column order
+#
+DimensionCalendars = [
+   'Gregorian',
+   'Julian',
+   'Coptic',
+   'Hebrew',
+   'Islamic',
+   'Persian',
+   'Bahai',
+   'Chinese',
+   'HinduSolar',
+   'HinduLunar',
+   'Samaritan'
+]
+
+CalendarDimension = namedtuple('CalendarDimension', ['FirstDays', 'LastDays', 'Columns'])
+
+#
+# Arrow IPC constants
+#
+ARROW_MAGIC = b'ARROW1'
+ARROW_CONTINUATION = 0xFFFFFFFF
+ARROW_METADATA_V5 = 4
+ARROW_HEADER_SCHEMA = 1
+ARROW_HEADER_RECORD_BATCH = 3
+ARROW_TYPE_INT = 2
+ARROW_TYPE_BOOL = 6
+ARROW_ALIGNMENT = 8
+
+#
+# Flatbuffer items used to build Arrow metadata
+#
+FLAT_TABLE = 0
+FLAT_STRING = 1
+FLAT_VECTOR = 2
+FLAT_STRUCTS = 3
+
+#
+# Inline field formats in a flatbuffer table (struct format, size)
+#
+FlatScalarsList = [
+   'B',1,
+   'H',2,
+   'i',4,
+   'q',8
+]
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmIslamicFromDays (nDays: int):
+#
+# Islamic date for the eastern hemisphere
+#
+   return PYIslamic.IslamicFromDays(nDays,PYIslamic.EASTHEMISPHERE)
+# End Def
+
+def cmChineseFromDays (nDays: int):
+#
+# Chinese date for China
+#
+   return PYChinese.cmChineseFromDays(nDays,PYChinese.CHINESE)
+# End Def
+
+def cmDimensionCalendar (sCalendar: str, DaysArray) -> PYColumnar.CalendarColumns:
+#
+# Convert the days dates in DaysArray to sCalendar columns
+#
+# Julian, Coptic and Gregorian dates are computed over the whole array at once,
+# the other calendars one date at a time
+#
+   if sCalendar == 'Gregorian':
+      ArraysList = PYArithmetic.GregorianFromDaysArray(DaysArray)
+      ArraysList.append(PYArithmetic.GregorianWeekDayArray(DaysArray))
+      return PYColumnar.ColumnarFromArrays(PYColumnar.GregorianDateRecord,DaysArray,ArraysList)
+   elif sCalendar == 'Julian':
+      ArraysList = PYArithmetic.JulianFromDaysArray(DaysArray)
+      ArraysList.append(PYArithmetic.GregorianWeekDayArray(DaysArray))
+      ArraysList.append(PYArithmetic.JulianLeapYearArray(ArraysList[2]))
+      return PYColumnar.ColumnarFromArrays(PYJulian.JulianDateRecord,DaysArray,ArraysList)
+   elif sCalendar == 'Coptic':
+      ArraysList = PYArithmetic.CopticFromDaysArray(DaysArray)
+      return PYColumnar.ColumnarFromArrays(PYCoptic.CopticDateRecord,DaysArray,ArraysList)
+   elif sCalendar == 'Hebrew':
+      return PYColumnar.ColumnarFromDays(PYHebrew.HebrewFromDays,DaysArray)
+   elif sCalendar == 'Islamic':
+      return PYColumnar.ColumnarFromDays(cmIslamicFromDays,DaysArray)
+   elif sCalendar == 'Persian':
+      return PYColumnar.ColumnarFromDays(PYPersian.PersianFromDays,DaysArray)
+   elif sCalendar == 'Bahai':
+      return PYColumnar.ColumnarFromDays(PYBahai.BahaiFromDays,DaysArray)
+   elif sCalendar == 'Chinese':
+      return PYColumnar.ColumnarFromDays(cmChineseFromDays,DaysArray)
+   elif sCalendar == 'HinduSolar':
+      return PYColumnar.ColumnarFromDays(PYHindu.HinduSolarFromDays,DaysArray)
+   elif sCalendar == 'HinduLunar':
+      return PYColumnar.ColumnarFromDays(PYHindu.HinduLunarFromDays,DaysArray)
+   elif sCalendar == 'Samaritan':
+      return PYColumnar.ColumnarFromDays(PYSamaritan.SamaritanFromDays,DaysArray)
+   raise ValueError('Unknown calendar ' + sCalendar)
+# End Def
+
+def BuildCalendarDimension (nFromDays: int, nToDays: int, CalendarsList = None) -> CalendarDimension:
+#
+# Build the dimension table for days dates nFromDays through nToDays
+#
+# Columns are named calendar + field (HebrewMonth, PersianYear, ...) after a
+# leading Days column. CalendarsList defaults to DimensionCalendars
+#
+   if nToDays < nFromDays:
+      raise ValueError('nToDays is before nFromDays')
+   if CalendarsList is None:
+      CalendarsList = DimensionCalendars
+   DaysArray = np.arange(nFromDays,nToDays + 1,dtype=PYColumnar.cmColumnType('Days'))
+   Columns = {'Days': DaysArray}
+   for sCalendar in CalendarsList:
+      Calendar = cmDimensionCalendar(sCalendar,DaysArray)
+      for sField in Calendar.Record._fields:
+         Columns[sCalendar + sField] = Calendar.Columns[sField]
+   return CalendarDimension(nFromDays,nToDays,Columns)
+# End Def
+
+def DimensionLength (Dimension: CalendarDimension) -> int:
+#
+# Number of rows held
+#
+   return Dimension.LastDays - Dimension.FirstDays + 1
+# End Def
+
+def DimensionLookup (Dimension: CalendarDimension, nDays: int):
+#
+# Return the row for days date nDays as a dictionary of field values,
+# None if nDays is outside the table
+#
+   if nDays < Dimension.FirstDays or nDays > Dimension.LastDays:
+      return None
+   nIndex = nDays - Dimension.FirstDays
+   Row = {}
+   for sField in Dimension.Columns:
+      Row[sField] = Dimension.Columns[sField][nIndex].item()
+   return Row
+# End Def
+
+def cmDimensionCheck (Dimension: CalendarDimension, nVersion: int) -> CalendarDimension:
+#
+# Verify a loaded table is complete and in the current format
+#
+   if nVersion != DIMENSION_FORMAT_VERSION:
+      raise ValueError('Dimension format version ' + str(nVersion) + ' is not ' + str(DIMENSION_FORMAT_VERSION))
+   if 'Days' not in Dimension.Columns:
+      raise ValueError('Dimension has no Days column')
+   nRows = DimensionLength(Dimension)
+   for sField in Dimension.Columns:
+      if len(Dimension.Columns[sField]) != nRows:
+         raise ValueError('Dimension column ' + sField + ' has the wrong length')
+   return Dimension
+# End Def
+
+def DimensionSaveNumPy (Dimension: CalendarDimension, sDirectory: str):
+#
+# Write the table to sDirectory as one .npy file per column plus a manifest
+#
+# The manifest is written last so an interrupted save is never loaded
+#
+   os.makedirs(sDirectory,exist_ok=True)
+   sManifest = os.path.join(sDirectory,DIMENSION_MANIFEST)
+   if os.path.exists(sManifest):
+      os.remove(sManifest)
+   FieldsList = []
+   for sField in Dimension.Columns:
+      Column = np.ascontiguousarray(Dimension.Columns[sField])
+      np.save(os.path.join(sDirectory,sField + '.npy'),Column,allow_pickle=False)
+      FieldsList.append([sField,Column.dtype.str])
+   Manifest = {
+      'FormatVersion': DIMENSION_FORMAT_VERSION,
+      'FirstDays': Dimension.FirstDays,
+      'LastDays': Dimension.LastDays,
+      'Fields': FieldsList
+   }
+   with open(sManifest + '.tmp','w') as pyFile:
+      json.dump(Manifest,pyFile,indent=1)
+   os.replace(sManifest + '.tmp',sManifest)
+# End Def
+
+def DimensionLoadNumPy (sDirectory: str) -> CalendarDimension:
+#
+# Map a table written by DimensionSaveNumPy, columns are read-only memory maps
+#
+   with open(os.path.join(sDirectory,DIMENSION_MANIFEST)) as pyFile:
+      Manifest = json.load(pyFile)
+   Columns = {}
+   for sField, sType in Manifest['Fields']:
+      Columns[sField] = np.load(os.path.join(sDirectory,sField + '.npy'),mmap_mode='r',allow_pickle=False)
+      if Columns[sField].dtype.str != sType:
+         raise ValueError('Dimension column ' + sField + ' is not ' + sType)
+   Dimension = CalendarDimension(Manifest['FirstDays'],Manifest['LastDays'],Columns)
+   return cmDimensionCheck(Dimension,Manifest['FormatVersion'])
+# End Def
+
+def cmDimensionMetadata (Dimension: CalendarDimension) -> dict:
+#
+# Arrow schema metadata for the table
+#
+   return {
+      DIMENSION_METADATA_PREFIX + 'FormatVersion': str(DIMENSION_FORMAT_VERSION),
+      DIMENSION_METADATA_PREFIX + 'FirstDays': str(Dimension.FirstDays),
+      DIMENSION_METADATA_PREFIX + 'LastDays': str(Dimension.LastDays)
+   }
+# End Def
+
+def cmDimensionFromMetadata (Metadata: dict, Columns: dict) -> CalendarDimension:
+#
+# Rebuild the table from Arrow schema metadata and the loaded columns
+#
+   try:
+      nVersion = int(Metadata[DIMENSION_METADATA_PREFIX + 'FormatVersion'])
+      nFirstDays = int(Metadata[DIMENSION_METADATA_PREFIX + 'FirstDays'])
+      nLastDays = int(Metadata[DIMENSION_METADATA_PREFIX + 'LastDays'])
+   except KeyError:
+      raise ValueError('Arrow file is not a calendar dimension table')
+   return cmDimensionCheck(CalendarDimension(nFirstDays,nLastDays,Columns),nVersion)
+# End Def
+
+def cmAlign (nValue: int, nAlignment: int) -> int:
+#
+# Round nValue up to a multiple of nAlignment
+#
+   return (nValue + nAlignment - 1) // nAlignment * nAlignment
+# End Def
+
+def cmFlatScalarSize (sFormat: str) -> int:
+#
+# Size in bytes of an inline flatbuffer field
+#
+   for i in range(0,len(FlatScalarsList),2):
+      if FlatScalarsList[i] == sFormat:
+         return FlatScalarsList[i + 1]
+   raise ValueError('Unknown flatbuffer field format ' + sFormat)
+# End Def
+
+def cmFlatPad (Buffer: bytearray, nAlignment: int, nAfter: int = 0):
+#
+# Pad Buffer so that the byte nAfter bytes on is aligned to nAlignment
+#
+   while (len(Buffer) + nAfter) % nAlignment != 0:
+      Buffer.append(0)
+# End Def
+
+def cmFlatPut (Buffer: bytearray, Item) -> int:
+#
+# Append a flatbuffer item to Buffer and return its position
+#
+# Items are lists:
+#    [FLAT_TABLE, FieldsList]        FieldsList entries are None (absent),
+#                                    [format, value] with format B, H, i or q,
+#                                    or ['O', Item] for an offset to Item
+#    [FLAT_STRING, sText]
+#    [FLAT_VECTOR, ItemsList]        vector of offsets to tables
+#    [FLAT_STRUCTS, Bytes, nCount]   vector of 8-byte aligned structs
+#
+# Buffers are built front to back, so every offset points forward
+#
+   if Item[0] == FLAT_STRING:
+      Text = Item[1].encode('utf-8')
+      cmFlatPad(Buffer,4)
+      nPosition = len(Buffer)
+      Buffer += struct.pack('<I',len(Text)) + Text + b'\0'
+      return nPosition
+   elif Item[0] == FLAT_STRUCTS:
+      cmFlatPad(Buffer,8,4)
+      nPosition = len(Buffer)
+      Buffer += struct.pack('<I',Item[2]) + Item[1]
+      return nPosition
+   elif Item[0] == FLAT_VECTOR:
+      cmFlatPad(Buffer,4)
+      nPosition = len(Buffer)
+      Buffer += struct.pack('<I',len(Item[1])) + bytes(4 * len(Item[1]))
+      for i in range(len(Item[1])):
+         nChild = cmFlatPut(Buffer,Item[1][i])
+         nSlot = nPosition + 4 + 4 * i
+         struct.pack_into('<I',Buffer,nSlot,nChild - nSlot)
+      return nPosition
+   FieldsList = Item[1]
+   OffsetsList = []
+   nSize = 4
+   for Field in FieldsList:
+      if Field is None:
+         OffsetsList.append(0)
+         continue
+      nFieldSize = 4 if Field[0] == 'O' else cmFlatScalarSize(Field[0])
+      nSize = cmAlign(nSize,nFieldSize)
+      OffsetsList.append(nSize)
+      nSize = nSize + nFieldSize
+   nSize = cmAlign(nSize,4)
+   cmFlatPad(Buffer,2)
+   nVTable = len(Buffer)
+   Buffer += struct.pack('<' + 'H' * (len(OffsetsList) + 2),4 + 2 * len(OffsetsList),nSize,*OffsetsList)
+   cmFlatPad(Buffer,8)
+   nPosition = len(Buffer)
+   Buffer += bytes(nSize)
+   struct.pack_into('<i',Buffer,nPosition,nPosition - nVTable)
+   for i in range(len(FieldsList)):
+      Field = FieldsList[i]
+      if Field is not None and Field[0] != 'O':
+         struct.pack_into('<' + Field[0],Buffer,nPosition + OffsetsList[i],Field[1])
+   for i in range(len(FieldsList)):
+      Field = FieldsList[i]
+      if Field is not None and Field[0] == 'O':
+         nChild = cmFlatPut(Buffer,Field[1])
+         nSlot = nPosition + OffsetsList[i]
+         struct.pack_into('<I',Buffer,nSlot,nChild - nSlot)
+   return nPosition
+# End Def
+
+def cmFlatBuffer (Root) -> bytes:
+#
+# Serialize the table Root as a complete flatbuffer padded to ARROW_ALIGNMENT
+#
+   Buffer = bytearray(4)
+   struct.pack_into('<I',Buffer,0,cmFlatPut(Buffer,Root))
+   cmFlatPad(Buffer,ARROW_ALIGNMENT)
+   return bytes(Buffer)
+# End Def
+
+def cmFlatField (Buffer, nTable: int, nField: int):
+#
+# Position of field nField of the table at nTable, None if it is absent
+#
+   nVTable = nTable - struct.unpack_from('<i',Buffer,nTable)[0]
+   if 4 + 2 * nField >= struct.unpack_from('<H',Buffer,nVTable)[0]:
+      return None
+   nOffset = struct.unpack_from('<H',Buffer,nVTable + 4 + 2 * nField)[0]
+   if nOffset == 0:
+      return None
+   return nTable + nOffset
+# End Def
+
+def cmFlatScalar (Buffer, nTable: int, nField: int, sFormat: str, nDefault: int = 0) -> int:
+#
+# Value of an inline field, nDefault if it is absent
+#
+   nPosition = cmFlatField(Buffer,nTable,nField)
+   if nPosition is None:
+      return nDefault
+   return struct.unpack_from('<' + sFormat,Buffer,nPosition)[0]
+# End Def
+
+def cmFlatObject (Buffer, nTable: int, nField: int):
+#
+# Position of the item an offset field points to, None if it is absent
+#
+   nPosition = cmFlatField(Buffer,nTable,nField)
+   if nPosition is None:
+      return None
+   return nPosition + struct.unpack_from('<I',Buffer,nPosition)[0]
+# End Def
+
+def cmFlatString (Buffer, nPosition: int) -> str:
+#
+# Flatbuffer string at nPosition
+#
+   nLength = struct.unpack_from('<I',Buffer,nPosition)[0]
+   return bytes(Buffer[nPosition + 4:nPosition + 4 + nLength]).decode('utf-8')
+# End Def
+
+def cmFlatVector (Buffer, nPosition: int) -> list:
+#
+# Positions of the tables in the offset vector at nPosition
+#
+   if nPosition is None:
+      return []
+   PositionsList = []
+   for i in range(struct.unpack_from('<I',Buffer,nPosition)[0]):
+      nSlot = nPosition + 4 + 4 * i
+      PositionsList.append(nSlot + struct.unpack_from('<I',Buffer,nSlot)[0])
+   return PositionsList
+# End Def
+
+def cmFlatStructs (Buffer, nPosition: int, sFormat: str) -> list:
+#
+# Unpack the struct vector at nPosition, one tuple per struct
+#
+   if nPosition is None:
+      return []
+   nCount = struct.unpack_from('<I',Buffer,nPosition)[0]
+   return list(struct.iter_unpack('<' + sFormat,bytes(Buffer[nPosition + 4:nPosition + 4 + nCount * struct.calcsize('<' + sFormat)])))
+# End Def
+
+def cmArrowField (sField: str, pyType: np.dtype) -> list:
+#
+# Arrow Field table for a column of pyType
+#
+   if pyType == np.bool_:
+      TypeList = [FLAT_TABLE,[]]
+      nTypeType = ARROW_TYPE_BOOL
+   else:
+      TypeList = [FLAT_TABLE,[['i',pyType.itemsize * 8],['B',1]]]
+      nTypeType = ARROW_TYPE_INT
+   return [FLAT_TABLE,[['O',[FLAT_STRING,sField]],['B',0],['B',nTypeType],['O',TypeList],None,['O',[FLAT_VECTOR,[]]]]]
+# End Def
+
+def cmArrowSchema (Dimension: CalendarDimension) -> list:
+#
+# Arrow Schema table for the table columns and metadata
+#
+   FieldsList = []
+   for sField in Dimension.Columns:
+      FieldsList.append(cmArrowField(sField,Dimension.Columns[sField].dtype))
+   MetadataList = []
+   Metadata = cmDimensionMetadata(Dimension)
+   for sKey in Metadata:
+      MetadataList.append([FLAT_TABLE,[['O',[FLAT_STRING,sKey]],['O',[FLAT_STRING,Metadata[sKey]]]]])
+   return [FLAT_TABLE,[['H',0],['O',[FLAT_VECTOR,FieldsList]],['O',[FLAT_VECTOR,MetadataList]]]]
+# End Def
+
+def cmArrowMessage (nHeaderType: int, Header: list, nBodyLength: int) -> bytes:
+#
+# Encapsulated Arrow message: continuation marker, length and flatbuffer
+#
+   Buffer = cmFlatBuffer([FLAT_TABLE,[['H',ARROW_METADATA_V5],['B',nHeaderType],['O',Header],['q',nBodyLength]]])
+   return struct.pack('<Ii',ARROW_CONTINUATION,len(Buffer)) + Buffer
+# End Def
+
+def cmArrowWrite (Dimension: CalendarDimension, sFile: str):
+#
+# Write the table as an Arrow IPC file with a single record batch
+#
+# Integer columns are written straight from their arrays, flag columns are
+# packed eight to a byte as Arrow requires
+#
+   nRows = DimensionLength(Dimension)
+   BodyList = []
+   BuffersList = []
+   NodesList = []
+   nBody = 0
+   for sField in Dimension.Columns:
+      Column = np.ascontiguousarray(Dimension.Columns[sField])
+      if Column.dtype == np.bool_:
+         Column = np.packbits(Column,bitorder='little')
+      else:
+         Column = Column.astype(Column.dtype.newbyteorder('<'),copy=False)
+      NodesList.append(struct.pack('<qq',nRows,0))
+      BuffersList.append(struct.pack('<qq',nBody,0))
+      BuffersList.append(struct.pack('<qq',nBody,Column.nbytes))
+      BodyList.append(Column)
+      nBody = cmAlign(nBody + Column.nbytes,ARROW_ALIGNMENT)
+   RecordBatch = [FLAT_TABLE,[['q',nRows],['O',[FLAT_STRUCTS,b''.join(NodesList),len(NodesList)]],['O',[FLAT_STRUCTS,b''.join(BuffersList),len(BuffersList)]]]]
+   Schema = cmArrowSchema(Dimension)
+   with open(sFile + '.tmp','wb') as pyFile:
+      pyFile.write(ARROW_MAGIC + bytes(2))
+      pyFile.write(cmArrowMessage(ARROW_HEADER_SCHEMA,Schema,0))
+      nBlock = pyFile.tell()
+      Message = cmArrowMessage(ARROW_HEADER_RECORD_BATCH,RecordBatch,nBody)
+      pyFile.write(Message)
+      for Column in BodyList:
+         pyFile.write(memoryview(Column).cast('B'))
+         pyFile.write(bytes(cmAlign(Column.nbytes,ARROW_ALIGNMENT) - Column.nbytes))
+      pyFile.write(struct.pack('<Ii',ARROW_CONTINUATION,0))
+      Block = struct.pack('<qiiq',nBlock,len(Message),0,nBody)
+      Footer = cmFlatBuffer([FLAT_TABLE,[['H',ARROW_METADATA_V5],['O',Schema],['O',[FLAT_STRUCTS,b'',0]],['O',[FLAT_STRUCTS,Block,1]]]])
+      pyFile.write(Footer)
+      pyFile.write(struct.pack('<i',len(Footer)) + ARROW_MAGIC)
+   os.replace(sFile + '.tmp',sFile)
+# End Def
+
+def cmArrowRead (sFile: str) -> CalendarDimension:
+#
+# Map an uncompressed Arrow IPC file of integer and flag columns
+#
+# Integer columns are views of the memory map, nothing is copied
+#
+   with open(sFile,'rb') as pyFile:
+      Map = mmap.mmap(pyFile.fileno(),0,access=mmap.ACCESS_READ)
+   if Map[:6] != ARROW_MAGIC or Map[-6:] != ARROW_MAGIC:
+      raise ValueError(sFile + ' is not an Arrow file')
+   nFooterLength = struct.unpack_from('<i',Map,len(Map) - 10)[0]
+   nFooter = len(Map) - 10 - nFooterLength
+   Footer = nFooter + struct.unpack_from('<I',Map,nFooter)[0]
+   Schema = cmFlatObject(Map,Footer,1)
+   FieldsList = []
+   for Field in cmFlatVector(Map,cmFlatObject(Map,Schema,1)):
+      sField = cmFlatString(Map,cmFlatObject(Map,Field,0))
+      nTypeType = cmFlatScalar(Map,Field,2,'B')
+      if nTypeType == ARROW_TYPE_BOOL:
+         pyType = np.dtype(np.bool_)
+      elif nTypeType == ARROW_TYPE_INT:
+         Type = cmFlatObject(Map,Field,3)
+         sKind = 'i' if cmFlatScalar(Map,Type,1,'B') else 'u'
+         pyType = np.dtype('<' + sKind + str(cmFlatScalar(Map,Type,0,'i') // 8))
+      else:
+         raise ValueError('Arrow column ' + sField + ' is not an integer or flag column')
+      FieldsList.append([sField,pyType])
+   Metadata = {}
+   for KeyValue in cmFlatVector(Map,cmFlatObject(Map,Schema,2)):
+      Metadata[cmFlatString(Map,cmFlatObject(Map,KeyValue,0))] = cmFlatString(Map,cmFlatObject(Map,KeyValue,1))
+   BatchesList = []
+   for nOffset, nMetadataLength, nPad, nBodyLength in cmFlatStructs(Map,cmFlatObject(Map,Footer,3),'qiiq'):
+      nMessage = nOffset + 4
+      if struct.unpack_from('<I',Map,nOffset)[0] == ARROW_CONTINUATION:
+         nMessage = nOffset + 8
+      Message = nMessage + struct.unpack_from('<I',Map,nMessage)[0]
+      if cmFlatScalar(Map,Message,1,'B') != ARROW_HEADER_RECORD_BATCH:
+         raise ValueError('Arrow block is not a record batch')
+      RecordBatch = cmFlatObject(Map,Message,2)
+      if cmFlatField(Map,RecordBatch,3) is not None:
+         raise ValueError('Compressed Arrow files are not supported')
+      nRows = cmFlatScalar(Map,RecordBatch,0,'q')
+      NodesList = cmFlatStructs(Map,cmFlatObject(Map,RecordBatch,1),'qq')
+      BuffersList = cmFlatStructs(Map,cmFlatObject(Map,RecordBatch,2),'qq')
+      nBody = nOffset + nMetadataLength
+      Batch = {}
+      for i in range(len(FieldsList)):
+         sField, pyType = FieldsList[i]
+         if NodesList[i][1] != 0:
+            raise ValueError('Arrow column ' + sField + ' has null values')
+         nStart = nBody + BuffersList[2 * i + 1][0]
+         if pyType == np.bool_:
+            Packed = np.frombuffer(Map,dtype=np.uint8,count=(nRows + 7) // 8,offset=nStart)
+            Batch[sField] = np.unpackbits(Packed,count=nRows,bitorder='little').astype(np.bool_)
+         else:
+            Batch[sField] = np.frombuffer(Map,dtype=pyType,count=nRows,offset=nStart)
+      BatchesList.append(Batch)
+   Columns = {}
+   for sField, pyType in FieldsList:
+      if len(BatchesList) == 1:
+         Columns[sField] = BatchesList[0][sField]
+      else:
+         Columns[sField] = np.concatenate([Batch[sField] for Batch in BatchesList])
+   return cmDimensionFromMetadata(Metadata,Columns)
+# End Def
+
+def DimensionSaveArrow (Dimension: CalendarDimension, sFile: str):
+#
+# Write the table to sFile as an Arrow IPC file
+#
+   if pyarrow is None:
+      cmArrowWrite(Dimension,sFile)
+      return
+   ArraysList = []
+   for sField in Dimension.Columns:
+      ArraysList.append(pyarrow.array(Dimension.Columns[sField]))
+   Table = pyarrow.Table.from_arrays(ArraysList,names=list(Dimension.Columns),metadata=cmDimensionMetadata(Dimension))
+   with pyarrow.OSFile(sFile + '.tmp','wb') as Sink:
+      with pyarrow.ipc.new_file(Sink,Table.schema) as Writer:
+         Writer.write_table(Table)
+   os.replace(sFile + '.tmp',sFile)
+# End Def
+
+def DimensionLoadArrow (sFile: str) -> CalendarDimension:
+#
+# Map an Arrow IPC file written by DimensionSaveArrow
+#
+   if pyarrow is None:
+      return cmArrowRead(sFile)
+   Table = pyarrow.ipc.open_file(pyarrow.memory_map(sFile,'r')).read_all()
+   Metadata = {}
+   if Table.schema.metadata is not None:
+      for Key in Table.schema.metadata:
+         Metadata[Key.decode('utf-8')] = Table.schema.metadata[Key].decode('utf-8')
+   Columns = {}
+   for sField in Table.column_names:
+      Column = Table.column(sField)
+      if Column.num_chunks == 1:
+         Columns[sField] = Column.chunk(0).to_numpy(zero_copy_only=False)
+      else:
+         Columns[sField] = Column.to_numpy()
+   return cmDimensionFromMetadata(Metadata,Columns)
+# End Def
+
+if __name__ == '__main__':
+   #
+   # Build a month of the dimension table, write both formats and map them back
+   #
+   import tempfile
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   Dimension = BuildCalendarDimension(nDays,nDays + 30)
+   print ('Rows: ' + str(DimensionLength(Dimension)) + ' Columns: ' + str(len(Dimension.Columns)))
+   with tempfile.TemporaryDirectory() as sDirectory:
+      DimensionSaveNumPy(Dimension,os.path.join(sDirectory,'Dimension'))
+      Loaded = DimensionLoadNumPy(os.path.join(sDirectory,'Dimension'))
+      print ('NumPy today: ' + str(DimensionLookup(Loaded,nDays)))
+      DimensionSaveArrow(Dimension,os.path.join(sDirectory,'Dimension.arrow'))
+      Loaded = DimensionLoadArrow(os.path.join(sDirectory,'Dimension.arrow'))
+      print ('Arrow in 10 days: ' + str(DimensionLookup(Loaded,nDays + 10)))
+      del Loaded
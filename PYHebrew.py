@@ -87,6 +87,7 @@ HebrewHolidaysList = [
 ShortHebrewMonths = [Iyyar,Tammuz,Elul,Tevet,AdarII]
 MonthNames = ['Nisan','Iyyar','Sivan','Tammuz','Av','Elul','Tishri','Marheshvan','Kislev','Tevet','Shevat','Adar','AdarII']
 HebrewHoliday = namedtuple('HebrewHoliday', ['Name', 'DateFound', 'Date', 'DateObserved'])
+HebrewDateRecord = namedtuple('HebrewDateRecord', ['Month', 'Day', 'Year', 'SabbaticalYear', 'LeapYear'])
 
 Nisan = 1
 Iyyar = 2
@@ -314,13 +315,7 @@ def HebrewFromDays (nDays: int):
    while nDays > DaysFromHebrew(nMonth,cmLastDayOfHebrewMonth(nMonth,nYear),nYear):
       nMonth = nMonth + 1
    nDay = nDays - DaysFromHebrew(nMonth,1,nYear) + 1
-   HebrewDate = []
-   HebrewDate.append(nMonth)
-   HebrewDate.append(nDay)
-   HebrewDate.append(nYear)
-   HebrewDate.append(cmHebrewSabbaticalYear(nYear))
-   HebrewDate.append(cmHebrewLeapYear(nYear))
-   return HebrewDate
+   return HebrewDateRecord(nMonth,nDay,nYear,cmHebrewSabbaticalYear(nYear),cmHebrewLeapYear(nYear))
 # End Def
 
 def HebrewDateCalculation (holidayName: str, nMonth: int, nDay: int, nGregorianYear: int, ThursdayRule: int, FridayRule: int, SaturdayRule: int, SundayRule: int, MondayRule: int, MarheshvanRule: int, KisLevRule: int, WeekRule: int, AfterRule: int, Weekday: int):
@@ -405,17 +400,18 @@ def FormatHebrewDate (HebrewDate) -> str:
    return  MonthNames[HebrewDate[0] - 1] + ' ' + str(HebrewDate[1]) + ', ' + str(HebrewDate[2]) + sLeapYear + sSabbaticalYear
 # End Def
 
-pyNow = CurrentDate()
-print ("Today: " + str(pyNow))
-print ("Today's Ordinal Days: " + str(pyNow.toordinal()))
-HebrewDate = HebrewFromDays (pyNow.toordinal())
-print ('Hebrew Date: ' + FormatHebrewDate(HebrewDate))
-print ("DaysFromHebrew: " + str(DaysFromHebrew(HebrewDate[0],HebrewDate[1],HebrewDate[2])))
-print ('')
-print ('Hebrew Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(HebrewHolidaysList):
-   HEBREWHoliday = HebrewDateCalculation (HebrewHolidaysList[i],HebrewHolidaysList[i + 1],HebrewHolidaysList[i + 2],pyNow.year,HebrewHolidaysList[i + 3],HebrewHolidaysList[i + 4],HebrewHolidaysList[i + 5],HebrewHolidaysList[i + 6],HebrewHolidaysList[i + 7],HebrewHolidaysList[i + 8],HebrewHolidaysList[i + 9],HebrewHolidaysList[i + 10],HebrewHolidaysList[i + 11],HebrewHolidaysList[i + 12])
-   print (HEBREWHoliday)
-   i = i + 13
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   print ("Today: " + str(pyNow))
+   print ("Today's Ordinal Days: " + str(pyNow.toordinal()))
+   HebrewDate = HebrewFromDays (pyNow.toordinal())
+   print ('Hebrew Date: ' + FormatHebrewDate(HebrewDate))
+   print ("DaysFromHebrew: " + str(DaysFromHebrew(HebrewDate[0],HebrewDate[1],HebrewDate[2])))
+   print ('')
+   print ('Hebrew Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(HebrewHolidaysList):
+      HEBREWHoliday = HebrewDateCalculation (HebrewHolidaysList[i],HebrewHolidaysList[i + 1],HebrewHolidaysList[i + 2],pyNow.year,HebrewHolidaysList[i + 3],HebrewHolidaysList[i + 4],HebrewHolidaysList[i + 5],HebrewHolidaysList[i + 6],HebrewHolidaysList[i + 7],HebrewHolidaysList[i + 8],HebrewHolidaysList[i + 9],HebrewHolidaysList[i + 10],HebrewHolidaysList[i + 11],HebrewHolidaysList[i + 12])
+      print (HEBREWHoliday)
+      i = i + 13
@@ -14,6 +14,7 @@
 
 from datetime import datetime, date
 import math
+from collections import namedtuple
 
 # Global Variables
 
@@ -26,11 +27,6 @@ HinduSynodicMonth = (29 + 7087771 / 13358334)
 HinduCreation = (HINDU_EPOCH - 1955880000 * HinduSiderealYear)
 HinduAnomalisticYear = (1577917828000 / (4320000000 - 387))
 HinduAnomalisticMonth = (1577917828 / (57753336 - 488199))
-HinduLocaleLatitude = 23.1793013
-HinduLocaleLongitude = 75.7849097             
-HinduLocaleElevation = 0
-HinduLocaleZone = 5.5
-HinduLocaleName = 'Ujjain'
 
 January = 1
 February = 2
@@ -65,6 +61,128 @@ NEWMOON = 0
 FULLMOON = 180
 VisibleHorizon = 0.8413147543981382   # Half diameter of the sun (16 minutes + 34.478885263888294 minutes for refraction)
 MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
+NthNewMoonEpoch = 11.458922815748194   # cmNthNewMoon(0), new moon of January 11, 1
+LunarPhaseMargin = 30   # Degrees from new moon beyond which cmLunarPhase never prefers cmNthNewMoon
+
+#
+# Solar longitude periodic terms X, Y, Z in the order summed by cmSolarLongitude
+#
+SolarLongitudeTermsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+
+#
+# Lunar longitude periodic terms V, W, X, Y, Z in the order summed by cmLunarLongitude
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
 GEOCENTRIC = True
 TOPOCENTRIC = False
 
@@ -78,6 +196,19 @@ HinduYogaName = ['Viskambha','Priti','Ayusman','Saubhagya','Sobhana','Atiganda',
     'Vyaghata','Harsana','Vajra','Siddhi','Vyatipata','Variyas','Parigha','Siva','Siddha','Sadhya','Subha','Sukla','Brahman', \
     'Indra','Vaidhrti']
 
+#
+# Dates returned by HinduSolarFromDays and HinduLunarFromDays
+#
+HinduSolarDateRecord = namedtuple('HinduSolarDateRecord', ['Month', 'Day', 'Year'])
+HinduLunarDateRecord = namedtuple('HinduLunarDateRecord', ['Month', 'LeapMonth', 'Day', 'LeapDay', 'Year', 'LunarStation'])
+
+#
+# Location of the sunrises and sunsets that begin Hindu days, passed as Locale
+#
+CalendarLocale = namedtuple('CalendarLocale', ['Name', 'Latitude', 'Longitude', 'Elevation', 'Zone'])
+UJJAIN = CalendarLocale('Ujjain',23.1793013,75.7849097,0,5.5)
+HinduLocale = UJJAIN   # Used when no Locale is given
+
 def CurrentDate () -> date:
 #
 # Retrieve the current date
@@ -539,9 +670,11 @@ def cmApproxMomentOfDepression (nMoment: float, nLatitude: float, nLongitude: fl
    nTry = cmSineOffset(nMoment,nLatitude,nLongitude,nDepression)
    if nDepression >= 0:
       if bEarly == MORNING:
-         nAlt = 1
+         nAlt = nDays
       else:
-         nAlt = nDays + .5
+         nAlt = nDays + 1
+   else:
+      nAlt = nDays + .5
    if abs(nTry) > 1:
       nValue = cmSineOffset(nAlt,nLatitude,nLongitude,nDepression)
    else:
@@ -597,7 +730,7 @@ def cmSunSet (nDays: int, nZone: float, nLatitude: float, nLongitude: float, nEl
    return cmDusk(nDays,nZone,nLatitude,nLongitude,nDepression + cmSolarRefraction(nElevation,nLatitude))
 # End Def
 
-def cmHinduSunRise (nDays: int) -> float:
+def cmHinduSunRise (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Hindu Sunrise
 #
@@ -605,11 +738,13 @@ def cmHinduSunRise (nDays: int) -> float:
 # instead of following the strict Hindu Surya-Siddhanta calculations which can be off by more
 # than 16 minutes
 #
-   nRise = cmSunRise(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0))
+   if Locale is None:
+      Locale = HinduLocale
+   nRise = cmSunRise(nDays,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0))
    return ((1/60) / 24) * cmRound(nRise * 1440)
 # End Def
 
-def cmHinduSunSet (nDays: int) -> float:
+def cmHinduSunSet (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Hindu Sunset
 #
@@ -617,61 +752,71 @@ def cmHinduSunSet (nDays: int) -> float:
 # instead of following the strict Hindu Surya-Siddhanta calculations which can be off by more
 # than 16 minutes
 #
-   nSet = cmSunSet(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0))
+   if Locale is None:
+      Locale = HinduLocale
+   nSet = cmSunSet(nDays,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0))
    return ((1/60) / 24) * cmRound(nSet * 1440)
 # End Def
 
-def cmDayTimeTemporalHour (nDays: int) -> float:
+def cmDayTimeTemporalHour (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Temporal or Seasonal Hour
 #
-   return (1 / 12) * (cmSunSet(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
-      - cmSunRise(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)))
+   if Locale is None:
+      Locale = HinduLocale
+   return (1 / 12) * (cmSunSet(nDays,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
+      - cmSunRise(nDays,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)))
 # End Def
 
-def cmNightTimeTemporalHour (nDays: int) -> float:
+def cmNightTimeTemporalHour (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Temporal or Seasonal Hour
 #
-   return (1 / 12) * (cmSunRise(nDays + 1,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
-      - cmSunSet(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)))
+   if Locale is None:
+      Locale = HinduLocale
+   return (1 / 12) * (cmSunRise(nDays + 1,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
+      - cmSunSet(nDays,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)))
 # End Def
 
-def cmStandardFromSunDial (nMoment: float) -> float:
+def cmStandardFromSunDial (nMoment: float, Locale: CalendarLocale = None) -> float:
 #
 # Convert Sundial time to Standard time
 #
+   if Locale is None:
+      Locale = HinduLocale
    nDate = cmFloor(nMoment)
    nHour = 24 * cmMod(nMoment,1)
    if nHour >= 6 and nHour <= 18:
-      return cmSunRise(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
-         + (nHour - 6) * cmDayTimeTemporalHour(nDate)
+      return cmSunRise(nDate,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
+         + (nHour - 6) * cmDayTimeTemporalHour(nDate,Locale)
    elif nHour < 6:
-      return cmSunSet(nDays - 1,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
-         + (nHour + 6) * cmNightTimeTemporalHour(nDate - 1)
+      return cmSunSet(nDate - 1,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
+         + (nHour + 6) * cmNightTimeTemporalHour(nDate - 1,Locale)
    else:
-      return cmSunSet(nDays,HinduLocaleZone,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
-         + (nHour - 18) * cmNightTimeTemporalHour(nDate)
+      return cmSunSet(nDate,Locale.Zone,Locale.Latitude,Locale.Longitude,Locale.Elevation,cmAngle(0,SUNRISE_SUNSET_TIME,0)) \
+         + (nHour - 18) * cmNightTimeTemporalHour(nDate,Locale)
 # End Def 
 
-def cmHinduStandardFromSundial (nMoment: float) -> float:
+def cmHinduStandardFromSundial (nMoment: float, Locale: CalendarLocale = None) -> float:
 #
 # Hindu Temporal Time
 #
+   if Locale is None:
+      Locale = HinduLocale
    nDate = cmFloor(nMoment)
    nTime = cmMod(nMoment,1)
    nQ = cmFloor(nTime * 4)
    if nQ == 0:
-      nA = cmHinduSunSet(nDate - 1)
-      nB = cmHinduSunRise(nDate)
+      nA = cmHinduSunSet(nDate - 1,Locale)
+      nB = cmHinduSunRise(nDate,Locale)
       nAdjust = -.25
    elif nQ == 3:
       nA = cmHinduSetSet(nDate)
-      nB = cmHinduSunRise(nDate + 1)
+      nB = cmHinduSunRise(nDate + 1,Locale)
       nAdjust = .75
    else:
-      nA = cmHinduSunRise(nDate)
-      nB = cmHinduSunSet(nDate)
+      nA = cmHinduSunRise(nDate,Locale)
+      nB = cmHinduSunSet(nDate,Locale)
       nAdjust = .25
    return nA + 2 * (nB - nA) * (nTime - nAdjust)
 # End Def
@@ -767,36 +912,36 @@ def cmHinduCalendarYear (nMoment: float) -> int:
    return cmRound(((nMoment - HINDU_EPOCH) / HinduSiderealYear) - (cmHinduSolarLongitude(nMoment) / 360))
 # End Def
 
-def HinduSolarFromDays (nDays: int):
+def HinduSolarFromDays (nDays: int, Locale: CalendarLocale = None):
 #
 # Given a Days date, return the Hindu Solar date (Saka Era)
 #
-   nCritical = cmHinduSunRise(nDays + 1)
+   if Locale is None:
+      Locale = HinduLocale
+   nCritical = cmHinduSunRise(nDays + 1,Locale)
    nMonth = cmHinduZodiac(nCritical)
    nYear = cmHinduCalendarYear(nCritical) - HINDU_SOLAR_ERA
    nApprox = nDays - 3 - cmMod(cmFloor(cmHinduSolarLongitude(nCritical)),30)
    bLoop = True
    while bLoop == True:
-      if cmHinduZodiac(cmHinduSunRise(nApprox + 1)) != nMonth:
+      if cmHinduZodiac(cmHinduSunRise(nApprox + 1,Locale)) != nMonth:
          nApprox = nApprox + 1
       else:
          bLoop = False
    nDay = nDays - nApprox + 1
-   HinduSolarDate = []
-   HinduSolarDate.append(nMonth)
-   HinduSolarDate.append(nDay)
-   HinduSolarDate.append(nYear)
-   return HinduSolarDate
+   return HinduSolarDateRecord(nMonth,nDay,nYear)
 # End Def
 
-def DaysFromHinduSolar (nMonth: int, nDay: int, nYear: int) -> int:
+def DaysFromHinduSolar (nMonth: int, nDay: int, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Hindu Solar Date to Days Date
 #
+   if Locale is None:
+      Locale = HinduLocale
    nBegin = cmFloor((nYear + HINDU_SOLAR_ERA + ((nMonth - 1) / 12)) * HinduSiderealYear) + HINDU_EPOCH - 3
    bLoop = True
    while bLoop == True:
-      if cmHinduZodiac(cmHinduSunRise(nBegin + 1)) != nMonth:
+      if cmHinduZodiac(cmHinduSunRise(nBegin + 1,Locale)) != nMonth:
          nBegin = nBegin + 1
       else:
          bLoop = False
@@ -817,11 +962,13 @@ def cmHinduLunarPhase (nMoment: float) -> float:
   return cmCalcDegrees(cmHinduLunarLongitude(nMoment) - cmHinduSolarLongitude(nMoment))
 # End Def
 
-def cmHinduLunarDayFromMoment (nMoment: float) -> int:
+def cmHinduLunarDayFromMoment (nMoment: float, Locale: CalendarLocale = None) -> int:
 #
 # Hindu Phase of the moon (tithi) at nMoment - returns values from 1 to 30
 #
-   return cmFloor((cmHinduLunarPhase(cmHinduSunRise(nMoment)) / 12) + 1)
+   if Locale is None:
+      Locale = HinduLocale
+   return cmFloor((cmHinduLunarPhase(cmHinduSunRise(nMoment,Locale)) / 12) + 1)
 # End Def
 
 def cmHinduNewMoonBefore (nMoment: float) -> float:
@@ -862,11 +1009,13 @@ def cmHinduNewMoonBefore (nMoment: float) -> float:
    return nNewMoment
 # End Def
 
-def cmHinduLunarStation (nDays: int) -> int:
+def cmHinduLunarStation (nDays: int, Locale: CalendarLocale = None) -> int:
 #
 # Hindu Lunar Station (naksatra)
 #
-   return cmFloor(cmHinduLunarLongitude(cmHinduSunRise(nDays)) / cmAngle(0,800,0)) + 1
+   if Locale is None:
+      Locale = HinduLocale
+   return cmFloor(cmHinduLunarLongitude(cmHinduSunRise(nDays,Locale)) / cmAngle(0,800,0)) + 1
 # End Def
 
 def cmHinduYoga (nDays: int) -> int:
@@ -876,16 +1025,18 @@ def cmHinduYoga (nDays: int) -> int:
    return cmFloor(cmMod((cmHinduSolarLongitude(nDays) + cmHinduLunarLongitude(nDays)) / cmAngle(0,800,0),27)) + 1
 # End Def
 
-def HinduLunarFromDays (nDays: int):
+def HinduLunarFromDays (nDays: int, Locale: CalendarLocale = None):
 #
 # Given a days date, return the Hindu Lunar date
 #
-   nCritical = cmHinduSunRise(nDays)
-   nDay = cmHinduLunarDayFromMoment(nCritical)
+   if Locale is None:
+      Locale = HinduLocale
+   nCritical = cmHinduSunRise(nDays,Locale)
+   nDay = cmHinduLunarDayFromMoment(nCritical,Locale)
 #
 # Check for Leap Day
 #
-   if nDay == cmHinduLunarDayFromMoment(cmHinduSunRise(nDays - 1)):
+   if nDay == cmHinduLunarDayFromMoment(cmHinduSunRise(nDays - 1,Locale),Locale):
       bLeapDay = True
    else:
       bLeapDay = False
@@ -907,14 +1058,7 @@ def HinduLunarFromDays (nDays: int):
       nYear = cmHinduCalendarYear(nDays + 180) - HINDU_LUNAR_ERA
    else:
       nYear = cmHinduCalendarYear(nDays) - HINDU_LUNAR_ERA
-   HinduLunarDate = []
-   HinduLunarDate.append(nMonth)
-   HinduLunarDate.append(bLeapMonth)
-   HinduLunarDate.append(nDay)
-   HinduLunarDate.append(bLeapDay)
-   HinduLunarDate.append(nYear)
-   HinduLunarDate.append(cmHinduLunarStation(nDays))
-   return HinduLunarDate
+   return HinduLunarDateRecord(nMonth,bLeapMonth,nDay,bLeapDay,nYear,cmHinduLunarStation(nDays,Locale))
 # End Def
 
 def cmHinduLunarOnOrBefore (nMonth1: int, bLeapMonth1: bool, nDay1: int, bLeapDay1: bool, nYear1: int, nMonth2: int, bLeapMonth2: bool, nDay2: int, bLeapDay2: bool, nYear2: int) -> bool:
@@ -936,12 +1080,14 @@ def cmHinduLunarOnOrBefore (nMonth1: int, bLeapMonth1: bool, nDay1: int, bLeapDa
    return bReturn
 # End Def
 
-def DaysFromHinduLunar (nMonth: int, bLeapMonth: bool, nDay: int, bLeapDay: bool, nYear: int) -> int:
+def DaysFromHinduLunar (nMonth: int, bLeapMonth: bool, nDay: int, bLeapDay: bool, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Given a Hindu Lunar date, return the Days date
 #
 # Rough Approximation
 #
+   if Locale is None:
+      Locale = HinduLocale
    nApprox = HINDU_EPOCH + HinduSiderealYear * (nYear + HINDU_LUNAR_ERA + (nMonth - 1) / 12)
 #
 # Solar based approximation
@@ -950,7 +1096,7 @@ def DaysFromHinduLunar (nMonth: int, bLeapMonth: bool, nDay: int, bLeapDay: bool
 #
 # Lunar Day of Solar Approximation
 #
-   nLunarDay = cmHinduLunarDayFromMoment(nSolarApprox + .25)
+   nLunarDay = cmHinduLunarDayFromMoment(nSolarApprox + .25,Locale)
 #
 # Check for month
 #
@@ -960,7 +1106,7 @@ def DaysFromHinduLunar (nMonth: int, bLeapMonth: bool, nDay: int, bLeapDay: bool
 #
 # Middle of preceding solar month
 #
-      HinduLunarDate = HinduLunarFromDays(nSolarApprox - 15)
+      HinduLunarDate = HinduLunarFromDays(nSolarApprox - 15,Locale)
       #
       # Look in preceding month
       #
@@ -978,10 +1124,10 @@ def DaysFromHinduLunar (nMonth: int, bLeapMonth: bool, nDay: int, bLeapDay: bool
 #
 # Refine Estimation
 #
-   nTau = nEstimated - cmMod3(cmHinduLunarDayFromMoment(nEstimated + .25) - nDay,-15,15)
+   nTau = nEstimated - cmMod3(cmHinduLunarDayFromMoment(nEstimated + .25,Locale) - nDay,-15,15)
    bLoop = True
    while bLoop == True:
-      nLoopDay = cmHinduLunarDayFromMoment(cmHinduSunRise(nTau))
+      nLoopDay = cmHinduLunarDayFromMoment(cmHinduSunRise(nTau,Locale),Locale)
       if nLoopDay == nDay or nLoopDay == cmAMod(nDay + 1,30):
          bLoop = False
       else:
@@ -1015,36 +1161,40 @@ def cmHinduSolarLongitudeAtOrAfter (nTargetLongitude: float, nMoment: float) ->
    return nStartMoment + ((nEndMoment - nStartMoment) * .5)
 # End Def
 
-def cmHinduLunarDayAtOrAfter (nLunarDay: float, nMoment: float) -> float:
+def cmHinduLunarDayAtOrAfter (nLunarDay: float, nMoment: float, Locale: CalendarLocale = None) -> float:
 # 
 # Moment at which nLunarDay occurred at or after nMoment
 #
-   return cmStandardFromUniversal(cmLunarPhaseAtOrAfter(nMoment,(nLunarDay - 1) * 12),HinduLocaleZone)
+   if Locale is None:
+      Locale = HinduLocale
+   return cmStandardFromUniversal(cmLunarPhaseAtOrAfter(nMoment,(nLunarDay - 1) * 12),Locale.Zone)
 # End Def
 
-def cmHinduLunarNewYear (nGregorianYear: int) -> date:
+def cmHinduLunarNewYear (nGregorianYear: int, Locale: CalendarLocale = None) -> date:
 #
 # Hindu Lunar New Year (Chandramana Ugadi)
 #
 # Lunar New Year is the (sunrise-to-sunrise) day of the last new moon before the sun reaches the fixed First
 # Point in Aries
 #
+   if Locale is None:
+      Locale = HinduLocale
    nJan1 = date(nGregorianYear,January,1).toordinal()
    nMina = cmHinduSolarLongitudeAtOrAfter(330,nJan1)
-   nNewMoon = cmHinduLunarDayAtOrAfter(1,nMina)
+   nNewMoon = cmHinduLunarDayAtOrAfter(1,nMina,Locale)
    nDays = cmFloor(nNewMoon)
-   nCritical = cmHinduSunRise(nDays)
-   if (nNewMoon >= nCritical) or (cmHinduLunarDayFromMoment(cmHinduSunRise(nDays + 1)) != 2):
+   nCritical = cmHinduSunRise(nDays,Locale)
+   if (nNewMoon >= nCritical) or (cmHinduLunarDayFromMoment(cmHinduSunRise(nDays + 1,Locale),Locale) != 2):
       nDays = nDays + 1
 #
 # Check for a leap month where the Hindu Lunar New Year is observed in the following month
 #
-   HinduLunarDate = HinduLunarFromDays(nDays)
+   HinduLunarDate = HinduLunarFromDays(nDays,Locale)
    if HinduLunarDate[1] == True:
       nNewMoon = cmFloor(cmHinduNewMoonBefore(nDays + 35))
       nDays = cmFloor(nNewMoon)
-      nCritical = cmHinduSunRise(nDays)
-      if (nNewMoon >= nCritical) or (cmHinduLunarDayFromMoment(cmHinduSunRise(nDays + 1)) != 2):
+      nCritical = cmHinduSunRise(nDays,Locale)
+      if (nNewMoon >= nCritical) or (cmHinduLunarDayFromMoment(cmHinduSunRise(nDays + 1,Locale),Locale) != 2):
          nDays = nDays + 1
    return date.fromordinal(nDays)
 # End Def
@@ -1255,6 +1405,77 @@ def cmNthNewMoon (nNthMoon: int) -> float:
    return cmUniversalFromDynamical(nApprox + nCorrection + nExtra + nAdditional)
 # End Def
 
+def cmLunarPhaseKernel (nMoment: float, bRate: bool = False):
+#
+# Lunar Phase as calculated by cmLunarPhase, fused into one pass
+#
+# Julian centuries and nutation are calculated once for both the lunar and
+# solar longitude and the periodic terms are summed from tables in the same
+# order as cmLunarLongitude and cmSolarLongitude, so the phase is identical.
+# The cmNthNewMoon check is only made within LunarPhaseMargin degrees of new
+# moon, the only place the two estimates can disagree by more than 180 degrees.
+#
+# When bRate is True, returns [Phase, Rate] with Rate the change of the phase
+# in degrees per day, for root finders
+#
+   nC = cmJulianCenturies(nMoment)
+   nNutation = cmNutation(nC)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = 0
+   nCorrectionRate = 0
+   for i in range(0,len(LunarLongitudeTermsList),5):
+      nV = LunarLongitudeTermsList[i]
+      nW = LunarLongitudeTermsList[i + 1]
+      nX = LunarLongitudeTermsList[i + 2]
+      nY = LunarLongitudeTermsList[i + 3]
+      nZ = LunarLongitudeTermsList[i + 4]
+      nArgument = (nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode)
+      nCorrection += nV * nE**abs(nX) * math.sin(math.radians(nArgument))
+      if bRate == True:
+         nCorrectionRate += nV * nE**abs(nX) * math.cos(math.radians(nArgument)) \
+                          * (nW * 445267.1114034 + nX * 35999.0502909 + nY * 477198.8675055 + nZ * 483202.0175233)
+   nCorrection = .000001 * nCorrection
+   nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
+   nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
+   nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
+   nLunarLongitude = cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + nNutation)
+   nSolarSum = 0
+   nSolarRate = 0
+   for i in range(0,len(SolarLongitudeTermsList),3):
+      nX = SolarLongitudeTermsList[i]
+      nY = SolarLongitudeTermsList[i + 1]
+      nZ = SolarLongitudeTermsList[i + 2]
+      nSolarSum += nX * math.sin(math.radians(nY + (nZ * nC)))
+      if bRate == True:
+         nSolarRate += nX * nZ * math.cos(math.radians(nY + (nZ * nC)))
+   nSolarLongitude = cmCalcDegrees(282.7771834 + 36000.76953744 * nC + (.000005729577951308232 * nSolarSum) + cmAberration(nC) + nNutation)
+   nPhase = cmCalcDegrees(nLunarLongitude - nSolarLongitude)
+   if nPhase < LunarPhaseMargin or nPhase > 360 - LunarPhaseMargin:
+      nMeanSynodic = cmFloor(cmRound((nMoment - NthNewMoonEpoch) / MeanSynodicMonth))
+      nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
+      if abs(nPhase - nPreferred) > 180:
+         nPhase = nPreferred
+   if bRate == False:
+      return nPhase
+#
+# Derivatives per century of the terms above, using the linear rates of the
+# fundamental arguments, converted to degrees per day
+#
+   nRadians = math.pi / 180
+   nLunarRate = 481267.88123421 \
+              + nRadians * (.000001 * nCorrectionRate \
+              + .003958 * 131.849 * cmCoSineDegrees(119.75 + (nC * 131.849)) \
+              + .000318 * 479264.29 * cmCoSineDegrees(53.09 + (nC * 479264.29)) \
+              + .001962 * (481267.88123421 - 483202.0175233) * cmCoSineDegrees(nMeanMoon - nMoonFromNode))
+   nSolarRate = 36000.76953744 + nRadians * .000005729577951308232 * nSolarRate
+   return [nPhase,(nLunarRate - nSolarRate) / 36525]
+# End Def
+
 def cmLunarPhase (nMoment: float) -> float:
 #
 # Lunar Phase
@@ -1264,16 +1485,9 @@ def cmLunarPhase (nMoment: float) -> float:
 # moon as calculated by the more precise cmNthNewMoon function.
 #
 # If it does, then an approximation based on cmNthNewMoon is
-# preferred.
-#
-   nLongitudeDifference = cmCalcDegrees(cmLunarLongitude(nMoment) - cmSolarLongitude(nMoment))
-   nNthNewMoon = cmNthNewMoon(0)
-   nMeanSynodic = cmFloor(cmRound((nMoment - nNthNewMoon) / MeanSynodicMonth))
-   nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
-   if abs(nLongitudeDifference - nPreferred) > 180:
-      return nPreferred
-   else:
-      return nLongitudeDifference
+# preferred. See cmLunarPhaseKernel
+#
+   return cmLunarPhaseKernel(nMoment)
 # End Def
 
 def cmLunarPhaseAtOrBefore (nMoment: float, nTargetLongitude: float) -> float:
@@ -1356,7 +1570,7 @@ def cmLunarFindPhase (nFromDays: int, nToDays: int, nTargetLongitude: float) ->
          bLoop = False
       else:
          nTo = nTo - 28
-         if nFrom > nTo:
+         if nFromDays > nTo:
             bLoop = False
             nMoon = date(1,1,1).toordinal()
    return nMoon
@@ -1635,8 +1849,8 @@ def cmMoonRise (nUniversalDays: int, nLatitude: float, nLongitude: float, nEleva
 #
    MoonRiseList = []
    nOneHour = 1 / 24
-   nLower = nDays
-   nUpper = nDays + 1
+   nLower = nUniversalDays
+   nUpper = nUniversalDays + 1
    nLowerStarting = nLower
    nUpperStarting = nUpper
    if nType == GEOCENTRIC:
@@ -1736,8 +1950,8 @@ def cmMoonSet (nUniversalDays: int, nLatitude: float, nLongitude: float, nElevat
 #
    MoonSetList = []
    nOneHour = 1 / 24
-   nLower = nDays - 1
-   nUpper = nDays
+   nLower = nUniversalDays - 1
+   nUpper = nUniversalDays
    nLowerStarting = nLower
    nUpperStarting = nUpper
    if nType == GEOCENTRIC:
@@ -1845,73 +2059,86 @@ def cmHinduLunarOnOrBefore (nMonth1: int, nLeapMonth1: bool, nDay1: int, nLeapDa
       (nDay1 == nDay2 and (nLeapDay1 == False or nLeapDay2 == True))))))))
 # End Def
 
-def cmHinduDateOccur (nMonth: int, nDay: int, nYear: int) -> int:
+def cmHinduDateOccur (nMonth: int, nDay: int, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Compute day on which an event is observed
 #
-   nTry = DaysFromHinduLunar(nMonth,False,nDay,False,nYear)
+   if Locale is None:
+      Locale = HinduLocale
+   nTry = DaysFromHinduLunar(nMonth,False,nDay,False,nYear,Locale)
    if nDay > 15:
-      MidLunarDate = HinduLunarFromDays(nTry - 5)
+      MidLunarDate = HinduLunarFromDays(nTry - 5,Locale)
    else:
-      MidLunarDate = HinduLunarFromDays(nTry)
+      MidLunarDate = HinduLunarFromDays(nTry,Locale)
    bExpunged = nMonth != MidLunarDate[0]
    nOccurDate = nTry
    if bExpunged == True:
       bLoop = True
       while bLoop == True:
-        HinduLoopDate = HinduLunarFromDays(nOccurDate)
+        HinduLoopDate = HinduLunarFromDays(nOccurDate,Locale)
         if cmHinduLunarOnOrBefore(HinduLoopDate[0],HinduLoopDate[1],HinduLoopDate[2],HinduLoopDate[3],HinduLoopDate[4],MidLunarDate[0],MidLunarDate[1],nDay,False,MidLunarDate[4]) == False:
            nOccurDate = nOccurDate + 1
         else:
            nOccurDate = nOccurDate - 1
            bLoop = False
    else:
-      HinduLunarDate = HinduLunarFromDays(nOccurDate)
+      HinduLunarDate = HinduLunarFromDays(nOccurDate,Locale)
       if nDay != HinduLunarDate[2]:
          nOccurDate = nOccurDate - 1
    return nOccurDate
 # End Def
 
-def cmHinduTithiOccur (nMonth: int, nTithi: float, nTime: float, nYear: int) -> int:
+def cmHinduTithiOccur (nMonth: int, nTithi: float, nTime: float, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Tithi time of day
 #
-  nApprox = cmHinduDateOccur(nMonth,cmFloor(nTithi),nYear)
-  nLunar = cmHinduLunarDayAtOrAfter (nTithi,nApprox - 2)
+  if Locale is None:
+     Locale = HinduLocale
+  nApprox = cmHinduDateOccur(nMonth,cmFloor(nTithi),nYear,Locale)
+  nLunar = cmHinduLunarDayAtOrAfter (nTithi,nApprox - 2,Locale)
   nTry = cmFloor(nLunar)
-  nT = cmStandardFromSunDial(nTry + nTime)
-  if (nLunar <= nT) or (cmHinduLunarPhase(cmStandardFromSunDial(nTry + 1 + nTime)) > nTithi * 12):
+  nT = cmStandardFromSunDial(nTry + nTime,Locale)
+  if (nLunar <= nT) or (cmHinduLunarPhase(cmStandardFromSunDial(nTry + 1 + nTime,Locale)) > nTithi * 12):
      return nTry
   else:
      return nTry + 1
 # End Def
 
-def cmHinduLunarEvent (nMonth: int, nTithi: float, nTime: float, nGregorianYear: int) -> int:
+def cmHinduLunarEvent (nMonth: int, nTithi: float, nTime: float, nGregorianYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Occurence of Hindu Lunar Event
 #
+   if Locale is None:
+      Locale = HinduLocale
    nJan1 = date(nGregorianYear,January,1).toordinal()
    nDec31 = date(nGregorianYear,December,31).toordinal()
-   HinduLunarDate = HinduLunarFromDays(nJan1)
-   nDate0 = cmHinduTithiOccur(nMonth,nTithi,nTime,HinduLunarDate[4])
-   nDate1 = cmHinduTithiOccur(nMonth,nTithi,nTime,HinduLunarDate[4] + 1)
+   HinduLunarDate = HinduLunarFromDays(nJan1,Locale)
+   nDate0 = cmHinduTithiOccur(nMonth,nTithi,nTime,HinduLunarDate[4],Locale)
+   nDate1 = cmHinduTithiOccur(nMonth,nTithi,nTime,HinduLunarDate[4] + 1,Locale)
    if nDate0 >= nJan1 and nDate0 <= nDec31:
       return nDate0
    else:
       return nDate1
 # End Def
 
-def cmDiwali (nGregorianYear: int) -> date:
+def cmDiwali (nGregorianYear: int, Locale: CalendarLocale = None) -> date:
 #
 # Diwali in nGregorianYear
 #
-   nDiwali = cmHinduLunarEvent(KARTIKA,1,0,nGregorianYear)
-   HinduLunarDate = HinduLunarFromDays(nDiwali)
+   if Locale is None:
+      Locale = HinduLocale
+   nEvent = cmHinduLunarEvent(KARTIKA,1,0,nGregorianYear,Locale)
+#
+# The event is the day the first tithi of Kartika is current at sundial midnight, one day after the new moon when
+# the new moon falls late in the day. The rules below are reckoned from the day of that new moon
+#
+   nDiwali = cmFloor(cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nEvent + 1,NEWMOON),Locale.Zone))
+   HinduLunarDate = HinduLunarFromDays(nDiwali,Locale)
    if HinduLunarDate[1] == True:
-      nNewMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nDiwali - 15,NEWMOON),HinduLocaleZone)
+      nNewMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nDiwali - 15,NEWMOON),Locale.Zone)
       nDiwali = cmFloor(nNewMoon - 1)
    else:
-      nNewMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nDiwali + 5,NEWMOON),HinduLocaleZone)
+      nNewMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nDiwali + 5,NEWMOON),Locale.Zone)
 #
 # If New Moon is before or equal to 6pm and the month KARTIKA isn't a leap month, Diwali is the prior day
 #
@@ -1921,22 +2148,24 @@ def cmDiwali (nGregorianYear: int) -> date:
 #
 # If Lunar Day (Tithi) starts on after 6pm, Diwali is the prior day
 #
-      nSunRise = cmHinduSunRise(nDiwali)
+      nSunRise = cmHinduSunRise(nDiwali,Locale)
       nTithi = cmCalcDegrees((cmHinduLunarLongitude(nSunRise) - cmHinduSolarLongitude(nSunRise))) / 12
       if cmMod(nSunRise - (1 - cmMod(nTithi,1)),1) >= .75:
          nDiwali = nDiwali - 1
    return date.fromordinal(nDiwali)
 # End Def
 
-def cmHoli (nGregorianYear: int) -> date:
+def cmHoli (nGregorianYear: int, Locale: CalendarLocale = None) -> date:
 #
 # Holi in nGregorian Year
 #
-   nMonthEnd = cmHinduLunarEvent(PHALGUNA,29,0,nGregorianYear)
-   nFullMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nMonthEnd,FULLMOON),HinduLocaleZone)
+   if Locale is None:
+      Locale = HinduLocale
+   nMonthEnd = cmHinduLunarEvent(PHALGUNA,29,0,nGregorianYear,Locale)
+   nFullMoon = cmStandardFromUniversal(cmLunarPhaseAtOrBefore(nMonthEnd,FULLMOON),Locale.Zone)
    nDays = cmFloor(nFullMoon)
-   nSunSet = cmHinduSunSet(cmFloor(nFullMoon))
-   nTithi = cmCalcDegrees(cmHinduLunarLongitude(cmHinduSunSet(cmFloor(nSunSet)) - cmHinduSolarLongitude(cmFloor(nSunSet)))) / 12
+   nSunSet = cmHinduSunSet(cmFloor(nFullMoon),Locale)
+   nTithi = cmCalcDegrees(cmHinduLunarLongitude(cmHinduSunSet(cmFloor(nSunSet),Locale) - cmHinduSolarLongitude(cmFloor(nSunSet)))) / 12
    if nFullMoon >= nSunSet:
       nDays = nDays + 1
    elif (cmMod(nTithi,1) >= .75):
@@ -1944,39 +2173,40 @@ def cmHoli (nGregorianYear: int) -> date:
    return date.fromordinal(nDays)
 # End Def
 
-pyNow = CurrentDate()
-#pyNow = date(2026,3,3)
-print ("Today: " + str(pyNow))
-nDays = pyNow.toordinal()
-print ("Today's Ordinal Days: " + str(nDays))
-print ("Hindu Location: " + HinduLocaleName)
-dtSunRise = cmTimeFromSerial(cmMomentToSerial(cmHinduSunRise(nDays)))
-print ("Sunrise: " + f"{dtSunRise.hour:02d}" + ':' + f"{dtSunRise.minute:02d}")
-dtSunSet = cmTimeFromSerial(cmMomentToSerial(cmHinduSunSet(nDays)))
-print ("Sunset: " + f"{dtSunSet.hour:02d}" + ':' + f"{dtSunSet.minute:02d}") 
-MoonRiseList = cmMoonRise(nDays,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,HinduLocaleZone,TOPOCENTRIC)
-if len(MoonRiseList) > 0:
-   dtMoonRise = cmTimeFromSerial(cmMomentToSerial(MoonRiseList[0]))
-   print ("Moonrise: " + f"{dtMoonRise.hour:02d}" + ':' + f"{dtMoonRise.minute:02d}")
-else:
-   print ("Moonrise: Did not occur")
-MoonSetList = cmMoonSet(nDays,HinduLocaleLatitude,HinduLocaleLongitude,HinduLocaleElevation,HinduLocaleZone,TOPOCENTRIC)
-if len(MoonSetList) > 0:
-   dtMoonSet = cmTimeFromSerial(cmMomentToSerial(MoonSetList[0]))
-   print ("Moonset: " + f"{dtMoonSet.hour:02d}" + ':' + f"{dtMoonSet.minute:02d}")
-else:
-   print ("Moonset: Did not occur")
-HinduSolarDate = HinduSolarFromDays(nDays)
-print ('Hindu Solar Date: ' + SolarMonthNames[HinduSolarDate[0] - 1] + ' ' + str(HinduSolarDate[1]) + ', ' + str(HinduSolarDate[2]))
-print ('Days from Hindu Solar: ' + str(DaysFromHinduSolar(HinduSolarDate[0],HinduSolarDate[1],HinduSolarDate[2])))
-HinduLunarDate = HinduLunarFromDays(nDays)
-print ('Hindu Yoga: ' + HinduYogaName[cmHinduYoga(nDays) - 1])
-print ('Hindu Lunar Date: ' + FormatHinduLunarDate(HinduLunarDate[0],HinduLunarDate[1],HinduLunarDate[2],HinduLunarDate[3],HinduLunarDate[4],HinduLunarDate[5]))
-print ('Days from Hindu Lunar: ' + str(DaysFromHinduLunar(HinduLunarDate[0],HinduLunarDate[1],HinduLunarDate[2],HinduLunarDate[3],HinduLunarDate[4])))
-print ('')
-print ('Hindu Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-print ('Mesha Sankranti (Solar New Year): ' + str(date.fromordinal(cmFloor(cmHinduSolarLongitudeAtOrAfter(0,date(pyNow.year,January,1).toordinal())))))
-print ('Chandramana Ugadi (Lunar New Year): ' + str(cmHinduLunarNewYear(pyNow.year)))
-print ('Diwali: ' + str(cmDiwali(pyNow.year)))
-print ('Holi: ' + str(cmHoli(pyNow.year)))
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   #pyNow = date(2026,3,3)
+   print ("Today: " + str(pyNow))
+   nDays = pyNow.toordinal()
+   print ("Today's Ordinal Days: " + str(nDays))
+   print ("Hindu Location: " + HinduLocale.Name)
+   dtSunRise = cmTimeFromSerial(cmMomentToSerial(cmHinduSunRise(nDays,HinduLocale)))
+   print ("Sunrise: " + f"{dtSunRise.hour:02d}" + ':' + f"{dtSunRise.minute:02d}")
+   dtSunSet = cmTimeFromSerial(cmMomentToSerial(cmHinduSunSet(nDays,HinduLocale)))
+   print ("Sunset: " + f"{dtSunSet.hour:02d}" + ':' + f"{dtSunSet.minute:02d}") 
+   MoonRiseList = cmMoonRise(nDays,HinduLocale.Latitude,HinduLocale.Longitude,HinduLocale.Elevation,HinduLocale.Zone,TOPOCENTRIC)
+   if len(MoonRiseList) > 0:
+      dtMoonRise = cmTimeFromSerial(cmMomentToSerial(MoonRiseList[0]))
+      print ("Moonrise: " + f"{dtMoonRise.hour:02d}" + ':' + f"{dtMoonRise.minute:02d}")
+   else:
+      print ("Moonrise: Did not occur")
+   MoonSetList = cmMoonSet(nDays,HinduLocale.Latitude,HinduLocale.Longitude,HinduLocale.Elevation,HinduLocale.Zone,TOPOCENTRIC)
+   if len(MoonSetList) > 0:
+      dtMoonSet = cmTimeFromSerial(cmMomentToSerial(MoonSetList[0]))
+      print ("Moonset: " + f"{dtMoonSet.hour:02d}" + ':' + f"{dtMoonSet.minute:02d}")
+   else:
+      print ("Moonset: Did not occur")
+   HinduSolarDate = HinduSolarFromDays(nDays)
+   print ('Hindu Solar Date: ' + SolarMonthNames[HinduSolarDate[0] - 1] + ' ' + str(HinduSolarDate[1]) + ', ' + str(HinduSolarDate[2]))
+   print ('Days from Hindu Solar: ' + str(DaysFromHinduSolar(HinduSolarDate[0],HinduSolarDate[1],HinduSolarDate[2])))
+   HinduLunarDate = HinduLunarFromDays(nDays)
+   print ('Hindu Yoga: ' + HinduYogaName[cmHinduYoga(nDays) - 1])
+   print ('Hindu Lunar Date: ' + FormatHinduLunarDate(HinduLunarDate[0],HinduLunarDate[1],HinduLunarDate[2],HinduLunarDate[3],HinduLunarDate[4],HinduLunarDate[5]))
+   print ('Days from Hindu Lunar: ' + str(DaysFromHinduLunar(HinduLunarDate[0],HinduLunarDate[1],HinduLunarDate[2],HinduLunarDate[3],HinduLunarDate[4])))
+   print ('')
+   print ('Hindu Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   print ('Mesha Sankranti (Solar New Year): ' + str(date.fromordinal(cmFloor(cmHinduSolarLongitudeAtOrAfter(0,date(pyNow.year,January,1).toordinal())))))
+   print ('Chandramana Ugadi (Lunar New Year): ' + str(cmHinduLunarNewYear(pyNow.year,HinduLocale)))
+   print ('Diwali: ' + str(cmDiwali(pyNow.year,HinduLocale)))
+   print ('Holi: ' + str(cmHoli(pyNow.year,HinduLocale)))
@@ -18,6 +18,10 @@
 #
 
 import math
+from collections import namedtuple
+import os
+import atexit
+import threading
 from datetime import date, datetime, timezone
 from tzlocal import get_localzone
 import pytz
@@ -83,6 +87,176 @@ NEWMOON = 0
 EASTHEMISPHERE = 0
 WESTHEMISPHERE = -1
 MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
+NthNewMoonEpoch = 11.458922815748194   # cmNthNewMoon(0), new moon of January 11, 1
+LunarPhaseMargin = 30   # Degrees from new moon beyond which cmLunarPhase never prefers cmNthNewMoon
+
+#
+# Solar longitude periodic terms X, Y, Z in the order summed by cmSolarLongitude
+#
+SolarLongitudeTermsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+
+#
+# Lunar longitude periodic terms V, W, X, Y, Z in the order summed by cmLunarLongitude
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
+FIRSTQUARTERMOON = 90
+MORNING = True
+EVENING = False
+VisibleHorizon = 0.8413147543981382   # Half diameter of the sun (16 minutes + 34.478885263888294 minutes for refraction)
+SUNRISE_SUNSET_TIME = 0
+MoonRadius = 1737400   # Meters
+LunarHourAngleRate = 347.81   # Degrees per day the moon moves westward against the horizon
+
+#
+# Crescent visibility rules used to start each month
+#
+# NOON_UTC_VISIBILITY - new moon before noon UTC, crescent seen the next day
+# TOPOCENTRIC_VISIBILITY - crescent observed from the Islamic locale
+#
+NOON_UTC_VISIBILITY = 0
+TOPOCENTRIC_VISIBILITY = 1
+
+#
+# Location the crescent is observed from for TOPOCENTRIC_VISIBILITY, passed as Locale
+#
+CalendarLocale = namedtuple('CalendarLocale', ['Name', 'Latitude', 'Longitude', 'Elevation', 'Zone'])
+MECCA = CalendarLocale('Mecca',21.4225,39.8262,277,3)
+IslamicLocale = MECCA   # Used when no Locale is given
+
+#
+# Yallop crescent visibility zones: Zone, Description, lowest q value
+#
+IslamicCrescentZonesList = [
+   'A','Easily visible',.216,
+   'B','Visible under perfect conditions',-.014,
+   'C','May need optical aid to find the crescent',-.160,
+   'D','Will need optical aid to find the crescent',-.232,
+   'E','Not visible with a telescope',-.293,
+   'F','Not visible, below the Danjon limit',None
+]
+
+#
+# Month start tables, calculated as needed and kept in memory. Call
+# IslamicMonthTablePersist to keep them between runs in a directory
+#
+IslamicMonthTableDirectory = None   # Set by IslamicMonthTablePersist, None keeps the tables in memory only
+IslamicMonthTable = {}   # (Visibility rule, Locale): [signature, {elapsed months: days date}]
+IslamicMonthTableChanged = set()
+
+#
+# Date returned by IslamicFromDays
+#
+IslamicDateRecord = namedtuple('IslamicDateRecord', ['Month', 'Day', 'Year'])
 
 def CurrentDate () -> date:
 #
@@ -535,6 +709,77 @@ def cmNthNewMoon (nNthMoon: int) -> float:
    return cmUniversalFromDynamical(nApprox + nCorrection + nExtra + nAdditional)
 # End Def
 
+def cmLunarPhaseKernel (nMoment: float, bRate: bool = False):
+#
+# Lunar Phase as calculated by cmLunarPhase, fused into one pass
+#
+# Julian centuries and nutation are calculated once for both the lunar and
+# solar longitude and the periodic terms are summed from tables in the same
+# order as cmLunarLongitude and cmSolarLongitude, so the phase is identical.
+# The cmNthNewMoon check is only made within LunarPhaseMargin degrees of new
+# moon, the only place the two estimates can disagree by more than 180 degrees.
+#
+# When bRate is True, returns [Phase, Rate] with Rate the change of the phase
+# in degrees per day, for root finders
+#
+   nC = cmJulianCenturies(nMoment)
+   nNutation = cmNutation(nC)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = 0
+   nCorrectionRate = 0
+   for i in range(0,len(LunarLongitudeTermsList),5):
+      nV = LunarLongitudeTermsList[i]
+      nW = LunarLongitudeTermsList[i + 1]
+      nX = LunarLongitudeTermsList[i + 2]
+      nY = LunarLongitudeTermsList[i + 3]
+      nZ = LunarLongitudeTermsList[i + 4]
+      nArgument = (nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode)
+      nCorrection += nV * nE**abs(nX) * math.sin(math.radians(nArgument))
+      if bRate == True:
+         nCorrectionRate += nV * nE**abs(nX) * math.cos(math.radians(nArgument)) \
+                          * (nW * 445267.1114034 + nX * 35999.0502909 + nY * 477198.8675055 + nZ * 483202.0175233)
+   nCorrection = .000001 * nCorrection
+   nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
+   nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
+   nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
+   nLunarLongitude = cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + nNutation)
+   nSolarSum = 0
+   nSolarRate = 0
+   for i in range(0,len(SolarLongitudeTermsList),3):
+      nX = SolarLongitudeTermsList[i]
+      nY = SolarLongitudeTermsList[i + 1]
+      nZ = SolarLongitudeTermsList[i + 2]
+      nSolarSum += nX * math.sin(math.radians(nY + (nZ * nC)))
+      if bRate == True:
+         nSolarRate += nX * nZ * math.cos(math.radians(nY + (nZ * nC)))
+   nSolarLongitude = cmCalcDegrees(282.7771834 + 36000.76953744 * nC + (.000005729577951308232 * nSolarSum) + cmAberration(nC) + nNutation)
+   nPhase = cmCalcDegrees(nLunarLongitude - nSolarLongitude)
+   if nPhase < LunarPhaseMargin or nPhase > 360 - LunarPhaseMargin:
+      nMeanSynodic = cmFloor(cmRound((nMoment - NthNewMoonEpoch) / MeanSynodicMonth))
+      nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
+      if abs(nPhase - nPreferred) > 180:
+         nPhase = nPreferred
+   if bRate == False:
+      return nPhase
+#
+# Derivatives per century of the terms above, using the linear rates of the
+# fundamental arguments, converted to degrees per day
+#
+   nRadians = math.pi / 180
+   nLunarRate = 481267.88123421 \
+              + nRadians * (.000001 * nCorrectionRate \
+              + .003958 * 131.849 * cmCoSineDegrees(119.75 + (nC * 131.849)) \
+              + .000318 * 479264.29 * cmCoSineDegrees(53.09 + (nC * 479264.29)) \
+              + .001962 * (481267.88123421 - 483202.0175233) * cmCoSineDegrees(nMeanMoon - nMoonFromNode))
+   nSolarRate = 36000.76953744 + nRadians * .000005729577951308232 * nSolarRate
+   return [nPhase,(nLunarRate - nSolarRate) / 36525]
+# End Def
+
 def cmLunarPhase (nMoment: float) -> float:
 #
 # Lunar Phase
@@ -544,16 +789,9 @@ def cmLunarPhase (nMoment: float) -> float:
 # moon as calculated by the more precise cmNthNewMoon function.
 #
 # If it does, then an approximation based on cmNthNewMoon is
-# preferred.
-#
-   nLongitudeDifference = cmCalcDegrees(cmLunarLongitude(nMoment) - cmSolarLongitude(nMoment))
-   nNthNewMoon = cmNthNewMoon(0)
-   nMeanSynodic = cmFloor(cmRound((nMoment - nNthNewMoon) / MeanSynodicMonth))
-   nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
-   if abs(nLongitudeDifference - nPreferred) > 180:
-      return nPreferred
-   else:
-      return nLongitudeDifference
+# preferred. See cmLunarPhaseKernel
+#
+   return cmLunarPhaseKernel(nMoment)
 # End Def
 
 def cmLunarPhaseAtOrBefore (nMoment: float, nTargetLongitude: float) -> float:
@@ -591,6 +829,459 @@ def cmLunarPhaseAtOrBefore (nMoment: float, nTargetLongitude: float) -> float:
    return nStartMoment + ((nEndMoment - nStartMoment) * .5)
 # End Def
 
+def cmMod3 (x: float, a: float, b: float) -> float:
+#
+# Force modulus x into the range a..b for Real Numbers
+#
+   if a == b:
+      return x
+   else:
+      return a + (cmMod(x - a,b - a))
+# End Def
+
+def cmSignum (nAny: float) -> int:
+#
+# Return the sign of nAny
+#
+   if nAny < 0:
+      return -1
+   elif nAny > 0:
+      return 1
+   else:
+      return 0
+# End Def
+
+def cmArcCoSineDegrees (nTheta: float) -> float:
+#
+# Arc Cosine converted to degrees
+#
+   return cmRadiansToDegrees(math.acos(nTheta))
+# End Def
+
+def cmArcSinDegrees (nTheta: float) -> float:
+#
+# Arc Sine converted to Degrees
+#
+   return cmRadiansToDegrees(math.asin(nTheta))
+# End Def
+
+def cmTangentDegrees (nTheta: float) -> float:
+#
+# Tangent degrees converted to Radians
+#
+   return math.tan(cmDegreesToRadians(nTheta))
+# End Def
+
+def cmArcTanDegrees (nY: float, nX: float) -> float:
+#
+# Arc Tangent converted to -180 to 180 degrees range
+#
+ return cmCalcDegrees(cmRadiansToDegrees(math.atan2(nY,nX)))
+# End Def
+
+def cmAngle (nDegrees: float, nMinutes: float, nSeconds: float) -> float:
+#
+# Return decimal degrees
+#
+   nDecimalDegrees = (abs(nDegrees) + (abs(nMinutes) / 60) + (abs(nSeconds) / 3600))
+   if nDegrees < 0:
+      nDecimalDegrees = nDegrees * -1
+   return nDecimalDegrees
+# End Def
+
+def cmObliquity (nCenturies: float) -> float:
+#
+# Obliquity Earth Orbit
+#
+   return cmAngle(23,26,21.448) - (cmAngle(0,0,46.8150) * nCenturies) - (cmAngle(0,0,0.00059) * nCenturies**2) + (cmAngle(0,0,0.001813) * nCenturies**3)
+# End Def
+
+def cmZoneFromLongitude (nLongitude: float) -> float:
+#
+# Local mean time zone changes every 15 degrees. Convert to a fraction of a day.
+#
+   return nLongitude / 360
+# End Def
+
+def cmLocalFromUniversal (nUniversal: float, nLongitude: float) -> float:
+#
+# Convert Universal Time to Local
+#
+   return nUniversal  + cmZoneFromLongitude(nLongitude)
+# End Def
+
+def cmUniversalFromLocal (nLocal: float, nLongitude: float) -> float:
+#
+# Convert Local Time to Universal
+#
+   return nLocal - cmZoneFromLongitude(nLongitude)
+# End Def
+
+def cmStandardFromUniversal (nUniversal: float, nZone: float) -> float:
+#
+# Convert Universal Time to Standard
+#
+   return nUniversal + nZone / 24
+# End Def
+
+def cmStandardFromLocal (nLocal: float, nZone: float, nLongitude: float) -> float:
+#
+# Convert Local Time to Standard
+#
+   return cmStandardFromUniversal(cmUniversalFromLocal(nLocal,nLongitude),nZone)
+# End Def
+
+def cmUniversalFromStandard (nStandard: float, nZone: float) -> float:
+#
+# Convert Standard Time to Universal
+#
+   return nStandard - nZone / 24
+# End Def
+
+def cmEquationOfTime (nMoment: float) -> float:
+#
+# Equation of Time
+#
+   nC = cmJulianCenturies(nMoment)
+   nLongitude = 280.46645 + 36000.76983 * nC + .0003032 * nC**2
+   nAnomaly = 357.52910 + 35999.05030 * nC - 0.0001559 * nC**2 - 0.00000048 * nC**3
+   nEccentricity = 0.016708617 - 0.000042037 * nC - 0.0000001236 * nC**2
+   nY = cmTangentDegrees(cmObliquity(nC) / 2)**2
+   nEquation = 1 / (2 * math.pi) \
+             * ((nY * cmSinDegrees(nLongitude * 2)) \
+             - (2 * nEccentricity * cmSinDegrees(nAnomaly)) \
+             + (4 * nEccentricity * nY * cmSinDegrees(nAnomaly) * cmCoSineDegrees(nLongitude * 2)) \
+             - (.5 * nY**2 * cmSinDegrees(nLongitude * 4)) \
+             - (1.25 * nEccentricity**2 * cmSinDegrees(nAnomaly * 2)))
+   nEquationAdjust = abs(nEquation) if abs(nEquation) < .5 else .5 
+   return cmSignum(nEquation) * nEquationAdjust
+# End Def
+
+def cmLocalFromApparent (nMoment: float, nLongitude: float) -> float:
+#
+# Convert Apparent time to Local
+#
+   return nMoment - cmEquationOfTime(cmUniversalFromLocal(nMoment,nLongitude))
+# End Def
+
+def cmEarthRadius (nLatitude: float) -> float:
+#
+# Earth Radius at a given Latitude
+#
+# As a safeguard, ensure latitude is in the range of 0-90
+#
+   nLatitudeRadians = cmDegreesToRadians(cmMod(abs(nLatitude),90))**2
+#
+# Radius at the equator = 6378136.6 meters
+# Radius at the poles = 6356752.314245 meters
+#
+   return 6356752.314245 * (1 + nLatitudeRadians)**0.5 / ((6356752.314245**2 / 6378136.6**2) + nLatitudeRadians)**.5
+# End Def
+
+def cmSolarRefraction (nElevation: float, nLatitude: float) -> float:
+#
+# Atmosphere General Refraction of Light adjusted for Elevation
+#
+   nEarthRadius = cmEarthRadius(nLatitude)
+   if nElevation > 0:
+      nAdjustedElevation = nElevation
+      nElevationSQRT = nElevation**.5
+   else:
+      nAdjustedElevation = 0
+      nElevationSQRT = 0
+   return VisibleHorizon \
+          + cmArcCoSineDegrees(nEarthRadius / (nEarthRadius + nAdjustedElevation)) \
+          + cmAngle(0,0,19) * nElevationSQRT
+# End Def
+
+def cmDeclination (nMoment: float, nLatitude: float, nLongitude: float) -> float:
+#
+# Angular distance of a point north or south of the celestial equator
+#
+   nObliquity = cmObliquity(cmJulianCenturies(nMoment))
+   return cmArcSinDegrees(cmSinDegrees(nLatitude) \
+          * cmCoSineDegrees(nObliquity) \
+          + cmCoSineDegrees(nLatitude) \
+          * cmSinDegrees(nObliquity) \
+          * cmSinDegrees(nLongitude))
+# End Def
+
+def cmSineOffset (nMoment: float, nLatitude: float, nLongitude: float, nDepression: float) -> float:
+#
+# Angle between where the sun is at (nMoment) and where we want it to be (nDeclination)
+#
+   nUniversal = cmUniversalFromLocal(nMoment,nLongitude)
+   nDeclination = cmDeclination(nUniversal,0,cmSolarLongitude(nMoment))
+   return cmTangentDegrees(nLatitude) \
+          * cmTangentDegrees(nDeclination) \
+          + (cmSinDegrees(nDepression) / (cmCoSineDegrees(nDeclination) * cmCoSineDegrees(nLatitude)))
+# End Def
+
+def cmApproxMomentOfDepression (nMoment: float, nLatitude: float, nLongitude: float, nDepression: float, bEarly: bool) -> float:
+#
+# Approximation for Moment when Sun is at nDepression angle
+#
+   nApprox = 0    # if return is 0, event did not occur
+   nDays = cmFloor(nMoment)
+   nTry = cmSineOffset(nMoment,nLatitude,nLongitude,nDepression)
+   if nDepression >= 0:
+      if bEarly == MORNING:
+         nAlt = nDays
+      else:
+         nAlt = nDays + 1
+   else:
+      nAlt = nDays + .5
+   if abs(nTry) > 1:
+      nValue = cmSineOffset(nAlt,nLatitude,nLongitude,nDepression)
+   else:
+      nValue = nTry
+   if abs(nValue) <=1:   # Event Occurs
+      nOffset = cmMod3(cmArcSinDegrees(nValue) / 360,-.5,.5)
+      if bEarly == MORNING:
+         nOffsetAdjust = (.25 - nOffset)
+      else:
+        nOffsetAdjust = (.75 + nOffset)
+      nApprox = cmLocalFromApparent(nDays + nOffsetAdjust,nLongitude)
+   return nApprox
+# End Def
+
+def cmMomentOfDepression (nApprox: float, nLatitude: float, nLongitude: float, nDepression: float, bEarly: bool) -> float:
+#
+# Find Moment when the Sun is at nDepression angle
+#
+   nMoment = cmApproxMomentOfDepression(nApprox,nLatitude,nLongitude,nDepression,bEarly)
+   if nMoment != 0:
+      if abs(nApprox - nMoment) >= 30 / 3600:   # Within 30 sec?
+         nMoment = cmApproxMomentOfDepression(nMoment,nLatitude,nLongitude,nDepression,bEarly)
+   return nMoment
+# End Def
+
+def cmDusk (nDays: int, nZone: float, nLatitude: float, nLongitude: float, nDepression: float) -> float:
+#
+# Calculate Dusk
+#
+   nEvent = cmMomentOfDepression(nDays + .75,nLatitude,nLongitude,nDepression,EVENING)
+   return cmStandardFromLocal(nEvent,nZone,nLongitude)
+# End Def
+
+def cmSunSet (nDays: int, nZone: float, nLatitude: float, nLongitude: float, nElevation: float, nDepression: float) -> float: 
+#
+# Calculate Sunset in nZone time
+#
+   return cmDusk(nDays,nZone,nLatitude,nLongitude,cmAngle(0,nDepression,0) + cmSolarRefraction(nElevation,nLatitude))
+# End Def
+
+def cmSumDistancePeriods (nE: float, nElongation: float, nSolarAnomaly: float, nLunarAnomaly: float, nMoonFromNode: float, nV: float, nW: float, nX: float, nY: float, nZ: float) -> float:
+#
+# Distance adjustments of the Moon from Earth
+#
+   return nV * nE**abs(nX) * cmCoSineDegrees((nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode))
+# End Def
+
+def cmLunarDistance (nMoment: float) -> float:
+#
+# Return the Distance in meters of the Moon from Earth
+#
+# Get UTC Moment in nTimeZone
+#
+   nC = cmJulianCenturies(nMoment)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-20905355,0,0,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-2955968,2,0,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,48888,0,1,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,246158,2,0,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-170733,2,0,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-129620,0,1,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,104755,0,1,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-34782,4,0,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-21636,4,0,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,30824,2,1,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-16675,1,1,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-10445,2,0,2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,14403,2,0,-3,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,6322,1,0,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,5751,0,1,2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-4950,2,-2,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,2616,2,1,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-2117,0,2,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1423,4,0,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1571,4,-1,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,1165,0,2,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-3699111,2,0,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-569925,0,0,2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-3149,0,0,0,2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-152138,2,-1,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-204586,2,-1,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,108743,1,0,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,10321,2,0,0,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,79661,0,0,1,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-23210,0,0,3,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,24208,2,1,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-8379,1,0,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-12831,2,-1,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-11650,4,0,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-7003,0,1,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,10056,2,-1,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-9884,2,-2,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,4130,2,0,1,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-3958,4,-1,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,3258,3,0,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1897,4,-1,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,2354,2,2,-1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1117,0,0,4,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1739,1,0,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-4421,0,0,2,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,0,0,1,2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,0,-1,2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,0,2,0,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,0,0,2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,0,0,2,2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,1,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,-1,0,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,1,0,-2) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,1,1,1,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,3,0,-2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,4,0,-3,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,0,2,-1,2,0) \
+               + cmSumDistancePeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,8752,2,0,-1,-2)
+   return 385000560 + nCorrection
+# End Def
+
+def cmLunarLatitude (nMoment: float) -> float:
+#
+# Return the Latitude of the Moon
+#
+   nC = cmJulianCenturies(nMoment)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nVenus = .000175 * (cmSinDegrees(119.75 + (nC * 131.849) + nMoonFromNode) +  cmSinDegrees(119.75 + (nC * 131.849) - nMoonFromNode))
+   nFlatEarth = (-.002235 * cmSinDegrees(nMeanMoon)) + (.000127 * cmSinDegrees(nMeanMoon - nLunarAnomaly)) + (-.000115 * cmSinDegrees(nMeanMoon + nLunarAnomaly))
+   nExtra = .000382 * cmSinDegrees(313.45 + nC * 481266.484)
+   nCorrection = cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,5128122,0,0,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,277693,0,0,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,55413,2,0,-1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,32573,2,0,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,9266,2,0,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,8216,2,-1,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,4200,2,0,1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,2463,2,-1,-1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,2065,2,-1,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,1828,4,0,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1749,0,0,0,3) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1491,1,0,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1410,0,1,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1335,1,0,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,1021,4,0,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,777,0,0,1,-3) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,607,2,0,0,-3) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,491,2,-1,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,439,0,0,3,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,421,2,0,-3,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-351,2,1,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,315,2,-1,1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-283,0,0,1,3) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,223,1,1,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-220,0,1,-2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-185,1,0,1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-177,0,1,2,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,166,4,-1,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,132,4,0,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,115,4,-1,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,280602,0,0,1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,173237,2,0,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,46271,2,0,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,17198,0,0,2,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,8822,0,0,2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,4324,2,0,-2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-3359,2,1,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,2211,2,-1,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1870,0,1,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1794,0,1,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1565,0,1,-1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1475,0,1,1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-1344,0,1,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,1107,0,0,3,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,833,4,0,-1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,671,4,0,-2,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,596,2,0,2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-451,2,0,-2,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,422,2,0,2,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-366,2,1,-1,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,331,4,0,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,302,2,-2,0,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-229,2,1,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,223,1,1,0,1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-220,2,1,-1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,181,2,-1,-2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,176,4,0,-2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-164,1,0,1,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,-119,1,0,-2,-1) \
+                + cmSumLunarPeriods(nE,nElongation,nSolarAnomaly,nLunarAnomaly,nMoonFromNode,107,2,-2,0,1)
+   nCorrection = .000001 * nCorrection
+   return cmCalcDegrees(nCorrection + nVenus + nFlatEarth + nExtra)
+# End Def
+
+def cmLunarParallax (nMoment: float, nLunarAltitude: float, nLatitude: float) -> float:
+#
+# Lunar Parallax
+#
+   return cmArcSinDegrees((cmEarthRadius(nLatitude) / cmLunarDistance(nMoment)) * cmCoSineDegrees(nLunarAltitude))
+# End Def
+
+def cmRightAscension (nMoment: float, nLatitude: float, nLongitude: float) -> float:
+#
+# Angular distance measured eastward along the celestial equator from the vernal equinox 
+#
+   nObliquity = cmObliquity(cmJulianCenturies(nMoment))
+   return cmArcTanDegrees((cmSinDegrees(nLongitude) * cmCoSineDegrees(nObliquity)) - (cmTangentDegrees(nLatitude) * cmSinDegrees(nObliquity)),cmCoSineDegrees(nLongitude))
+# End Def
+
+def cmSiderealFromMoment (nMoment: float) -> float:
+#
+# Convert Moment Time to Sidereal
+#
+   nC = (nMoment - J2000) / 36525
+   return cmCalcDegrees(280.46061837 + 36525 * 360.98564736629 * nC + .000387933 * nC**2 - (nC**3 / 38710000))
+# End Def
+
+def cmGeocentricLunarAltitude (nMoment: float, nLatitude: float, nLongitude: float) -> float:
+#
+# Geocentric Altitude of the Moon above the horizon at UTC nMoment
+#
+# Not corrected for parallax or refraction
+#
+   nLunarLongitude = cmLunarLongitude(nMoment)
+   nLunarLatitude = cmLunarLatitude(nMoment)
+   nLunarRightAscension = cmRightAscension(nMoment,nLunarLatitude,nLunarLongitude)
+   nLunarDeclination = cmDeclination(nMoment,nLunarLatitude,nLunarLongitude)
+   nLocalSiderealHourAngle = cmCalcDegrees(cmSiderealFromMoment(nMoment) + nLongitude - nLunarRightAscension)
+   nAltitude = cmArcSinDegrees((cmSinDegrees(nLatitude) \
+             * cmSinDegrees(nLunarDeclination)) \
+             + (cmCoSineDegrees(nLatitude) \
+             * cmCoSineDegrees(nLunarDeclination) \
+             * cmCoSineDegrees(nLocalSiderealHourAngle)))
+   return cmMod3(nAltitude,-180,180)
+# End Def
+
+def cmTopocentricLunarAltitude (nMoment: float, nLatitude: float, nLongitude: float, nElevation: float) -> float:
+#
+# Topocentric Lunar Altitude
+#
+# Correct geocentric altitude from earth center to surface
+# and adjust for parallax and refraction
+#
+   nLunarAltitude = cmGeocentricLunarAltitude(nMoment,nLatitude,nLongitude)
+   return nLunarAltitude - cmLunarParallax(nMoment,nLunarAltitude,nLatitude) + cmSolarRefraction(nElevation,nLatitude)
+# End Def
+
 def cmPhasisOnOrBefore (nDays: int) -> int:
 #
 # Crescent moon
@@ -615,6 +1306,267 @@ def cmPhasisOnOrBefore (nDays: int) -> int:
    return nCrescent
 # End Def
 
+def cmVisibleCrescent (nDays: int, nLatitude: float, nLongitude: float, nElevation: float) -> bool:
+#
+# Check if the new crescent moon is observable in the evening before nDays
+#
+# Shaukat's criterion tested at dusk with the sun 4.5 degrees below the horizon.
+# The moon must be past new but short of first quarter, the arc of light
+# must be between 10.6 and 90 degrees, and the topocentric lunar altitude
+# must be above 4.1 degrees
+#
+   nEvent = cmMomentOfDepression(nDays - 1 + .75,nLatitude,nLongitude,4.5,EVENING)
+   if nEvent == 0:   # Sun does not set
+      return False
+   nMoment = cmUniversalFromLocal(nEvent,nLongitude)
+   nPhase = cmLunarPhase(nMoment)
+   nArcOfLight = cmArcCoSineDegrees(cmCoSineDegrees(cmLunarLatitude(nMoment)) * cmCoSineDegrees(nPhase))
+   return nPhase > NEWMOON and nPhase < FIRSTQUARTERMOON \
+      and nArcOfLight >= 10.6 and nArcOfLight <= 90 \
+      and cmTopocentricLunarAltitude(nMoment,nLatitude,nLongitude,nElevation) > 4.1
+# End Def
+
+def cmTopocentricPhasisOnOrBefore (nDays: int, Locale: CalendarLocale = None) -> int:
+#
+# Crescent moon
+#
+# First day on or before nDays of a month that begins with the new crescent
+# observed from Locale
+#
+   if Locale is None:
+      Locale = IslamicLocale
+   nMean = nDays - cmFloor((cmLunarPhase(nDays + 1) / 360) * MeanSynodicMonth)
+   if nDays - nMean <= 3 and cmVisibleCrescent(nDays,Locale.Latitude,Locale.Longitude,Locale.Elevation) == False:
+      nCrescent = nMean - 30
+   else:
+      nCrescent = nMean - 2
+   nLimit = nCrescent + 35   # Guard against a locale where the crescent is never seen
+   while nCrescent < nLimit and cmVisibleCrescent(nCrescent,Locale.Latitude,Locale.Longitude,Locale.Elevation) == False:
+      nCrescent = nCrescent + 1
+   return nCrescent
+# End Def
+
+#
+# Visibility Rule, [Name, Version, Phasis on or before function, Observed from a Locale]
+#
+# The built in rules name their function, looked up in this module when a
+# month is calculated, so a replacement installed by PYCache is used
+#
+IslamicVisibilityRules = {
+   NOON_UTC_VISIBILITY: ['NoonUTC',1,'cmPhasisOnOrBefore',False],
+   TOPOCENTRIC_VISIBILITY: ['Topocentric',1,'cmTopocentricPhasisOnOrBefore',True]
+}
+
+def IslamicRegisterVisibilityRule (nRule: int, sName: str, nVersion: int, fnPhasisOnOrBefore, bLocale: bool = False) -> None:
+#
+# Add or replace a visibility rule
+#
+# fnPhasisOnOrBefore(nDays), or fnPhasisOnOrBefore(nDays,Locale) when bLocale
+# is True, must return the days date of the first day of the Islamic month in
+# progress on nDays. Bump nVersion whenever the function changes so a
+# persisted month table built by an older version is discarded
+#
+   IslamicVisibilityRules[nRule] = [sName,nVersion,fnPhasisOnOrBefore,bLocale]
+   IslamicMonthTableClear(nRule)
+# End Def
+
+def cmIslamicMonthTableKey (nRule: int, Locale: CalendarLocale = None) -> tuple:
+#
+# Month table key, a rule observed from a Locale has a table per Locale
+#
+   if IslamicVisibilityRules[nRule][3] == False:
+      return (nRule,None)
+   if Locale is None:
+      Locale = IslamicLocale
+   return (nRule,Locale)
+# End Def
+
+def cmIslamicMonthTableSignature (Key: tuple) -> str:
+#
+# Identify the rule, and for observational rules the locale, a table was built for
+#
+   VisibilityRule = IslamicVisibilityRules[Key[0]]
+   sSignature = VisibilityRule[0] + ' ' + str(VisibilityRule[1])
+   if Key[1] is not None:
+      sSignature = sSignature + ' ' + str(Key[1].Latitude) + ' ' + str(Key[1].Longitude) + ' ' + str(Key[1].Elevation)
+   return sSignature
+# End Def
+
+def cmIslamicMonthTableFile (Key: tuple) -> str:
+#
+# Path of the persisted month table for Key, None if persistence is off
+#
+   if IslamicMonthTableDirectory is None:
+      return None
+   sName = 'IslamicMonths' + IslamicVisibilityRules[Key[0]][0]
+   if Key[1] is not None:
+      sName = sName + '_' + ''.join(sCharacter for sCharacter in Key[1].Name if sCharacter.isalnum())
+   return os.path.join(IslamicMonthTableDirectory,sName + '.txt')
+# End Def
+
+def cmIslamicMonthTable (Key: tuple) -> dict:
+#
+# Return the month table for Key, loading the persisted copy on first use
+#
+# The table maps the elapsed month count ((year - 1) * 12 + month - 1)
+# to the days date of the first day of that month. A table built for another
+# rule version or locale is discarded
+#
+   sSignature = cmIslamicMonthTableSignature(Key)
+   if Key in IslamicMonthTable and IslamicMonthTable[Key][0] == sSignature:
+      return IslamicMonthTable[Key][1]
+   MonthTable = cmIslamicMonthTableRead(Key,sSignature)
+   IslamicMonthTable[Key] = [sSignature,MonthTable]
+   return MonthTable
+# End Def
+
+def cmIslamicMonthTableRead (Key: tuple, sSignature: str) -> dict:
+#
+# Persisted month table for Key, empty if persistence is off, there is none,
+# or it was built for another signature
+#
+   MonthTable = {}
+   sFile = cmIslamicMonthTableFile(Key)
+   if sFile is not None and os.path.isfile(sFile):
+      try:
+         with open(sFile,'r') as fTable:
+            if fTable.readline().rstrip('\n') == sSignature:
+               for sLine in fTable:
+                  Fields = sLine.split()
+                  if len(Fields) == 2:
+                     MonthTable[int(Fields[0])] = int(Fields[1])
+      except (OSError, ValueError):
+         MonthTable = {}
+   return MonthTable
+# End Def
+
+def cmIslamicMonthStart (nElapsedMonths: int, nRule: int, Locale: CalendarLocale = None) -> int:
+#
+# Days date of the first day of the Islamic month nElapsedMonths after Muharram 1 AH
+#
+# Missing entries are calculated a full Islamic year at a time
+#
+   Key = cmIslamicMonthTableKey(nRule,Locale)
+   MonthTable = cmIslamicMonthTable(Key)
+   if nElapsedMonths not in MonthTable:
+      fnPhasisOnOrBefore = IslamicVisibilityRules[nRule][2]
+      if isinstance(fnPhasisOnOrBefore, str):
+         fnPhasisOnOrBefore = globals()[fnPhasisOnOrBefore]
+      nMonth = cmFloor(nElapsedMonths / 12) * 12
+      while nMonth < cmFloor(nElapsedMonths / 12) * 12 + 12:
+         if nMonth not in MonthTable:
+            if Key[1] is None:
+               MonthTable[nMonth] = fnPhasisOnOrBefore(ISLAMIC_EPOCH + cmFloor((nMonth + .5) * MeanSynodicMonth))
+            else:
+               MonthTable[nMonth] = fnPhasisOnOrBefore(ISLAMIC_EPOCH + cmFloor((nMonth + .5) * MeanSynodicMonth),Key[1])
+         nMonth = nMonth + 1
+      IslamicMonthTableChanged.add(Key)
+   return MonthTable[nElapsedMonths]
+# End Def
+
+def cmIslamicElapsedMonths (nDays: int, nRule: int, Locale: CalendarLocale = None) -> int:
+#
+# Find the month in the table whose first day is on or before nDays
+# and whose following month starts after nDays
+#
+   nElapsedMonths = cmFloor((nDays - ISLAMIC_EPOCH) / MeanSynodicMonth)
+   while cmIslamicMonthStart(nElapsedMonths,nRule,Locale) > nDays:
+      nElapsedMonths = nElapsedMonths - 1
+   while cmIslamicMonthStart(nElapsedMonths + 1,nRule,Locale) <= nDays:
+      nElapsedMonths = nElapsedMonths + 1
+   return nElapsedMonths
+# End Def
+
+def IslamicMonthTableSave (nRule: int, Locale: CalendarLocale = None) -> bool:
+#
+# Write the month table for nRule, observed from Locale, to disk
+#
+   return cmIslamicMonthTableWrite(cmIslamicMonthTableKey(nRule,Locale))
+# End Def
+
+def cmIslamicMonthTableWrite (Key: tuple) -> bool:
+#
+# Write the month table for Key to disk
+#
+   sFile = cmIslamicMonthTableFile(Key)
+   if sFile is None or Key not in IslamicMonthTable:
+      return False
+   sSignature = IslamicMonthTable[Key][0]
+   MonthTable = dict(IslamicMonthTable[Key][1])   # Other threads may still be adding months
+   sTemp = sFile + '.' + str(os.getpid()) + '.' + str(threading.get_ident())
+   try:
+      os.makedirs(IslamicMonthTableDirectory,exist_ok=True)
+      with open(sTemp,'w') as fTable:
+         fTable.write(sSignature + '\n')
+         for nElapsedMonths in sorted(MonthTable):
+            fTable.write(str(nElapsedMonths) + ' ' + str(MonthTable[nElapsedMonths]) + '\n')
+      os.replace(sTemp,sFile)   # Readers see the old or the new table, never a partial one
+   except OSError:
+      return False
+   IslamicMonthTableChanged.discard(Key)
+   return True
+# End Def
+
+def cmIslamicMonthTableSaveChanged () -> None:
+#
+# Persist every table that grew during this run
+#
+   for Key in list(IslamicMonthTableChanged):
+      cmIslamicMonthTableWrite(Key)
+# End Def
+
+def IslamicMonthTableBuild (nFromYear: int, nToYear: int, nRule: int, Locale: CalendarLocale = None) -> int:
+#
+# Fill the month table for Islamic years nFromYear through nToYear, observed
+# from Locale, and persist it when persistence is on. Returns the number of
+# months in the table
+#
+   nYear = nFromYear
+   while nYear <= nToYear:
+      cmIslamicMonthStart((nYear - 1) * 12,nRule,Locale)
+      nYear = nYear + 1
+   IslamicMonthTableSave(nRule,Locale)
+   return len(IslamicMonthTable[cmIslamicMonthTableKey(nRule,Locale)][1])
+# End Def
+
+def IslamicMonthTableClear (nRule: int, Locale: CalendarLocale = None) -> None:
+#
+# Discard the month tables for nRule in memory and on disk, only the table
+# observed from Locale when one is given
+#
+   KeysList = [Key for Key in list(IslamicMonthTable) if Key[0] == nRule and Locale is None]
+   if nRule in IslamicVisibilityRules:
+      KeysList.append(cmIslamicMonthTableKey(nRule,Locale))
+   for Key in KeysList:
+      IslamicMonthTable.pop(Key,None)
+      IslamicMonthTableChanged.discard(Key)
+      sFile = cmIslamicMonthTableFile(Key)
+      if sFile is not None and os.path.isfile(sFile):
+         try:
+            os.remove(sFile)
+         except OSError:
+            pass
+# End Def
+
+def IslamicMonthTablePersist (sPath: str) -> None:
+#
+# Keep the month tables between runs in directory sPath, for example
+# os.path.join(os.path.expanduser('~'),'.PYCalendrical'). Tables are read from
+# sPath on first use and those that grew are written back at exit. None turns
+# persistence off again
+#
+   global IslamicMonthTableDirectory
+   IslamicMonthTableDirectory = sPath
+   atexit.unregister(cmIslamicMonthTableSaveChanged)
+   if sPath is None:
+      return
+   for Key in list(IslamicMonthTable):   # Add the persisted months to tables already in memory
+      for nElapsedMonths, nDays in cmIslamicMonthTableRead(Key,IslamicMonthTable[Key][0]).items():
+         IslamicMonthTable[Key][1].setdefault(nElapsedMonths,nDays)
+      IslamicMonthTableChanged.add(Key)
+   atexit.register(cmIslamicMonthTableSaveChanged)
+# End Def
+
 def cmGregorianWeekDay (nDays: int) -> int:
 #
 # Calculate the Gregorian day of the week
@@ -652,40 +1604,36 @@ def cmGregorianYearFromDays (nDays: int) -> int:
    return pyDate.year
 # End Def
 
-def cmIslamicFromDays (nDays: int):
+def cmIslamicFromDays (nDays: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None):
 #
 # Given an Days Date, return Islamic Date
 #
-   IslamicDate = []
-   nCrescent = cmPhasisOnOrBefore(nDays)
-   nElaspedMonths = cmRound((nCrescent - ISLAMIC_EPOCH) / MeanSynodicMonth)
+   nElaspedMonths = cmIslamicElapsedMonths(nDays,nVisibilityRule,Locale)
    nYear = cmFloor(nElaspedMonths / 12) + 1
    nMonth = cmMod(nElaspedMonths,12) + 1
-   nDay = nDays - nCrescent + 1
-   IslamicDate.append(nMonth)
-   IslamicDate.append(nDay)
-   IslamicDate.append(nYear)
-   return IslamicDate
+   nDay = nDays - cmIslamicMonthStart(nElaspedMonths,nVisibilityRule,Locale) + 1
+   return IslamicDateRecord(nMonth,nDay,nYear)
 # End Def
 
-def IslamicFromDays (nDays: int, nHemisphere: int):
+def IslamicFromDays (nDays: int, nHemisphere: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None):
 #
 # Get Islamic date hemisphere aware
 #
-   IslamicDate = cmIslamicFromDays(nDays + nHemisphere)
+# nVisibilityRule starts the months, Locale is where a TOPOCENTRIC_VISIBILITY
+# crescent is observed from
+#
+   IslamicDate = cmIslamicFromDays(nDays + nHemisphere,nVisibilityRule,Locale)
    return IslamicDate
 # End Def
 
-def DaysFromIslamic (nMonth: int, nDay: int, nYear: int) -> int:
+def DaysFromIslamic (nMonth: int, nDay: int, nYear: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None) -> int:
 #
 # Given a Days Date, return Islamic Date
 #
-   nMidMonth = ISLAMIC_EPOCH \
-             + cmFloor(((nYear - 1) * 12 + nMonth - .5) * MeanSynodicMonth)
-   return cmPhasisOnOrBefore(nMidMonth) + nDay - 1
+   return cmIslamicMonthStart((nYear - 1) * 12 + nMonth - 1,nVisibilityRule,Locale) + nDay - 1
 # End Def
 
-def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear: int):
+def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None):
 #
 # Determine days dates of Islamic date in a Gregorian year
 #
@@ -699,11 +1647,11 @@ def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear:
    nSecondDate = 0
    nGregorianStart = date(nGregorianYear,January,1).toordinal()
    nGregorianEnd = date(nGregorianYear,December,31).toordinal()
-   IslamicDate = IslamicFromDays(nGregorianStart,EASTHEMISPHERE)
+   IslamicDate = IslamicFromDays(nGregorianStart,EASTHEMISPHERE,nVisibilityRule,Locale)
 #
 # Check first possible Islamic Year
 #
-   nDays = DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2] - 1)
+   nDays = DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2] - 1,nVisibilityRule,Locale)
    if nDays >= nGregorianStart and nDays <= nGregorianEnd:
       bFirstValidDate = True
       nFirstDate = nDays
@@ -711,7 +1659,7 @@ def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear:
 #
 # Check second possible Islamic Year
 #
-   nDays = DaysFromIslamic(nIslamicMonth,nIslamicDay,IslamicDate[2])
+   nDays = DaysFromIslamic(nIslamicMonth,nIslamicDay,IslamicDate[2],nVisibilityRule,Locale)
    if nDays >= nGregorianStart and nDays <= nGregorianEnd:
       if bFirstValidDate == False:
          bFirstValidDate = True
@@ -724,7 +1672,7 @@ def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear:
 # Check third possible Islamic Year
 #
    if bFirstValidDate == False or bSecondValidDate == False:
-      nDays = DaysFromIslamic(nIslamicMonth,nIslamicDay,IslamicDate[2] + 1)
+      nDays = DaysFromIslamic(nIslamicMonth,nIslamicDay,IslamicDate[2] + 1,nVisibilityRule,Locale)
       if nDays >= nGregorianStart and nDays <= nGregorianEnd:
          if bFirstValidDate == False:
             nFirstDate = nDays
@@ -740,7 +1688,7 @@ def cmIslamicInGregorian (nIslamicMonth: int, nIslamicDay: int, nGregorianYear:
    return IslamicInGregorian
 # End Def
 
-def IslamicDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: int) -> int:
+def IslamicDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None) -> int:
 #
 # Return Islamic dates occurring in a given Gregorian year
 # Dates can occur more than once in a given year, and,
@@ -754,7 +1702,7 @@ def IslamicDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule:
 #
 # Get days date of first Day of Month 10
 #
-      IslamicInGregorian = cmIslamicInGregorian(SHAWWAL,1,nGregorianYear)
+      IslamicInGregorian = cmIslamicInGregorian(SHAWWAL,1,nGregorianYear,nVisibilityRule,Locale)
       nFirstDate = IslamicInGregorian[0]
       bFirstValidDate = IslamicInGregorian[1]
       nSecondDate = IslamicInGregorian[2]
@@ -778,45 +1726,308 @@ def IslamicDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule:
       IslamicInGregorian = []
       IslamicInGregorian.append(nHoliday1)
    else:
-      IslamicInGregorian = cmIslamicInGregorian (nMonth,nDay,nGregorianYear)
+      IslamicInGregorian = cmIslamicInGregorian (nMonth,nDay,nGregorianYear,nVisibilityRule,Locale)
    return date.fromordinal(IslamicInGregorian[0])
 # End Def     
 
+def IslamicHolidaysInRange (nFromGregorianYear: int, nToGregorianYear: int, nVisibilityRule: int = NOON_UTC_VISIBILITY, Locale: CalendarLocale = None):
+#
+# Return [Name, date] for every Islamic holiday in Gregorian years
+# nFromGregorianYear through nToGregorianYear in date order
+#
+# A single scan of the month start table replaces the per year searches
+# of IslamicDateCalculation and returns every occurrence in the range
+#
+   HolidaysInRange = []
+   nGregorianStart = date(nFromGregorianYear,January,1).toordinal()
+   nGregorianEnd = date(nToGregorianYear,December,31).toordinal()
+   nElapsedMonths = cmIslamicElapsedMonths(nGregorianStart,nVisibilityRule,Locale)
+   nLastMonth = cmIslamicElapsedMonths(nGregorianEnd,nVisibilityRule,Locale)
+   while nElapsedMonths <= nLastMonth:
+      nMonth = cmMod(nElapsedMonths,12) + 1
+      nMonthStart = cmIslamicMonthStart(nElapsedMonths,nVisibilityRule,Locale)
+      i = 0
+      while i < len(IslamicHolidaysList):
+         nDays = 0
+         if IslamicHolidaysList[i + 3] == ISLAMIC_QUDS_DAY:
+            if nMonth == RAMADAN:
+               nDays = cmWeekDayBefore(Friday,cmIslamicMonthStart(nElapsedMonths + 1,nVisibilityRule,Locale))
+         elif IslamicHolidaysList[i + 1] == nMonth:
+            nDays = nMonthStart + IslamicHolidaysList[i + 2] - 1
+         if nDays >= nGregorianStart and nDays <= nGregorianEnd:
+            HolidaysInRange.append([IslamicHolidaysList[i],date.fromordinal(nDays)])
+         i = i + 4
+      nElapsedMonths = nElapsedMonths + 1
+   HolidaysInRange.sort(key=lambda Holiday: Holiday[1])
+   return HolidaysInRange
+# End Def
+
+def cmCrescentEphemeris (nHour: int) -> list:
 #
-# Show Islamic Date for today local and then both west and east of International Date Line
+# Lunar longitude, latitude, distance and solar longitude at UTC hour nHour
+# (hours since the epoch), the samples shared by every city in an evening
 #
-pyNow = CurrentDate()
-print ('Today Local: ' + str(pyNow))
-sLocalTimezone = str(cmLocalTimeZoneName())
-nLocalTimezoneOffset = cmTimeZoneOffset(sLocalTimezone)
-if nLocalTimezoneOffset < 0:
-   nLocalHemisphere = WESTHEMISPHERE
-else:
-   nLocalHemisphere = EASTHEMISPHERE  
-print ('Local Timezone: ' + sLocalTimezone + ' Offset Hours: ' + str(nLocalTimezoneOffset))
-nDays = pyNow.toordinal()
-print ("Today's Local Ordinal Days: " + str(nDays))
+   nMoment = nHour / 24
+   return [cmLunarLongitude(nMoment),cmLunarLatitude(nMoment),cmLunarDistance(nMoment),cmSolarLongitude(nMoment)]
+# End Def
 
-IslamicDate = IslamicFromDays(nDays,nLocalHemisphere)
-print ('Local Islamic Date: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
-print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+def cmCrescentEphemerisAt (nMoment: float, EphemerisCache: dict) -> list:
+#
+# Interpolate the hourly lunar and solar samples to UTC nMoment
+#
+# Samples are calculated once and kept in EphemerisCache, so cities with
+# sunsets in the same hour share the same two evaluations
+#
+   nHour = cmFloor(nMoment * 24)
+   if nHour not in EphemerisCache:
+      EphemerisCache[nHour] = cmCrescentEphemeris(nHour)
+   if nHour + 1 not in EphemerisCache:
+      EphemerisCache[nHour + 1] = cmCrescentEphemeris(nHour + 1)
+   Before = EphemerisCache[nHour]
+   After = EphemerisCache[nHour + 1]
+   nFraction = nMoment * 24 - nHour
+   Ephemeris = []
+   Ephemeris.append(cmCalcDegrees(Before[0] + cmMod3(After[0] - Before[0],-180,180) * nFraction))
+   Ephemeris.append(Before[1] + (After[1] - Before[1]) * nFraction)
+   Ephemeris.append(Before[2] + (After[2] - Before[2]) * nFraction)
+   Ephemeris.append(cmCalcDegrees(Before[3] + cmMod3(After[3] - Before[3],-180,180) * nFraction))
+   return Ephemeris
+# End Def
 
-IslamicDate = IslamicFromDays(nDays,WESTHEMISPHERE)
-print ('Islamic Date for West Hemisphere: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
-print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+def cmCrescentSolarState (nQuarter: int) -> list:
+#
+# Solar longitude, obliquity and equation of time at UTC quarter day nQuarter
+# (quarter days since the epoch), the solar samples shared by every city in
+# an evening
+#
+   nMoment = nQuarter / 4
+   return [cmSolarLongitude(nMoment),cmObliquity(cmJulianCenturies(nMoment)),cmEquationOfTime(nMoment)]
+# End Def
 
-IslamicDate = IslamicFromDays(nDays,EASTHEMISPHERE)
-print ('Islamic Date for East Hemisphere: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
-print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+def cmCrescentSolarStateAt (nMoment: float, nColumn: int, SolarCache: dict) -> float:
+#
+# Interpolate column nColumn (0 solar longitude, 1 obliquity, 2 equation of
+# time) of the quarter day solar samples to UTC nMoment
+#
+# Cubic interpolation between the four surrounding samples, exact at a
+# sample. Samples are calculated once and kept in SolarCache
+#
+   nQuarter = cmFloor(nMoment * 4)
+   for nSample in range(nQuarter - 1,nQuarter + 3):
+      if nSample not in SolarCache:
+         SolarCache[nSample] = cmCrescentSolarState(nSample)
+   f = nMoment * 4 - nQuarter
+   nBase = SolarCache[nQuarter][nColumn]
+   nBefore = SolarCache[nQuarter - 1][nColumn] - nBase
+   nAfter = SolarCache[nQuarter + 1][nColumn] - nBase
+   nLast = SolarCache[nQuarter + 2][nColumn] - nBase
+   if nColumn == 0:
+      nBefore = cmMod3(nBefore,-180,180)
+      nAfter = cmMod3(nAfter,-180,180)
+      nLast = cmMod3(nLast,-180,180)
+   nValue = nBase + f * ((f - 1) * ((2 - f) * nBefore + (f + 1) * nLast) / 6 - (f + 1) * (f - 2) * nAfter / 2)
+   if nColumn == 0:
+      return cmCalcDegrees(nValue)
+   return nValue
+# End Def
 
-print ('')
-print ('Islamic Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(IslamicHolidaysList):
-   print (IslamicHolidaysList[i] + ': ' + str(IslamicDateCalculation(IslamicHolidaysList[i + 1],IslamicHolidaysList[i + 2],pyNow.year,IslamicHolidaysList[i + 3])))      
-   i = i + 4
+def cmCrescentApproxSunset (nMoment: float, nLatitude: float, nLongitude: float, nDepression: float, SolarCache: dict) -> float:
+#
+# cmApproxMomentOfDepression in the evening with the solar longitude,
+# obliquity and equation of time interpolated from SolarCache
+#
+   nApprox = 0    # if return is 0, event did not occur
+   nDays = cmFloor(nMoment)
+   for nTry in (nMoment,nDays + 1):
+      nDeclination = cmArcSinDegrees(cmSinDegrees(cmCrescentSolarStateAt(cmUniversalFromLocal(nTry,nLongitude),1,SolarCache)) \
+                     * cmSinDegrees(cmCrescentSolarStateAt(nTry,0,SolarCache)))
+      nValue = cmTangentDegrees(nLatitude) \
+             * cmTangentDegrees(nDeclination) \
+             + (cmSinDegrees(nDepression) / (cmCoSineDegrees(nDeclination) * cmCoSineDegrees(nLatitude)))
+      if abs(nValue) <= 1:   # Event Occurs
+         nApparent = nDays + (.75 + cmMod3(cmArcSinDegrees(nValue) / 360,-.5,.5))
+         nApprox = nApparent - cmCrescentSolarStateAt(cmUniversalFromLocal(nApparent,nLongitude),2,SolarCache)
+         break
+   return nApprox
+# End Def
 
+def cmCrescentSunset (nDays: int, nLatitude: float, nLongitude: float, nElevation: float, SolarCache: dict) -> float:
+#
+# Sunset of nDays in Universal Time as cmSunSet(nDays,0,...,SUNRISE_SUNSET_TIME),
+# from the solar samples in SolarCache
+#
+   nDepression = cmAngle(0,SUNRISE_SUNSET_TIME,0) + cmSolarRefraction(nElevation,nLatitude)
+   nEvent = cmCrescentApproxSunset(nDays + .75,nLatitude,nLongitude,nDepression,SolarCache)
+   if nEvent != 0:
+      if abs(nDays + .75 - nEvent) >= 30 / 3600:   # Within 30 sec?
+         nEvent = cmCrescentApproxSunset(nEvent,nLatitude,nLongitude,nDepression,SolarCache)
+   return cmStandardFromLocal(nEvent,0,nLongitude)
+# End Def
+
+def cmAltitudeFromPosition (nMoment: float, nLatitude: float, nLongitude: float, nEclipticLatitude: float, nEclipticLongitude: float) -> float:
+#
+# Geocentric altitude at UTC nMoment of a body at the given ecliptic position
+#
+   nRightAscension = cmRightAscension(nMoment,nEclipticLatitude,nEclipticLongitude)
+   nDeclination = cmDeclination(nMoment,nEclipticLatitude,nEclipticLongitude)
+   nHourAngle = cmSiderealFromMoment(nMoment) + nLongitude - nRightAscension
+   return cmArcSinDegrees((cmSinDegrees(nLatitude) * cmSinDegrees(nDeclination)) \
+          + (cmCoSineDegrees(nLatitude) * cmCoSineDegrees(nDeclination) * cmCoSineDegrees(nHourAngle)))
+# End Def
+
+def cmCrescentZone (nQ: float) -> str:
+#
+# Yallop visibility zone for the q test value
+#
+   i = 0
+   while i < len(IslamicCrescentZonesList) - 3:
+      if nQ > IslamicCrescentZonesList[i + 2]:
+         return IslamicCrescentZonesList[i]
+      i = i + 3
+   return IslamicCrescentZonesList[i]
+# End Def
 
+def IslamicCrescentVisibility (nDays: int, CitiesList: list):
+#
+# Crescent visibility in the evening of nDays for every city in CitiesList
+#
+# CitiesList holds Name, Latitude, Longitude, Elevation (meters) per city.
+# Each city gets Name, sunset (UTC moment), moon age (hours), lag time
+# (minutes), arc of light and topocentric lunar altitude at sunset (degrees),
+# Yallop's q at the best time (sunset plus 4/9 of the lag) and the zone.
+#
+# The conjunction is found once per evening and the lunar and solar
+# positions are sampled hourly and shared across the cities. Sunsets come
+# from quarter day solar samples (longitude, obliquity, equation of time)
+# shared the same way. Altitudes match cmTopocentricLunarAltitude, moonset
+# uses the same horizon
+#
+   VisibilityList = []
+   EphemerisCache = {}
+   SolarCache = {}
+   nNewMoon = cmNthNewMoon(cmRound((nDays + .75 - NthNewMoonEpoch) / MeanSynodicMonth))
+   i = 0
+   while i < len(CitiesList):
+      sName = CitiesList[i]
+      nLatitude = CitiesList[i + 1]
+      nLongitude = CitiesList[i + 2]
+      nElevation = CitiesList[i + 3]
+      i = i + 4
+      nRefraction = cmSolarRefraction(nElevation,nLatitude)
+      nSunset = cmCrescentSunset(nDays,nLatitude,nLongitude,nElevation,SolarCache)
+      if nSunset < nDays - 1:   # Sun does not set
+         VisibilityList.append([sName,0,0,0,0,0,0,IslamicCrescentZonesList[-3]])
+         continue
+      nMoonAge = (nSunset - nNewMoon) * 24
+      Ephemeris = cmCrescentEphemerisAt(nSunset,EphemerisCache)
+      nArcOfLight = cmArcCoSineDegrees(cmCoSineDegrees(Ephemeris[1]) * cmCoSineDegrees(Ephemeris[0] - Ephemeris[3]))
+      nRightAscension = cmRightAscension(nSunset,Ephemeris[1],Ephemeris[0])
+      nDeclination = cmDeclination(nSunset,Ephemeris[1],Ephemeris[0])
+      nHourAngle = cmMod3(cmSiderealFromMoment(nSunset) + nLongitude - nRightAscension,-180,180)
+      nGeocentricAltitude = cmArcSinDegrees((cmSinDegrees(nLatitude) * cmSinDegrees(nDeclination)) \
+                          + (cmCoSineDegrees(nLatitude) * cmCoSineDegrees(nDeclination) * cmCoSineDegrees(nHourAngle)))
+      nParallaxRatio = cmEarthRadius(nLatitude) / Ephemeris[2]
+      nAltitude = nGeocentricAltitude - cmArcSinDegrees(nParallaxRatio * cmCoSineDegrees(nGeocentricAltitude)) + nRefraction
+#
+# Lag time from the hour angle where the topocentric altitude reaches zero
+#
+      nSetHourAngle = (cmSinDegrees(cmArcSinDegrees(nParallaxRatio) - nRefraction) \
+                    - cmSinDegrees(nLatitude) * cmSinDegrees(nDeclination)) \
+                    / (cmCoSineDegrees(nLatitude) * cmCoSineDegrees(nDeclination))
+      if nSetHourAngle > 1:   # Moon does not rise
+         nLagTime = 0
+      else:
+         nLagTime = ((cmArcCoSineDegrees(max(nSetHourAngle,-1)) - nHourAngle) / LunarHourAngleRate) * 1440
+#
+# Yallop q test at the best time
+#
+      if nMoonAge <= 0 or nLagTime <= 0:
+         nQ = -1
+      else:
+         nBestTime = nSunset + (nLagTime * 4 / 9) / 1440
+         Ephemeris = cmCrescentEphemerisAt(nBestTime,EphemerisCache)
+         nLunarAltitude = cmAltitudeFromPosition(nBestTime,nLatitude,nLongitude,Ephemeris[1],Ephemeris[0])
+         nArcOfVision = nLunarAltitude - cmAltitudeFromPosition(nBestTime,nLatitude,nLongitude,0,Ephemeris[3])
+         nSemiDiameter = cmArcSinDegrees(MoonRadius / Ephemeris[2]) * 60 \
+                       * (1 + cmSinDegrees(nLunarAltitude) * nParallaxRatio)
+         nWidth = nSemiDiameter * (1 - cmCoSineDegrees(cmArcCoSineDegrees(cmCoSineDegrees(Ephemeris[1]) * cmCoSineDegrees(Ephemeris[0] - Ephemeris[3]))))
+         nQ = (nArcOfVision - (11.8371 - 6.3226 * nWidth + .7319 * nWidth**2 - .1018 * nWidth**3)) / 10
+      VisibilityList.append([sName,nSunset,nMoonAge,nLagTime,nArcOfLight,nAltitude,nQ,cmCrescentZone(nQ)])
+   return VisibilityList
+# End Def
 
+def IslamicCrescentZones (VisibilityList: list) -> dict:
+#
+# Group the cities returned by IslamicCrescentVisibility by visibility zone
+#
+   Zones = {}
+   i = 0
+   while i < len(IslamicCrescentZonesList):
+      Zones[IslamicCrescentZonesList[i]] = []
+      i = i + 3
+   for Visibility in VisibilityList:
+      Zones[Visibility[7]].append(Visibility[0])
+   return Zones
+# End Def
 
+if __name__ == '__main__':
+   #
+   # Show Islamic Date for today local and then both west and east of International Date Line
+   #
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   sLocalTimezone = str(cmLocalTimeZoneName())
+   nLocalTimezoneOffset = cmTimeZoneOffset(sLocalTimezone)
+   if nLocalTimezoneOffset < 0:
+      nLocalHemisphere = WESTHEMISPHERE
+   else:
+      nLocalHemisphere = EASTHEMISPHERE  
+   print ('Local Timezone: ' + sLocalTimezone + ' Offset Hours: ' + str(nLocalTimezoneOffset))
+   nDays = pyNow.toordinal()
+   print ("Today's Local Ordinal Days: " + str(nDays))
+
+   IslamicDate = IslamicFromDays(nDays,nLocalHemisphere)
+   print ('Local Islamic Date: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
+   print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+
+   IslamicDate = IslamicFromDays(nDays,WESTHEMISPHERE)
+   print ('Islamic Date for West Hemisphere: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
+   print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+
+   IslamicDate = IslamicFromDays(nDays,EASTHEMISPHERE)
+   print ('Islamic Date for East Hemisphere: ' + IslamicMonthNamesList[IslamicDate[0] - 1] + ' ' + str(IslamicDate[1]) + ', ' + str(IslamicDate[2]))
+   print ('Days from Islamic Date: ' + str(DaysFromIslamic(IslamicDate[0],IslamicDate[1],IslamicDate[2])))
+
+   print ('')
+   print ('Islamic Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(IslamicHolidaysList):
+      print (IslamicHolidaysList[i] + ': ' + str(IslamicDateCalculation(IslamicHolidaysList[i + 1],IslamicHolidaysList[i + 2],pyNow.year,IslamicHolidaysList[i + 3])))      
+      i = i + 4
+
+   print ('')
+   print ('Islamic Holidays during Gregorian Years ' + str(pyNow.year) + ' to ' + str(pyNow.year + 2))
+   print ('')
+   for Holiday in IslamicHolidaysInRange(pyNow.year,pyNow.year + 2):
+      print (Holiday[0] + ': ' + str(Holiday[1]))
+
+   #
+   # Crescent visibility on the evening before the next Islamic month
+   #
+   CitiesList = [
+      'Mecca',21.4225,39.8262,277,
+      'Cairo',30.0444,31.2357,23,
+      'Jakarta',-6.2088,106.8456,8,
+      'Cape Town',-33.9249,18.4241,25,
+      'Los Angeles',33.942496,-118.408049,38.95344
+   ]
+   IslamicDate = IslamicFromDays(nDays,EASTHEMISPHERE)
+   nEvening = nDays - IslamicDate[1] + 29
+   while cmIslamicFromDays(nEvening + 1)[1] != 1:
+      nEvening = nEvening + 1
+   print ('')
+   print ('Crescent Visibility on the evening of ' + str(date.fromordinal(nEvening)))
+   print ('')
+   for Visibility in IslamicCrescentVisibility(nEvening,CitiesList):
+      print (Visibility[0] + ': Zone ' + Visibility[7] + ' Moon Age ' + str(round(Visibility[2],1)) + ' hours Lag ' + str(round(Visibility[3])) + ' minutes Altitude ' + str(round(Visibility[5],1)))
@@ -44,6 +44,11 @@ JULIAN_EPOCH = -1   # December 30, 0000
 MonthNames = ['January','February','March','April','May','June','July','August','September','October','November','December']
 WeekDayNames = ['Sunday','Monday','Tuesday','Wednesday','Thursday','Friday','Saturday']
 
+#
+# Date returned by JulianFromDays
+#
+JulianDateRecord = namedtuple('JulianDateRecord', ['Month', 'Day', 'Year', 'WeekDay', 'LeapYear'])
+
 def CurrentDate () -> date:
 #
 # Retrieve the current date
@@ -74,7 +79,7 @@ def cmJulianLeapYear (nYear: int):
       nLeapYear = True
    elif nYear == 0:
       nLeapYear = True
-   elif cmFloor(cmMod(nYear,4)) == 3:
+   elif nYear < 0 and cmFloor(cmMod(nYear,4)) == 3:
      nLeapYear = True
    return nLeapYear
 # End Def
@@ -142,13 +147,7 @@ def JulianFromDays (nDays: int):
       nCorrection = 2
    nMonth = cmFloor((1 / 367) * (12 * (nPriorDays + nCorrection) + 373))
    nDay = nDays - DaysFromJulian(nMonth,1,nYear) + 1
-   JulianDate = []
-   JulianDate.append(nMonth)
-   JulianDate.append(nDay)
-   JulianDate.append(nYear)
-   JulianDate.append(nWeekDay)
-   JulianDate.append(nLeapYear)
-   return JulianDate
+   return JulianDateRecord(nMonth,nDay,nYear,nWeekDay,nLeapYear)
 # End Def
 
 def OrthodoxEasterDate (nYear: int) -> date:
@@ -179,10 +178,11 @@ def FormatJulianDate (JulianDate) -> str:
    return  WeekDayNames[JulianDate[3]] + ', ' + MonthNames[JulianDate[0] - 1] + ' ' + str(JulianDate[1]) + ', ' + str(JulianDate[2]) + sLeapYear
 # End Def 
 
-pyNow = CurrentDate()
-print ("Today: " + str(pyNow))
-print ("Today's Ordinal Days: " + str(pyNow.toordinal()))
-JulianDate = JulianFromDays(pyNow.toordinal())
-print ('Julian Date: ' + FormatJulianDate(JulianDate))
-print ("DaysFromJulian: " + str(DaysFromJulian(JulianDate[0],JulianDate[1],JulianDate[2])))
-print ("Orthodox Easter: " + str(OrthodoxEasterDate(pyNow.year)))
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   print ("Today: " + str(pyNow))
+   print ("Today's Ordinal Days: " + str(pyNow.toordinal()))
+   JulianDate = JulianFromDays(pyNow.toordinal())
+   print ('Julian Date: ' + FormatJulianDate(JulianDate))
+   print ("DaysFromJulian: " + str(DaysFromJulian(JulianDate[0],JulianDate[1],JulianDate[2])))
+   print ("Orthodox Easter: " + str(OrthodoxEasterDate(pyNow.year)))
@@ -0,0 +1,380 @@
+########################################################################################
+# File: PYMemo.py
+# Contents: Persistent cache of expensive astronomical event calculations.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-19
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Persistent Memo Cache
+#
+# New moons, equinoxes, solstices and the solar new years of the Persian and
+# Bahai calendars depend only on their arguments (and, for the equinoxes, on the
+# local time zone), yet every process recomputes them from nothing. MemoInstall
+# replaces those functions in a calendar module with a cached version that
+# keeps results in memory and in an SQLite file shared by every process:
+#
+#    import PYChinese, PYMemo
+#    PYMemo.MemoInstall(PYChinese)
+#
+# Results are keyed by function name, arguments (Locale records included) and
+# any module values listed for the function. Each function also has an algorithm version made from
+# the version number in MemoTargetsList and its compiled code. Rows written
+# under another version are deleted when the function is installed, so a
+# changed algorithm never returns an old result.
+#
+# The file uses SQLite write-ahead logging, so any number of processes read
+# it while one writes. New results are written MEMO_FLUSH_SIZE at a time and
+# at exit. MemoWarmUp fills the cache ahead of time.
+#
+
+from datetime import date, datetime, timezone
+import atexit
+import hashlib
+import inspect
+import os
+import sqlite3
+import threading
+import pytz
+
+#
+# Global variables
+#
+
+MEMO_LAYOUT = 1   # Cache file layout, bump to discard every file written before
+MEMO_FLUSH_SIZE = 256   # New results held before writing to the file
+MEMO_BUSY_TIMEOUT = 5000   # Milliseconds to wait for another writer
+MEAN_SYNODIC_MONTH = 29.530588861
+NTH_NEW_MOON_EPOCH = 11.458922815748194   # cmNthNewMoon(0), January 11, 0001
+
+SPRING = 0
+SUMMER = 90
+AUTUMN = 180
+WINTER = 270
+
+December = 12
+
+MemoDirectory = os.path.join(os.path.expanduser('~'),'.PYCalendrical')
+MemoFileName = 'Memo.sqlite'
+
+#
+# Module, Function, Version, module values the result depends on
+#
+# Increase Version when a change outside the function itself (a helper or a
+# constant) alters its results
+#
+MemoTargetsList = [
+   'PYAstronomy','cmNthNewMoon',1,[],
+   'PYAstronomy','SeasonalEquinox',1,['LocalTimeZoneName'],
+   'PYBahai','cmNthNewMoon',1,[],
+   'PYBahai','cmBahaiNewYearOnOrBefore',2,['BahaiLocale'],
+   'PYChinese','cmNthNewMoon',1,[],
+   'PYChinese','cmChineseWinterSolsticeOnOrBefore',1,[],
+   'PYHindu','cmNthNewMoon',1,[],
+   'PYIslamic','cmNthNewMoon',1,[],
+   'PYPersian','cmPersianNewYearOnOrBefore',2,['PersianLocale'],
+   'PYSamaritan','cmNthNewMoon',1,[]
+]
+
+#
+# 'Module.Function' -> [Module, fnOriginal, sVersion, ContextList, ValuesDict, Signature]
+#
+MemoInstalled = {}
+MemoPending = []
+MemoCounts = {'Memory': 0, 'File': 0, 'Computed': 0}
+MemoLock = threading.RLock()
+MemoConnection = None
+MemoProcess = 0
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmMemoFile () -> str:
+#
+# Full path of the cache file
+#
+   return os.path.join(MemoDirectory,MemoFileName)
+# End Def
+
+def cmMemoOpen ():
+#
+# Open (or create) the cache file, in memory only if it cannot be written
+#
+   try:
+      os.makedirs(MemoDirectory,exist_ok=True)
+      Connection = sqlite3.connect(cmMemoFile(),timeout=MEMO_BUSY_TIMEOUT / 1000,check_same_thread=False)
+      Connection.execute('PRAGMA journal_mode=WAL')
+   except (OSError, sqlite3.Error):
+      Connection = sqlite3.connect(':memory:',check_same_thread=False)
+   Connection.execute('PRAGMA busy_timeout=' + str(MEMO_BUSY_TIMEOUT))
+   Connection.execute('PRAGMA synchronous=NORMAL')
+   if Connection.execute('PRAGMA user_version').fetchone()[0] != MEMO_LAYOUT:
+      Connection.execute('DROP TABLE IF EXISTS Memo')
+      Connection.execute('PRAGMA user_version=' + str(MEMO_LAYOUT))
+   Connection.execute('CREATE TABLE IF NOT EXISTS Memo (Function TEXT, Arguments TEXT, Version TEXT, Value, ' \
+                      + 'PRIMARY KEY (Function, Arguments)) WITHOUT ROWID')
+   Connection.commit()
+   return Connection
+# End Def
+
+def cmMemoConnection ():
+#
+# Connection for this process, reopened after a fork
+#
+# Callers hold MemoLock
+#
+   global MemoConnection, MemoProcess
+   if MemoConnection is None or MemoProcess != os.getpid():
+      MemoConnection = cmMemoOpen()
+      MemoProcess = os.getpid()
+   return MemoConnection
+# End Def
+
+def cmMemoVersion (fnFunction, nVersion: int) -> str:
+#
+# Algorithm version of fnFunction: the given version number and a digest of its code
+#
+   Code = fnFunction.__code__
+   sDigest = hashlib.sha1(Code.co_code + repr(Code.co_consts).encode('utf-8')).hexdigest()
+   return str(nVersion) + '-' + sDigest[:16]
+# End Def
+
+def cmMemoEncode (Value):
+#
+# Value as stored in the file. Numbers are stored as is, aware datetimes as
+# UTC ISO text followed by their time zone name
+#
+   if isinstance(Value, datetime):
+      sZone = getattr(Value.tzinfo,'zone',None) or str(Value.tzinfo)
+      return 'datetime ' + Value.astimezone(timezone.utc).isoformat() + ' ' + sZone
+   if isinstance(Value, (int, float)):
+      return Value
+   raise TypeError('Cannot cache ' + type(Value).__name__ + ' results')
+# End Def
+
+def cmMemoDecode (Value):
+#
+# Value as returned by the original function
+#
+   if isinstance(Value, str):
+      sType, sMoment, sZone = Value.split(' ')
+      return datetime.fromisoformat(sMoment).astimezone(pytz.timezone(sZone))
+   return Value
+# End Def
+
+def cmMemoKey (Entry: list, Arguments: tuple) -> str:
+#
+# Cache key for Arguments, including the module values the result depends on
+#
+   sKey = repr(Arguments)
+   for sName in Entry[3]:
+      Value = getattr(Entry[0],sName)
+      if callable(Value):
+         Value = Value()
+      sKey = sKey + ' ' + sName + '=' + str(Value)
+   return sKey
+# End Def
+
+def cmMemoArguments (Signature, Arguments: tuple, Keywords: dict) -> tuple:
+#
+# Arguments and Keywords of a call as the positional arguments of Signature,
+# defaults included, so every form of the same call shares one key
+#
+   if not Keywords and len(Arguments) == len(Signature.parameters):
+      return Arguments
+   Bound = Signature.bind(*Arguments,**Keywords)
+   Bound.apply_defaults()
+   return tuple(Bound.arguments.values())
+# End Def
+
+def cmMemoFunction (sName: str):
+#
+# Cached replacement for the installed function sName
+#
+   def fnMemo (*Arguments, **Keywords):
+      Entry = MemoInstalled[sName]
+      Arguments = cmMemoArguments(Entry[5],Arguments,Keywords)
+      sKey = cmMemoKey(Entry,Arguments)
+      Values = Entry[4]
+      if sKey in Values:
+         MemoCounts['Memory'] = MemoCounts['Memory'] + 1
+         return Values[sKey]
+      with MemoLock:
+         Row = cmMemoConnection().execute('SELECT Value FROM Memo WHERE Function = ? AND Arguments = ? AND Version = ?', \
+                                          (sName,sKey,Entry[2])).fetchone()
+      if Row is not None:
+         MemoCounts['File'] = MemoCounts['File'] + 1
+         Value = cmMemoDecode(Row[0])
+      else:
+         MemoCounts['Computed'] = MemoCounts['Computed'] + 1
+         Value = Entry[1](*Arguments)
+         with MemoLock:
+            MemoPending.append((sName,sKey,Entry[2],cmMemoEncode(Value)))
+            if len(MemoPending) >= MEMO_FLUSH_SIZE:
+               MemoFlush()
+      Values[sKey] = Value
+      return Value
+   fnMemo.__name__ = sName.split('.')[-1]
+   fnMemo.__wrapped__ = MemoInstalled[sName][1]
+   return fnMemo
+# End Def
+
+def MemoInstall (Module) -> list:
+#
+# Replace the functions of Module listed in MemoTargetsList with cached versions
+#
+# Calls made inside the module use the cached versions as well. Returns the
+# names installed
+#
+   InstalledList = []
+   for i in range(0,len(MemoTargetsList),4):
+      if MemoTargetsList[i] != Module.__name__:
+         continue
+      sName = MemoTargetsList[i] + '.' + MemoTargetsList[i + 1]
+      if sName in MemoInstalled:
+         continue
+      fnOriginal = getattr(Module,MemoTargetsList[i + 1])
+      sVersion = cmMemoVersion(fnOriginal,MemoTargetsList[i + 2])
+      with MemoLock:
+         Connection = cmMemoConnection()
+         try:
+            Connection.execute('DELETE FROM Memo WHERE Function = ? AND Version <> ?',(sName,sVersion))
+            Connection.commit()
+         except sqlite3.OperationalError:
+            Connection.rollback()
+      MemoInstalled[sName] = [Module,fnOriginal,sVersion,MemoTargetsList[i + 3],{},inspect.signature(fnOriginal)]
+      setattr(Module,MemoTargetsList[i + 1],cmMemoFunction(sName))
+      InstalledList.append(sName)
+   return InstalledList
+# End Def
+
+def MemoUninstall (Module):
+#
+# Restore the original functions of Module
+#
+   MemoFlush()
+   for sName in list(MemoInstalled):
+      Entry = MemoInstalled[sName]
+      if Entry[0] is Module:
+         setattr(Module,sName.split('.')[-1],Entry[1])
+         del MemoInstalled[sName]
+# End Def
+
+def MemoFlush () -> int:
+#
+# Write new results to the cache file, returns the number written
+#
+# When another process holds the file the results stay pending for the next flush
+#
+   global MemoPending
+   with MemoLock:
+      if len(MemoPending) == 0:
+         return 0
+      Connection = cmMemoConnection()
+      try:
+         Connection.executemany('INSERT OR REPLACE INTO Memo VALUES (?, ?, ?, ?)',MemoPending)
+         Connection.commit()
+      except sqlite3.OperationalError:
+         Connection.rollback()
+         return 0
+      nWritten = len(MemoPending)
+      MemoPending = []
+      return nWritten
+# End Def
+
+def MemoClear ():
+#
+# Discard every cached result, in memory and in the file
+#
+   global MemoPending
+   with MemoLock:
+      MemoPending = []
+      for sName in MemoInstalled:
+         MemoInstalled[sName][4].clear()
+      Connection = cmMemoConnection()
+      Connection.execute('DELETE FROM Memo')
+      Connection.commit()
+# End Def
+
+def MemoStatistics () -> dict:
+#
+# Results served from memory and from the file, results computed, and rows in the file
+#
+   Statistics = dict(MemoCounts)
+   with MemoLock:
+      Statistics['Rows'] = cmMemoConnection().execute('SELECT COUNT(*) FROM Memo').fetchone()[0]
+   Statistics['Pending'] = len(MemoPending)
+   return Statistics
+# End Def
+
+def MemoWarmUp (sName: str, ArgumentsList) -> int:
+#
+# Cache the installed function sName ('PYChinese.cmNthNewMoon') for every
+# argument tuple in ArgumentsList, returns the number computed
+#
+   if sName not in MemoInstalled:
+      raise ValueError(sName + ' is not installed')
+   Entry = MemoInstalled[sName]
+   fnMemo = getattr(Entry[0],sName.split('.')[-1])
+   nComputed = MemoCounts['Computed']
+   for Arguments in ArgumentsList:
+      fnMemo(*Arguments)
+   MemoFlush()
+   return MemoCounts['Computed'] - nComputed
+# End Def
+
+def MemoWarmUpYears (nFromYear: int, nToYear: int) -> int:
+#
+# Cache every installed function over Gregorian years nFromYear through nToYear:
+# the new moons, the four seasonal events and the new year searches made for
+# dates in those years. Returns the number computed
+#
+   nFromDays = date(nFromYear,1,1).toordinal()
+   nToDays = date(nToYear,December,31).toordinal()
+   nFirstMoon = int((nFromDays - NTH_NEW_MOON_EPOCH) // MEAN_SYNODIC_MONTH)
+   nLastMoon = int((nToDays - NTH_NEW_MOON_EPOCH) // MEAN_SYNODIC_MONTH) + 1
+   nComputed = 0
+   for sName in list(MemoInstalled):
+      sFunction = sName.split('.')[-1]
+      if sFunction == 'cmNthNewMoon':
+         ArgumentsList = [(n,) for n in range(nFirstMoon,nLastMoon + 1)]
+      elif sFunction == 'SeasonalEquinox':
+         ArgumentsList = [(nYear,nEvent) for nYear in range(nFromYear,nToYear + 1) for nEvent in (SPRING,SUMMER,AUTUMN,WINTER)]
+      elif sFunction == 'cmChineseWinterSolsticeOnOrBefore':
+         ArgumentsList = [(date(nYear,December,31).toordinal(),0) for nYear in range(nFromYear,nToYear + 1)]
+      elif sFunction == 'cmBahaiNewYearOnOrBefore':
+         ArgumentsList = [(date(nYear,December,31).toordinal(),MemoInstalled[sName][0].BahaiLocale) for nYear in range(nFromYear,nToYear + 1)]
+      else:
+         ArgumentsList = [(date(nYear,December,31).toordinal(),MemoInstalled[sName][0].PersianLocale) for nYear in range(nFromYear,nToYear + 1)]
+      nComputed = nComputed + MemoWarmUp(sName,ArgumentsList)
+   return nComputed
+# End Def
+
+atexit.register(MemoFlush)
+
+if __name__ == '__main__':
+   #
+   # Cache the Persian and Chinese calendars and time a cold and a warm year of dates
+   #
+   import time
+   import PYChinese
+   import PYPersian
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   print ('Cache file: ' + cmMemoFile())
+   print ('Installed: ' + str(MemoInstall(PYPersian) + MemoInstall(PYChinese)))
+   nDays = pyNow.toordinal()
+   for sPass in ['First', 'Second']:
+      nStart = time.perf_counter()
+      for nDay in range(nDays,nDays + 366,7):
+         PYPersian.PersianFromDays(nDay)
+         PYChinese.cmChineseFromDays(nDay,PYChinese.CHINESE)
+      print (sPass + ' pass: ' + str(round(time.perf_counter() - nStart,3)) + ' seconds')
+   MemoFlush()
+   print ('Statistics: ' + str(MemoStatistics()))
@@ -0,0 +1,250 @@
+########################################################################################
+# File: PYParallel.py
+# Contents: Parallel batch execution of calendar conversions.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-21
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Parallel Batch Conversions
+#
+# ParallelMap runs any of the *FromDays, DaysFrom* or *DateCalculation functions
+# over a list of arguments on several cores and returns the results in order:
+#
+#    ParallelMap(PYHebrew.HebrewFromDays,range(738000,748000))
+#    ParallelMap(PYPersian.DaysFromPersian,[(1,1,1400),(1,1,1401)])
+#
+# On a free-threaded (no GIL) CPython the work is spread over a thread pool, so
+# every worker shares one copy of each cache. Otherwise a process pool is used
+# and each process keeps its own caches. Arguments are sent to workers in
+# contiguous chunks, so each worker converts neighbouring dates and reuses the
+# new years and month starts it has already found.
+#
+# Caches shared by threads are safe to use concurrently: PYCache stripes every
+# cache over independently locked parts, the Samaritan year and Islamic month
+# tables only ever gain entries, and PYMemo serializes its file access.
+#
+# ParallelBenchmark times a workload with 1, 2, 4, 8 ... workers and reports the
+# speedup over one worker.
+#
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from itertools import repeat
+import atexit
+import importlib
+import inspect
+import os
+import sys
+import threading
+import time
+
+#
+# Global variables
+#
+
+PARALLEL_AUTO = 0   # Threads when the GIL is disabled, processes otherwise
+PARALLEL_THREADS = 1
+PARALLEL_PROCESSES = 2
+PARALLEL_SERIAL = 3
+
+PARALLEL_CHUNKS_PER_WORKER = 4   # Chunks handed to each worker, evens out slow dates
+PARALLEL_MINIMUM_CHUNK = 16
+
+ParallelModeNames = ['Auto','Threads','Processes','Serial']
+
+#
+# (Mode, Workers) -> executor, kept so worker caches stay warm between calls
+#
+ParallelExecutors = {}
+ParallelLock = threading.Lock()
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def ParallelFreeThreaded () -> bool:
+#
+# True when running on a CPython build with the GIL disabled
+#
+   fnGilEnabled = getattr(sys,'_is_gil_enabled',None)
+   return fnGilEnabled is not None and fnGilEnabled() == False
+# End Def
+
+def cmParallelMode (nMode: int) -> int:
+#
+# Resolve PARALLEL_AUTO to threads or processes
+#
+   if nMode == PARALLEL_AUTO:
+      if ParallelFreeThreaded() == True:
+         return PARALLEL_THREADS
+      return PARALLEL_PROCESSES
+   return nMode
+# End Def
+
+def cmParallelWorkers (nWorkers: int) -> int:
+#
+# Number of workers, one per core when nWorkers is 0
+#
+   if nWorkers is None or nWorkers < 1:
+      return os.cpu_count() or 1
+   return nWorkers
+# End Def
+
+def cmParallelExecutor (nMode: int, nWorkers: int):
+#
+# Pool of nWorkers threads or processes, created on first use and then reused
+#
+   with ParallelLock:
+      Key = (nMode,nWorkers)
+      if Key not in ParallelExecutors:
+         if nMode == PARALLEL_THREADS:
+            ParallelExecutors[Key] = ThreadPoolExecutor(max_workers=nWorkers,thread_name_prefix='PYParallel')
+         else:
+            ParallelExecutors[Key] = ProcessPoolExecutor(max_workers=nWorkers)
+      return ParallelExecutors[Key]
+# End Def
+
+def ParallelShutdown ():
+#
+# Stop every pool. Pools are created again when next needed
+#
+   with ParallelLock:
+      for Key in list(ParallelExecutors):
+         ParallelExecutors.pop(Key).shutdown(wait=True)
+# End Def
+
+def cmParallelArguments (ArgumentsList) -> list:
+#
+# Argument tuples, a single argument may be given without a tuple
+#
+   TuplesList = []
+   for Arguments in ArgumentsList:
+      if isinstance(Arguments, tuple):
+         TuplesList.append(Arguments)
+      else:
+         TuplesList.append((Arguments,))
+   return TuplesList
+# End Def
+
+def cmParallelReference (fnFunction):
+#
+# (Module, Name) under which a worker process finds fnFunction, or fnFunction
+# itself when it is not a module attribute
+#
+# Functions replaced by PYCache or PYMemo are closures that cannot be pickled,
+# so they are sent by name and the worker takes the module's current function
+#
+   fnOriginal = inspect.unwrap(fnFunction)
+   Module = sys.modules.get(fnOriginal.__module__)
+   if Module is not None and getattr(Module,fnOriginal.__name__,None) is fnFunction:
+      return (fnOriginal.__module__,fnOriginal.__name__)
+   return fnFunction
+# End Def
+
+def cmParallelChunk (fnFunction, ChunkList) -> list:
+#
+# Worker task: call fnFunction, or the function a cmParallelReference names,
+# for every argument tuple in ChunkList
+#
+   if isinstance(fnFunction, tuple):
+      fnFunction = getattr(importlib.import_module(fnFunction[0]),fnFunction[1])
+   return [fnFunction(*Arguments) for Arguments in ChunkList]
+# End Def
+
+def ParallelMap (fnFunction, ArgumentsList, nWorkers: int = 0, nMode: int = PARALLEL_AUTO, nChunkSize: int = 0) -> list:
+#
+# Call fnFunction for every entry of ArgumentsList on nWorkers workers
+# (one per core when 0) and return the results in the same order
+#
+# fnFunction must be a module level function, for example PYHebrew.HebrewFromDays,
+# so it can be sent to worker processes; functions replaced by PYCache or PYMemo
+# are sent by name. nChunkSize is the number of calls per
+# task, chosen from the list length when 0
+#
+   TuplesList = cmParallelArguments(ArgumentsList)
+   nMode = cmParallelMode(nMode)
+   nWorkers = cmParallelWorkers(nWorkers)
+   if nMode == PARALLEL_SERIAL or nWorkers == 1 or len(TuplesList) <= PARALLEL_MINIMUM_CHUNK:
+      return cmParallelChunk(fnFunction,TuplesList)
+   if nChunkSize < 1:
+      nChunkSize = max(PARALLEL_MINIMUM_CHUNK,-(-len(TuplesList) // (nWorkers * PARALLEL_CHUNKS_PER_WORKER)))
+   ChunksList = [TuplesList[i:i + nChunkSize] for i in range(0,len(TuplesList),nChunkSize)]
+   Executor = cmParallelExecutor(nMode,nWorkers)
+   if nMode == PARALLEL_PROCESSES:
+      fnFunction = cmParallelReference(fnFunction)
+   ResultsList = []
+   for ChunkResults in Executor.map(cmParallelChunk,repeat(fnFunction),ChunksList):
+      ResultsList.extend(ChunkResults)
+   return ResultsList
+# End Def
+
+def ParallelFromDays (fnFromDays, nFromDays: int, nToDays: int, Locale = None, nWorkers: int = 0, nMode: int = PARALLEL_AUTO) -> list:
+#
+# Convert days dates nFromDays through nToDays with fnFromDays in parallel
+#
+# Locale is passed to fnFromDays when given (PYHindu, PYBahai, PYPersian, PYSamaritan)
+#
+   if Locale is None:
+      ArgumentsList = [(nDays,) for nDays in range(nFromDays,nToDays + 1)]
+   else:
+      ArgumentsList = [(nDays,Locale) for nDays in range(nFromDays,nToDays + 1)]
+   return ParallelMap(fnFromDays,ArgumentsList,nWorkers,nMode)
+# End Def
+
+def ParallelBenchmark (fnFunction, ArgumentsList, WorkersList = None, nMode: int = PARALLEL_AUTO) -> list:
+#
+# Time fnFunction over ArgumentsList with each worker count in WorkersList
+#
+# Returns [Workers, Seconds, Speedup, Efficiency] per worker count. Every run
+# starts with fresh pools (cold worker caches) and its results are checked
+# against the single worker run
+#
+   if WorkersList is None:
+      WorkersList = []
+      nWorkers = 1
+      while nWorkers <= max(8,cmParallelWorkers(0)):
+         WorkersList.append(nWorkers)
+         nWorkers = nWorkers * 2
+   ResultsList = []
+   BaseList = None
+   nBaseSeconds = 0
+   for nWorkers in WorkersList:
+      ParallelShutdown()
+      nStart = time.perf_counter()
+      RunList = ParallelMap(fnFunction,ArgumentsList,nWorkers,nMode)
+      nSeconds = time.perf_counter() - nStart
+      if BaseList is None:
+         BaseList = RunList
+         nBaseSeconds = nSeconds
+      elif RunList != BaseList:
+         raise RuntimeError('Results with ' + str(nWorkers) + ' workers differ from 1 worker')
+      nSpeedup = nBaseSeconds / nSeconds
+      ResultsList.append([nWorkers,nSeconds,nSpeedup,nSpeedup / nWorkers])
+   ParallelShutdown()
+   return ResultsList
+# End Def
+
+atexit.register(ParallelShutdown)
+
+if __name__ == '__main__':
+   #
+   # Benchmark a few years of Hebrew and Persian conversions
+   #
+   import PYHebrew
+   import PYPersian
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   print ('Cores: ' + str(cmParallelWorkers(0)) + ' Free-threaded: ' + str(ParallelFreeThreaded()) \
+          + ' Mode: ' + ParallelModeNames[cmParallelMode(PARALLEL_AUTO)])
+   nDays = pyNow.toordinal()
+   for fnFromDays in [PYHebrew.HebrewFromDays, PYPersian.PersianFromDays]:
+      print (fnFromDays.__name__ + ' over ' + str(4 * 365) + ' days')
+      for nWorkers, nSeconds, nSpeedup, nEfficiency in ParallelBenchmark(fnFromDays,range(nDays,nDays + 4 * 365)):
+         print ('   Workers: ' + str(nWorkers) + ' Seconds: ' + str(round(nSeconds,3)) + ' Speedup: ' + str(round(nSpeedup,2)) \
+                + ' Efficiency: ' + str(round(nEfficiency,2)))
@@ -12,6 +12,7 @@
 #
 
 import math
+from collections import namedtuple
 from datetime import date
 
 #
@@ -49,10 +50,6 @@ ESFAND = 12
 PERSIAN_EPOCH = 226896   # March 22, 622
 J2000 = 730120.5   # January 1, 2000 at noon
 SPRING = 0
-TehranLocale_Latitude = 35.69439  
-TehranLocale_Longitude = 51.42151 
-TehranLocale_Elevation = 1178
-TehranLocale_Zone = 3.5
 
 PersianMonthNames = ['Farvardin','Ordibehesht','Xordad','Tir','Mordad','Shahrivar','Mehr','Aban','Azar','Dey','Bahman','Esfand']
 #
@@ -64,6 +61,18 @@ PersianHolidaysList = [
    'Sizdah Bedar',FARVARDIN,13,
 ]
 
+#
+# Date returned by PersianFromDays
+#
+PersianDateRecord = namedtuple('PersianDateRecord', ['Month', 'Day', 'Year'])
+
+#
+# Location of the noon that decides the Persian new year, passed as Locale
+#
+CalendarLocale = namedtuple('CalendarLocale', ['Name', 'Latitude', 'Longitude', 'Elevation', 'Zone'])
+TEHRAN = CalendarLocale('Tehran',35.69439,51.42151,1178,3.5)
+PersianLocale = TEHRAN   # Used when no Locale is given
+
 def CurrentDate () -> date:
 #
 # Retrieve the current date
@@ -261,7 +270,7 @@ def cmEquationOfTime (nMoment: float) -> float:
    return cmSignum(nEquation) * nEquationAdjust
 # End Def
 
-def cmApparentFromLocal (nMoment: float) -> float:
+def cmApparentFromLocal (nMoment: float, nLongitude: float) -> float:
 #
 # Convert Local time to Apparent
 #
@@ -324,11 +333,13 @@ def cmMidday (nMoment: float, nLongitude: float) -> float:
    return cmUniversalFromApparent(nMoment + .5,nLongitude)
 # End Def
 
-def cmMiddayInTehran (nDays: int) -> float:
+def cmMiddayInTehran (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Midday or solar noon in Tehran
 #
-   return cmMidday(nDays,TehranLocale_Longitude)
+   if Locale is None:
+      Locale = PersianLocale
+   return cmMidday(nDays,Locale.Longitude)
 # End Def
 
 def cmAberration (nC: float) -> float:
@@ -437,25 +448,29 @@ def cmEstimatePriorSolarLongitude (nMoment: float, nLongitude: float) -> float:
       return nEstimate
 # End Def
 
-def cmPersianNewYearOnOrBefore (nDays: int) -> int:
+def cmPersianNewYearOnOrBefore (nDays: int, Locale: CalendarLocale = None) -> int:
 #
 # Search for Persian New Year on vernal equinox (Around March 21)
 #
-   nApprox = cmFloor(cmEstimatePriorSolarLongitude(cmMiddayInTehran(nDays),SPRING))
-   while cmSolarLongitude(cmMiddayInTehran(nApprox)) > SPRING + 2:
+   if Locale is None:
+      Locale = PersianLocale
+   nApprox = cmFloor(cmEstimatePriorSolarLongitude(cmMiddayInTehran(nDays,Locale),SPRING))
+   while cmSolarLongitude(cmMiddayInTehran(nApprox,Locale)) > SPRING + 2:
       nApprox = nApprox + 1
    return nApprox
 # End Def
 
-def DaysFromPersian (nMonth: int, nDay: int, nYear: int) -> int:
+def DaysFromPersian (nMonth: int, nDay: int, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Given a Persian Date, return Days Date
 #
+   if Locale is None:
+      Locale = PersianLocale
    if 0 < nYear:
       nYearAdjusted = nYear - 1
    else:
     nYearAdjusted = nYear
-   nDays = cmPersianNewYearOnOrBefore(PERSIAN_EPOCH + 180 + cmFloor(cmMeanTropicalYear(0) * nYearAdjusted))
+   nDays = cmPersianNewYearOnOrBefore(PERSIAN_EPOCH + 180 + cmFloor(cmMeanTropicalYear(0) * nYearAdjusted),Locale)
    if nMonth <= MEHR:
       nDayAdjusted = 31
       nExtraDays = 0
@@ -465,25 +480,23 @@ def DaysFromPersian (nMonth: int, nDay: int, nYear: int) -> int:
    return nDays - 1 + (nDayAdjusted * (nMonth - 1)) + nExtraDays + nDay
 # End Def
 
-def PersianFromDays (nDays: int):
+def PersianFromDays (nDays: int, Locale: CalendarLocale = None):
 #
 # Given a Days date, return Persian Date
 #
-   nNewYear = cmPersianNewYearOnOrBefore(nDays)
+   if Locale is None:
+      Locale = PersianLocale
+   nNewYear = cmPersianNewYearOnOrBefore(nDays,Locale)
    nYear = cmRound((nNewYear - PERSIAN_EPOCH) / (cmMeanTropicalYear(0)) + 1)
    if 0 > nYear:
       nYear = nYear + 1
-   nDayOfYear = nDays - DaysFromPersian(FARVARDIN,1,nYear) + 1
+   nDayOfYear = nDays - DaysFromPersian(FARVARDIN,1,nYear,Locale) + 1
    if nDayOfYear <= 186:
       nMonth = cmCeiling(nDayOfYear / 31)
    else:
       nMonth = cmCeiling((nDayOfYear - 6) / 30)
-   nDay = nDays - DaysFromPersian(nMonth,1,nYear) + 1
-   PersianDate = []
-   PersianDate.append(nMonth)
-   PersianDate.append(nDay)
-   PersianDate.append(nYear)
-   return PersianDate
+   nDay = nDays - DaysFromPersian(nMonth,1,nYear,Locale) + 1
+   return PersianDateRecord(nMonth,nDay,nYear)
 # End Def
 
 def cmPersianYear (nGregorianYear: int) -> int:
@@ -500,39 +513,40 @@ def cmPersianYear (nGregorianYear: int) -> int:
       return nPersianYear
 # End Def
 
-def PersianDateCalculation (nMonth: int, nDay: int, nGregorianYear: int) -> date:
+def PersianDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, Locale: CalendarLocale = None) -> date:
 #
 # Return Persian dates occurring in a given Gregorian year
 #
+   if Locale is None:
+      Locale = PersianLocale
    nPersianYear = cmPersianYear(nGregorianYear)
    nJan1 = date(nGregorianYear,January,1).toordinal()
    nDec31 = date(nGregorianYear,December,31).toordinal()
 #
 # Calculate the Persian Date
 #
-   nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear)
+   nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear,Locale)
    if nCalcDays < nJan1:
-      nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear + 1)
+      nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear + 1,Locale)
    else:
       if nCalcDays > nDec31:
-         nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear - 1)
+         nCalcDays = DaysFromPersian(nMonth,nDay,nPersianYear - 1,Locale)
    return date.fromordinal(nCalcDays)
 # End Def
 
-pyNow = CurrentDate()
-#pyNow = date(2025,10,31)
-print ('Today Local: ' + str(pyNow))
-nDays = pyNow.toordinal()
-print ("Today's Local Ordinal Days: " + str(nDays))
-PersianDate = PersianFromDays(nDays)
-print ('Persian Date: ' + PersianMonthNames[PersianDate[0] - 1] + ' ' + str(PersianDate[1]) + ', ' + str(PersianDate[2]))
-print ('Days from Persian: ' + str(DaysFromPersian(PersianDate[0],PersianDate[1],PersianDate[2])))
-print ('')
-print ('Persian Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(PersianHolidaysList):
-   print (PersianHolidaysList[i] + ': ' + str(PersianDateCalculation(PersianHolidaysList[i + 1],PersianHolidaysList[i + 2],pyNow.year)))      
-   i = i + 3
-
-
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   #pyNow = date(2025,10,31)
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   print ("Today's Local Ordinal Days: " + str(nDays))
+   PersianDate = PersianFromDays(nDays)
+   print ('Persian Date: ' + PersianMonthNames[PersianDate[0] - 1] + ' ' + str(PersianDate[1]) + ', ' + str(PersianDate[2]))
+   print ('Days from Persian: ' + str(DaysFromPersian(PersianDate[0],PersianDate[1],PersianDate[2])))
+   print ('')
+   print ('Persian Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(PersianHolidaysList):
+      print (PersianHolidaysList[i] + ': ' + str(PersianDateCalculation(PersianHolidaysList[i + 1],PersianHolidaysList[i + 2],pyNow.year)))      
+      i = i + 3
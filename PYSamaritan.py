@@ -12,6 +12,7 @@
 #
 
 import math
+from collections import namedtuple
 from datetime import date
 
 #
@@ -56,10 +57,145 @@ SAMARITAN_EPOCH = -598573   # March 15, -1639 (Julian)
 JULIAN_EPOCH = -1   # December 30, 0000
 J2000 = 730120.5   # January 1, 2000 at noon
 MeanSynodicMonth = 29.530588861   # Mean time from new moon to new moon
-SamaritanLocale_Latitude = 32.1994   # Mount Gerizim  
-SamaritanLocale_Longitude = 35.2728 
-SamaritanLocale_Elevation = 881
-SamaritanLocale_Zone = 2
+NthNewMoonEpoch = 11.458922815748194   # cmNthNewMoon(0), new moon of January 11, 1
+LunarPhaseMargin = 30   # Degrees from new moon beyond which cmLunarPhase never prefers cmNthNewMoon
+
+#
+# Solar longitude periodic terms X, Y, Z in the order summed by cmSolarLongitude
+#
+SolarLongitudeTermsList = [
+   403406,270.54861,.9287892,
+   195207,340.19128,35999.1376958,
+   119433,63.91854,35999.4089666,
+   112392,331.2622,35998.7287385,
+   3891,317.843,71998.20261,
+   2819,86.631,71998.4403,
+   1721,240.052,36000.35726,
+   660,310.26,71997.4812,
+   350,247.23,32964.4678,
+   334,260.87,-19.4410,
+   314,297.82,445267.1117,
+   268,343.14,45036.884,
+   242,166.79,3.1008,
+   234,81.53,22518.4434,
+   158,3.5,-19.9739,
+   132,132.75,65928.9345,
+   129,182.95,9038.0293,
+   114,162.03,3034.7684,
+   99,29.8,33718.148,
+   93,266.4,3034.448,
+   86,249.2,-2280.773,
+   78,157.6,29929.992,
+   72,257.8,31556.493,
+   68,185.1,149.588,
+   64,69.9,9037.75,
+   46,8,107997.405,
+   38,197.1,-4444.176,
+   37,250.4,151.771,
+   32,65.3,67555.316,
+   29,162.7,31556.08,
+   28,341.5,-4561.54,
+   27,98.5,1221.655,
+   27,291.6,107996.706,
+   25,146.7,62894.167,
+   24,110,31437.369,
+   21,342.6,-31931.757,
+   21,5.2,14578.298,
+   20,230.9,34777.243,
+   18,256.1,1221.999,
+   17,45.3,62894.511,
+   14,242.9,-4442.039,
+   13,151.8,119.066,
+   13,115.2,107997.909,
+   13,285.3,16859.071,
+   12,53.3,-4.578,
+   10,205.7,-39.127,
+   10,126.6,26895.292,
+   10,85.9,12297.536,
+   10,146.1,90073.778
+]
+
+#
+# Lunar longitude periodic terms V, W, X, Y, Z in the order summed by cmLunarLongitude
+#
+LunarLongitudeTermsList = [
+   6288774,0,0,1,0,
+   658314,2,0,0,0,
+   -185116,0,1,0,0,
+   58793,2,0,-2,0,
+   53322,2,0,1,0,
+   -40923,0,1,-1,0,
+   -30383,0,1,1,0,
+   -12528,0,0,1,2,
+   10675,4,0,-1,0,
+   8548,4,0,-2,0,
+   -6766,2,1,0,0,
+   4987,1,1,0,0,
+   3994,2,0,2,0,
+   3665,2,0,-3,0,
+   -2602,2,0,-1,2,
+   -2348,1,0,1,0,
+   -2120,0,1,2,0,
+   2048,2,-2,-1,0,
+   -1595,2,0,0,2,
+   -1110,0,0,2,2,
+   -810,2,1,1,0,
+   -713,0,2,-1,0,
+   691,2,1,-2,0,
+   549,4,0,1,0,
+   520,4,-1,0,0,
+   -399,2,1,0,-2,
+   351,1,1,1,0,
+   330,4,0,-3,0,
+   -323,0,2,1,0,
+   294,2,0,3,0,
+   1274027,2,0,-1,0,
+   213618,0,0,2,0,
+   -114332,0,0,0,2,
+   57066,2,-1,-1,0,
+   45758,2,-1,0,0,
+   -34720,1,0,0,0,
+   15327,2,0,0,-2,
+   10980,0,0,1,-2,
+   10034,0,0,3,0,
+   -7888,2,1,-1,0,
+   -5163,1,0,-1,0,
+   4036,2,-1,1,0,
+   3861,4,0,0,0,
+   -2689,0,1,-2,0,
+   2390,2,-1,-2,0,
+   2236,2,-2,0,0,
+   -2069,0,2,0,0,
+   -1773,2,0,1,-2,
+   1215,4,-1,-1,0,
+   -892,3,0,-1,0,
+   759,4,-1,-2,0,
+   -700,2,2,-1,0,
+   596,2,-1,0,-2,
+   537,0,0,4,0,
+   -487,1,0,-2,0,
+   -381,0,0,2,-2,
+   -340,3,0,-2,0,
+   327,2,-1,2,0,
+   299,1,1,-1,0
+]
+
+#
+# Samaritan year structures by (Locale, Gregorian year): [New year days date, [Month start days dates]]
+#
+SamaritanYearCache = {}
+
+#
+# Date returned by SamaritanFromDays
+#
+SamaritanDateRecord = namedtuple('SamaritanDateRecord', ['Month', 'Day', 'Year'])
+
+#
+# Location of the noon and new moons that decide Samaritan months, passed as Locale
+#
+CalendarLocale = namedtuple('CalendarLocale', ['Name', 'Latitude', 'Longitude', 'Elevation', 'Zone'])
+MOUNT_GERIZIM = CalendarLocale('Mount Gerizim',32.1994,35.2728,881,2)
+SamaritanLocale = MOUNT_GERIZIM   # Used when no Locale is given
 
 def CurrentDate () -> date:
 #
@@ -562,7 +698,7 @@ def cmNewMoonAfter (nMoment: float) -> float:
 # occasions (i.e. year 2481) when nMoment is very close to
 # the time of a new moon which are addressed.
 #
-   nN0 = cmNthNewMoon(0)
+   nN0 = NthNewMoonEpoch
    nLunarPhase = cmLunarPhase(nMoment)
 #
 # To ensure independence of the phase at the R.D. epoch,
@@ -590,7 +726,7 @@ def cmNewMoonBefore (nMoment: float) -> float:
 # occasions (i.e. year 2481) when nMoment is very close to
 # the time of a new moon which are addressed.
 #
-   nN0 = cmNthNewMoon(0)
+   nN0 = NthNewMoonEpoch
    nLunarPhase = cmLunarPhase(nMoment)
 #
 # To ensure independence of the phase at the R.D. epoch,
@@ -608,6 +744,77 @@ def cmNewMoonBefore (nMoment: float) -> float:
    return nNewMoon
 # End Def
 
+def cmLunarPhaseKernel (nMoment: float, bRate: bool = False):
+#
+# Lunar Phase as calculated by cmLunarPhase, fused into one pass
+#
+# Julian centuries and nutation are calculated once for both the lunar and
+# solar longitude and the periodic terms are summed from tables in the same
+# order as cmLunarLongitude and cmSolarLongitude, so the phase is identical.
+# The cmNthNewMoon check is only made within LunarPhaseMargin degrees of new
+# moon, the only place the two estimates can disagree by more than 180 degrees.
+#
+# When bRate is True, returns [Phase, Rate] with Rate the change of the phase
+# in degrees per day, for root finders
+#
+   nC = cmJulianCenturies(nMoment)
+   nNutation = cmNutation(nC)
+   nMeanMoon = cmMeanLunarLongitude(nC)
+   nElongation = cmLunarElongation(nC)
+   nSolarAnomaly = cmSolarAnomaly(nC)
+   nLunarAnomaly = cmLunarAnomaly(nC)
+   nMoonFromNode = cmMoonNode(nC)
+   nE = 1 - .002516 * nC - .0000074 * nC**2
+   nCorrection = 0
+   nCorrectionRate = 0
+   for i in range(0,len(LunarLongitudeTermsList),5):
+      nV = LunarLongitudeTermsList[i]
+      nW = LunarLongitudeTermsList[i + 1]
+      nX = LunarLongitudeTermsList[i + 2]
+      nY = LunarLongitudeTermsList[i + 3]
+      nZ = LunarLongitudeTermsList[i + 4]
+      nArgument = (nW * nElongation) + (nX * nSolarAnomaly) + (nY * nLunarAnomaly) + (nZ * nMoonFromNode)
+      nCorrection += nV * nE**abs(nX) * math.sin(math.radians(nArgument))
+      if bRate == True:
+         nCorrectionRate += nV * nE**abs(nX) * math.cos(math.radians(nArgument)) \
+                          * (nW * 445267.1114034 + nX * 35999.0502909 + nY * 477198.8675055 + nZ * 483202.0175233)
+   nCorrection = .000001 * nCorrection
+   nVenus = .003958  * cmSinDegrees(119.75 + (nC * 131.849))
+   nJupiter = .000318 * cmSinDegrees(53.09 + (nC * 479264.29))
+   nFlatEarth = .001962 * cmSinDegrees(nMeanMoon - nMoonFromNode)
+   nLunarLongitude = cmCalcDegrees(nMeanMoon + nCorrection + nVenus + nJupiter + nFlatEarth + nNutation)
+   nSolarSum = 0
+   nSolarRate = 0
+   for i in range(0,len(SolarLongitudeTermsList),3):
+      nX = SolarLongitudeTermsList[i]
+      nY = SolarLongitudeTermsList[i + 1]
+      nZ = SolarLongitudeTermsList[i + 2]
+      nSolarSum += nX * math.sin(math.radians(nY + (nZ * nC)))
+      if bRate == True:
+         nSolarRate += nX * nZ * math.cos(math.radians(nY + (nZ * nC)))
+   nSolarLongitude = cmCalcDegrees(282.7771834 + 36000.76953744 * nC + (.000005729577951308232 * nSolarSum) + cmAberration(nC) + nNutation)
+   nPhase = cmCalcDegrees(nLunarLongitude - nSolarLongitude)
+   if nPhase < LunarPhaseMargin or nPhase > 360 - LunarPhaseMargin:
+      nMeanSynodic = cmFloor(cmRound((nMoment - NthNewMoonEpoch) / MeanSynodicMonth))
+      nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
+      if abs(nPhase - nPreferred) > 180:
+         nPhase = nPreferred
+   if bRate == False:
+      return nPhase
+#
+# Derivatives per century of the terms above, using the linear rates of the
+# fundamental arguments, converted to degrees per day
+#
+   nRadians = math.pi / 180
+   nLunarRate = 481267.88123421 \
+              + nRadians * (.000001 * nCorrectionRate \
+              + .003958 * 131.849 * cmCoSineDegrees(119.75 + (nC * 131.849)) \
+              + .000318 * 479264.29 * cmCoSineDegrees(53.09 + (nC * 479264.29)) \
+              + .001962 * (481267.88123421 - 483202.0175233) * cmCoSineDegrees(nMeanMoon - nMoonFromNode))
+   nSolarRate = 36000.76953744 + nRadians * .000005729577951308232 * nSolarRate
+   return [nPhase,(nLunarRate - nSolarRate) / 36525]
+# End Def
+
 def cmLunarPhase (nMoment: float) -> float:
 #
 # Lunar Phase
@@ -617,16 +824,9 @@ def cmLunarPhase (nMoment: float) -> float:
 # moon as calculated by the more precise cmNthNewMoon function.
 #
 # If it does, then an approximation based on cmNthNewMoon is
-# preferred.
-#
-   nLongitudeDifference = cmCalcDegrees(cmLunarLongitude(nMoment) - cmSolarLongitude(nMoment))
-   nNthNewMoon = cmNthNewMoon(0)
-   nMeanSynodic = cmFloor(cmRound((nMoment - nNthNewMoon) / MeanSynodicMonth))
-   nPreferred = cmMod((nMoment - cmNthNewMoon(nMeanSynodic)) / MeanSynodicMonth,1) * 360
-   if abs(nLongitudeDifference - nPreferred) > 180:
-      return nPreferred
-   else:
-      return nLongitudeDifference
+# preferred. See cmLunarPhaseKernel
+#
+   return cmLunarPhaseKernel(nMoment)
 # End Def
 
 def cmSumSolarLongitudePeriods (dtC: float, dwX: float, dtY: float, dtZ: float) -> float:
@@ -695,25 +895,31 @@ def cmSolarLongitude (dtMoment: float) -> float:
    return cmCalcDegrees(dtLongitude + cmAberration(dtC) + cmNutation(dtC))
 # End Def
 
-def cmSamaritanNoon (nDays: int) -> float:
+def cmSamaritanNoon (nDays: int, Locale: CalendarLocale = None) -> float:
 #
 # Calculate Samaritan solar noon on nDays
 #
-   return cmMidday(nDays,SamaritanLocale_Longitude)
+   if Locale is None:
+      Locale = SamaritanLocale
+   return cmMidday(nDays,Locale.Longitude)
 # End Def
 
-def cmSamaritanNewMoonAfter (nMoment: float) -> float:
+def cmSamaritanNewMoonAfter (nMoment: float, Locale: CalendarLocale = None) -> float:
 #
 # Calculate Samaritan date of the first new moon after nMoment
 #
-   return cmCeiling(cmApparentFromUniversal(cmNewMoonAfter(nMoment),SamaritanLocale_Longitude) - .5)
+   if Locale is None:
+      Locale = SamaritanLocale
+   return cmCeiling(cmApparentFromUniversal(cmNewMoonAfter(nMoment),Locale.Longitude) - .5)
 # End Def
 
-def cmSamaritanNewMoonAtOrBefore (nMoment: float) -> float:
+def cmSamaritanNewMoonAtOrBefore (nMoment: float, Locale: CalendarLocale = None) -> float:
 #
 # Calculate Samaritan date of the first new moon at or before nMoment
 #
-   return cmCeiling(cmApparentFromUniversal(cmNewMoonBefore(nMoment),SamaritanLocale_Longitude) - .5)
+   if Locale is None:
+      Locale = SamaritanLocale
+   return cmCeiling(cmApparentFromUniversal(cmNewMoonBefore(nMoment),Locale.Longitude) - .5)
 # End Def
 
 def cmGregorianWeekDay (nDays: int) -> int:
@@ -732,7 +938,7 @@ def cmJulianLeapYear (nYear: int):
       nLeapYear = True
    elif nYear == 0:
       nLeapYear = True
-   elif cmFloor(cmMod(nYear,4)) == 3:
+   elif nYear < 0 and cmFloor(cmMod(nYear,4)) == 3:
      nLeapYear = True
    return nLeapYear
 # End Def
@@ -808,11 +1014,12 @@ def cmJulianInGregorian (nMonth: int, nDay: int, nGregorianYear: int):
    return JulianInGregorian
 # End Def
 
-def cmSamaritanNewYearOnOrBefore (nDays: int) -> int:
+def cmSamaritanNewYear (nGregorianYear: int, Locale: CalendarLocale = None) -> int:
 #
-# Calculate Samaritan New Year
+# Calculate the Samaritan New Year falling in nGregorianYear
 #
-   nGregorianYear = cmGregorianYearFromDays(nDays)
+   if Locale is None:
+      Locale = SamaritanLocale
    nJan1 = date(nGregorianYear,January,1).toordinal()
    nDec31 = date(nGregorianYear,December,31).toordinal()
    JulianInGregorian = cmJulianInGregorian(March,11,nGregorianYear)
@@ -823,78 +1030,170 @@ def cmSamaritanNewYearOnOrBefore (nDays: int) -> int:
       nJulianDays = JulianInGregorian[0]
    else:
       nJulianDays = JulianInGregorian[1]
-   return cmFloor(cmSamaritanNewMoonAfter(cmSamaritanNoon(nJulianDays)))
+   return cmFloor(cmSamaritanNewMoonAfter(cmSamaritanNoon(nJulianDays,Locale),Locale))
+# End Def
+
+def cmSamaritanYear (nGregorianYear: int, Locale: CalendarLocale = None):
+#
+# Return the Samaritan year beginning in nGregorianYear
+#
+# The new year and the start of every month up to the next new year are
+# calculated once per Locale and kept in SamaritanYearCache
+#
+   if Locale is None:
+      Locale = SamaritanLocale
+   Key = (Locale,nGregorianYear)
+   if Key not in SamaritanYearCache:
+      nNewYear = cmSamaritanNewYear(nGregorianYear,Locale)
+      nNextNewYear = cmSamaritanNewYear(nGregorianYear + 1,Locale)
+      MonthStartsList = []
+      nMonthStart = nNewYear
+      while nMonthStart < nNextNewYear:
+         MonthStartsList.append(nMonthStart)
+         nMonthStart = cmSamaritanNewMoonAtOrBefore(nNewYear + 29.5 * len(MonthStartsList) + 15,Locale)
+      SamaritanYearCache[Key] = [nNewYear,MonthStartsList]
+   return SamaritanYearCache[Key]
+# End Def
+
+def SamaritanYearCacheClear () -> None:
+#
+# Discard the cached Samaritan year structures
+#
+   SamaritanYearCache.clear()
+# End Def
+
+def cmSamaritanNewYearOnOrBefore (nDays: int, Locale: CalendarLocale = None) -> int:
+#
+# Calculate Samaritan New Year
+#
+   if Locale is None:
+      Locale = SamaritanLocale
+   return cmSamaritanYear(cmGregorianYearFromDays(nDays),Locale)[0]
 # End Def
 
-def SamaritanFromDays (nDays: int):
+def cmSamaritanYearNumber (nNewYear: int, nMonth: int) -> int:
+#
+# Samaritan year number of nMonth in the year beginning on nNewYear
+#
+   return cmRound(((nNewYear - SAMARITAN_EPOCH) / 365.25) + cmCeiling((nMonth - 5) / 8))
+# End Def
+
+def SamaritanFromDays (nDays: int, Locale: CalendarLocale = None):
 #
 # Calculate Samaritan Date from Days
 #
-   nMoon = cmFloor(cmSamaritanNewMoonAtOrBefore(cmSamaritanNoon(nDays)))
-   nNewYear = cmSamaritanNewYearOnOrBefore(nMoon)
-   nMonth = cmRound((nMoon - nNewYear) / 29.5) + 1
-   nYear = cmRound(((nNewYear - SAMARITAN_EPOCH) / 365.25) + cmCeiling((nMonth - 5) / 8))
-   nDay = nDays - nMoon + 1
-   SamaritanDate = []
-   SamaritanDate.append(nMonth)
-   SamaritanDate.append(nDay)
-   SamaritanDate.append(nYear)
-   return SamaritanDate
+   if Locale is None:
+      Locale = SamaritanLocale
+   nGregorianYear = cmGregorianYearFromDays(nDays)
+   SamaritanYear = cmSamaritanYear(nGregorianYear,Locale)
+   if nDays < SamaritanYear[0]:
+      SamaritanYear = cmSamaritanYear(nGregorianYear - 1,Locale)
+   MonthStartsList = SamaritanYear[1]
+   nMonth = len(MonthStartsList)
+   while MonthStartsList[nMonth - 1] > nDays:
+      nMonth = nMonth - 1
+   return SamaritanDateRecord(nMonth,nDays - MonthStartsList[nMonth - 1] + 1,cmSamaritanYearNumber(SamaritanYear[0],nMonth))
 # End Def
 
-def DaysFromSamaritan (nMonth: int, nDay: int, nYear: int) -> int:
+def DaysFromSamaritan (nMonth: int, nDay: int, nYear: int, Locale: CalendarLocale = None) -> int:
 #
 # Calculate Days from Samaritan Date
 #
-   nY = cmSamaritanNewYearOnOrBefore(cmFloor(SAMARITAN_EPOCH + 50 + (365.25 * (nYear - cmCeiling((nMonth - 5) / 8)))))
-   nM = cmSamaritanNewMoonAtOrBefore(nY + 29.5 * (nMonth - 1) + 15)
+   if Locale is None:
+      Locale = SamaritanLocale
+   nGregorianYear = cmGregorianYearFromDays(cmFloor(SAMARITAN_EPOCH + 50 + (365.25 * (nYear - cmCeiling((nMonth - 5) / 8)))))
+   SamaritanYear = cmSamaritanYear(nGregorianYear,Locale)
+   if nMonth >= 1 and nMonth <= len(SamaritanYear[1]):
+      nM = SamaritanYear[1][nMonth - 1]
+   else:
+      nM = cmSamaritanNewMoonAtOrBefore(SamaritanYear[0] + 29.5 * (nMonth - 1) + 15,Locale)
    return nM + nDay - 1
 # End Def
 
-def cmSamaritanInGregorian (nMonth: int, nDay: int, nGregorianYear: int) -> int: 
+def SamaritanDatesInRange (nFromDays: int, nToDays: int, Locale: CalendarLocale = None):
+#
+# Iterate over (Days, SamaritanDateRecord) for nFromDays through nToDays
+#
+# Walks the cached month starts, so each Samaritan year is calculated once
+#
+   if Locale is None:
+      Locale = SamaritanLocale
+   nDays = nFromDays
+   SamaritanDate = SamaritanFromDays(nDays,Locale)
+   nGregorianYear = cmGregorianYearFromDays(nDays)
+   if nDays < cmSamaritanYear(nGregorianYear,Locale)[0]:
+      nGregorianYear = nGregorianYear - 1
+   nMonth = SamaritanDate[0]
+   nDay = SamaritanDate[1]
+   while nDays <= nToDays:
+      SamaritanYear = cmSamaritanYear(nGregorianYear,Locale)
+      MonthStartsList = SamaritanYear[1]
+      if nMonth < len(MonthStartsList):
+         nMonthEnd = MonthStartsList[nMonth]
+      else:
+         nMonthEnd = cmSamaritanYear(nGregorianYear + 1,Locale)[0]
+      nYear = cmSamaritanYearNumber(SamaritanYear[0],nMonth)
+      while nDays < nMonthEnd and nDays <= nToDays:
+         yield (nDays,SamaritanDateRecord(nMonth,nDay,nYear))
+         nDays = nDays + 1
+         nDay = nDay + 1
+      nDay = 1
+      if nMonth < len(MonthStartsList):
+         nMonth = nMonth + 1
+      else:
+         nMonth = 1
+         nGregorianYear = nGregorianYear + 1
+# End Def
+
+def cmSamaritanInGregorian (nMonth: int, nDay: int, nGregorianYear: int, Locale: CalendarLocale = None) -> int: 
 #
 # Return the Samaritan days date occuring in a Gregorian Year
 #
+   if Locale is None:
+      Locale = SamaritanLocale
    nSamaritanYear0 = nGregorianYear + 1638
    nSamaritanYear1 = nSamaritanYear0 + 1
    nJan1 = date(nGregorianYear,January,1).toordinal()
    nDec31 = date(nGregorianYear,December,31).toordinal()
-   nDays = DaysFromSamaritan(nMonth,nDay,nSamaritanYear0)
+   nDays = DaysFromSamaritan(nMonth,nDay,nSamaritanYear0,Locale)
    if nDays >= nJan1 and nDays <= nDec31:
       return nDays
    else:
-      return DaysFromSamaritan(nMonth,nDay,nSamaritanYear1)
+      return DaysFromSamaritan(nMonth,nDay,nSamaritanYear1,Locale)
 # End Def
 
-def SamaritanDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: int) -> date:
+def SamaritanDateCalculation (nMonth: int, nDay: int, nGregorianYear: int, nRule: int, Locale: CalendarLocale = None) -> date:
 #
 # Return Samaritan dates occurring in a given Gregorian year
 #
+   if Locale is None:
+      Locale = SamaritanLocale
    if nRule == SIMMUT_OF_PASSOVER:
-      nPassover = cmSamaritanInGregorian(1,14,nGregorianYear)      
+      nPassover = cmSamaritanInGregorian(1,14,nGregorianYear,Locale)      
       nCalcDays = nPassover - 49 - cmGregorianWeekDay(nPassover)
    elif nRule == SIMMUT_OF_TABERNACLES:
-      nTabernacles = cmSamaritanInGregorian(7,15,nGregorianYear)
+      nTabernacles = cmSamaritanInGregorian(7,15,nGregorianYear,Locale)
       nCalcDays = nTabernacles - 49 - cmGregorianWeekDay(nTabernacles)
    elif nRule == PENTECOST:
-      nPassover = cmSamaritanInGregorian(1,14,nGregorianYear)
+      nPassover = cmSamaritanInGregorian(1,14,nGregorianYear,Locale)
       nCalcDays = nPassover + 56
    else:
-      nCalcDays = cmSamaritanInGregorian(nMonth,nDay,nGregorianYear)
+      nCalcDays = cmSamaritanInGregorian(nMonth,nDay,nGregorianYear,Locale)
    return date.fromordinal(nCalcDays)
 # End Def
 
-pyNow = CurrentDate()
-print ('Today Local: ' + str(pyNow))
-nDays = pyNow.toordinal()
-print ("Today's Local Ordinal Days: " + str(nDays))
-SamaritanDate = SamaritanFromDays(nDays)
-print ('Samaritan Date: ' + str(SamaritanDate[0]) + ' ' + str(SamaritanDate[1]) + ', ' + str(SamaritanDate[2]))
-print ('Days From Samaritan: ' + str(DaysFromSamaritan(SamaritanDate[0],SamaritanDate[1],SamaritanDate[2])))
-print ('')
-print ('Samaritan Holidays during Gregorian Year ' + str(pyNow.year))
-print ('')
-i = 0
-while i < len(SamaritanHolidaysList):
-   print (SamaritanHolidaysList[i] + ': ' + str(SamaritanDateCalculation(SamaritanHolidaysList[i + 1],SamaritanHolidaysList[i + 2],pyNow.year,SamaritanHolidaysList[i + 3])))      
-   i = i + 4
+if __name__ == '__main__':
+   pyNow = CurrentDate()
+   print ('Today Local: ' + str(pyNow))
+   nDays = pyNow.toordinal()
+   print ("Today's Local Ordinal Days: " + str(nDays))
+   SamaritanDate = SamaritanFromDays(nDays)
+   print ('Samaritan Date: ' + str(SamaritanDate[0]) + ' ' + str(SamaritanDate[1]) + ', ' + str(SamaritanDate[2]))
+   print ('Days From Samaritan: ' + str(DaysFromSamaritan(SamaritanDate[0],SamaritanDate[1],SamaritanDate[2])))
+   print ('')
+   print ('Samaritan Holidays during Gregorian Year ' + str(pyNow.year))
+   print ('')
+   i = 0
+   while i < len(SamaritanHolidaysList):
+      print (SamaritanHolidaysList[i] + ': ' + str(SamaritanDateCalculation(SamaritanHolidaysList[i + 1],SamaritanHolidaysList[i + 2],pyNow.year,SamaritanHolidaysList[i + 3])))      
+      i = i + 4
@@ -0,0 +1,410 @@
+########################################################################################
+# File: PYServer.py
+# Contents: Local HTTP/JSON calendar conversion server.
+# Version: 1.11
+# Python Version: 3.13
+# Date: 2025-06-23
+# By: Rick Kelly
+# Email: rk55911@outlook.com
+# ########################################################################################
+#
+# Calendar Conversion Server
+#
+# Keeps every calendar module loaded, with PYCache installed and warmed around
+# today, and answers GET requests with JSON. Only the standard library is
+# needed beyond the calendar modules themselves:
+#
+#    python PYServer.py --port 8080
+#
+#    /calendars                                  Calendar names
+#    /convert?calendar=Hebrew&date=2025-06-23    One date, or days=739425
+#    /range?calendar=Persian&from=2025-01-01&to=2025-12-31
+#    /holidays?calendar=Chinese&year=2025
+#    /sun?date=2025-06-23&latitude=33.94&longitude=-118.41&elevation=39&timezone=America/Los_Angeles
+#    /moon?date=2025-06-23&latitude=33.94&longitude=-118.41&elevation=39&timezone=America/Los_Angeles&topocentric=1
+#    /statistics                                 Latency histograms and cache counts
+#
+# The Bahai, Hindu, Persian and Samaritan calendars accept latitude, longitude,
+# elevation and zone (hours) to replace the default locale, Chinese accepts
+# country (0 China, 1 Vietnam, 2 Korea, 3 Japan) and Islamic hemisphere
+# (east or west, also 0 east and 1 west). Errors are returned as {"Error": message} with status 400,
+# 404 or 500.
+#
+# Every request is timed and counted in its endpoint's latency histogram,
+# buckets in milliseconds are SERVER_BUCKETS.
+#
+
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import argparse
+import bisect
+import json
+import sys
+import threading
+import time
+import PYAstronomy
+import PYAsync
+import PYBahai
+import PYCache
+import PYChinese
+import PYCoptic
+import PYHebrew
+import PYHindu
+import PYIslamic
+import PYJulian
+import PYMemo
+import PYPersian
+import PYSamaritan
+
+#
+# Global variables
+#
+
+SERVER_HOST = '127.0.0.1'
+SERVER_PORT = 8080
+SERVER_MAX_RANGE = 3660   # Longest /range request in days
+SERVER_WARM_DAYS = 366   # Days from today converted at start up
+SERVER_BUCKETS = [.5,1,2,5,10,20,50,100,200,500,1000,2000,5000]   # Upper bounds, milliseconds
+
+ServerModulesList = [PYAstronomy, PYBahai, PYChinese, PYCoptic, PYHebrew, PYHindu, PYIslamic, PYJulian, PYPersian, PYSamaritan]
+ServerLocaleCalendars = ['Bahai', 'HinduLunar', 'HinduSolar', 'Persian', 'Samaritan']
+ServerHemispheres = {'east': PYIslamic.EASTHEMISPHERE, 'west': PYIslamic.WESTHEMISPHERE, '0': PYIslamic.EASTHEMISPHERE, '1': PYIslamic.WESTHEMISPHERE}
+
+#
+# Endpoint -> [Count, Errors, Total ms, Maximum ms, Buckets]
+#
+ServerLatency = {}
+ServerLatencyLock = threading.Lock()
+
+def CurrentDate () -> date:
+#
+# Retrieve the current date
+#
+   return date.today()
+# End Def
+
+def cmServerJson (Value):
+#
+# JSON ready copy of Value, records become objects and dates ISO strings
+#
+   if isinstance(Value, tuple) and hasattr(Value,'_fields'):
+      return {sField: cmServerJson(Item) for sField, Item in zip(Value._fields,Value)}
+   if isinstance(Value, (list, tuple)):
+      return [cmServerJson(Item) for Item in Value]
+   if isinstance(Value, dict):
+      return {str(Key): cmServerJson(Item) for Key, Item in Value.items()}
+   if isinstance(Value, (date, datetime)):
+      return Value.isoformat()
+   return Value
+# End Def
+
+def cmServerDays (Query: dict, sName: str) -> int:
+#
+# Days date from an ISO date parameter sName, or from days when sName is 'date'
+#
+   if sName in Query:
+      return date.fromisoformat(Query[sName]).toordinal()
+   if sName == 'date' and 'days' in Query:
+      return int(Query['days'])
+   raise ValueError('Missing parameter ' + sName)
+# End Def
+
+def cmServerFloat (Query: dict, sName: str, nDefault: float = None) -> float:
+#
+# Float parameter sName, required when nDefault is None
+#
+   if sName in Query:
+      return float(Query[sName])
+   if nDefault is None:
+      raise ValueError('Missing parameter ' + sName)
+   return nDefault
+# End Def
+
+def cmServerLocale (sCalendar: str, Query: dict):
+#
+# Locale for sCalendar from the request, None for the calendar default
+#
+   if sCalendar == 'Chinese' and 'country' in Query:
+      return int(Query['country'])
+   if sCalendar == 'Islamic' and 'hemisphere' in Query:
+      sHemisphere = Query['hemisphere'].lower()
+      if sHemisphere not in ServerHemispheres:
+         raise ValueError('Hemisphere must be east or west')
+      return ServerHemispheres[sHemisphere]
+   if sCalendar not in ServerLocaleCalendars or 'latitude' not in Query:
+      return None
+   i = PYAsync.cmAsyncCalendar(sCalendar)
+   Module = sys.modules[PYAsync.AsyncCalendarsList[i + 1].__module__]
+   return Module.CalendarLocale(Query.get('name','Request'),cmServerFloat(Query,'latitude'),cmServerFloat(Query,'longitude'), \
+                                cmServerFloat(Query,'elevation',0),cmServerFloat(Query,'zone'))
+# End Def
+
+def cmServerCalendar (Query: dict) -> str:
+#
+# Calendar parameter, checked against PYAsync.AsyncCalendarsList
+#
+   if 'calendar' not in Query:
+      raise ValueError('Missing parameter calendar')
+   PYAsync.cmAsyncCalendar(Query['calendar'])
+   return Query['calendar']
+# End Def
+
+def ServerCalendars (Query: dict) -> list:
+#
+# /calendars
+#
+   return [PYAsync.AsyncCalendarsList[i] for i in range(0,len(PYAsync.AsyncCalendarsList),3)]
+# End Def
+
+def ServerConvert (Query: dict):
+#
+# /convert
+#
+   sCalendar = cmServerCalendar(Query)
+   nDays = cmServerDays(Query,'date')
+   Locale = cmServerLocale(sCalendar,Query)
+   if Locale is None:
+      Locale = PYAsync.AsyncCalendarsList[PYAsync.cmAsyncCalendar(sCalendar) + 2]
+   return {'Days': nDays, 'Gregorian': date.fromordinal(nDays), sCalendar: PYAsync.cmAsyncConvertRange(sCalendar,nDays,nDays,Locale)[0]}
+# End Def
+
+def ServerRange (Query: dict) -> list:
+#
+# /range, at most SERVER_MAX_RANGE days
+#
+   sCalendar = cmServerCalendar(Query)
+   nFromDays = cmServerDays(Query,'from')
+   nToDays = cmServerDays(Query,'to')
+   if nToDays < nFromDays or nToDays - nFromDays >= SERVER_MAX_RANGE:
+      raise ValueError('Range must be 1 to ' + str(SERVER_MAX_RANGE) + ' days')
+   Locale = cmServerLocale(sCalendar,Query)
+   if Locale is None:
+      Locale = PYAsync.AsyncCalendarsList[PYAsync.cmAsyncCalendar(sCalendar) + 2]
+   if sCalendar == 'Samaritan':
+      ResultsList = [SamaritanDate for nDays, SamaritanDate in PYSamaritan.SamaritanDatesInRange(nFromDays,nToDays,Locale)]
+   else:
+      ResultsList = PYAsync.cmAsyncConvertRange(sCalendar,nFromDays,nToDays,Locale)
+   return [{'Days': nDays, 'Gregorian': date.fromordinal(nDays), sCalendar: ResultsList[nDays - nFromDays]} for nDays in range(nFromDays,nToDays + 1)]
+# End Def
+
+def ServerHolidays (Query: dict) -> list:
+#
+# /holidays, [Name, Date] for the holidays of a calendar in a Gregorian year
+#
+   sCalendar = cmServerCalendar(Query)
+   nYear = int(Query.get('year',CurrentDate().year))
+   Locale = cmServerLocale(sCalendar,Query)
+   HolidaysList = []
+   if sCalendar == 'Hebrew':
+      for i in range(0,len(PYHebrew.HebrewHolidaysList),13):
+         HebrewHoliday = PYHebrew.HebrewDateCalculation(PYHebrew.HebrewHolidaysList[i],PYHebrew.HebrewHolidaysList[i + 1],PYHebrew.HebrewHolidaysList[i + 2],nYear,*PYHebrew.HebrewHolidaysList[i + 3:i + 13])
+         if HebrewHoliday.DateFound == True:
+            HolidaysList.append([HebrewHoliday.Name,HebrewHoliday.DateObserved])
+   elif sCalendar == 'Islamic':
+      HolidaysList = PYIslamic.IslamicHolidaysInRange(nYear,nYear)
+   elif sCalendar == 'Chinese':
+      if Locale is None:
+         Locale = PYChinese.CHINESE
+      for i in range(0,len(PYChinese.ChineseHolidaysList),4):
+         ChineseHoliday = PYChinese.ChineseHolidayCalculation(PYChinese.ChineseHolidaysList[i + 1],PYChinese.ChineseHolidaysList[i + 2],nYear,PYChinese.ChineseHolidaysList[i + 3],Locale)
+         if len(ChineseHoliday) != 0:
+            HolidaysList.append([PYChinese.ChineseHolidaysList[i],ChineseHoliday[0]])
+   elif sCalendar == 'Bahai':
+      for i in range(0,len(PYBahai.BahaiHolidaysList),4):
+         HolidaysList.append([PYBahai.BahaiHolidaysList[i],PYBahai.BahaiDateCalculation(PYBahai.BahaiHolidaysList[i + 1],PYBahai.BahaiHolidaysList[i + 2],nYear,PYBahai.BahaiHolidaysList[i + 3],Locale)])
+   elif sCalendar == 'Persian':
+      for i in range(0,len(PYPersian.PersianHolidaysList),3):
+         HolidaysList.append([PYPersian.PersianHolidaysList[i],PYPersian.PersianDateCalculation(PYPersian.PersianHolidaysList[i + 1],PYPersian.PersianHolidaysList[i + 2],nYear,Locale)])
+   elif sCalendar == 'Coptic':
+      for i in range(0,len(PYCoptic.CopticHolidaysList),4):
+         HolidaysList.append([PYCoptic.CopticHolidaysList[i],PYCoptic.CopticDateCalculation(PYCoptic.CopticHolidaysList[i + 1],PYCoptic.CopticHolidaysList[i + 2],nYear,PYCoptic.CopticHolidaysList[i + 3])])
+   elif sCalendar == 'Samaritan':
+      for i in range(0,len(PYSamaritan.SamaritanHolidaysList),4):
+         HolidaysList.append([PYSamaritan.SamaritanHolidaysList[i],PYSamaritan.SamaritanDateCalculation(PYSamaritan.SamaritanHolidaysList[i + 1],PYSamaritan.SamaritanHolidaysList[i + 2],nYear,PYSamaritan.SamaritanHolidaysList[i + 3],Locale)])
+   elif sCalendar == 'Julian':
+      HolidaysList.append(['Orthodox Easter',PYJulian.OrthodoxEasterDate(nYear)])
+   else:
+      if Locale is None:
+         Locale = PYHindu.HinduLocale
+      HolidaysList.append(['Mesha Sankranti',date.fromordinal(PYHindu.cmFloor(PYHindu.cmHinduSolarLongitudeAtOrAfter(0,date(nYear,1,1).toordinal())))])
+      HolidaysList.append(['Chandramana Ugadi',PYHindu.cmHinduLunarNewYear(nYear,Locale)])
+      HolidaysList.append(['Diwali',PYHindu.cmDiwali(nYear,Locale)])
+      HolidaysList.append(['Holi',PYHindu.cmHoli(nYear,Locale)])
+   return HolidaysList
+# End Def
+
+def ServerSun (Query: dict) -> dict:
+#
+# /sun, sunrise, transit and sunset, depression in degrees below the horizon
+#
+   nDays = cmServerDays(Query,'date')
+   nLatitude = cmServerFloat(Query,'latitude')
+   nLongitude = cmServerFloat(Query,'longitude')
+   nElevation = cmServerFloat(Query,'elevation',0)
+   nDepression = cmServerFloat(Query,'depression',PYAstronomy.SUNRISE_SUNSET_TIME)
+   sTimezone = Query.get('timezone','UTC')
+   return {'Sunrise': PYAstronomy.SunRiseTimeZone(nDays,sTimezone,nLatitude,nLongitude,nElevation,nDepression), \
+           'Transit': PYAstronomy.SunTransitAware(nDays,nLongitude,sTimezone), \
+           'Sunset': PYAstronomy.SunSetTimeZone(nDays,sTimezone,nLatitude,nLongitude,nElevation,nDepression)}
+# End Def
+
+def ServerMoon (Query: dict) -> dict:
+#
+# /moon, moonrises and moonsets, geocentric unless topocentric=1
+#
+   nDays = cmServerDays(Query,'date')
+   nLatitude = cmServerFloat(Query,'latitude')
+   nLongitude = cmServerFloat(Query,'longitude')
+   nElevation = cmServerFloat(Query,'elevation',0)
+   sTimezone = Query.get('timezone','UTC')
+   bType = PYAstronomy.GEOCENTRIC
+   if Query.get('topocentric','0') == '1':
+      bType = PYAstronomy.TOPOCENTRIC
+   return {'Moonrise': PYAstronomy.MoonRiseAware(nDays,nLatitude,nLongitude,nElevation,sTimezone,bType), \
+           'Moonset': PYAstronomy.MoonSetAware(nDays,nLatitude,nLongitude,nElevation,sTimezone,bType)}
+# End Def
+
+def cmServerPercentile (Buckets: list, nCount: int, nFraction: float) -> float:
+#
+# Upper bound in milliseconds of the bucket holding the nFraction percentile
+#
+   nRunning = 0
+   for i in range(len(Buckets)):
+      nRunning = nRunning + Buckets[i]
+      if nRunning >= nCount * nFraction:
+         if i < len(SERVER_BUCKETS):
+            return SERVER_BUCKETS[i]
+         return None
+   return None
+# End Def
+
+def ServerStatistics (Query: dict) -> dict:
+#
+# /statistics, latency by endpoint and PYCache counts
+#
+   Statistics = {}
+   with ServerLatencyLock:
+      for sEndpoint in sorted(ServerLatency):
+         nCount, nErrors, nTotal, nMaximum, Buckets = ServerLatency[sEndpoint]
+         BucketsDict = {}
+         for i in range(len(Buckets)):
+            if i < len(SERVER_BUCKETS):
+               BucketsDict['<=' + str(SERVER_BUCKETS[i])] = Buckets[i]
+            else:
+               BucketsDict['>' + str(SERVER_BUCKETS[-1])] = Buckets[i]
+         Statistics[sEndpoint] = {'Count': nCount, 'Errors': nErrors, 'Mean': round(nTotal / nCount,3), 'Maximum': round(nMaximum,3), \
+                                  'P50': cmServerPercentile(Buckets,nCount,.5), 'P90': cmServerPercentile(Buckets,nCount,.9), \
+                                  'P99': cmServerPercentile(Buckets,nCount,.99), 'Buckets': BucketsDict}
+   Cache = {'Hits': 0, 'Misses': 0, 'Size': 0}
+   for Counts in PYCache.CacheStatistics().values():
+      for sCount in Cache:
+         Cache[sCount] = Cache[sCount] + Counts[sCount]
+   return {'Endpoints': Statistics, 'Cache': Cache}
+# End Def
+
+def cmServerRecord (sEndpoint: str, nMilliseconds: float, bError: bool):
+#
+# Add one request to the latency histogram of sEndpoint
+#
+   with ServerLatencyLock:
+      if sEndpoint not in ServerLatency:
+         ServerLatency[sEndpoint] = [0,0,0.0,0.0,[0] * (len(SERVER_BUCKETS) + 1)]
+      Entry = ServerLatency[sEndpoint]
+      Entry[0] = Entry[0] + 1
+      if bError == True:
+         Entry[1] = Entry[1] + 1
+      Entry[2] = Entry[2] + nMilliseconds
+      Entry[3] = max(Entry[3],nMilliseconds)
+      Entry[4][bisect.bisect_left(SERVER_BUCKETS,nMilliseconds)] = Entry[4][bisect.bisect_left(SERVER_BUCKETS,nMilliseconds)] + 1
+# End Def
+
+ServerRoutes = {
+   '/calendars': ServerCalendars,
+   '/convert': ServerConvert,
+   '/range': ServerRange,
+   '/holidays': ServerHolidays,
+   '/sun': ServerSun,
+   '/moon': ServerMoon,
+   '/statistics': ServerStatistics
+}
+
+class ServerHandler(BaseHTTPRequestHandler):
+#
+# Route a GET request to its endpoint function and reply with JSON
+#
+   server_version = 'PYCalendrical/1.11'
+
+   def do_GET (self):
+      nStart = time.perf_counter()
+      Url = urlsplit(self.path)
+      Query = dict(parse_qsl(Url.query))
+      nStatus = 200
+      if Url.path not in ServerRoutes:
+         nStatus = 404
+         Reply = {'Error': 'Unknown endpoint ' + Url.path}
+      else:
+         try:
+            Reply = cmServerJson(ServerRoutes[Url.path](Query))
+         except (ValueError, KeyError, OverflowError) as Error:
+            nStatus = 400
+            Reply = {'Error': str(Error)}
+         except Exception as Error:
+            nStatus = 500
+            Reply = {'Error': type(Error).__name__ + ': ' + str(Error)}
+      Body = json.dumps(Reply).encode('utf-8')
+      self.send_response(nStatus)
+      self.send_header('Content-Type','application/json')
+      self.send_header('Content-Length',str(len(Body)))
+      self.end_headers()
+      self.wfile.write(Body)
+      if Url.path in ServerRoutes:
+         cmServerRecord(Url.path,(time.perf_counter() - nStart) * 1000,nStatus != 200)
+   # End Def
+
+   def log_message (self, sFormat, *Arguments):
+      pass
+   # End Def
+# End Class
+
+def ServerWarmUp (nDays: int = SERVER_WARM_DAYS, bMemo: bool = False) -> float:
+#
+# Install PYCache (and PYMemo when bMemo) and convert nDays days from today in
+# every calendar. Returns the seconds taken
+#
+   nStart = time.perf_counter()
+   for Module in ServerModulesList:
+      if bMemo == True:
+         PYMemo.MemoInstall(Module)
+      PYCache.CacheInstall(Module)
+   nToday = CurrentDate().toordinal()
+   for sCalendar in ServerCalendars({}):
+      ServerRange({'calendar': sCalendar, 'from': date.fromordinal(nToday).isoformat(), 'to': date.fromordinal(nToday + nDays - 1).isoformat()})
+   return time.perf_counter() - nStart
+# End Def
+
+def ServerStart (sHost: str = SERVER_HOST, nPort: int = SERVER_PORT) -> ThreadingHTTPServer:
+#
+# Server answering on sHost:nPort, call serve_forever() to run it
+#
+   Server = ThreadingHTTPServer((sHost,nPort),ServerHandler)
+   Server.daemon_threads = True
+   return Server
+# End Def
+
+if __name__ == '__main__':
+   Parser = argparse.ArgumentParser(description='Calendar conversion server')
+   Parser.add_argument('--host',default=SERVER_HOST)
+   Parser.add_argument('--port',type=int,default=SERVER_PORT)
+   Parser.add_argument('--warm-days',type=int,default=SERVER_WARM_DAYS,help='days from today converted at start up')
+   Parser.add_argument('--memo',action='store_true',help='also install the PYMemo disk cache')
+   Arguments = Parser.parse_args()
+   print ('Today Local: ' + str(CurrentDate()))
+   print ('Warm up: ' + str(round(ServerWarmUp(Arguments.warm_days,Arguments.memo),3)) + ' seconds')
+   Server = ServerStart(Arguments.host,Arguments.port)
+   print ('Listening on http://' + Arguments.host + ':' + str(Server.server_address[1]))
+   try:
+      Server.serve_forever()
+   except KeyboardInterrupt:
+      pass
+   Server.server_close()